@@ -17,7 +17,12 @@ __author__ = "Parker Hancock"
 __all__ = [
     "Document",
     "compare_documents",
+    "CompressionPolicy",
+    "InMemoryPackage",
     "OOXMLPackage",
+    "TemplateCache",
+    "RegexCache",
+    "get_regex_cache",
     "RelationshipManager",
     "RelationshipTypes",
     "ContentTypeManager",
@@ -33,6 +38,7 @@ __all__ = [
     "NoteNotFoundError",
     "TextSearch",
     "TextSpan",
+    "MultiParagraphSpan",
     "Match",
     "TrackedXMLGenerator",
     "SuggestionGenerator",
@@ -41,6 +47,7 @@ __all__ = [
     "AcceptResult",
     "RejectResult",
     "FormatResult",
+    "SaveResult",
     "ComparisonStats",
     "BatchResult",
     "Edit",
@@ -139,7 +146,10 @@ from .ooxml_validator import (
 from .operations.batch import Edit
 
 # Import package class
-from .package import OOXMLPackage
+from .package import CompressionPolicy, InMemoryPackage, OOXMLPackage
+
+# Import regex cache
+from .regex_cache import RegexCache, get_regex_cache
 
 # Import relationship manager
 from .relationships import RelationshipManager, RelationshipTypes
@@ -160,6 +170,7 @@ from .results import (
     EditResult,
     FormatResult,
     RejectResult,
+    SaveResult,
 )
 
 # Import scope evaluation
@@ -181,9 +192,12 @@ from .style_templates import (
 # Import suggestion generator
 from .suggestions import SuggestionGenerator
 
+# Import template cache
+from .template_cache import TemplateCache
+
 # Import templating
 from .templating import DocxBuilder
-from .text_search import TextSearch, TextSpan
+from .text_search import MultiParagraphSpan, TextSearch, TextSpan
 
 # Import XML generation
 from .tracked_xml import TrackedXMLGenerator
@@ -15,6 +15,9 @@ from .package import OOXMLPackage
 
 logger = logging.getLogger(__name__)
 
+# Path to the content types part within the package
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
 
 class ContentTypeManager:
     """Manages [Content_Types].xml in OOXML packages.
@@ -51,7 +54,6 @@ class ContentTypeManager:
             package: The OOXMLPackage containing the [Content_Types].xml file
         """
         self._package = package
-        self._content_types_path = package.temp_dir / "[Content_Types].xml"
         self._root: etree._Element | None = None
         self._tree: etree._ElementTree | None = None
         self._modified = False
@@ -61,10 +63,10 @@ class ContentTypeManager:
         if self._root is not None:
             return
 
-        if self._content_types_path.exists():
-            parser = etree.XMLParser(remove_blank_text=False)
-            self._tree = etree.parse(str(self._content_types_path), parser)
-            self._root = self._tree.getroot()
+        root = self._package.get_part(CONTENT_TYPES_PART)
+        if root is not None:
+            self._root = root
+            self._tree = root.getroottree()
         else:
             # Create new content types file structure (shouldn't happen for valid docx)
             self._root = etree.Element(
@@ -263,16 +265,10 @@ class ContentTypeManager:
         if not self._modified or self._tree is None:
             return
 
-        # Write the file
-        self._tree.write(
-            str(self._content_types_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        self._package.set_part(CONTENT_TYPES_PART, self._tree.getroot(), pretty_print=True)
 
         self._modified = False
-        logger.debug(f"Saved content types file: {self._content_types_path}")
+        logger.debug(f"Saved content types file: {CONTENT_TYPES_PART}")
 
     @property
     def is_modified(self) -> bool:
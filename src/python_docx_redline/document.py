@@ -5,10 +5,13 @@ This module provides the main Document class which handles loading .docx files,
 inserting tracked changes, and saving the modified documents.
 """
 
+import copy
 import io
 import logging
-from collections.abc import Iterator
+import weakref
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO
 
@@ -26,13 +29,14 @@ if TYPE_CHECKING:
     from python_docx_redline.models.paragraph import Paragraph
     from python_docx_redline.models.section import Section
     from python_docx_redline.models.table import Table, TableRow
-    from python_docx_redline.models.tracked_change import TrackedChange
+    from python_docx_redline.models.tracked_change import LazyTrackedChange, TrackedChange
 
 from lxml import etree
 
 from .author import AuthorIdentity
 from .constants import WORD_NAMESPACE, XML_NAMESPACE
-from .match import Match
+from .id_allocator import IdAllocator
+from .match import LazyMatch, Match
 from .operations.batch import BatchOperations
 from .operations.change_management import ChangeManagement
 from .operations.comments import CommentOperations
@@ -54,11 +58,13 @@ from .operations.section import SectionOperations
 from .operations.tables import TableOperations
 from .operations.toc import TOC, TOCOperations
 from .operations.tracked_changes import TrackedChangeOperations
-from .package import OOXMLPackage
-from .results import BatchResult, ComparisonStats, EditResult, FormatResult
-from .scope import NoteScope, ScopeEvaluator, parse_note_scope
+from .package import CompressionPolicy, InMemoryPackage, OOXMLPackage
+from .results import BatchResult, ComparisonStats, EditResult, FormatResult, SaveResult
+from .revision_index import RevisionIndex
+from .scope import NoteScope, PositionIndex, ScopeEvaluator, parse_note_scope
+from .search_index import SearchIndex
 from .styles import StyleManager
-from .text_search import TextSearch, TextSpan
+from .text_search import MultiParagraphSpan, ParagraphTextIndex, TextSearch, TextSpan
 from .tracked_xml import TrackedXMLGenerator
 from .validation import ValidationError
 
@@ -101,6 +107,7 @@ class Document:
         source: str | Path | bytes | BinaryIO,
         author: str | AuthorIdentity = "Claude",
         minimal_edits: bool = True,
+        in_memory: bool = False,
     ) -> None:
         """Initialize a Document from a .docx file or in-memory data.
 
@@ -116,6 +123,10 @@ class Document:
                    to produce human-looking redlines. If False, uses coarse
                    "delete all + insert all" pattern. Per-operation overrides
                    are available via the `minimal` parameter on individual methods.
+            in_memory: If True, keep the package parts in memory (InMemoryPackage)
+                   instead of extracting them to a temporary directory. Loading,
+                   editing and saving then never touch the filesystem, apart from
+                   a scratch copy made while validating on save. (default: False)
 
         Raises:
             ValidationError: If the document cannot be loaded or is invalid
@@ -141,6 +152,9 @@ class Document:
             ...     guid="c5c513d2-1f51-4d69-ae91-17e5787f9bfc"
             ... )
             >>> doc = Document("contract.docx", author=identity)
+            >>>
+            >>> # Keep the package in memory (no temp directory)
+            >>> doc = Document(doc_bytes, in_memory=True)
         """
         # Detect and normalize source type
         if isinstance(source, bytes):
@@ -153,9 +167,27 @@ class Document:
             self._source_stream = None
             self.path = Path(source)
 
+        self._init_state(author, minimal_edits, in_memory)
+
+        # Load the document
+        self._load_document()
+
+    def _init_state(
+        self, author: str | AuthorIdentity, minimal_edits: bool, in_memory: bool
+    ) -> None:
+        """Set up the attributes that do not depend on the document's XML.
+
+        Shared by __init__ and clone(), so a copy starts out with the same
+        components as a freshly loaded document.
+
+        Args:
+            author: Author name or full AuthorIdentity
+            minimal_edits: Whether tracked changes use word-level diffing
+            in_memory: Whether the package parts are kept in memory
+        """
         # Store author identity (convert string to AuthorIdentity if needed)
         if isinstance(author, str):
-            self._author_identity = None
+            self._author_identity: AuthorIdentity | None = None
             self.author = author
         else:
             self._author_identity = author
@@ -164,22 +196,31 @@ class Document:
         # Store minimal edits setting (propagates to all operations)
         self._minimal_edits = minimal_edits
 
+        self._in_memory = in_memory
         self._package: OOXMLPackage | None = None
 
         # Initialize components
-        self._text_search = TextSearch()
-        self._xml_generator = TrackedXMLGenerator(
-            doc=self, author=author if isinstance(author, str) else author.display_name
+        self._text_index = ParagraphTextIndex()
+        self._text_search = TextSearch(self._text_index)
+        self._ids = IdAllocator(self)
+        self._revisions = RevisionIndex(self)
+        # Changes listed with lazy text, loaded before any change is resolved
+        self._listed_changes: weakref.WeakValueDictionary[int, LazyTrackedChange] = (
+            weakref.WeakValueDictionary()
         )
-
-        # Load the document
-        self._load_document()
+        self._xml_generator = TrackedXMLGenerator(doc=self, author=self.author)
+        # Bumped by edits to xml_root that invalidate no paragraph; with the
+        # text index generation, tells whether the tree changed since it was
+        # loaded or last written to the package
+        self._edit_generation = 0
+        self._saved_generation = (0, 0)
 
     def _load_document(self) -> None:
         """Load and parse the Word document XML.
 
         If the document is a .docx file (ZIP archive), it will be extracted
-        to a temporary directory using OOXMLPackage. The main document.xml
+        to a temporary directory using OOXMLPackage, or held in memory using
+        InMemoryPackage when `in_memory` was requested. The main document.xml
         is then parsed.
 
         Supports loading from file paths or in-memory streams (BytesIO).
@@ -197,8 +238,9 @@ class Document:
             source_desc = str(self.path)
 
         # Try to open as ZIP package (.docx)
+        package_cls = InMemoryPackage if self._in_memory else OOXMLPackage
         try:
-            self._package = OOXMLPackage.open(source)
+            self._package = package_cls.open(source)
         except ValidationError as e:
             # Not a valid ZIP - check if it's raw XML
             if self._source_stream is not None:
@@ -209,16 +251,20 @@ class Document:
         # Parse the document.xml
         try:
             if self._package is not None:
-                document_xml = self._package.get_part_path("word/document.xml")
+                root = self._package.get_part("word/document.xml")
+                if root is None:
+                    raise ValidationError(f"document.xml not found in {source_desc}")
+                self.xml_tree = root.getroottree()
             else:
-                document_xml = self.path  # type: ignore
+                document_xml = self.path
+                assert document_xml is not None
+                if not document_xml.exists():
+                    raise ValidationError(f"document.xml not found in {source_desc}")
 
-            if not document_xml.exists():
-                raise ValidationError(f"document.xml not found in {source_desc}")
+                # Parse XML with lxml
+                parser = etree.XMLParser(remove_blank_text=False)
+                self.xml_tree = etree.parse(str(document_xml), parser)
 
-            # Parse XML with lxml
-            parser = etree.XMLParser(remove_blank_text=False)
-            self.xml_tree = etree.parse(str(document_xml), parser)
             self.xml_root = self.xml_tree.getroot()
 
         except etree.XMLSyntaxError as e:
@@ -276,6 +322,8 @@ class Document:
             self.xml_tree._setroot(new_root)
             self.xml_root = new_root
             root = new_root
+            if self._package is not None:
+                self._package.set_part("word/document.xml", new_root)
 
         # Ensure mc:Ignorable includes w15 and w16du
         mc_ignorable_attr = f"{{{MC_NAMESPACE}}}Ignorable"
@@ -292,6 +340,63 @@ class Document:
 
         if updated:
             root.set(mc_ignorable_attr, " ".join(ignorable_parts))
+            self._edit_generation += 1
+
+    def clone(self, author: str | AuthorIdentity | None = None) -> "Document":
+        """Create an independent copy of this document in memory.
+
+        The copy shares nothing mutable with the original: parsed XML parts
+        are deep-copied and the package is cloned into an InMemoryPackage,
+        whose unchanged media is only read from the source archive when it
+        is accessed. Nothing is re-parsed, so forking a loaded document is
+        much cheaper than loading the same file again.
+
+        Unsaved edits, pending style changes and edit groups are carried
+        over. The copy has no path, so it must be saved to an explicit
+        destination.
+
+        Args:
+            author: Author for tracked changes made in the copy (default: the
+                author of this document)
+
+        Returns:
+            A new Document with the same contents
+
+        Example:
+            >>> template = Document("template.docx", in_memory=True)
+            >>> for client in clients:
+            ...     doc = template.clone()
+            ...     doc.replace("{{CLIENT}}", client.name)
+            ...     doc.save(f"{client.id}.docx")
+        """
+        if hasattr(self, "_style_manager_instance"):
+            self._style_manager_instance.save()
+
+        clone = Document.__new__(Document)
+        clone._source_stream = None
+        clone.path = None
+        if author is None:
+            author = self._author_identity or self.author
+        clone._init_state(author, self._minimal_edits, in_memory=True)
+
+        if self._package is not None:
+            clone._package = self._package.clone()
+            root = clone._package.get_part("word/document.xml")
+            assert root is not None
+            clone.xml_tree = root.getroottree()
+        else:
+            clone.xml_tree = copy.deepcopy(self.xml_tree)
+        clone.xml_root = clone.xml_tree.getroot()
+
+        if hasattr(self, "_edit_groups_instance"):
+            clone._edit_groups_instance = copy.deepcopy(self._edit_groups_instance)
+
+        if self.is_modified:
+            clone._edit_generation += 1
+        if clone._author_identity is not None:
+            clone._ensure_ms365_namespaces()
+
+        return clone
 
     # Backward compatibility properties for package access
     @property
@@ -304,11 +409,100 @@ class Document:
         """Check if this is a ZIP package (backward compatibility)."""
         return self._package is not None
 
+    @property
+    def text_index(self) -> ParagraphTextIndex:
+        """Get the cache of paragraph text used by searches.
+
+        find_all() and the insert/delete/replace/move operations reuse the
+        text of paragraphs that did not change, and only rebuild paragraphs
+        that did. Tracked operations, accepting or rejecting changes and the
+        text and style setters of the wrappers returned by `paragraphs`,
+        `sections` and `tables` invalidate the paragraphs they edit. Any
+        other edit, including one made directly through `xml_root`, is
+        detected when the paragraph is next searched, by checking its runs
+        and text elements against those its text was built from.
+
+        Returns:
+            The ParagraphTextIndex for this document
+
+        Example:
+            >>> doc = Document("contract.docx")
+            >>> for old, new in renames.items():
+            ...     doc.replace_tracked(old, new)
+            >>> doc.text_index.hits, doc.text_index.misses
+            (11940, 260)
+        """
+        return self._text_index
+
+    def _positions(self) -> PositionIndex:
+        """Get the positional index of the document for the current generation.
+
+        Returns:
+            PositionIndex over xml_root
+        """
+        return self._text_search.positions(self.xml_root)
+
+    def build_search_index(self) -> SearchIndex:
+        """Build a trigram index that narrows later searches.
+
+        Indexes the text of every paragraph in the body, footnotes,
+        endnotes, headers and footers. Afterwards, literal searches only
+        scan paragraphs containing every three-character sequence of the
+        query, and regex searches only scan paragraphs containing the
+        longest literal the regex requires. Results are unchanged.
+
+        The index is kept up to date as the document is edited: paragraphs
+        that changed (see `text_index`) are re-indexed when next searched,
+        and suspending the text index clears it until the next search
+        indexes the paragraphs again. Building is worthwhile when the same
+        document is searched many times.
+
+        Returns:
+            The SearchIndex, also available as `doc.text_index.search_index`
+
+        Example:
+            >>> doc = Document("contract.docx")
+            >>> doc.build_search_index()
+            >>> for term in glossary:
+            ...     hits[term] = doc.find_all(term, include_footnotes=True)
+        """
+        self._text_index.resume()
+        if self._text_index.search_index is None:
+            self._text_index.search_index = SearchIndex(self._text_index)
+        search_index = self._text_index.search_index
+
+        footnotes, endnotes = self._read_notes()
+        header_footer_ops = HeaderFooterOperations(self)
+        notes: list[Footnote | Endnote] = [*footnotes, *endnotes]
+        parts: list[Header | Footer] = [*header_footer_ops.headers, *header_footer_ops.footers]
+
+        p_tag = f"{{{WORD_NAMESPACE}}}p"
+        search_index.update(self._positions().paragraphs)
+        for note in notes:
+            search_index.update(note.element.findall(p_tag))
+        for part in parts:
+            search_index.update(list(part.element.iter(p_tag)))
+        return search_index
+
+    def _read_notes(self) -> tuple[list["Footnote"], list["Endnote"]]:
+        """Get the footnotes and endnotes, for searching them.
+
+        Returns:
+            Tuple of (footnotes, endnotes)
+        """
+        note_ops = self._note_ops
+        return note_ops.footnotes, note_ops.endnotes
+
+    # Components other than TrackedChangeOperations edit xml_root without
+    # invalidating paragraphs, so handing one out counts as an edit for
+    # is_modified.
+
     @property
     def _comment_ops(self) -> CommentOperations:
         """Get the CommentOperations instance (lazy initialization)."""
         if not hasattr(self, "_comment_ops_instance"):
             self._comment_ops_instance = CommentOperations(self)
+        self._edit_generation += 1
         return self._comment_ops_instance
 
     @property
@@ -323,6 +517,7 @@ class Document:
         """Get the ChangeManagement instance (lazy initialization)."""
         if not hasattr(self, "_change_mgmt_instance"):
             self._change_mgmt_instance = ChangeManagement(self)
+        self._edit_generation += 1
         return self._change_mgmt_instance
 
     @property
@@ -330,6 +525,7 @@ class Document:
         """Get the FormatOperations instance (lazy initialization)."""
         if not hasattr(self, "_format_ops_instance"):
             self._format_ops_instance = FormatOperations(self)
+        self._edit_generation += 1
         return self._format_ops_instance
 
     @property
@@ -337,6 +533,7 @@ class Document:
         """Get the TableOperations instance (lazy initialization)."""
         if not hasattr(self, "_table_ops_instance"):
             self._table_ops_instance = TableOperations(self)
+        self._edit_generation += 1
         return self._table_ops_instance
 
     @property
@@ -344,6 +541,7 @@ class Document:
         """Get the NoteOperations instance (lazy initialization)."""
         if not hasattr(self, "_note_ops_instance"):
             self._note_ops_instance = NoteOperations(self)
+        self._edit_generation += 1
         return self._note_ops_instance
 
     @property
@@ -351,6 +549,7 @@ class Document:
         """Get the HeaderFooterOperations instance (lazy initialization)."""
         if not hasattr(self, "_header_footer_ops_instance"):
             self._header_footer_ops_instance = HeaderFooterOperations(self)
+        self._edit_generation += 1
         return self._header_footer_ops_instance
 
     @property
@@ -358,6 +557,7 @@ class Document:
         """Get the ImageOperations instance (lazy initialization)."""
         if not hasattr(self, "_image_ops_instance"):
             self._image_ops_instance = ImageOperations(self)
+        self._edit_generation += 1
         return self._image_ops_instance
 
     @property
@@ -365,6 +565,7 @@ class Document:
         """Get the BatchOperations instance (lazy initialization)."""
         if not hasattr(self, "_batch_ops_instance"):
             self._batch_ops_instance = BatchOperations(self)
+        self._edit_generation += 1
         return self._batch_ops_instance
 
     @property
@@ -372,6 +573,7 @@ class Document:
         """Get the SectionOperations instance (lazy initialization)."""
         if not hasattr(self, "_section_ops_instance"):
             self._section_ops_instance = SectionOperations(self)
+        self._edit_generation += 1
         return self._section_ops_instance
 
     @property
@@ -379,6 +581,7 @@ class Document:
         """Get the PatternOperations instance (lazy initialization)."""
         if not hasattr(self, "_pattern_ops_instance"):
             self._pattern_ops_instance = PatternOperations(self)
+        self._edit_generation += 1
         return self._pattern_ops_instance
 
     @property
@@ -386,6 +589,7 @@ class Document:
         """Get the ComparisonOperations instance (lazy initialization)."""
         if not hasattr(self, "_comparison_ops_instance"):
             self._comparison_ops_instance = ComparisonOperations(self)
+        self._edit_generation += 1
         return self._comparison_ops_instance
 
     @property
@@ -393,6 +597,7 @@ class Document:
         """Get the HyperlinkOperations instance (lazy initialization)."""
         if not hasattr(self, "_hyperlink_ops_instance"):
             self._hyperlink_ops_instance = HyperlinkOperations(self)
+        self._edit_generation += 1
         return self._hyperlink_ops_instance
 
     @property
@@ -400,6 +605,7 @@ class Document:
         """Get the TOCOperations instance (lazy initialization)."""
         if not hasattr(self, "_toc_ops_instance"):
             self._toc_ops_instance = TOCOperations(self)
+        self._edit_generation += 1
         return self._toc_ops_instance
 
     @property
@@ -407,6 +613,7 @@ class Document:
         """Get the CrossReferenceOperations instance (lazy initialization)."""
         if not hasattr(self, "_cross_reference_ops_instance"):
             self._cross_reference_ops_instance = CrossReferenceOperations(self)
+        self._edit_generation += 1
         return self._cross_reference_ops_instance
 
     @property
@@ -465,7 +672,11 @@ class Document:
         """
         from python_docx_redline.models.paragraph import Paragraph
 
-        return [Paragraph(p) for p in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}p")]
+        # Edits made through the wrappers invalidate the paragraphs they touch
+        invalidate = self._text_index.invalidate
+        return [
+            Paragraph(p, on_change=invalidate) for p in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}p")
+        ]
 
     @property
     def sections(self) -> list["Section"]:
@@ -487,7 +698,7 @@ class Document:
         """
         from python_docx_redline.models.section import Section
 
-        return Section.from_document(self.xml_root)
+        return Section.from_document(self.xml_root, on_change=self._text_index.invalidate)
 
     @property
     def tables(self) -> list["Table"]:
@@ -762,8 +973,9 @@ class Document:
             )
 
         # Search document body
-        all_paragraphs = list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}p"))
-        paragraphs = ScopeEvaluator.filter_paragraphs(all_paragraphs, scope)
+        self._text_index.resume()
+        positions = self._positions()
+        paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
 
         # Parse fuzzy configuration if provided
         from .fuzzy import parse_fuzzy_config
@@ -784,14 +996,14 @@ class Document:
         matches = []
         for idx, span in enumerate(spans):
             # Get paragraph index within ALL paragraphs (not just filtered)
-            paragraph_index = all_paragraphs.index(span.paragraph)
+            paragraph_index = positions.paragraph_index(span.paragraph)
 
             # Get full paragraph text
             text_elements = span.paragraph.findall(f".//{{{WORD_NAMESPACE}}}t")
             paragraph_text = "".join(elem.text or "" for elem in text_elements)
 
             # Determine location string
-            location = self._get_location_string(span.paragraph)
+            location = self._get_location_string(span.paragraph, positions)
 
             # Get context with custom size
             context = self._get_context_with_size(span, context_chars)
@@ -842,6 +1054,311 @@ class Document:
 
         return matches
 
+    def iter_matches(
+        self,
+        text: str,
+        regex: bool = False,
+        case_sensitive: bool = True,
+        scope: str | dict | Any | None = None,
+        context_chars: int = 40,
+        fuzzy: float | dict[str, Any] | None = None,
+        include_deleted: bool = False,
+        include_footnotes: bool = False,
+        include_endnotes: bool = False,
+    ) -> Iterator[Match]:
+        """Yield occurrences of text lazily, in document order.
+
+        Takes the same arguments as find_all(), but searches only as far as
+        the caller consumes the iterator, and each match computes its
+        context, location, paragraph_index and paragraph_text the first time
+        they are read. Use it to stop at the first match or to check whether
+        text occurs more than once without searching the whole document.
+
+        Matches read their metadata from the document when it is accessed,
+        so read it before editing the document.
+
+        Args:
+            text: The text or regex pattern to search for
+            regex: Whether to treat text as a regex pattern (default: False)
+            case_sensitive: Whether to perform case-sensitive search (default: True)
+            scope: Limit search scope, as for find_all()
+            context_chars: Number of characters to show before/after match (default: 40)
+            fuzzy: Fuzzy matching configuration, as for find_all()
+            include_deleted: If True, include text inside tracked deletions
+                (default: False)
+            include_footnotes: If True, also search within footnotes (default: False)
+            include_endnotes: If True, also search within endnotes (default: False)
+
+        Yields:
+            Match objects (LazyMatch) with deferred metadata
+
+        Raises:
+            re.error: If regex=True and the pattern is invalid
+            ImportError: If fuzzy matching requested but rapidfuzz not installed
+            ValueError: If both fuzzy and regex are specified
+
+        Example:
+            >>> # Is the term defined more than once?
+            >>> from itertools import islice
+            >>> len(list(islice(doc.iter_matches("Effective Date"), 2))) > 1
+            False
+            >>>
+            >>> first = next(doc.iter_matches("Confidential"), None)
+        """
+        note_scope = parse_note_scope(scope) if isinstance(scope, str) else None
+        if note_scope is not None:
+            yield from self._find_all_in_notes(
+                text,
+                note_scope,
+                regex=regex,
+                case_sensitive=case_sensitive,
+                context_chars=context_chars,
+                fuzzy=fuzzy,
+                include_deleted=include_deleted,
+            )
+            return
+
+        from .fuzzy import parse_fuzzy_config
+
+        self._text_index.resume()
+        positions = self._positions()
+        paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
+
+        spans = self._text_search.iter_text(
+            text,
+            paragraphs,
+            case_sensitive=case_sensitive,
+            regex=regex,
+            fuzzy=parse_fuzzy_config(fuzzy),
+            include_deleted=include_deleted,
+        )
+
+        index = 0
+        for span in spans:
+            yield LazyMatch(
+                index=index,
+                text=span.text,
+                span=span,
+                loaders=self._match_loaders(span, positions, context_chars),
+            )
+            index += 1
+
+        note_scopes = []
+        if include_footnotes:
+            note_scopes.append(NoteScope(scope_type="footnotes"))
+        if include_endnotes:
+            note_scopes.append(NoteScope(scope_type="endnotes"))
+        for extra_scope in note_scopes:
+            note_matches = self._find_all_in_notes(
+                text,
+                extra_scope,
+                regex=regex,
+                case_sensitive=case_sensitive,
+                context_chars=context_chars,
+                fuzzy=fuzzy,
+                include_deleted=include_deleted,
+            )
+            for note_match in note_matches:
+                note_match.index = index
+                index += 1
+                yield note_match
+
+    def _match_loaders(
+        self, span: TextSpan, positions: PositionIndex, context_chars: int
+    ) -> dict[str, Callable[[], Any]]:
+        """Build the functions that compute a LazyMatch's deferred metadata.
+
+        Args:
+            span: The matched TextSpan
+            positions: Positional index of the searched document
+            context_chars: Number of characters of context before/after
+
+        Returns:
+            Dict mapping attribute names to functions computing them
+        """
+        paragraph = span.paragraph
+        return {
+            "context": lambda: self._get_context_with_size(span, context_chars),
+            "paragraph_index": lambda: positions.paragraph_index(paragraph),
+            "paragraph_text": lambda: "".join(
+                elem.text or "" for elem in paragraph.findall(f".//{{{WORD_NAMESPACE}}}t")
+            ),
+            "location": lambda: self._get_location_string(paragraph, positions),
+        }
+
+    def find_all_many(
+        self,
+        patterns: list[str],
+        regex: bool = False,
+        case_sensitive: bool = True,
+        scope: str | dict | Any | None = None,
+        context_chars: int = 40,
+        normalize_special_chars: bool = False,
+        include_deleted: bool = False,
+    ) -> list[Match]:
+        """Find all occurrences of many patterns in a single pass over the document.
+
+        Equivalent to calling find_all() once per pattern, but the document is
+        traversed only once: literal patterns are matched together with an
+        Aho-Corasick automaton, and regex patterns are scanned together as
+        one alternation, each pattern then being tried only where the
+        alternation matched. Regexes with inline flags or numbered group
+        references are scanned one at a time. Use this to check a document
+        against a large set of terms or rules.
+
+        Args:
+            patterns: The texts or regex patterns to search for. Duplicates
+                are searched once.
+            regex: Whether to treat patterns as regexes (default: False)
+            case_sensitive: Whether to perform case-sensitive search (default: True)
+            scope: Limit search scope, as for find_all() (including note scopes
+                such as "footnotes" or "endnote:2")
+            context_chars: Number of characters to show before/after match (default: 40)
+            normalize_special_chars: Match smart quotes, bullets and dashes
+                against their ASCII equivalents in literal patterns (default: False)
+            include_deleted: If True, include text inside tracked deletions when
+                searching. If False (default), skip text in w:del elements.
+
+        Returns:
+            List of Match objects in document order, each with `pattern` set to
+            the pattern that produced it. Matches at the same position are
+            ordered as their patterns were given.
+
+        Raises:
+            re.error: If regex=True and a pattern is invalid
+            ValueError: If a literal pattern is empty
+
+        Example:
+            >>> matches = doc.find_all_many(["Licensor", "Licensee", "Effective Date"])
+            >>> for match in matches:
+            ...     print(f"{match.pattern}: {match.location}")
+            Licensor: body
+            Effective Date: body
+            >>>
+            >>> # Regex rules, case-insensitive
+            >>> matches = doc.find_all_many(
+            ...     [r"\\d+ days", r"shall not"], regex=True, case_sensitive=False
+            ... )
+        """
+        patterns = list(dict.fromkeys(patterns))
+
+        # Each group is a list of paragraphs, a location (None for body
+        # paragraphs) and a function giving the paragraph_index of each
+        groups: list[tuple[list[Any], str | None, Callable[[Any], int]]] = []
+        note_scope = parse_note_scope(scope) if isinstance(scope, str) else None
+        if note_scope is not None:
+            search_footnotes = note_scope.scope_type in ("footnotes", "footnote", "notes")
+            search_endnotes = note_scope.scope_type in ("endnotes", "endnote", "notes")
+            self._text_index.resume()
+            footnotes, endnotes = self._read_notes()
+            notes: list[tuple[str, Footnote | Endnote]] = [
+                *(("footnote", note) for note in (footnotes if search_footnotes else [])),
+                *(("endnote", note) for note in (endnotes if search_endnotes else [])),
+            ]
+            for kind, note in notes:
+                if note_scope.note_id is not None and note.id != note_scope.note_id:
+                    continue
+                note_paragraphs = [p._element for p in note.paragraphs]
+                ordinals = {p: i for i, p in enumerate(note_paragraphs)}
+                groups.append((note_paragraphs, f"{kind}:{note.id}", ordinals.__getitem__))
+        else:
+            self._text_index.resume()
+            positions = self._positions()
+            paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
+            groups.append((paragraphs, None, positions.paragraph_index))
+
+        matches: list[Match] = []
+        for paragraphs, location, paragraph_index in groups:
+            if not paragraphs:
+                continue
+
+            found = self._text_search.find_text_many(
+                patterns,
+                paragraphs,
+                case_sensitive=case_sensitive,
+                regex=regex,
+                normalize_special_chars=normalize_special_chars,
+                include_deleted=include_deleted,
+            )
+
+            for pattern_idx, span in found:
+                paragraph = span.paragraph
+                text_elements = paragraph.findall(f".//{{{WORD_NAMESPACE}}}t")
+                matches.append(
+                    Match(
+                        index=len(matches),
+                        text=span.text,
+                        context=self._get_context_with_size(span, context_chars),
+                        paragraph_index=paragraph_index(paragraph),
+                        paragraph_text="".join(elem.text or "" for elem in text_elements),
+                        location=location or self._get_location_string(paragraph),
+                        span=span,
+                        pattern=patterns[pattern_idx],
+                    )
+                )
+
+        return matches
+
+    def find_all_spanning(
+        self,
+        text: str,
+        regex: bool = False,
+        case_sensitive: bool = True,
+        scope: str | dict | Any | None = None,
+        separator: str = "\n",
+        normalize_special_chars: bool = False,
+        include_deleted: bool = False,
+    ) -> list[MultiParagraphSpan]:
+        """Find text that may cross paragraph breaks.
+
+        find_all() searches each paragraph on its own, so a clause that
+        wraps into the next paragraph or list item is never found. This
+        searches the paragraphs in scope as one text, joined by `separator`,
+        and maps each match back to the runs of every paragraph it covers.
+
+        Args:
+            text: The text or regex pattern to search for, with `separator`
+                (or, for a regex, a pattern such as \\s+) at paragraph breaks
+            regex: Whether to treat text as a regex pattern (default: False)
+            case_sensitive: Whether to perform case-sensitive search (default: True)
+            scope: Limit search scope, as for find_all() (note scopes excepted)
+            separator: Text placed between paragraphs (default: "\\n")
+            normalize_special_chars: Match smart quotes, bullets and dashes
+                against their ASCII equivalents (default: False)
+            include_deleted: If True, include text inside tracked deletions when
+                searching. If False (default), skip text in w:del elements.
+
+        Returns:
+            List of MultiParagraphSpan objects in document order, each holding
+            one TextSpan per paragraph the match covers
+
+        Raises:
+            re.error: If regex=True and the pattern is invalid
+
+        Example:
+            >>> spans = doc.find_all_spanning(r"shall\\s+indemnify", regex=True)
+            >>> for span in spans:
+            ...     print(len(span.paragraphs), repr(span.text))
+            2 'shall\\nindemnify'
+        """
+        self._text_index.resume()
+        positions = self._positions()
+        paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
+
+        # Text box paragraphs are already part of the paragraph anchoring them
+        p_tag = f"{{{WORD_NAMESPACE}}}p"
+        paragraphs = [p for p in paragraphs if next(p.iterancestors(p_tag), None) is None]
+
+        return self._text_search.find_text_spanning(
+            text,
+            paragraphs,
+            separator=separator,
+            case_sensitive=case_sensitive,
+            regex=regex,
+            normalize_special_chars=normalize_special_chars,
+            include_deleted=include_deleted,
+        )
+
     def _find_all_in_notes(
         self,
         text: str,
@@ -877,9 +1394,11 @@ class Document:
         search_endnotes = note_scope.scope_type in ("endnotes", "endnote", "notes")
         specific_note_id = note_scope.note_id
 
+        self._text_index.resume()
+        footnotes, endnotes = self._read_notes()
+
         # Search footnotes
         if search_footnotes:
-            footnotes = self.footnotes
             for footnote in footnotes:
                 # If searching specific note, skip others
                 if specific_note_id is not None and footnote.id != specific_note_id:
@@ -927,7 +1446,6 @@ class Document:
 
         # Search endnotes
         if search_endnotes:
-            endnotes = self.endnotes
             for endnote in endnotes:
                 # If searching specific note, skip others
                 if specific_note_id is not None and endnote.id != specific_note_id:
@@ -1061,7 +1579,7 @@ class Document:
             include_deleted=include_deleted,
         )
 
-    def _get_location_string(self, paragraph: Any) -> str:
+    def _get_location_string(self, paragraph: Any, positions: PositionIndex | None = None) -> str:
         """Get a human-readable location string for a paragraph.
 
         Returns strings like:
@@ -1072,6 +1590,8 @@ class Document:
 
         Args:
             paragraph: The paragraph Element
+            positions: Positional index of the document (default: None, uses
+                the index for the current generation)
 
         Returns:
             A human-readable location string
@@ -1082,7 +1602,7 @@ class Document:
             tag = parent.tag
             if tag == f"{{{WORD_NAMESPACE}}}tc":  # Table cell
                 # Find table, row, and cell indices
-                return self._get_table_location(parent)
+                return self._get_table_location(parent, positions)
             elif tag == f"{{{WORD_NAMESPACE}}}hdr":  # Header
                 # Find which header (first, default, even)
                 return "header"
@@ -1096,11 +1616,13 @@ class Document:
 
         return "body"
 
-    def _get_table_location(self, cell: Any) -> str:
+    def _get_table_location(self, cell: Any, positions: PositionIndex | None = None) -> str:
         """Get detailed location string for a table cell.
 
         Args:
             cell: The table cell Element
+            positions: Positional index of the document (default: None, uses
+                the index for the current generation)
 
         Returns:
             Location string like "table:0:row:2:cell:1"
@@ -1120,10 +1642,11 @@ class Document:
         if table is None or table.tag != f"{{{WORD_NAMESPACE}}}tbl":
             return "table"
 
-        # Get all tables in document
-        all_tables = list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}tbl"))
+        # Get the table's position among all tables in the document
+        if positions is None or positions.root is not self.xml_root:
+            positions = self._positions()
         try:
-            table_idx = all_tables.index(table)
+            table_idx = positions.table_index(table)
         except ValueError:
             table_idx = 0
 
@@ -1641,6 +2164,25 @@ class Document:
             regex=regex,
         )
 
+    def deduplicate_media(self) -> int:
+        """Collapse media parts with identical contents into a single part.
+
+        Images inserted through this library are already stored once per
+        distinct content. This also collapses duplicates that were in the
+        document when it was loaded: relationships are pointed at one copy
+        and the others are removed. Pass `deduplicate_media=True` to save()
+        to do this automatically.
+
+        Returns:
+            Number of media parts removed
+
+        Example:
+            >>> doc = Document("contract.docx")
+            >>> removed = doc.deduplicate_media()
+            >>> doc.save("contract_small.docx")
+        """
+        return self._image_ops.deduplicate_media()
+
     def delete_tracked(
         self,
         text: str,
@@ -2514,21 +3056,33 @@ class Document:
         self,
         change_type: str | None = None,
         author: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        paragraph_range: tuple[int, int] | None = None,
     ) -> list["TrackedChange"]:
         """Get all tracked changes in the document.
 
         Returns a list of TrackedChange objects representing insertions, deletions,
-        moves, and formatting changes with their metadata.
+        moves, and formatting changes with their metadata, in document order.
+        Each change's text and date are read the first time they are accessed.
 
         Args:
             change_type: Optional filter by change type. Valid values:
                          "insertion", "deletion", "move_from", "move_to",
                          "format_run", "format_paragraph", or None for all.
             author: Optional filter by author name.
+            since: Optional earliest change date (inclusive).
+            until: Optional latest change date (inclusive).
+            paragraph_range: Optional (start, end) paragraph indices, as in
+                doc.paragraphs, with end exclusive. Only changes inside those
+                paragraphs are returned.
 
         Returns:
             List of TrackedChange objects matching the criteria.
 
+        Raises:
+            ValueError: If change_type is not a valid type
+
         Example:
             >>> # Get all changes
             >>> changes = doc.get_tracked_changes()
@@ -2541,71 +3095,130 @@ class Document:
             >>> # Get changes by specific author
             >>> johns_changes = doc.get_tracked_changes(author="John Doe")
         """
-        from python_docx_redline.models.tracked_change import ChangeType, TrackedChange
+        return list(
+            self.iter_tracked_changes(
+                change_type=change_type,
+                author=author,
+                since=since,
+                until=until,
+                paragraph_range=paragraph_range,
+            )
+        )
 
-        changes: list[TrackedChange] = []
+    def iter_tracked_changes(
+        self,
+        change_type: str | None = None,
+        author: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        paragraph_range: tuple[int, int] | None = None,
+    ) -> Iterator["TrackedChange"]:
+        """Yield tracked changes lazily, in document order.
 
-        # Map string type names to ChangeType enum values
-        type_map = {
-            "insertion": ChangeType.INSERTION,
-            "deletion": ChangeType.DELETION,
-            "move_from": ChangeType.MOVE_FROM,
-            "move_to": ChangeType.MOVE_TO,
-            "format_run": ChangeType.FORMAT_RUN,
-            "format_paragraph": ChangeType.FORMAT_PARAGRAPH,
-        }
+        Takes the same arguments as get_tracked_changes(). The document is
+        traversed once, only as far as the caller consumes the iterator, and
+        only the changes that pass every filter are built. Use it to page
+        through the changes of a large document.
+
+        Dates without a time zone, in the filters or in the document, are
+        taken to be UTC. Changes without a date are skipped when since or
+        until is given.
+
+        Args:
+            change_type: Optional filter by change type, as for
+                get_tracked_changes()
+            author: Optional filter by author name.
+            since: Optional earliest change date (inclusive).
+            until: Optional latest change date (inclusive).
+            paragraph_range: Optional (start, end) paragraph indices, end
+                exclusive.
+
+        Yields:
+            TrackedChange objects (LazyTrackedChange) matching the criteria
+
+        Raises:
+            ValueError: If change_type is not a valid type
 
-        # Validate change_type if provided
-        filter_type: ChangeType | None = None
+        Example:
+            >>> from itertools import islice
+            >>> page = list(islice(doc.iter_tracked_changes(author="Legal"), 50, 100))
+        """
+        from python_docx_redline.models.tracked_change import CHANGE_TYPES_BY_TAG
+
+        # Validate change_type before the first change is requested
+        tags = list(CHANGE_TYPES_BY_TAG)
         if change_type is not None:
-            if change_type not in type_map:
-                valid_types = ", ".join(sorted(type_map.keys()))
+            tags = [tag for tag in tags if CHANGE_TYPES_BY_TAG[tag].value == change_type]
+            if not tags:
+                valid_types = ", ".join(sorted(t.value for t in CHANGE_TYPES_BY_TAG.values()))
                 raise ValueError(f"Invalid change_type '{change_type}'. Valid types: {valid_types}")
-            filter_type = type_map[change_type]
-
-        # Collect insertions (w:ins)
-        if filter_type is None or filter_type == ChangeType.INSERTION:
-            for ins in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}ins"):
-                change = TrackedChange.from_element(ins, ChangeType.INSERTION, self)
-                if author is None or change.author == author:
-                    changes.append(change)
-
-        # Collect deletions (w:del)
-        if filter_type is None or filter_type == ChangeType.DELETION:
-            for del_elem in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}del"):
-                change = TrackedChange.from_element(del_elem, ChangeType.DELETION, self)
-                if author is None or change.author == author:
-                    changes.append(change)
-
-        # Collect move sources (w:moveFrom)
-        if filter_type is None or filter_type == ChangeType.MOVE_FROM:
-            for move_from in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}moveFrom"):
-                change = TrackedChange.from_element(move_from, ChangeType.MOVE_FROM, self)
-                if author is None or change.author == author:
-                    changes.append(change)
-
-        # Collect move destinations (w:moveTo)
-        if filter_type is None or filter_type == ChangeType.MOVE_TO:
-            for move_to in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}moveTo"):
-                change = TrackedChange.from_element(move_to, ChangeType.MOVE_TO, self)
-                if author is None or change.author == author:
-                    changes.append(change)
-
-        # Collect run property changes (w:rPrChange)
-        if filter_type is None or filter_type == ChangeType.FORMAT_RUN:
-            for rpr_change in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}rPrChange"):
-                change = TrackedChange.from_element(rpr_change, ChangeType.FORMAT_RUN, self)
-                if author is None or change.author == author:
-                    changes.append(change)
-
-        # Collect paragraph property changes (w:pPrChange)
-        if filter_type is None or filter_type == ChangeType.FORMAT_PARAGRAPH:
-            for ppr_change in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}pPrChange"):
-                change = TrackedChange.from_element(ppr_change, ChangeType.FORMAT_PARAGRAPH, self)
-                if author is None or change.author == author:
-                    changes.append(change)
-
-        return changes
+
+        def utc(date: datetime) -> datetime:
+            return date if date.tzinfo is not None else date.replace(tzinfo=timezone.utc)
+
+        earliest = utc(since) if since is not None else None
+        latest = utc(until) if until is not None else None
+
+        return self._iter_tracked_changes(tags, author, earliest, latest, paragraph_range)
+
+    def _iter_tracked_changes(
+        self,
+        tags: list[str],
+        author: str | None,
+        earliest: datetime | None,
+        latest: datetime | None,
+        paragraph_range: tuple[int, int] | None,
+    ) -> Iterator["TrackedChange"]:
+        """Traverse the document once for iter_tracked_changes()."""
+        from python_docx_redline.models.tracked_change import (
+            CHANGE_TYPES_BY_TAG,
+            LazyTrackedChange,
+            parse_change_date,
+        )
+
+        paragraph_tag = f"{{{WORD_NAMESPACE}}}p"
+        author_attr = f"{{{WORD_NAMESPACE}}}author"
+        date_attr = f"{{{WORD_NAMESPACE}}}date"
+
+        # Paragraphs are only visited when filtering by paragraph
+        start, end = paragraph_range if paragraph_range is not None else (0, 0)
+        if paragraph_range is not None:
+            elements = self.xml_root.iter(paragraph_tag, *tags)
+        else:
+            elements = self.xml_root.iter(*tags)
+        paragraph_index: dict[Any, int] = {}
+
+        for element in elements:
+            if element.tag == paragraph_tag:
+                index = len(paragraph_index)
+                if index >= end and next(element.iterancestors(paragraph_tag), None) is None:
+                    # Past the range; later changes are in later paragraphs
+                    return
+                paragraph_index[element] = index
+                continue
+
+            if author is not None and element.get(author_attr) != author:
+                continue
+
+            if earliest is not None or latest is not None:
+                date = parse_change_date(element.get(date_attr))
+                if date is None:
+                    continue
+                if date.tzinfo is None:
+                    date = date.replace(tzinfo=timezone.utc)
+                if (earliest is not None and date < earliest) or (
+                    latest is not None and date > latest
+                ):
+                    continue
+
+            if paragraph_range is not None:
+                paragraph = next(element.iterancestors(paragraph_tag), None)
+                if paragraph is None or not start <= paragraph_index[paragraph] < end:
+                    continue
+
+            change = LazyTrackedChange(element, CHANGE_TYPES_BY_TAG[element.tag], self)
+            self._listed_changes[id(change)] = change
+            yield change
 
     def accept_changes(
         self,
@@ -2739,16 +3352,9 @@ class Document:
             >>> print(f"Rejected {count} changes")
         """
         ids = self._edit_groups.get_group_ids(group_name)
-        count = 0
 
         # Reject in reverse order to handle nested elements properly
-        for change_id in reversed(ids):
-            try:
-                self._change_mgmt.reject_change(change_id)
-                count += 1
-            except ValueError:
-                # Change may have already been rejected or no longer exists
-                pass
+        count = self._change_mgmt.reject_ids(ids)
 
         self._edit_groups.mark_rejected(group_name)
         return count
@@ -2777,18 +3383,9 @@ class Document:
             >>> print(f"Accepted {count} changes")
         """
         ids = self._edit_groups.get_group_ids(group_name)
-        count = 0
 
         # Accept in reverse order to handle nested elements properly
-        for change_id in reversed(ids):
-            try:
-                self._change_mgmt.accept_change(change_id)
-                count += 1
-            except ValueError:
-                # Change may have already been accepted or no longer exists
-                pass
-
-        return count
+        return self._change_mgmt.accept_ids(ids)
 
     # Accept/Reject by text content
 
@@ -3606,31 +4203,27 @@ class Document:
             ValidationError: If document validation fails. Error includes detailed
                 list of validation issues for bug reporting.
         """
-        if not self._is_zip or not self._temp_dir:
+        if self._package is None:
             raise ValidationError(
                 "Cannot validate: document was not loaded from a .docx file. "
                 "Validation only works on full .docx documents."
             )
 
-        # Write the current XML state to temp directory
-        document_xml = self._temp_dir / "word" / "document.xml"
-        self.xml_tree.write(
-            str(document_xml),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=False,
-        )
+        # Write the current XML state to the package
+        self._package.set_part("word/document.xml", self.xml_root)
 
         # Run full validation
         from .validation_docx import DOCXSchemaValidator
 
-        validator = DOCXSchemaValidator(
-            unpacked_dir=self._temp_dir,
-            original_file=self.path,
-            verbose=verbose,
-        )
+        with self._package.unpacked() as unpacked_dir:
+            validator = DOCXSchemaValidator(
+                unpacked_dir=unpacked_dir,
+                original_file=self.path,
+                verbose=verbose,
+            )
+            is_valid = validator.validate()
 
-        if not validator.validate():
+        if not is_valid:
             raise ValidationError(
                 "Document validation failed. Please report this as a bug. "
                 "See validation errors above for details."
@@ -3638,19 +4231,162 @@ class Document:
 
         return True
 
+    @property
+    def is_modified(self) -> bool:
+        """Check whether the document differs from the package it was loaded from.
+
+        The tree is not serialized. Parts written through the package are
+        tracked by its modification generation. Edits to xml_root are tracked
+        by the text index generation, which tracked operations and wrapper
+        setters bump for each paragraph they edit, and by a document
+        generation bumped whenever another component that edits the tree is
+        handed out.
+
+        Edits made directly to the elements of xml_root are not counted
+        here. Saving still writes them: before treating a save as a no-op,
+        the tree is compared with the stored main document part.
+
+        After saving over the original file, that file becomes the reference.
+        Raw XML documents always count as modified.
+
+        Returns:
+            True if saving would write anything other than the original package
+
+        Example:
+            >>> doc = Document("contract.docx")
+            >>> doc.is_modified
+            False
+            >>> doc.replace_tracked("30 days", "45 days")
+            >>> doc.is_modified
+            True
+        """
+        if self._package is None:
+            return True
+        if hasattr(self, "_style_manager_instance") and self._style_manager_instance.is_modified:
+            return True
+        if self._package.is_modified():
+            return True
+        return self._tree_generation() != self._saved_generation
+
+    def _tree_generation(self) -> tuple[int, int]:
+        """Get the counters that advance whenever xml_root may have been edited."""
+        return self._text_index.generation, self._edit_generation
+
+    def _tree_differs_from_package(self) -> bool:
+        """Compare xml_root with the stored main document part, byte for byte.
+
+        Catches edits made directly to the tree, which no generation counts.
+        """
+        assert self._package is not None
+        stored = self._package.get_part_bytes("word/document.xml")
+        if stored is None:
+            return True
+        if stored.startswith(b"<?xml"):
+            stored = stored[stored.index(b"?>") + 2 :]
+        current = etree.tostring(self.xml_root, encoding="utf-8", xml_declaration=False)
+        return current != stored.strip()
+
+    def _prepare_package_for_save(self, validate: bool, deduplicate_media: bool = False) -> bool:
+        """Write pending changes into the package and optionally validate it.
+
+        Args:
+            validate: Whether to run the DOCX schema validator on the package
+            deduplicate_media: Whether to collapse media parts with identical
+                contents first
+
+        Returns:
+            True if nothing changed, in which case the package is left as it
+            was loaded and validation is skipped
+
+        Raises:
+            ValidationError: If validation fails
+        """
+        assert self._package is not None
+
+        if deduplicate_media:
+            self.deduplicate_media()
+
+        if not self.is_modified and not self._tree_differs_from_package():
+            return True
+
+        # Save style changes if the StyleManager was accessed and modified
+        if hasattr(self, "_style_manager_instance"):
+            self._style_manager_instance.save()
+
+        # Write the modified XML back to the package
+        self._package.set_part("word/document.xml", self.xml_root)
+        self._saved_generation = self._tree_generation()
+
+        # Validate the full document structure before creating ZIP
+        # This catches OOXML spec violations that would produce broken Word files
+        if validate:
+            from .validation_docx import DOCXSchemaValidator
+
+            with self._package.unpacked() as unpacked_dir:
+                validator = DOCXSchemaValidator(
+                    unpacked_dir=unpacked_dir,
+                    original_file=self.path,
+                    verbose=False,
+                )
+                is_valid = validator.validate()
+            if not is_valid:
+                # Collect all validation errors for detailed bug reporting
+                error_list = validator.all_errors if hasattr(validator, "all_errors") else []
+                raise ValidationError(
+                    "Document validation failed. Please report this as a bug. "
+                    "See validation errors above for details.",
+                    errors=error_list,
+                )
+        return False
+
+    def _run_strict_validation(self, docx_path: Path) -> None:
+        """Validate a saved .docx file with the external OOXML-Validator.
+
+        Args:
+            docx_path: Path to the saved document
+
+        Raises:
+            OOXMLValidationError: If the validator reports errors
+        """
+        from .ooxml_validator import (
+            OOXMLValidationError,
+            is_ooxml_validator_available,
+            validate_with_ooxml_validator,
+        )
+
+        if is_ooxml_validator_available():
+            errors = validate_with_ooxml_validator(docx_path)
+            if errors:
+                raise OOXMLValidationError(
+                    f"Strict OOXML validation failed with {len(errors)} error(s)",
+                    errors,
+                )
+        else:
+            logger.warning(
+                "strict_validation requested but OOXML-Validator not available. "
+                "Install from https://github.com/mikeebowen/OOXML-Validator"
+            )
+
     def save(
         self,
-        output_path: str | Path | None = None,
+        output_path: str | Path | BinaryIO | None = None,
         validate: bool = True,
         strict_validation: bool = False,
-    ) -> None:
+        compression: CompressionPolicy | None = None,
+        deduplicate_media: bool = False,
+    ) -> SaveResult:
         """Save the document to a file.
 
         Validates the document structure before saving to ensure OOXML compliance
         and prevent broken Word files in production.
 
+        If nothing changed since the document was loaded (see is_modified), the
+        original package is copied to the destination without re-serializing or
+        validating it, and saving over the original file does nothing at all.
+
         Args:
-            output_path: Path to save the document. If None, saves to original path.
+            output_path: Path to save the document, or a writable binary file-like
+                        object (see save_to_stream()). If None, saves to original path.
                         For in-memory documents (loaded from bytes), output_path is required.
             validate: Whether to run Python-based OOXML validation (default: True).
                      Validation is strongly recommended to catch errors before production.
@@ -3659,12 +4395,31 @@ class Document:
                      the external OOXML-Validator tool (default: False). Only runs if
                      the validator is installed. Set to True for maximum confidence
                      in OOXML compliance. See: https://github.com/mikeebowen/OOXML-Validator
+            compression: Per-member compression settings, e.g.
+                     CompressionPolicy.fast() to store media and deflate XML on all
+                     cores. Default deflates modified members at the zlib default level.
+            deduplicate_media: Whether to collapse media parts with identical
+                     contents into one before saving (default: False). See
+                     deduplicate_media().
+
+        Returns:
+            SaveResult reporting whether the save was a no-op and whether the
+            document was validated
 
         Raises:
             ValidationError: If document validation fails. Error includes detailed
                 list of validation issues for bug reporting.
             ValueError: If output_path is not provided for in-memory documents.
         """
+        if output_path is not None and not isinstance(output_path, str | Path):
+            return self.save_to_stream(
+                output_path,
+                validate=validate,
+                strict_validation=strict_validation,
+                compression=compression,
+                deduplicate_media=deduplicate_media,
+            )
+
         if output_path is None:
             if self.path is None:
                 raise ValueError(
@@ -3677,65 +4432,24 @@ class Document:
 
         try:
             if self._package is not None:
-                # Save style changes if the StyleManager was accessed and modified
-                if hasattr(self, "_style_manager_instance"):
-                    self._style_manager_instance.save()
-
-                # Write the modified XML back to the package
-                self._package.set_part("word/document.xml", self.xml_root)
-
-                # Validate the full document structure before creating ZIP
-                # This catches OOXML spec violations that would produce broken Word files
-                if validate:
-                    from .validation_docx import DOCXSchemaValidator
-
-                    validator = DOCXSchemaValidator(
-                        unpacked_dir=self._package.temp_dir,
-                        original_file=self.path,
-                        verbose=False,
-                    )
-                    if not validator.validate():
-                        # Collect all validation errors for detailed bug reporting
-                        error_list = (
-                            validator.all_errors if hasattr(validator, "all_errors") else []
-                        )
-                        raise ValidationError(
-                            "Document validation failed. Please report this as a bug. "
-                            "See validation errors above for details.",
-                            errors=error_list,
-                        )
+                unchanged = self._prepare_package_for_save(validate, deduplicate_media)
 
                 # Save the package to the output path
-                self._package.save(output_path)
+                self._package.save(output_path, compression=compression)
 
                 # Run strict OOXML validation if requested
                 if strict_validation:
-                    from .ooxml_validator import (
-                        OOXMLValidationError,
-                        is_ooxml_validator_available,
-                        validate_with_ooxml_validator,
-                    )
-
-                    if is_ooxml_validator_available():
-                        errors = validate_with_ooxml_validator(output_path)
-                        if errors:
-                            raise OOXMLValidationError(
-                                f"Strict OOXML validation failed with {len(errors)} error(s)",
-                                errors,
-                            )
-                    else:
-                        logger.warning(
-                            "strict_validation requested but OOXML-Validator not available. "
-                            "Install from https://github.com/mikeebowen/OOXML-Validator"
-                        )
-            else:
-                # Save XML directly (raw XML file, not a package)
-                self.xml_tree.write(
-                    str(output_path),
-                    encoding="utf-8",
-                    xml_declaration=True,
-                    pretty_print=False,
-                )
+                    self._run_strict_validation(output_path)
+                return SaveResult(unchanged=unchanged, validated=validate and not unchanged)
+
+            # Save XML directly (raw XML file, not a package)
+            self.xml_tree.write(
+                str(output_path),
+                encoding="utf-8",
+                xml_declaration=True,
+                pretty_print=False,
+            )
+            return SaveResult(unchanged=False, validated=False)
 
         except ValidationError:
             # Re-raise ValidationError with all its attributes intact
@@ -3746,10 +4460,85 @@ class Document:
                 raise
             raise ValidationError(f"Failed to save document: {e}") from e
 
+    def save_to_stream(
+        self,
+        stream: BinaryIO,
+        validate: bool = True,
+        strict_validation: bool = False,
+        compression: CompressionPolicy | None = None,
+        deduplicate_media: bool = False,
+    ) -> SaveResult:
+        """Save the document into a writable binary stream.
+
+        Zip members are written straight into the stream, so the archive is never
+        materialized in memory. The stream does not need to be seekable: HTTP
+        response bodies, pipes and spooled temp files all work. The stream is
+        left open.
+
+        Args:
+            stream: Writable binary file-like object
+            validate: Whether to run Python-based OOXML validation (default: True).
+                     As with save_to_bytes(), only runs when the document has an
+                     original file to compare against.
+            strict_validation: Whether to also run full OOXML spec validation using
+                     the external OOXML-Validator tool (default: False). The validator
+                     needs a file, so the document is saved to a temp file, validated,
+                     then copied into the stream.
+            compression: Per-member compression settings (see save())
+            deduplicate_media: Whether to collapse duplicate media first (see save())
+
+        Returns:
+            SaveResult reporting whether the save was a no-op and whether the
+            document was validated
+
+        Raises:
+            ValidationError: If validation fails
+
+        Example:
+            >>> doc = Document("contract.docx")
+            >>> doc.replace_tracked("old", "new")
+            >>> with open("out.docx", "wb") as f:
+            ...     doc.save_to_stream(f)
+        """
+        if self._package is None:
+            raise ValidationError("save_to_stream only supported for .docx files")
+
+        try:
+            validate = validate and self.path is not None
+            unchanged = self._prepare_package_for_save(validate, deduplicate_media)
+            result = SaveResult(unchanged=unchanged, validated=validate and not unchanged)
+
+            if not strict_validation:
+                self._package.save_to_stream(stream, compression=compression)
+                return result
+
+            # Strict validation needs a file on disk: validate it before
+            # anything is written to the stream
+            import shutil
+            import tempfile
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = Path(temp_dir) / "document.docx"
+                self._package.save(temp_path, compression=compression)
+                self._run_strict_validation(temp_path)
+                with open(temp_path, "rb") as f:
+                    shutil.copyfileobj(f, stream)
+            return result
+
+        except ValidationError:
+            raise
+        except Exception as e:
+            # Check if it's an OOXMLValidationError (from strict validation)
+            if type(e).__name__ == "OOXMLValidationError":
+                raise
+            raise ValidationError(f"Failed to save document to stream: {e}") from e
+
     def save_to_bytes(
         self,
         validate: bool = True,
         strict_validation: bool = False,
+        compression: CompressionPolicy | None = None,
+        deduplicate_media: bool = False,
     ) -> bytes:
         """Save the document to bytes (in-memory).
 
@@ -3758,6 +4547,9 @@ class Document:
         - Storing documents in databases
         - Sending documents over network
 
+        To write into a file, socket or response body without building the
+        whole archive in memory, use save_to_stream() instead.
+
         Args:
             validate: Whether to run Python-based OOXML validation (default: True).
                      Set to False for in-memory documents without an original file,
@@ -3765,9 +4557,12 @@ class Document:
             strict_validation: Whether to also run full OOXML spec validation using
                      the external OOXML-Validator tool (default: False). Only runs if
                      the validator is installed. Note: requires writing to a temp file.
+            compression: Per-member compression settings (see save())
+            deduplicate_media: Whether to collapse duplicate media first (see save())
 
         Returns:
-            bytes: The complete .docx file as bytes
+            bytes: The complete .docx file as bytes. If nothing changed since
+            the document was loaded, these are the original package bytes.
 
         Raises:
             ValidationError: If validation fails
@@ -3781,73 +4576,15 @@ class Document:
         if self._package is None:
             raise ValidationError("save_to_bytes only supported for .docx files")
 
-        try:
-            # Save style changes if the StyleManager was accessed and modified
-            if hasattr(self, "_style_manager_instance"):
-                self._style_manager_instance.save()
-
-            # Write the modified XML back to the package
-            self._package.set_part("word/document.xml", self.xml_root)
-
-            # Validate if requested and we have an original file to compare against
-            if validate and self.path is not None:
-                from .validation_docx import DOCXSchemaValidator
-
-                validator = DOCXSchemaValidator(
-                    unpacked_dir=self._package.temp_dir,
-                    original_file=self.path,
-                    verbose=False,
-                )
-                if not validator.validate():
-                    error_list = validator.all_errors if hasattr(validator, "all_errors") else []
-                    raise ValidationError(
-                        "Document validation failed. Please report this as a bug. "
-                        "See validation errors above for details.",
-                        errors=error_list,
-                    )
-
-            # Save to bytes using the package
-            doc_bytes = self._package.save_to_bytes()
-
-            # Run strict OOXML validation if requested (requires temp file)
-            if strict_validation:
-                import tempfile
-
-                from .ooxml_validator import (
-                    OOXMLValidationError,
-                    is_ooxml_validator_available,
-                    validate_with_ooxml_validator,
-                )
-
-                if is_ooxml_validator_available():
-                    with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as f:
-                        temp_path = Path(f.name)
-                        f.write(doc_bytes)
-
-                    try:
-                        errors = validate_with_ooxml_validator(temp_path)
-                        if errors:
-                            raise OOXMLValidationError(
-                                f"Strict OOXML validation failed with {len(errors)} error(s)",
-                                errors,
-                            )
-                    finally:
-                        temp_path.unlink(missing_ok=True)
-                else:
-                    logger.warning(
-                        "strict_validation requested but OOXML-Validator not available. "
-                        "Install from https://github.com/mikeebowen/OOXML-Validator"
-                    )
-
-            return doc_bytes
-
-        except ValidationError:
-            raise
-        except Exception as e:
-            # Check if it's an OOXMLValidationError (from strict validation)
-            if type(e).__name__ == "OOXMLValidationError":
-                raise
-            raise ValidationError(f"Failed to save document to bytes: {e}") from e
+        buffer = io.BytesIO()
+        self.save_to_stream(
+            buffer,
+            validate=validate,
+            strict_validation=strict_validation,
+            compression=compression,
+            deduplicate_media=deduplicate_media,
+        )
+        return buffer.getvalue()
 
     def render_to_images(
         self,
@@ -4033,6 +4770,11 @@ class Document:
         - Suggestions for failed edits (similar text that exists)
         - Dry run mode to preview changes without applying
 
+        Insert, delete and replace edits are found in one search of the
+        document and applied together. From the first edit that could match
+        text an earlier edit changes, edits are applied one at a time, so
+        the outcome is the same as applying each edit in turn.
+
         Args:
             edits: List of edits in any of these formats:
                 - Tuple: (old_text, new_text) - applies as tracked replace
@@ -4050,6 +4792,7 @@ class Document:
             - succeeded: List of EditResult for successful edits
             - failed: List of EditResult for failed edits with suggestions
             - summary: One-line summary string
+            - timings: Seconds spent searching, planning and applying
             - Pretty-print output via str(results)
 
         Example:
@@ -5713,6 +6456,8 @@ class Document:
             >>> element = doc.resolve_ref("p:5")  # Get 6th paragraph
             >>> element = doc.resolve_ref("tbl:0/row:1/cell:2")  # Table cell
         """
+        # Callers may edit the resolved element in place
+        self._edit_generation += 1
         return self._ref_registry.resolve_ref(ref)
 
     def get_ref(self, element: etree._Element, use_fingerprint: bool = False) -> "Ref":
@@ -5962,9 +6707,7 @@ class Document:
         # Create the insertion element
         if track:
             # Tracked insertion: wrap in <w:ins>
-            insertion_xml = self._xml_generator.create_insertion(text, author_name)
-            elements = self._tracked_ops._parse_xml_elements(insertion_xml)
-            insertion_element = elements[0]
+            insertion_element = self._xml_generator.create_insertion_element(text, author_name)
         else:
             # Untracked insertion: plain runs
             source_run = match.runs[0] if match.runs else None
@@ -6591,12 +7334,11 @@ class Document:
         # Helper function to perform a single replacement
         def do_replacement(match: "TextSpan") -> None:
             if track:
-                # Tracked replace: deletion + insertion XML
-                deletion_xml = self._xml_generator.create_deletion(match.text, author_name)
-                insertion_xml = self._xml_generator.create_insertion(replace, author_name)
-                elements = self._tracked_ops._parse_xml_elements(
-                    f"{deletion_xml}\n    {insertion_xml}"
-                )
+                # Tracked replace: deletion + insertion
+                elements = [
+                    self._xml_generator.create_deletion_element(match.text, author_name),
+                    self._xml_generator.create_insertion_element(replace, author_name),
+                ]
                 self._tracked_ops._replace_match_with_elements(match, elements)
             else:
                 # Untracked replace: just replace with plain runs
@@ -6746,9 +7488,7 @@ class Document:
 
         if track:
             # Tracked deletion: wrap in <w:del>
-            deletion_xml = self._xml_generator.create_deletion(match.text, author_name)
-            elements = self._tracked_ops._parse_xml_elements(deletion_xml)
-            deletion_element = elements[0]
+            deletion_element = self._xml_generator.create_deletion_element(match.text, author_name)
             self._tracked_ops._replace_match_with_element(match, deletion_element)
         else:
             # Untracked deletion: simply remove the matched text
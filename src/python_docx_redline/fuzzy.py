@@ -15,9 +15,25 @@ Example:
     True
 """
 
+import importlib.util
+import math
 import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator
+from itertools import islice
 from typing import Any
 
+# Slack for comparing scores computed in floating point with the threshold
+_EPSILON = 1e-9
+
+# Longest pattern whose windows fuzzy_find_all_batch() scores with
+# process.cdist; rapidfuzz compares these a machine word at a time, and
+# longer patterns are cheaper to follow with one LCS pass per start
+_CDIST_MAX_PATTERN_LEN = 64
+
+# Windows scored per process.cdist call, to bound the memory of their copies
+_CDIST_CHUNK = 100_000
+
 
 def normalize_whitespace(text: str) -> str:
     """Normalize whitespace in text for matching.
@@ -124,9 +140,13 @@ def fuzzy_find_all(
 ) -> list[tuple[int, int, float]]:
     """Find all fuzzy matches of pattern in text using sliding window.
 
-    This function uses a sliding window approach to find all occurrences of
-    pattern in text that meet the fuzzy matching threshold. It returns the
-    start/end positions and similarity scores of all matches.
+    Windows 0.7x-1.3x the pattern length are considered shortest first and
+    left to right, and a window at the threshold replaces the matches it
+    overlaps only if it scores higher than all of them. For the ratio,
+    levenshtein and partial_ratio algorithms, windows are only scored near
+    alignments of the pattern with the text, found with bit-parallel scans
+    (see _ratio_scores() and _PartialRatioWindows). The results are the same
+    as scoring every window.
 
     Args:
         text: The text to search in
@@ -136,7 +156,8 @@ def fuzzy_find_all(
         normalize_ws: Whether to normalize whitespace before matching
 
     Returns:
-        List of tuples (start_pos, end_pos, similarity_score) for each match
+        List of tuples (start_pos, end_pos, similarity_score) for each match,
+        sorted by position
 
     Raises:
         ImportError: If rapidfuzz is not installed
@@ -160,69 +181,820 @@ def fuzzy_find_all(
     if not 0 <= threshold <= 1:
         raise ValueError(f"Threshold must be between 0 and 1, got {threshold}")
 
-    # Validate algorithm
-    valid_algorithms = ["ratio", "partial_ratio", "token_sort_ratio", "levenshtein"]
-    if algorithm not in valid_algorithms:
-        raise ValueError(
-            f"Invalid algorithm '{algorithm}'. Must be one of: {', '.join(valid_algorithms)}"
-        )
+    # Select the similarity function ("levenshtein" uses normalized edit distance)
+    scorers = {
+        "ratio": fuzz.ratio,
+        "partial_ratio": fuzz.partial_ratio,
+        "token_sort_ratio": fuzz.token_sort_ratio,
+        "levenshtein": fuzz.ratio,
+    }
+    if algorithm not in scorers:
+        raise ValueError(f"Invalid algorithm '{algorithm}'. Must be one of: {', '.join(scorers)}")
 
     # Normalize whitespace if requested
     search_text = normalize_whitespace(text) if normalize_ws else text
     search_pattern = normalize_whitespace(pattern) if normalize_ws else pattern
+    if not search_pattern:
+        return []
 
-    matches: list[tuple[int, int, float]] = []
-    pattern_len = len(search_pattern)
+    windows: _PartialRatioWindows | _ScoredWindows
+    if algorithm == "partial_ratio":
+        windows = _PartialRatioWindows(search_text, search_pattern, threshold)
+    elif algorithm == "token_sort_ratio":
+        # Sorting tokens moves text around, so there is no alignment to follow
+        scorer = scorers[algorithm]
+        windows = _ScoredWindows(
+            _score_every_window(search_text, search_pattern, threshold, scorer)
+        )
+    else:
+        windows = _ScoredWindows(_ratio_scores(search_text, search_pattern, threshold))
+
+    return _select_matches(windows, threshold)
+
+
+def _window_lengths(pattern_len: int) -> tuple[int, int]:
+    """Get the shortest and longest window for a pattern (0.7x-1.3x its length)."""
+    return max(1, int(pattern_len * 0.7)), int(pattern_len * 1.3)
+
+
+def _similarity(distance: int, length: int) -> float:
+    """Compute a ratio score exactly as rapidfuzz does, scaled to 0.0-1.0.
+
+    Args:
+        distance: Insertions and deletions between the two strings
+        length: Combined length of the two strings
+
+    Returns:
+        The similarity, equal to fuzz.ratio() / 100.0 for those strings
+    """
+    return (1.0 - distance / length) * 100 / 100.0
+
+
+def _min_common(threshold: float, length: int, other_len: int) -> int:
+    """Get the shortest LCS with which two strings reach the threshold.
+
+    Args:
+        threshold: Similarity threshold (0.0 to 1.0)
+        length: Length of one string
+        other_len: Length of the other string
+
+    Returns:
+        The LCS length, or one more than the shorter length if none reaches it
+    """
+    total = length + other_len
+    return bisect_left(
+        range(min(length, other_len) + 1),
+        True,
+        key=lambda common: _similarity(total - 2 * common, total) >= threshold,
+    )
+
+
+def _pattern_masks(pattern: str) -> dict[str, int]:
+    """Map each character of the pattern to the bit set of its positions."""
+    masks: dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _start_distances(pattern: str, text: str) -> list[int]:
+    """Find how closely the pattern occurs starting at each position of text.
+
+    Runs Myers' bit-parallel algorithm backwards over the text, with the
+    pattern positions as the bits of a Python integer.
+
+    Args:
+        pattern: The pattern to search for
+        text: The text to search in
+
+    Returns:
+        For each start position from 0 to len(text), the lowest Levenshtein
+        distance between the pattern and a substring of text starting there
+    """
+    masks = _pattern_masks(pattern[::-1])
+    full = (1 << len(pattern)) - 1
+    last = 1 << (len(pattern) - 1)
+    positive, negative = full, 0
+    distance = len(pattern)
+    distances = [distance]
+    for char in reversed(text):
+        match = masks.get(char, 0)
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        up = negative | (~(horizontal | positive) & full)
+        down = positive & horizontal
+        if up & last:
+            distance += 1
+        elif down & last:
+            distance -= 1
+        up = (up << 1) & full
+        down = (down << 1) & full
+        positive = down | (~(vertical | up) & full)
+        negative = up & vertical
+        distances.append(distance)
+    return distances[::-1]
+
+
+def _lcs_vectors(masks: dict[str, int], full: int, chars: str) -> Iterator[int]:
+    """Compare the pattern with growing prefixes of chars.
+
+    Uses the bit-parallel LCS algorithm of Allison-Dix and Hyyrö.
+
+    Args:
+        masks: Bit sets of each pattern character's positions
+        full: Bit set of every pattern position
+        chars: The text to compare, in the order it is consumed
+
+    Yields:
+        After each character, a bit vector whose zero bits below position i
+        count the longest common subsequence of the pattern's first i
+        characters and the characters consumed so far
+    """
+    vector = full
+    for char in chars:
+        matched = vector & masks.get(char, 0)
+        vector = ((vector + matched) | (vector - matched)) & full
+        yield vector
+
+
+class _ScoredWindows:
+    """Windows of the text that reach the threshold, with their scores."""
+
+    def __init__(self, scores: dict[tuple[int, int], float]) -> None:
+        self.scores = scores
+
+    def windows(self) -> list[tuple[int, int]]:
+        """Get the windows that may reach the threshold, by length then start."""
+        return sorted(self.scores, key=lambda w: (w[1] - w[0], w[0]))
+
+    def score(self, start: int, end: int, floor: float) -> float | None:
+        """Get a window's score if it is above floor."""
+        score = self.scores.get((start, end))
+        return score if score is not None and score > floor else None
+
+
+def _score_every_window(
+    text: str, pattern: str, threshold: float, scorer: Callable[..., float]
+) -> dict[tuple[int, int], float]:
+    """Score every window of the text with a rapidfuzz scorer.
 
-    # Use sliding window to find all matches
-    # We'll check windows of varying sizes around the pattern length
-    min_len = max(1, int(pattern_len * 0.7))  # Allow for insertions/deletions
-    max_len = int(pattern_len * 1.3)
+    Returns:
+        The scores (0.0 to 1.0) of the windows at the threshold, by start and end
+    """
+    # rapidfuzz returns 0 for windows below the cutoff, which it can detect early
+    score_cutoff = max(0.0, threshold * 100 - _EPSILON)
+    min_len, max_len = _window_lengths(len(pattern))
+    scores: dict[tuple[int, int], float] = {}
+    for length in range(min_len, max_len + 1):
+        for start in range(len(text) - length + 1):
+            window = text[start : start + length]
+            score = scorer(window, pattern, score_cutoff=score_cutoff) / 100.0
+            if score >= threshold:
+                scores[start, start + length] = score
+    return scores
+
+
+def _ratio_needed(pattern_len: int, threshold: float) -> dict[int, int]:
+    """Get the LCS with the pattern each window length needs for fuzz.ratio.
+
+    Returns:
+        For each window length that can reach the threshold, the shortest
+        longest common subsequence with the pattern that does
+    """
+    min_len, max_len = _window_lengths(pattern_len)
+    needed = {n: _min_common(threshold, n, pattern_len) for n in range(min_len, max_len + 1)}
+    return {n: common for n, common in needed.items() if common <= min(n, pattern_len)}
+
+
+def _lengths_by_distance(pattern_len: int, threshold: float) -> list[list[int]]:
+    """Group the window lengths by the edits fuzz.ratio allows them.
+
+    Returns:
+        For each Levenshtein distance from the pattern, the window lengths
+        (in order) that can still reach the threshold that far from it
+    """
+    needed = _ratio_needed(pattern_len, threshold)
+    max_edits = {n: n + pattern_len - 2 * common for n, common in needed.items()}
+    return [
+        [n for n, edits in max_edits.items() if edits >= distance]
+        for distance in range(max(max_edits.values(), default=-1) + 1)
+    ]
+
+
+def _aligned_windows(
+    text: str, pattern: str, lengths_by_distance: list[list[int]]
+) -> list[tuple[int, int]]:
+    """Find the windows that start near an occurrence of the pattern.
 
-    checked_positions: set[tuple[int, int]] = set()
+    A window's ratio counts at least as many insertions and deletions as
+    the Levenshtein distance from its start to the closest occurrence of
+    the pattern, so only windows within that many edits can reach the
+    threshold.
+
+    Args:
+        text: The text to search in
+        pattern: The pattern to search for
+        lengths_by_distance: Window lengths allowed at each distance, as
+            returned by _lengths_by_distance()
+
+    Returns:
+        The start and end of each such window
+    """
+    windows: list[tuple[int, int]] = []
+    text_len = len(text)
+    for start, distance in enumerate(_start_distances(pattern, text)):
+        if distance < len(lengths_by_distance):
+            lengths = lengths_by_distance[distance]
+            fitting = lengths[: bisect_right(lengths, text_len - start)]
+            windows.extend((start, start + length) for length in fitting)
+    return windows
+
+
+def _ratio_scores(text: str, pattern: str, threshold: float) -> dict[tuple[int, int], float]:
+    """Score the windows that reach the threshold with fuzz.ratio.
+
+    Each start is scored with one _lcs_vectors() pass, which gives the
+    exact ratio of every window length at once. Starts are skipped when
+    every pattern occurrence from them is too many Levenshtein edits away
+    (which is at most the insertions and deletions a ratio counts), and a
+    pass stops once too many window characters are left out of the LCS.
+
+    Returns:
+        The scores (0.0 to 1.0) of the windows at the threshold, by start and end
+    """
+    pattern_len = len(pattern)
+    min_len, max_len = _window_lengths(pattern_len)
+    needed = _ratio_needed(pattern_len, threshold)
+    scores: dict[tuple[int, int], float] = {}
+    if not needed:
+        return scores
 
-    for window_len in range(min_len, max_len + 1):
-        for start in range(len(search_text) - window_len + 1):
-            end = start + window_len
+    max_edits = max(n + pattern_len - 2 * common for n, common in needed.items())
+    # Window characters left out of the LCS only accumulate
+    max_unmatched = max(n - common for n, common in needed.items())
+    start_distances = _start_distances(pattern, text)
+    masks = _pattern_masks(pattern)
+    full = (1 << pattern_len) - 1
 
-            # Skip if we've already checked this position
-            if (start, end) in checked_positions:
+    for start in range(len(text) - min_len + 1):
+        if start_distances[start] > max_edits:
+            continue
+        chars = text[start : start + max_len]
+        for length, vector in enumerate(_lcs_vectors(masks, full, chars), 1):
+            common = pattern_len - vector.bit_count()
+            if length - common > max_unmatched:
+                break
+            if common >= needed.get(length, pattern_len + 1):
+                total = length + pattern_len
+                scores[start, start + length] = _similarity(total - 2 * common, total)
+    return scores
+
+
+class _PartialRatioWindows:
+    """The windows that may reach the threshold with fuzz.partial_ratio.
+
+    partial_ratio aligns the shorter of a window and the pattern with the
+    other's prefixes, substrings of its own length and suffixes, and takes
+    the best fuzz.ratio. Skipping the alignments rapidfuzz skips (ones
+    ending or starting with a character the shorter string lacks) never
+    changes that best.
+
+    For a window longer than the pattern, the alignments are substrings of
+    the text, so one _lcs_vectors() pass per start finds every substring
+    of up to the pattern's length that reaches the threshold, and those
+    give such windows' exact scores. A window shorter than the pattern is
+    aligned with parts of the pattern instead: the passes keep its LCS bit
+    vectors, both forwards and backwards, which bound its prefix, suffix
+    and substring alignments, and the few substrings the bounds allow are
+    scored with fuzz.ratio when the window's score is needed.
+    """
+
+    def __init__(self, text: str, pattern: str, threshold: float) -> None:
+        from rapidfuzz import fuzz
+
+        self._ratio = fuzz.ratio
+        self._text = text
+        self._pattern = pattern
+        pattern_len = len(pattern)
+        self._min_len, self._max_len = _window_lengths(pattern_len)
+
+        # LCS with the pattern of a text substring at the threshold against it
+        substring_needed = [_min_common(threshold, n, pattern_len) for n in range(pattern_len + 1)]
+        # LCS with the pattern of a window aligned at the threshold with a
+        # part of the pattern, which at best shares all its characters
+        window_needed = [1] + [
+            bisect_left(range(n + 1), True, key=lambda c: _similarity(n - c, n + c) >= threshold)
+            for n in range(1, pattern_len + 1)
+        ]
+        lengths = [
+            (n, needed) for n, needed in enumerate(substring_needed) if n > 0 and needed <= n
+        ]
+        lengths += [
+            (n, window_needed[n])
+            for n in range(self._min_len, pattern_len + 1)
+            if window_needed[n] <= n
+        ]
+        max_edits = max((n + pattern_len - 2 * needed for n, needed in lengths), default=-1)
+        max_unmatched = max((n - needed for n, needed in lengths), default=-1)
+
+        # Best substring at the threshold starting at each position (shorter
+        # than the pattern, and exactly as long) and ending at each position
+        self._prefixes: dict[int, float] = {}
+        self._substrings: dict[int, float] = {}
+        self._suffixes: dict[int, float] = {}
+        # LCS bit vectors of windows up to the pattern's length, by start
+        # and length, and by end and length over the reversed strings
+        self._forward: dict[tuple[int, int], int] = {}
+        self._backward: dict[tuple[int, int], int] = {}
+
+        start_distances = _start_distances(pattern, text)
+        masks = _pattern_masks(pattern)
+        full = (1 << pattern_len) - 1
+        for start in range(len(text)):
+            if start_distances[start] > max_edits:
                 continue
-            checked_positions.add((start, end))
-
-            window = search_text[start:end]
-
-            # Compute similarity using selected algorithm
-            if algorithm == "ratio":
-                similarity = fuzz.ratio(window, search_pattern) / 100.0
-            elif algorithm == "partial_ratio":
-                similarity = fuzz.partial_ratio(window, search_pattern) / 100.0
-            elif algorithm == "token_sort_ratio":
-                similarity = fuzz.token_sort_ratio(window, search_pattern) / 100.0
-            elif algorithm == "levenshtein":
-                similarity = fuzz.ratio(window, search_pattern) / 100.0
-
-            if similarity >= threshold:
-                # Check for overlapping matches and keep the best one
-                overlaps = [
-                    (i, m_start, m_end, m_score)
-                    for i, (m_start, m_end, m_score) in enumerate(matches)
-                    if not (end <= m_start or start >= m_end)
-                ]
-
-                if overlaps:
-                    # If this match is better than overlapping ones, replace them
-                    best_overlap_score = max(score for _, _, _, score in overlaps)
-                    if similarity > best_overlap_score:
-                        # Remove overlapping matches
-                        for idx, _, _, _ in sorted(overlaps, reverse=True):
-                            del matches[idx]
-                        matches.append((start, end, similarity))
-                else:
-                    matches.append((start, end, similarity))
-
-    # Sort by position
-    return sorted(matches, key=lambda x: x[0])
+            chars = text[start : start + pattern_len]
+            for length, vector in enumerate(_lcs_vectors(masks, full, chars), 1):
+                common = pattern_len - vector.bit_count()
+                if length - common > max_unmatched:
+                    break
+                end = start + length
+                if common >= substring_needed[length]:
+                    total = length + pattern_len
+                    score = _similarity(total - 2 * common, total)
+                    if length < pattern_len:
+                        self._prefixes[start] = max(self._prefixes.get(start, 0.0), score)
+                    else:
+                        self._substrings[start] = score
+                    self._suffixes[end] = max(self._suffixes.get(end, 0.0), score)
+                if length >= self._min_len and common >= window_needed[length]:
+                    self._forward[start, length] = vector
+
+        lengths_by_end: dict[int, set[int]] = {}
+        for start, length in self._forward:
+            lengths_by_end.setdefault(start + length, set()).add(length)
+        reversed_masks = _pattern_masks(pattern[::-1])
+        for end, window_lengths in lengths_by_end.items():
+            chars = text[end - max(window_lengths) : end][::-1]
+            for length, vector in enumerate(_lcs_vectors(reversed_masks, full, chars), 1):
+                if length in window_lengths:
+                    self._backward[end, length] = vector
+
+        self._scores = self._score_longer_windows(threshold)
+
+    def _score_longer_windows(self, threshold: float) -> dict[tuple[int, int], float]:
+        """Score the windows longer than the pattern that reach the threshold."""
+        pattern_len = len(self._pattern)
+        starts = set(self._prefixes)
+        for start in self._substrings:
+            starts.update(range(max(0, start + pattern_len + 1 - self._max_len), start + 1))
+        for end in self._suffixes:
+            starts.update(range(max(0, end - self._max_len), end - pattern_len))
+
+        scores: dict[tuple[int, int], float] = {}
+        for start in starts:
+            best_substring = 0.0
+            for end in range(start + pattern_len + 1, start + self._max_len + 1):
+                if end > len(self._text):
+                    break
+                best_substring = max(
+                    best_substring, self._substrings.get(end - pattern_len - 1, 0.0)
+                )
+                score = max(
+                    self._prefixes.get(start, 0.0), best_substring, self._suffixes.get(end, 0.0)
+                )
+                if score >= threshold:
+                    scores[start, end] = score
+        return scores
+
+    def windows(self) -> list[tuple[int, int]]:
+        """Get the windows that may reach the threshold, by length then start."""
+        pattern_len = len(self._pattern)
+        found = {(start, start + length) for start, length in self._forward}
+        found.update(self._scores)
+        if self._min_len <= pattern_len:
+            found.update((start, start + pattern_len) for start in self._prefixes)
+            found.update((end - pattern_len, end) for end in self._suffixes)
+        text_len = len(self._text)
+        return sorted(
+            (w for w in found if w[0] >= 0 and w[1] <= text_len),
+            key=lambda w: (w[1] - w[0], w[0]),
+        )
+
+    def score(self, start: int, end: int, floor: float) -> float | None:
+        """Get a window's partial_ratio score if it is above floor."""
+        pattern_len = len(self._pattern)
+        length = end - start
+        if length > pattern_len:
+            score = self._scores.get((start, end))
+            return score if score is not None and score > floor else None
+
+        best = floor
+        if length == pattern_len:
+            # rapidfuzz also aligns the pattern with the window's prefixes and suffixes
+            best = max(best, self._prefixes.get(start, 0.0), self._suffixes.get(end, 0.0))
+        forward = self._forward.get((start, length))
+        if forward is not None:
+            backward = self._backward[end, length]
+            best = self._best_end_alignment(forward, length, length - 1, best)
+            best = self._best_end_alignment(backward, length, length, best)
+            if length < pattern_len:
+                best = self._best_substring(start, end, forward, backward, best)
+        return best if best > floor else None
+
+    @staticmethod
+    def _best_end_alignment(vector: int, window_len: int, longest: int, floor: float) -> float:
+        """Align a window with the pattern's prefixes (or suffixes, reversed).
+
+        Args:
+            vector: The window's LCS bit vector
+            window_len: Length of the window
+            longest: Length of the longest prefix to align
+            floor: Score to beat
+
+        Returns:
+            The best score above floor, or floor
+        """
+
+        def common(part_len: int) -> int:
+            return part_len - (vector & ((1 << part_len) - 1)).bit_count()
+
+        most = common(longest)
+        if _similarity(window_len - most, window_len + most) <= floor:
+            return floor
+        # Longer prefixes with no more in common with the window score lower
+        part_len = bisect_left(range(longest + 1), most, key=common)
+        best = floor
+        while part_len > 0 and _similarity(window_len - part_len, window_len + part_len) > best:
+            shared = common(part_len)
+            best = max(best, _similarity(window_len + part_len - 2 * shared, window_len + part_len))
+            part_len -= 1
+        return best
+
+    def _best_substring(
+        self, start: int, end: int, forward: int, backward: int, floor: float
+    ) -> float:
+        """Align a window shorter than the pattern with pattern substrings as long.
+
+        Args:
+            start: Start of the window
+            end: End of the window
+            forward: The window's LCS bit vector
+            backward: The window's LCS bit vector over the reversed strings
+            floor: Score to beat
+
+        Returns:
+            The best score above floor, or floor
+        """
+        pattern_len = len(self._pattern)
+        length = end - start
+        if _similarity(2 * length - 2 * (pattern_len - forward.bit_count()), 2 * length) <= floor:
+            return floor
+
+        def prefix_common(part_len: int) -> int:
+            return part_len - (forward & ((1 << part_len) - 1)).bit_count()
+
+        def suffix_common(part_len: int) -> int:
+            return part_len - (backward & ((1 << part_len) - 1)).bit_count()
+
+        # A substring scoring above floor shares more than floor * length
+        # characters with the window, and so do the pattern prefix ending
+        # with it and the pattern suffix starting with it
+        needed = max(0, int(floor * length) - 1)
+        positions = range(pattern_len + 1)
+        first = max(0, bisect_left(positions, needed, key=prefix_common) - length)
+        last = min(
+            pattern_len - length - 1,
+            pattern_len - bisect_left(positions, needed, key=suffix_common),
+        )
+
+        window = self._text[start:end]
+        best = floor
+        for offset in range(first, last + 1):
+            part = self._pattern[offset : offset + length]
+            score = self._ratio(window, part, score_cutoff=max(0.0, best * 100 - _EPSILON))
+            best = max(best, score / 100.0)
+        return best
+
+
+def _select_matches(
+    windows: "_ScoredWindows | _PartialRatioWindows", threshold: float
+) -> list[tuple[int, int, float]]:
+    """Pick the matches among scored windows.
+
+    Windows are taken shortest first and left to right; one at the threshold
+    is kept if it overlaps no kept match, and replaces the matches it
+    overlaps if it scores higher than all of them.
+
+    Args:
+        windows: The candidate windows and their scores
+        threshold: Similarity threshold (0.0 to 1.0)
+
+    Returns:
+        List of tuples (start_pos, end_pos, similarity_score), sorted by position
+    """
+    # Kept matches never overlap, so their starts and ends sort the same way
+    starts: list[int] = []
+    ends: list[int] = []
+    scores: list[float] = []
+    below_threshold = math.nextafter(threshold, -math.inf)
+    for start, end in windows.windows():
+        first = bisect_right(ends, start)
+        last = bisect_left(starts, end)
+        floor = max(scores[first:last], default=below_threshold)
+        score = windows.score(start, end, floor)
+        if score is None:
+            continue
+        starts[first:last] = [start]
+        ends[first:last] = [end]
+        scores[first:last] = [score]
+    return list(zip(starts, ends, scores, strict=True))
+
+
+def _alignment_cutoff(threshold: float) -> float:
+    """Lowest partial_ratio of a text that contains a ratio match.
+
+    A match 0.7x-1.3x the pattern length implies a pattern-length alignment
+    (or, in a text shorter than the pattern, a text-length one) at least
+    this similar, so texts whose best alignment scores lower hold no match.
+
+    Args:
+        threshold: Similarity threshold (0.0 to 1.0)
+
+    Returns:
+        The bound, on rapidfuzz's 0-100 scale
+    """
+    return 100 * min(
+        1 - ((1 - threshold) * 1.7 + 0.3) / 1.4,
+        1 - ((1 - threshold) * 2.3 + 0.3) / 2,
+    )
+
+
+def _required_qgrams(pattern: str, threshold: float, q: int) -> int:
+    """Count the pattern q-grams any match at the threshold must contain.
+
+    A window whose ratio with the pattern is at least the threshold is at
+    most (1 - threshold) * (window length + pattern length) insertions and
+    deletions away from it, and each edit destroys at most q of the
+    pattern's q-grams.
+
+    Args:
+        pattern: The pattern to search for
+        threshold: Similarity threshold (0.0 to 1.0)
+        q: Length of the q-grams
+
+    Returns:
+        Minimum number of pattern q-gram positions whose q-gram must occur in
+        the text (zero or less means the bound cannot exclude anything)
+    """
+    pattern_len = len(pattern)
+    max_edits = int((1 - threshold) * (int(pattern_len * 1.3) + pattern_len))
+    return (pattern_len - q + 1) - q * max_edits
+
+
+def _qgram_counts(pattern: str, q: int) -> dict[str, int]:
+    """Count the positions of each distinct q-gram in the pattern."""
+    counts: dict[str, int] = {}
+    for i in range(len(pattern) - q + 1):
+        gram = pattern[i : i + q]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def _shared_qgrams(text: str, qgram_counts: dict[str, int], window: int) -> Iterator[int]:
+    """Slide a match-sized window over the text's q-grams.
+
+    Args:
+        text: The text to check
+        qgram_counts: Number of positions of each distinct q-gram in the pattern
+        window: Length of the longest possible match
+
+    Yields:
+        For each q-gram of the text, the number of q-grams in the window
+        ending with it that pair up with distinct pattern positions
+    """
+    q = len(next(iter(qgram_counts)))
+    grams = [text[i : i + q] for i in range(len(text) - q + 1)]
+    span = window - q + 1
+    in_window: dict[str, int] = {}
+    shared = 0
+    for i, gram in enumerate(grams):
+        limit = qgram_counts.get(gram)
+        if limit:
+            count = in_window.get(gram, 0) + 1
+            in_window[gram] = count
+            if count <= limit:
+                shared += 1
+        if i >= span:
+            old = grams[i - span]
+            limit = qgram_counts.get(old)
+            if limit:
+                count = in_window[old]
+                in_window[old] = count - 1
+                if count <= limit:
+                    shared -= 1
+        yield shared
+
+
+def _has_qgrams(text: str, qgram_counts: dict[str, int], required: int, window: int) -> bool:
+    """Check whether some window of text shares enough q-grams with the pattern.
+
+    Args:
+        text: The text to check
+        qgram_counts: Number of positions of each distinct q-gram in the pattern
+        required: Minimum number of pattern q-gram positions a match must share
+        window: Length of the longest possible match
+
+    Returns:
+        True if the text may contain a match
+    """
+    # Quick rejection on q-grams missing from the whole text
+    allowed_missing = sum(qgram_counts.values()) - required
+    missing = 0
+    for gram, count in qgram_counts.items():
+        if gram not in text:
+            missing += count
+            if missing > allowed_missing:
+                return False
+
+    return any(shared >= required for shared in _shared_qgrams(text, qgram_counts, window))
+
+
+def _cdist_find_all(
+    texts: list[str], indices: list[int], pattern: str, threshold: float, workers: int
+) -> Iterator[tuple[int, list[tuple[int, int, float]]]]:
+    """Find ratio matches in many texts, scoring their windows with process.cdist.
+
+    The windows near occurrences of the pattern (see _aligned_windows())
+    are scored across texts in calls of about _CDIST_CHUNK windows each.
+
+    Args:
+        texts: The texts to search in
+        indices: Positions of the texts to search, in order
+        pattern: The pattern to search for
+        threshold: Similarity threshold (0.0 to 1.0)
+        workers: Threads used to score windows (-1 for all cores)
+
+    Yields:
+        Tuples of (text index, matches) for each text with at least one match
+    """
+    from rapidfuzz import fuzz, process
+
+    lengths_by_distance = _lengths_by_distance(len(pattern), threshold)
+    score_cutoff = max(0.0, threshold * 100 - _EPSILON)
+    pending: list[tuple[int, list[tuple[int, int]]]] = []
+    pending_count = 0
+    for position, i in enumerate(indices):
+        windows = _aligned_windows(texts[i], pattern, lengths_by_distance)
+        pending.append((i, windows))
+        pending_count += len(windows)
+        if pending_count < _CDIST_CHUNK and position < len(indices) - 1:
+            continue
+
+        choices = [
+            texts[j][start:end] for j, text_windows in pending for start, end in text_windows
+        ]
+        scores = iter(
+            process.cdist(
+                [pattern],
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=score_cutoff,
+                dtype="float64",
+                workers=workers,
+            )[0].tolist()
+        )
+        for j, text_windows in pending:
+            window_scores = {
+                window: score / 100.0
+                for window, score in zip(
+                    text_windows, islice(scores, len(text_windows)), strict=True
+                )
+                if score / 100.0 >= threshold
+            }
+            matches = _select_matches(_ScoredWindows(window_scores), threshold)
+            if matches:
+                yield j, matches
+        pending = []
+        pending_count = 0
+
+
+def fuzzy_find_all_batch(
+    texts: list[str],
+    pattern: str,
+    threshold: float = 0.9,
+    algorithm: str = "ratio",
+    normalize_ws: bool = False,
+    workers: int = 1,
+) -> Iterator[tuple[int, list[tuple[int, int, float]]]]:
+    """Find fuzzy matches of pattern in many texts, skipping hopeless ones.
+
+    For the ratio and levenshtein algorithms, texts are first filtered with
+    a q-gram bound: a text lacking too many of the pattern's q-grams cannot
+    contain a window similar enough to it. The remaining texts are scored
+    against the pattern with partial_ratio in a single rapidfuzz call
+    (process.cdist, using `workers` threads, when numpy is installed;
+    process.extract otherwise), and only texts whose best alignment could
+    reach the threshold are searched. With numpy and a pattern of up to 64
+    characters, the windows of those texts that start near an occurrence
+    of the pattern are then scored together with process.cdist; otherwise
+    each text is searched with fuzzy_find_all(). The results are those of
+    calling fuzzy_find_all() on every text.
+
+    Args:
+        texts: The texts to search in
+        pattern: The pattern to search for
+        threshold: Similarity threshold (0.0 to 1.0), default 0.9
+        algorithm: Matching algorithm (ratio, partial_ratio, token_sort_ratio, levenshtein)
+        normalize_ws: Whether to normalize whitespace before matching
+        workers: Threads used to score texts (-1 for all cores), default 1
+
+    Yields:
+        Tuples of (text index, matches) for each text with at least one
+        match, in order, where matches are as returned by fuzzy_find_all()
+
+    Raises:
+        ImportError: If rapidfuzz is not installed
+        ValueError: If threshold is not between 0 and 1, or algorithm is invalid
+
+    Example:
+        >>> texts = ["The producti0n products are ready", "Nothing here"]
+        >>> list(fuzzy_find_all_batch(texts, "production products", threshold=0.85))
+        [(0, [(4, 23, 0.87)])]
+    """
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError as e:
+        raise ImportError(
+            "rapidfuzz is required for fuzzy matching. "
+            'Install it with: pip install "python-docx-redline[fuzzy]"'
+        ) from e
+
+    # Validate threshold
+    if not 0 <= threshold <= 1:
+        raise ValueError(f"Threshold must be between 0 and 1, got {threshold}")
+
+    search_pattern = normalize_whitespace(pattern) if normalize_ws else pattern
+    pattern_len = len(search_pattern)
+    min_len = max(1, int(pattern_len * 0.7))
+    # rapidfuzz's process.cdist returns numpy arrays
+    has_numpy = importlib.util.find_spec("numpy") is not None
+
+    candidates = list(range(len(texts)))
+    if algorithm in ("ratio", "levenshtein") and search_pattern:
+        search_texts = [normalize_whitespace(t) if normalize_ws else t for t in texts]
+        candidates = [i for i in candidates if len(search_texts[i]) >= min_len]
+
+        # Cheap q-gram bound first, with trigrams unless the pattern is too short
+        q = 3 if _required_qgrams(search_pattern, threshold, 3) > 0 else 2
+        required = _required_qgrams(search_pattern, threshold, q)
+        if required > 0:
+            qgram_counts = _qgram_counts(search_pattern, q)
+            max_len = int(pattern_len * 1.3)
+            candidates = [
+                i
+                for i in candidates
+                if _has_qgrams(search_texts[i], qgram_counts, required, max_len)
+            ]
+
+        cutoff = _alignment_cutoff(threshold)
+        if cutoff > 0 and candidates:
+            choices = [search_texts[i] for i in candidates]
+            if has_numpy:
+                scores = process.cdist(
+                    [search_pattern],
+                    choices,
+                    scorer=fuzz.partial_ratio,
+                    score_cutoff=cutoff,
+                    dtype="float64",
+                    workers=workers,
+                )[0]
+                kept = [pos for pos, score in enumerate(scores) if score >= cutoff]
+            else:
+                results = process.extract(
+                    search_pattern,
+                    choices,
+                    scorer=fuzz.partial_ratio,
+                    score_cutoff=cutoff,
+                    limit=None,
+                )
+                kept = sorted(pos for _, _, pos in results)
+            candidates = [candidates[pos] for pos in kept]
+
+        if has_numpy and candidates and pattern_len <= _CDIST_MAX_PATTERN_LEN:
+            yield from _cdist_find_all(search_texts, candidates, search_pattern, threshold, workers)
+            return
+
+    for i in candidates:
+        matches = fuzzy_find_all(
+            texts[i],
+            pattern,
+            threshold=threshold,
+            algorithm=algorithm,
+            normalize_ws=normalize_ws,
+        )
+        if matches:
+            yield i, matches
 
 
 def parse_fuzzy_config(fuzzy: float | dict[str, Any] | None) -> dict[str, Any] | None:
@@ -231,7 +1003,9 @@ def parse_fuzzy_config(fuzzy: float | dict[str, Any] | None) -> dict[str, Any] |
     Accepts either:
     - None: Exact matching (no fuzzy)
     - float: Simple threshold (e.g., 0.9 for 90% similarity)
-    - dict: Full config with threshold, algorithm, normalize_whitespace
+    - dict: Full config with threshold, algorithm, normalize_whitespace,
+      and optionally workers (threads used to score paragraphs, -1 for all
+      cores)
 
     Args:
         fuzzy: Fuzzy configuration (None, float, or dict)
@@ -292,6 +1066,12 @@ def parse_fuzzy_config(fuzzy: float | dict[str, Any] | None) -> dict[str, Any] |
                     f"normalize_whitespace must be a boolean, got {type(normalize).__name__}"
                 )
             config["normalize_whitespace"] = normalize
+
+        if "workers" in fuzzy:
+            workers = fuzzy["workers"]
+            if isinstance(workers, bool) or not isinstance(workers, int) or workers == 0:
+                raise ValueError(f"workers must be a non-zero integer, got {workers!r}")
+            config["workers"] = workers
     else:
         raise ValueError(
             f"fuzzy parameter must be None, a float, or a dict, got {type(fuzzy).__name__}"
@@ -0,0 +1,181 @@
+"""
+Allocation of w:id values for tracked changes, bookmarks, comments and notes.
+
+IdAllocator finds the highest ID of every kind in one traversal of the
+document's parts the first time an ID is needed, then hands out IDs from
+counters. Document holds one allocator, so tracked changes made in the
+body, headers, footers and notes share a single sequence.
+"""
+
+import re
+from typing import Any
+
+from .constants import w
+
+CHANGE = "change"
+BOOKMARK = "bookmark"
+COMMENT = "comment"
+FOOTNOTE = "footnote"
+ENDNOTE = "endnote"
+
+# Elements whose w:id is a tracked change ID
+CHANGE_TAGS = (
+    w("ins"),
+    w("del"),
+    w("moveFrom"),
+    w("moveTo"),
+    w("moveFromRangeStart"),
+    w("moveToRangeStart"),
+    w("pPrChange"),
+    w("rPrChange"),
+    w("sectPrChange"),
+    w("tblPrChange"),
+    w("trPrChange"),
+    w("tcPrChange"),
+    w("customXmlInsRangeStart"),
+    w("customXmlDelRangeStart"),
+    w("customXmlMoveFromRangeStart"),
+    w("customXmlMoveToRangeStart"),
+)
+
+_KIND_BY_TAG = {
+    **dict.fromkeys(CHANGE_TAGS, CHANGE),
+    w("bookmarkStart"): BOOKMARK,
+    w("comment"): COMMENT,
+    w("commentRangeStart"): COMMENT,
+    w("footnote"): FOOTNOTE,
+    w("endnote"): ENDNOTE,
+}
+
+# First ID of each kind in a document that has none
+_FIRST_ID = {CHANGE: 1, BOOKMARK: 0, COMMENT: 0, FOOTNOTE: 1, ENDNOTE: 1}
+
+# Kinds whose IDs are kept apart from each other
+_SHARED = (CHANGE, BOOKMARK, COMMENT)
+
+_ANNOTATED_PART = re.compile(
+    r"word/(document|header\d*|footer\d*|footnotes|endnotes|comments)\.xml"
+)
+
+_ID = w("id")
+
+
+def highest_ids(roots: list[Any]) -> dict[str, int]:
+    """Find the highest w:id of each kind under the given XML roots.
+
+    Args:
+        roots: Root elements of the parts to scan
+
+    Returns:
+        Dict of kind to highest ID, for the kinds that have any
+    """
+    highest: dict[str, int] = {}
+    for root in roots:
+        for elem in root.iter(*_KIND_BY_TAG):
+            try:
+                value = int(elem.get(_ID, ""))
+            except ValueError:
+                # Missing or non-integer ID, skip
+                continue
+            kind = _KIND_BY_TAG[elem.tag]
+            if value > highest.get(kind, value - 1):
+                highest[kind] = value
+    return highest
+
+
+class IdAllocator:
+    """Hands out unused w:id values for one document.
+
+    New tracked change IDs are higher than every existing tracked change,
+    bookmark and comment ID. Bookmark and comment IDs continue from the
+    highest existing ID of their own kind, and no ID of these three kinds
+    is handed out twice. Footnote and endnote IDs are numbered separately.
+
+    Example:
+        >>> ids = IdAllocator(doc)
+        >>> change_id = ids.allocate(CHANGE)
+        >>> bookmark_id = ids.allocate(BOOKMARK)
+    """
+
+    def __init__(self, doc: Any | None = None) -> None:
+        """Initialize the allocator.
+
+        Args:
+            doc: Document to scan for existing IDs (none are assumed if None)
+        """
+        self._doc = doc
+        self._next: dict[str, int] | None = None
+
+    def allocate(self, kind: str) -> int:
+        """Allocate the next ID of a kind.
+
+        Args:
+            kind: One of CHANGE, BOOKMARK, COMMENT, FOOTNOTE or ENDNOTE
+
+        Returns:
+            An ID not used by any existing annotation of the kind
+        """
+        counters = self._counters()
+        value = counters[kind]
+        counters[kind] = value + 1
+        if kind in _SHARED:
+            for other in _SHARED:
+                if counters[other] <= value:
+                    counters[other] = value + 1
+        return value
+
+    def peek(self, kind: str) -> int:
+        """Get the ID the next allocate() call for a kind will return.
+
+        Args:
+            kind: One of CHANGE, BOOKMARK, COMMENT, FOOTNOTE or ENDNOTE
+
+        Returns:
+            The next ID of the kind
+        """
+        return self._counters()[kind]
+
+    def set_next(self, kind: str, value: int) -> None:
+        """Set the next ID of a kind.
+
+        Used when IDs up to value have been assigned without allocate(), or
+        when annotations were renumbered so that lower IDs are free again.
+
+        Args:
+            kind: One of CHANGE, BOOKMARK, COMMENT, FOOTNOTE or ENDNOTE
+            value: The next ID to hand out
+        """
+        self._counters()[kind] = value
+
+    def reset(self) -> None:
+        """Forget the counters so the next allocation scans the document again."""
+        self._next = None
+
+    def _counters(self) -> dict[str, int]:
+        """Get the counters, scanning the document the first time."""
+        if self._next is None:
+            highest = highest_ids(self._roots())
+            self._next = {
+                kind: max(first, highest.get(kind, first - 1) + 1)
+                for kind, first in _FIRST_ID.items()
+            }
+            # Tracked changes start above every bookmark and comment ID
+            self._next[CHANGE] = max(self._next[kind] for kind in _SHARED)
+        return self._next
+
+    def _roots(self) -> list[Any]:
+        """Get the root elements of every part that can hold annotations."""
+        if self._doc is None:
+            return []
+        package = getattr(self._doc, "_package", None)
+        if package is None:
+            xml_root = getattr(self._doc, "xml_root", None)
+            return [] if xml_root is None else [xml_root]
+
+        roots = []
+        for part_name in package.part_names():
+            if _ANNOTATED_PART.fullmatch(part_name):
+                root = package.get_part(part_name)
+                if root is not None:
+                    roots.append(root)
+        return roots
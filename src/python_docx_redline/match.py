@@ -5,8 +5,9 @@ This module provides the Match dataclass returned by Document.find_all(),
 which represents a single text match with location metadata and context.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .text_search import TextSpan
@@ -28,6 +29,8 @@ class Match:
         paragraph_text: Full text of the paragraph containing this match
         location: Human-readable location string (e.g., "body" or "table:0:row:2:cell:1")
         span: The underlying TextSpan object for advanced operations
+        pattern: The pattern that produced this match, for results of
+            Document.find_all_many() (None for find_all())
 
     Example:
         >>> matches = doc.find_all("production products")
@@ -44,12 +47,14 @@ class Match:
     paragraph_text: str
     location: str
     span: "TextSpan"
+    pattern: str | None = None
 
     def __repr__(self) -> str:
         """Return a detailed string representation."""
+        pattern = f", pattern={self.pattern!r}" if self.pattern is not None else ""
         return (
             f"Match(index={self.index}, text={self.text!r}, "
-            f"location={self.location!r}, paragraph_index={self.paragraph_index})"
+            f"location={self.location!r}, paragraph_index={self.paragraph_index}{pattern})"
         )
 
     def __str__(self) -> str:
@@ -60,3 +65,51 @@ class Match:
             display_context = display_context[:77] + "..."
 
         return f"[{self.index}] {self.location}: {display_context}"
+
+
+class LazyMatch(Match):
+    """A Match whose paragraph metadata is computed on first access.
+
+    Returned by Document.iter_matches(). The matched text and span are known
+    up front; context, paragraph_index, paragraph_text and location are each
+    computed the first time they are read, so callers that only count or
+    inspect spans never pay for them.
+
+    Example:
+        >>> match = next(doc.iter_matches("production products"))
+        >>> match.span.paragraph  # No context or location computed yet
+        >>> match.location  # Computed now
+        'body'
+    """
+
+    def __init__(
+        self,
+        index: int,
+        text: str,
+        span: "TextSpan",
+        loaders: dict[str, Callable[[], Any]],
+        pattern: str | None = None,
+    ) -> None:
+        """Initialize the match.
+
+        Args:
+            index: Zero-based index of this match in the search results
+            text: The matched text
+            span: The underlying TextSpan
+            loaders: Functions computing each deferred attribute by name
+            pattern: The pattern that produced this match, if any
+        """
+        self.index = index
+        self.text = text
+        self.span = span
+        self.pattern = pattern
+        self._loaders = loaders
+
+    def __getattr__(self, name: str) -> Any:
+        """Compute a deferred attribute and keep it for later reads."""
+        loader = self.__dict__.get("_loaders", {}).get(name)
+        if loader is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = loader()
+        setattr(self, name, value)
+        return value
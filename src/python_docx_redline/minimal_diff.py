@@ -629,11 +629,10 @@ def _apply_insertion_only(
             rpr = _get_run_rpr(run_span.runs[insert_after_run_idx + 1])
 
     # Create insertion element
-    ins_xml = xml_generator.create_insertion(hunk.insert_text, author)
-    ins_elem = _parse_tracked_xml(ins_xml)
+    ins_elem = xml_generator.create_insertion_element(hunk.insert_text, author)
 
     # Apply formatting to the run inside the insertion
-    if rpr is not None and ins_elem is not None:
+    if rpr is not None:
         inner_run = ins_elem.find(f".//{{{WORD_NAMESPACE}}}r")
         if inner_run is not None:
             # Insert cloned rPr at the beginning
@@ -641,9 +640,6 @@ def _apply_insertion_only(
             if cloned_rpr is not None:
                 inner_run.insert(0, cloned_rpr)
 
-    if ins_elem is None:
-        return
-
     # Insert into paragraph
     if insert_at_offset is not None and insert_at_offset > 0:
         # Need to split the run - insertion point is in the middle of a run
@@ -696,11 +692,10 @@ def _apply_deletion_with_optional_insertion(
         rpr = _get_run_rpr(run_span.runs[start_run_idx])
 
     # Create deletion element
-    del_xml = xml_generator.create_deletion(hunk.delete_text, author)
-    del_elem = _parse_tracked_xml(del_xml)
+    del_elem = xml_generator.create_deletion_element(hunk.delete_text, author)
 
     # Apply formatting to the run inside the deletion
-    if rpr is not None and del_elem is not None:
+    if rpr is not None:
         inner_run = del_elem.find(f".//{{{WORD_NAMESPACE}}}r")
         if inner_run is not None:
             cloned_rpr = _clone_rpr(rpr)
@@ -710,19 +705,15 @@ def _apply_deletion_with_optional_insertion(
     # Create insertion element if needed
     ins_elem = None
     if hunk.insert_text:
-        ins_xml = xml_generator.create_insertion(hunk.insert_text, author)
-        ins_elem = _parse_tracked_xml(ins_xml)
+        ins_elem = xml_generator.create_insertion_element(hunk.insert_text, author)
 
-        if rpr is not None and ins_elem is not None:
+        if rpr is not None:
             inner_run = ins_elem.find(f".//{{{WORD_NAMESPACE}}}r")
             if inner_run is not None:
                 cloned_rpr = _clone_rpr(rpr)
                 if cloned_rpr is not None:
                     inner_run.insert(0, cloned_rpr)
 
-    if del_elem is None:
-        return
-
     # Build list of elements to insert (deletion first, then insertion per R2)
     elements_to_insert = [del_elem]
     if ins_elem is not None:
@@ -740,29 +731,6 @@ def _apply_deletion_with_optional_insertion(
     )
 
 
-def _parse_tracked_xml(xml_str: str) -> Any | None:
-    """Parse tracked change XML string to element.
-
-    Args:
-        xml_str: XML string (w:ins or w:del)
-
-    Returns:
-        Parsed lxml element or None on error
-    """
-    try:
-        wrapper = (
-            f'<root xmlns:w="{WORD_NAMESPACE}" '
-            f'xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du" '
-            f'xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml">'
-            f"{xml_str}</root>"
-        )
-        root = etree.fromstring(wrapper.encode())
-        # Return the first child (w:ins or w:del)
-        return root[0] if len(root) > 0 else None
-    except etree.XMLSyntaxError:
-        return None
-
-
 def _split_run_and_insert(
     paragraph: Any,
     runs: list[Any],
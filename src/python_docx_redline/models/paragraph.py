@@ -3,6 +3,7 @@ Paragraph wrapper class for convenient access to paragraph elements.
 """
 
 import copy
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from lxml import etree
@@ -20,17 +21,30 @@ class Paragraph:
     Provides convenient Python API for working with paragraphs.
     """
 
-    def __init__(self, element: etree._Element):
+    def __init__(
+        self,
+        element: etree._Element,
+        on_change: Callable[[etree._Element], None] | None = None,
+    ):
         """Initialize Paragraph wrapper.
 
         Args:
             element: The w:p XML element to wrap
+            on_change: Called with the paragraph after the text or style
+                setter edits it (Document uses this to invalidate its text
+                cache)
         """
         if element.tag != f"{{{WORD_NAMESPACE}}}p":
             raise ValueError(f"Expected w:p element, got {element.tag}")
         self._element = element
+        self._on_change = on_change
         self._parent_section: Section | None = None
 
+    def _changed(self) -> None:
+        """Report an edit made through this wrapper."""
+        if self._on_change is not None:
+            self._on_change(self._element)
+
     @property
     def element(self) -> etree._Element:
         """Get the underlying XML element."""
@@ -67,6 +81,11 @@ class Paragraph:
         Args:
             value: New text content (may include markdown formatting)
         """
+        self._set_text(value)
+        self._changed()
+
+    def _set_text(self, value: str) -> None:
+        """Replace the paragraph content with runs for markdown text."""
         # Preserve paragraph properties (w:pPr)
         ppr = self._element.find(f"{{{WORD_NAMESPACE}}}pPr")
         preserved_ppr = copy.deepcopy(ppr) if ppr is not None else None
@@ -167,6 +186,7 @@ class Paragraph:
             if p_style is None:
                 p_style = etree.SubElement(p_pr, f"{{{WORD_NAMESPACE}}}pStyle")
             p_style.set(f"{{{WORD_NAMESPACE}}}val", value)
+        self._changed()
 
     @property
     def runs(self) -> list[etree._Element]:
@@ -5,6 +5,7 @@ A Section represents a logical section of a document: a heading paragraph
 followed by all paragraphs until the next heading.
 """
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from lxml import etree
@@ -106,7 +107,11 @@ class Section:
         return None
 
     @classmethod
-    def from_document(cls, xml_root: etree._Element) -> list["Section"]:
+    def from_document(
+        cls,
+        xml_root: etree._Element,
+        on_change: Callable[[etree._Element], None] | None = None,
+    ) -> list["Section"]:
         """Parse document into sections.
 
         A section is defined as a heading paragraph + all following paragraphs
@@ -115,6 +120,7 @@ class Section:
 
         Args:
             xml_root: The document root element
+            on_change: Passed on to each Paragraph
 
         Returns:
             List of Sections
@@ -123,7 +129,7 @@ class Section:
         all_p_elements = list(xml_root.iter(f"{{{WORD_NAMESPACE}}}p"))
 
         # Wrap in Paragraph objects
-        all_paragraphs = [Paragraph(p) for p in all_p_elements]
+        all_paragraphs = [Paragraph(p, on_change=on_change) for p in all_p_elements]
 
         # Group into sections
         sections: list[Section] = []
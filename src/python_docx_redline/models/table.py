@@ -3,6 +3,7 @@ Table wrapper classes for convenient access to table elements.
 """
 
 import copy
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from lxml import etree
@@ -20,19 +21,28 @@ class TableCell:
     Provides convenient Python API for working with table cells.
     """
 
-    def __init__(self, element: etree._Element, row_index: int, col_index: int):
+    def __init__(
+        self,
+        element: etree._Element,
+        row_index: int,
+        col_index: int,
+        on_change: Callable[[etree._Element], None] | None = None,
+    ):
         """Initialize TableCell wrapper.
 
         Args:
             element: The w:tc XML element to wrap
             row_index: 0-based row index in table
             col_index: 0-based column index in row
+            on_change: Called with each paragraph the cell's wrappers edit or
+                remove (Document uses this to invalidate its text cache)
         """
         if element.tag != f"{{{WORD_NAMESPACE}}}tc":
             raise ValueError(f"Expected w:tc element, got {element.tag}")
         self._element = element
         self._row_index = row_index
         self._col_index = col_index
+        self._on_change = on_change
 
     @property
     def element(self) -> etree._Element:
@@ -87,6 +97,8 @@ class TableCell:
 
         # Remove all existing paragraphs (tcPr is NOT a paragraph, so it's safe)
         for para in self._element.findall(f"{{{WORD_NAMESPACE}}}p"):
+            if self._on_change is not None:
+                self._on_change(para)
             self._element.remove(para)
 
         # Create new paragraph with text
@@ -142,7 +154,7 @@ class TableCell:
         from python_docx_redline.models.paragraph import Paragraph
 
         para_elements = self._element.findall(f"{{{WORD_NAMESPACE}}}p")
-        return [Paragraph(elem) for elem in para_elements]
+        return [Paragraph(elem, on_change=self._on_change) for elem in para_elements]
 
     def contains(self, text: str, case_sensitive: bool = True) -> bool:
         """Check if cell contains specific text.
@@ -172,17 +184,24 @@ class TableRow:
     Provides convenient Python API for working with table rows.
     """
 
-    def __init__(self, element: etree._Element, row_index: int):
+    def __init__(
+        self,
+        element: etree._Element,
+        row_index: int,
+        on_change: Callable[[etree._Element], None] | None = None,
+    ):
         """Initialize TableRow wrapper.
 
         Args:
             element: The w:tr XML element to wrap
             row_index: 0-based row index in table
+            on_change: Passed on to the row's cells
         """
         if element.tag != f"{{{WORD_NAMESPACE}}}tr":
             raise ValueError(f"Expected w:tr element, got {element.tag}")
         self._element = element
         self._row_index = row_index
+        self._on_change = on_change
 
     @property
     def element(self) -> etree._Element:
@@ -203,7 +222,8 @@ class TableRow:
         """
         cell_elements = self._element.findall(f"{{{WORD_NAMESPACE}}}tc")
         return [
-            TableCell(elem, self._row_index, col_idx) for col_idx, elem in enumerate(cell_elements)
+            TableCell(elem, self._row_index, col_idx, self._on_change)
+            for col_idx, elem in enumerate(cell_elements)
         ]
 
     def contains(self, text: str, case_sensitive: bool = True) -> bool:
@@ -230,15 +250,21 @@ class Table:
     Provides convenient Python API for working with tables.
     """
 
-    def __init__(self, element: etree._Element):
+    def __init__(
+        self,
+        element: etree._Element,
+        on_change: Callable[[etree._Element], None] | None = None,
+    ):
         """Initialize Table wrapper.
 
         Args:
             element: The w:tbl XML element to wrap
+            on_change: Passed on to the table's rows and cells
         """
         if element.tag != f"{{{WORD_NAMESPACE}}}tbl":
             raise ValueError(f"Expected w:tbl element, got {element.tag}")
         self._element = element
+        self._on_change = on_change
 
     @property
     def element(self) -> etree._Element:
@@ -253,7 +279,9 @@ class Table:
             List of TableRow objects
         """
         row_elements = self._element.findall(f"{{{WORD_NAMESPACE}}}tr")
-        return [TableRow(elem, row_idx) for row_idx, elem in enumerate(row_elements)]
+        return [
+            TableRow(elem, row_idx, self._on_change) for row_idx, elem in enumerate(row_elements)
+        ]
 
     @property
     def row_count(self) -> int:
@@ -8,7 +8,7 @@ the change type, author, date, text content, and the underlying XML element.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from lxml import etree
 
@@ -38,6 +38,34 @@ class ChangeType(Enum):
     FORMAT_PARAGRAPH = "format_paragraph"
 
 
+# Change type of each tracked change element, by qualified tag
+CHANGE_TYPES_BY_TAG = {
+    f"{{{WORD_NAMESPACE}}}ins": ChangeType.INSERTION,
+    f"{{{WORD_NAMESPACE}}}del": ChangeType.DELETION,
+    f"{{{WORD_NAMESPACE}}}moveFrom": ChangeType.MOVE_FROM,
+    f"{{{WORD_NAMESPACE}}}moveTo": ChangeType.MOVE_TO,
+    f"{{{WORD_NAMESPACE}}}rPrChange": ChangeType.FORMAT_RUN,
+    f"{{{WORD_NAMESPACE}}}pPrChange": ChangeType.FORMAT_PARAGRAPH,
+}
+
+
+def parse_change_date(date_str: str | None) -> datetime | None:
+    """Parse the w:date attribute of a tracked change.
+
+    Args:
+        date_str: ISO 8601 timestamp, or None
+
+    Returns:
+        The timestamp, or None if it is missing or malformed
+    """
+    if not date_str:
+        return None
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 @dataclass
 class TrackedChange:
     """Represents a single tracked change in a Word document.
@@ -94,14 +122,7 @@ class TrackedChange:
         change_id = element.get(f"{{{WORD_NAMESPACE}}}id", "")
         author = element.get(f"{{{WORD_NAMESPACE}}}author", "")
 
-        # Parse date
-        date_str = element.get(f"{{{WORD_NAMESPACE}}}date")
-        date: datetime | None = None
-        if date_str:
-            try:
-                date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            except ValueError:
-                pass
+        date = parse_change_date(element.get(f"{{{WORD_NAMESPACE}}}date"))
 
         # Extract text content based on change type
         text = cls._extract_text(element, change_type)
@@ -231,3 +252,61 @@ class TrackedChange:
     def __hash__(self) -> int:
         """Hash based on change ID."""
         return hash(self.id)
+
+
+class LazyTrackedChange(TrackedChange):
+    """A TrackedChange whose text and date are read on first access.
+
+    Returned by Document.iter_tracked_changes() and get_tracked_changes().
+    The ID, type and author are read up front; text and date are each
+    computed from the element the first time they are read, so listing
+    thousands of changes does not extract text nobody looks at. Before the
+    document accepts or rejects any change, it computes them for every
+    listed change still in use, so they keep the values the change had
+    when it was resolved.
+
+    Example:
+        >>> change = next(doc.iter_tracked_changes())
+        >>> change.author  # Read when the change was found
+        'John Doe'
+        >>> change.text  # Extracted now
+        'net 45'
+    """
+
+    def __init__(
+        self,
+        element: etree._Element,
+        change_type: ChangeType,
+        document: "Document | None" = None,
+    ) -> None:
+        """Initialize the change.
+
+        Args:
+            element: The XML element (w:ins, w:del, w:rPrChange, etc.)
+            change_type: The type of change
+            document: Optional reference to parent Document
+        """
+        self.id = element.get(f"{{{WORD_NAMESPACE}}}id", "")
+        self.change_type = change_type
+        self.author = element.get(f"{{{WORD_NAMESPACE}}}author", "")
+        self.element = element
+        self._document = document
+
+    def _load(self) -> None:
+        """Compute text and date now if they have not been read yet."""
+        self.text  # noqa: B018
+        self.date  # noqa: B018
+
+    def __getattr__(self, name: str) -> Any:
+        """Compute text or date and keep it for later reads."""
+        element = self.__dict__.get("element")
+        if element is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        if name == "text":
+            value: Any = self._extract_text(element, self.change_type)
+        elif name == "date":
+            value = parse_change_date(element.get(f"{{{WORD_NAMESPACE}}}date"))
+        else:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        setattr(self, name, value)
+        return value
@@ -0,0 +1,102 @@
+"""
+Multi-pattern literal search using an Aho-Corasick automaton.
+
+Checking a document against many literal patterns one at a time costs one
+scan of the text per pattern. The automaton built here finds every
+occurrence of every pattern, including overlapping ones, in a single scan.
+
+Example:
+    >>> from python_docx_redline.multi_search import AhoCorasick
+    >>> automaton = AhoCorasick(["he", "she", "hers"])
+    >>> list(automaton.iter_matches("ushers"))
+    [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+"""
+
+from collections import deque
+from collections.abc import Iterator, Sequence
+
+
+class AhoCorasick:
+    """Automaton that finds occurrences of many literal patterns at once.
+
+    Patterns are added to a trie whose nodes carry failure links to the
+    longest proper suffix that is also a trie path, so the text is scanned
+    once regardless of the number of patterns.
+
+    Attributes:
+        patterns: The patterns, in the order given
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        """Build the automaton.
+
+        Args:
+            patterns: Non-empty literal patterns to search for
+
+        Raises:
+            ValueError: If a pattern is empty
+        """
+        self.patterns = list(patterns)
+
+        # Node 0 is the root; each node has transitions, a failure link and
+        # the indices of the patterns ending there (including via suffixes)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple[int, ...]] = [()]
+
+        for pattern_idx, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("Patterns must not be empty")
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                node = next_node
+            self._output[node] += (pattern_idx,)
+
+        self._link()
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] += self._output[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield every occurrence of every pattern in the text.
+
+        Occurrences are yielded in order of their end position; occurrences
+        ending at the same position are yielded longest pattern first.
+
+        Args:
+            text: The text to scan
+
+        Yields:
+            (start, end, pattern_index) tuples, with end exclusive
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        patterns = self.patterns
+
+        node = 0
+        for pos, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern_idx in output[node]:
+                end = pos + 1
+                yield end - len(patterns[pattern_idx]), end, pattern_idx
@@ -7,6 +7,7 @@ extracted from the main Document class to improve separation of concerns.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -16,6 +17,7 @@ import yaml
 from ..errors import AmbiguousTextError, TextNotFoundError, ValidationError
 from ..results import BatchResult, EditResult
 from ..suggestions import SuggestionGenerator
+from .batch_planner import BatchPlan, BatchPlanner
 
 if TYPE_CHECKING:
     from ..document import Document
@@ -227,11 +229,30 @@ class BatchOperations:
 
         batch_result = BatchResult(dry_run=dry_run)
 
+        # Resolve the leading edits in one search and apply them together;
+        # edits from plan.stop on depend on earlier ones and run one by one
+        plan = BatchPlan()
+        if not dry_run:
+            planner = BatchPlanner(self)
+            plan = planner.plan(
+                [edit_dict for edit_dict, _, _ in normalized_edits],
+                default_track,
+                stop_on_error=not continue_on_error,
+            )
+            planner.apply(plan, stop_on_error=not continue_on_error)
+            batch_result.timings.update(plan.timings)
+
+        started = time.perf_counter()
         for i, (edit_dict, old_text, new_text) in enumerate(normalized_edits):
             edit_type = edit_dict.get("type", "replace")
 
+            if i < plan.stop:
+                result = plan.results[i]
+                result.index = i
+                result.old_text = old_text
+                result.new_text = new_text
             # For dry run, just validate without applying
-            if dry_run:
+            elif dry_run:
                 result = self._validate_edit(edit_type, edit_dict)
                 result.index = i
                 result.old_text = old_text
@@ -262,9 +283,13 @@ class BatchOperations:
                 batch_result.succeeded.append(result)
             else:
                 batch_result.failed.append(result)
-                if not continue_on_error:
-                    break
 
+            # Planned edits were all applied or skipped, so each is reported
+            if not continue_on_error and batch_result.failed and i + 1 >= plan.stop:
+                break
+
+        if not dry_run:
+            batch_result.timings["sequential"] = time.perf_counter() - started
         return batch_result
 
     def _normalize_edits(
@@ -439,24 +464,47 @@ class BatchOperations:
 
         try:
             return handler(edit_type, edit, default_track)
-        except TextNotFoundError as e:
-            return EditResult(
-                success=False,
-                edit_type=edit_type,
-                message=f"Text not found: {e}",
-                error=e,
-            )
-        except AmbiguousTextError as e:
-            return EditResult(
-                success=False,
-                edit_type=edit_type,
-                message=f"Ambiguous text: {e}",
-                error=e,
-            )
         except Exception as e:
-            return EditResult(
-                success=False, edit_type=edit_type, message=f"Error: {str(e)}", error=e
-            )
+            return self._error_result(edit_type, e)
+
+    def _error_result(self, edit_type: str, error: Exception) -> EditResult:
+        """Build the result of an edit that raised an exception.
+
+        Args:
+            edit_type: The type of edit that failed
+            error: The exception raised
+
+        Returns:
+            EditResult describing the failure
+        """
+        if isinstance(error, TextNotFoundError):
+            message = f"Text not found: {error}"
+        elif isinstance(error, AmbiguousTextError):
+            message = f"Ambiguous text: {error}"
+        else:
+            message = f"Error: {str(error)}"
+        return EditResult(success=False, edit_type=edit_type, message=message, error=error)
+
+    def _success_message(self, edit_type: str, edit: dict[str, Any], track: bool) -> str:
+        """Describe a successfully applied insert, delete or replace edit.
+
+        Args:
+            edit_type: The type of edit applied
+            edit: Dictionary with edit parameters
+            track: Whether the change was tracked
+
+        Returns:
+            Human-readable message for the EditResult
+        """
+        # *_tracked edits always track, so they don't say so
+        track_msg = " (tracked)" if track and not edit_type.endswith("_tracked") else ""
+        if edit_type.startswith("insert"):
+            after = edit.get("after")
+            location = f"after '{after}'" if after else f"before '{edit.get('before')}'"
+            return f"Inserted '{edit.get('text')}' {location}{track_msg}"
+        if edit_type.startswith("delete"):
+            return f"Deleted '{edit.get('text')}'{track_msg}"
+        return f"Replaced '{edit.get('find')}' with '{edit.get('replace')}'{track_msg}"
 
     def _get_track_value(self, edit: dict[str, Any], default_track: bool) -> bool:
         """Get the track value for an edit, using per-edit or default.
@@ -509,12 +557,10 @@ class BatchOperations:
             occurrence=occurrence,
             track=track,
         )
-        location = f"after '{after}'" if after else f"before '{before}'"
-        track_msg = " (tracked)" if track else ""
         return EditResult(
             success=True,
             edit_type=edit_type,
-            message=f"Inserted '{text}' {location}{track_msg}",
+            message=self._success_message(edit_type, edit, track),
         )
 
     def _handle_delete(
@@ -544,11 +590,10 @@ class BatchOperations:
             occurrence=occurrence,
             track=track,
         )
-        track_msg = " (tracked)" if track else ""
         return EditResult(
             success=True,
             edit_type=edit_type,
-            message=f"Deleted '{text}'{track_msg}",
+            message=self._success_message(edit_type, edit, track),
         )
 
     def _handle_replace(
@@ -582,11 +627,10 @@ class BatchOperations:
             track=track,
             minimal=minimal,
         )
-        track_msg = " (tracked)" if track else ""
         return EditResult(
             success=True,
             edit_type=edit_type,
-            message=f"Replaced '{find}' with '{replace}'{track_msg}",
+            message=self._success_message(edit_type, edit, track),
         )
 
     def _handle_insert_tracked(
@@ -611,7 +655,7 @@ class BatchOperations:
         return EditResult(
             success=True,
             edit_type=edit_type,
-            message=f"Inserted '{text}' after '{after}'",
+            message=self._success_message(edit_type, edit, track=True),
         )
 
     def _handle_delete_tracked(
@@ -632,7 +676,11 @@ class BatchOperations:
             )
 
         self._document.delete_tracked(text, author=author, scope=scope, regex=regex)
-        return EditResult(success=True, edit_type=edit_type, message=f"Deleted '{text}'")
+        return EditResult(
+            success=True,
+            edit_type=edit_type,
+            message=self._success_message(edit_type, edit, track=True),
+        )
 
     def _handle_replace_tracked(
         self, edit_type: str, edit: dict[str, Any], default_track: bool = False
@@ -659,7 +707,7 @@ class BatchOperations:
         return EditResult(
             success=True,
             edit_type=edit_type,
-            message=f"Replaced '{find}' with '{replace}'",
+            message=self._success_message(edit_type, edit, track=True),
         )
 
     def _handle_insert_paragraph(
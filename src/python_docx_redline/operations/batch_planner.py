@@ -0,0 +1,588 @@
+"""
+Single-pass planning for batch edits.
+
+Applying a batch edit by edit searches the whole document once per edit.
+BatchPlanner instead resolves the targets of every insert, delete and
+replace edit in one combined search, checks them against each other, and
+applies them from the end of each paragraph backwards, so offsets found in
+the unedited text stay valid and nothing is searched twice.
+
+The result must be the document that applying the edits one at a time
+would give. Planning therefore stops at the first edit that could see the
+effect of an earlier one: an edit whose matches overlap or touch an earlier
+target, or whose text could be matched in text an earlier edit introduces.
+That edit and every later one are left to be applied one at a time.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ..constants import WORD_NAMESPACE
+from ..errors import TextNotFoundError
+from ..multi_search import AhoCorasick
+from ..quote_normalization import NormalizedText, normalize_special_chars
+from ..regex_cache import compile_regex
+from ..results import EditResult
+from ..scope import ScopeEvaluator, parse_note_scope
+from ..suggestions import SuggestionGenerator
+
+if TYPE_CHECKING:
+    from ..text_search import TextSpan
+    from .batch import BatchOperations
+
+# Edit types the planner resolves, and whether each always tracks
+_PLANNABLE_TYPES = {
+    "insert": False,
+    "delete": False,
+    "replace": False,
+    "insert_tracked": True,
+    "delete_tracked": True,
+    "replace_tracked": True,
+}
+
+_P_TAG = f"{{{WORD_NAMESPACE}}}p"
+
+
+@dataclass
+class _EditSpec:
+    """An insert, delete or replace edit, resolved against the document."""
+
+    index: int
+    edit_type: str
+    edit: dict[str, Any]
+    action: str  # "insert_after", "insert_before", "delete" or "replace"
+    pattern: str | None
+    new_text: str
+    track: bool
+    scope: Any
+    regex: bool
+    occurrence: Any
+    matches: list[TextSpan] = field(default_factory=list)
+    paragraphs: list[Any] = field(default_factory=list)
+    error: Exception | None = None
+    # (paragraph, start, end, match_obj, new_text) of each selected target
+    targets: list[tuple[Any, int, int, Any, str]] = field(default_factory=list)
+
+
+class _ParagraphDraft:
+    """The searchable text a paragraph will have once its planned edits apply.
+
+    Edits are recorded as (start, end, replacement) over the original text,
+    where replacement is the text a search sees in place of the original
+    characters afterwards.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.original = text
+        # Closed intervals of original text claimed by planned edits
+        self.claimed: list[tuple[int, int]] = []
+        # Whether planned edits add tracked changes, or may add word-level ones
+        self.tracked = False
+        self.minimal = False
+        self.edits: list[tuple[int, int, str]] = []
+        self._text: str | None = None
+        self._regions: list[tuple[int, int]] = []
+        self._normalized: NormalizedText | None = None
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """Whether [start, end] overlaps or touches a claimed interval."""
+        return any(start <= c_end and c_start <= end for c_start, c_end in self.claimed)
+
+    def add(self, start: int, end: int, replacement: str | None) -> None:
+        """Claim [start, end] and, unless replacement is None, record the change."""
+        self.claimed.append((start, end))
+        if replacement is not None:
+            self.edits.append((start, end, replacement))
+            self._text = None
+            self._normalized = None
+
+    def text(self) -> tuple[str, list[tuple[int, int]]]:
+        """Get the edited text and the position of each replacement in it."""
+        if self._text is None:
+            pieces = []
+            regions = []
+            position = 0
+            length = 0
+            for start, end, replacement in sorted(self.edits):
+                pieces.append(self.original[position:start])
+                length += start - position
+                regions.append((length, length + len(replacement)))
+                pieces.append(replacement)
+                length += len(replacement)
+                position = end
+            pieces.append(self.original[position:])
+            self._text = "".join(pieces)
+            self._regions = regions
+        return self._text, self._regions
+
+    def normalized(self) -> NormalizedText:
+        """Get the edited text with special characters normalized."""
+        if self._normalized is None:
+            self._normalized = NormalizedText(self.text()[0])
+        return self._normalized
+
+
+def _overlaps_region(start: int, end: int, regions: list[tuple[int, int]]) -> bool:
+    """Whether text between two offsets overlaps or straddles one of the regions."""
+    for r_start, r_end in regions:
+        if r_start < r_end and start < r_end and end > r_start:
+            return True
+        if r_start == r_end and start < r_start < end:
+            return True
+    return False
+
+
+class _Watchlist:
+    """The texts of a batch's edits, checked against text that edits introduce.
+
+    Literal texts are matched with one Aho-Corasick automaton, so checking
+    an edited paragraph costs one scan however many edits there are.
+    """
+
+    def __init__(self, specs: list[_EditSpec]) -> None:
+        keys: dict[str, list[int]] = {}
+        self.regexes: list[tuple[int, re.Pattern[str]]] = []
+        for spec in specs:
+            if spec.pattern is None or spec.error is not None:
+                continue
+            if spec.regex:
+                self.regexes.append((spec.index, compile_regex(spec.pattern)))
+            else:
+                keys.setdefault(normalize_special_chars(spec.pattern), []).append(spec.index)
+        self._owners = list(keys.values())
+        self._automaton = AhoCorasick(list(keys)) if keys else None
+
+    def matched(self, draft: _ParagraphDraft) -> set[int]:
+        """Get the indexes of edits whose text matches across introduced text."""
+        text, regions = draft.text()
+        found: set[int] = set()
+        if self._automaton is not None:
+            normalized = draft.normalized()
+            for start, end, key_idx in self._automaton.iter_matches(normalized.text):
+                if _overlaps_region(*normalized.original_span(start, end), regions):
+                    found.update(self._owners[key_idx])
+        for index, pattern in self.regexes:
+            if any(_overlaps_region(*m.span(), regions) for m in pattern.finditer(text)):
+                found.add(index)
+        return found
+
+
+@dataclass
+class BatchPlan:
+    """Edits resolved in one search, ready to be applied together.
+
+    Attributes:
+        edits: The planned edits, in batch order
+        results: Results already known, keyed by edit index: failures found
+            while planning, and after apply(), every planned edit's outcome
+        stop: Index of the first edit left to be applied one at a time
+        timings: Seconds spent in each phase ("search", "plan", "apply")
+    """
+
+    edits: list[_EditSpec] = field(default_factory=list)
+    results: dict[int, EditResult] = field(default_factory=dict)
+    stop: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class BatchPlanner:
+    """Plans and applies the leading run of a batch of edits in one pass.
+
+    Example:
+        >>> planner = BatchPlanner(batch_ops)
+        >>> plan = planner.plan(edit_dicts, default_track=True)
+        >>> planner.apply(plan)
+        >>> remaining = edit_dicts[plan.stop:]  # Apply these one at a time
+    """
+
+    def __init__(self, batch: BatchOperations) -> None:
+        """Initialize the planner.
+
+        Args:
+            batch: The BatchOperations whose document is edited
+        """
+        self._batch = batch
+        self._document = batch._document
+
+    def plan(
+        self,
+        edits: list[dict[str, Any]],
+        default_track: bool,
+        stop_on_error: bool = False,
+    ) -> BatchPlan:
+        """Resolve the targets of as many leading edits as can be planned.
+
+        Args:
+            edits: Edit dictionaries, in batch order
+            default_track: Default value for 'track' if not specified per-edit
+            stop_on_error: If True, stop planning after the first failed edit
+
+        Returns:
+            BatchPlan covering edits[:plan.stop]
+        """
+        document = self._document
+        document._text_index.resume()
+        positions = document._positions()
+
+        specs = []
+        for index, edit in enumerate(edits):
+            spec = self._spec(index, edit, default_track)
+            if spec is None:
+                break
+            specs.append(spec)
+
+        started = time.perf_counter()
+        self._search(specs, positions)
+        searched = time.perf_counter()
+
+        plan = BatchPlan(stop=len(specs))
+        drafts: dict[Any, _ParagraphDraft] = {}
+        watchlist = _Watchlist(specs)
+        # Edits whose text planned edits could introduce
+        dependent: set[int] = set()
+        for spec in specs:
+            if spec.pattern is None:
+                # Missing parameters: the handler reports it without editing
+                result = self._batch._apply_single_edit(spec.edit_type, spec.edit, default_track)
+                plan.results[spec.index] = result
+                if stop_on_error:
+                    plan.stop = spec.index + 1
+                    break
+                continue
+
+            if spec.index in dependent or not self._independent(spec, drafts):
+                plan.stop = spec.index
+                break
+
+            if spec.error is None:
+                try:
+                    self._select(spec)
+                except Exception as e:
+                    spec.error = e
+
+            if spec.error is not None:
+                if isinstance(spec.error, TextNotFoundError):
+                    if any(para in drafts for para in spec.paragraphs):
+                        # Suggestions are drawn from text earlier edits change
+                        plan.stop = spec.index
+                        break
+                    suggestions = SuggestionGenerator.generate_suggestions(
+                        spec.error.text, spec.paragraphs
+                    )
+                    spec.error = TextNotFoundError(spec.error.text, suggestions=suggestions)
+                result = self._batch._error_result(spec.edit_type, spec.error)
+                plan.results[spec.index] = result
+                if stop_on_error:
+                    plan.stop = spec.index + 1
+                    break
+                continue
+
+            if not self._claim(spec, drafts):
+                plan.stop = spec.index
+                break
+            plan.edits.append(spec)
+            for paragraph in {target[0] for target in spec.targets}:
+                if drafts[paragraph].edits:
+                    dependent.update(watchlist.matched(drafts[paragraph]))
+
+        plan.timings["search"] = searched - started
+        plan.timings["plan"] = time.perf_counter() - searched
+        return plan
+
+    def apply(self, plan: BatchPlan, stop_on_error: bool = False) -> None:
+        """Apply the planned edits, last position in each paragraph first.
+
+        Each target is re-resolved from its offsets just before it is
+        applied, since editing a run replaces the run elements around it.
+        The outcome of every planned edit is added to plan.results.
+
+        With stop_on_error, once an edit fails no target of a later edit in
+        the batch is applied. Later edits whose targets were all applied
+        before the failure still succeed; the others fail as skipped.
+
+        Args:
+            plan: A plan returned by plan()
+            stop_on_error: If True, skip the edits after the first failed one
+        """
+        started = time.perf_counter()
+        document = self._document
+        order = {para: i for i, para in enumerate(document._positions().paragraphs)}
+
+        targets = [
+            (order.get(target[0], -1), target[1], spec, target)
+            for spec in plan.edits
+            for target in spec.targets
+        ]
+        targets.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+        failures: dict[int, Exception] = {}
+        applied: dict[int, int] = {}
+        # Index of the first failed edit, when later edits are skipped
+        limit: int | None = None
+        tracked_ops = document._tracked_ops
+        for _, _, spec, (paragraph, start, end, match_obj, new_text) in targets:
+            if spec.index in failures or (limit is not None and spec.index > limit):
+                continue
+            match = document._text_index.get(paragraph).span(start, end, match_obj)
+            author = spec.edit.get("author")
+            try:
+                if spec.action == "replace":
+                    tracked_ops._replace_match(
+                        match, new_text, author, spec.track, spec.edit.get("minimal")
+                    )
+                elif spec.action == "delete":
+                    tracked_ops._delete_match(match, author, spec.track)
+                else:
+                    tracked_ops._insert_at_match(
+                        match, spec.new_text, author, spec.track, spec.action == "insert_after"
+                    )
+            except Exception as e:
+                failures[spec.index] = e
+                if stop_on_error and (limit is None or spec.index < limit):
+                    limit = spec.index
+                continue
+            applied[spec.index] = applied.get(spec.index, 0) + 1
+
+        for spec in plan.edits:
+            count = applied.get(spec.index, 0)
+            if spec.index in failures:
+                result = self._batch._error_result(spec.edit_type, failures[spec.index])
+            elif count < len(spec.targets):
+                applied_text = f" ({count} of {len(spec.targets)} matches applied)" if count else ""
+                result = EditResult(
+                    success=False,
+                    edit_type=spec.edit_type,
+                    message=f"Skipped after edit {limit} failed{applied_text}",
+                )
+            else:
+                message = self._batch._success_message(spec.edit_type, spec.edit, spec.track)
+                result = EditResult(success=True, edit_type=spec.edit_type, message=message)
+            plan.results[spec.index] = result
+
+        plan.timings["apply"] = time.perf_counter() - started
+
+    def _spec(self, index: int, edit: dict[str, Any], default_track: bool) -> _EditSpec | None:
+        """Describe an edit for planning, or return None if it cannot be planned.
+
+        The spec's pattern is None when required parameters are missing.
+        """
+        edit_type = edit.get("type", "replace")
+        if edit_type not in _PLANNABLE_TYPES:
+            return None
+
+        scope = edit.get("scope")
+        if isinstance(scope, str):
+            note_scope = parse_note_scope(scope)
+            if note_scope is not None and note_scope.note_id is not None:
+                return None
+
+        always_tracked = _PLANNABLE_TYPES[edit_type]
+        track = True if always_tracked else self._batch._get_track_value(edit, default_track)
+        occurrence = "first" if always_tracked else edit.get("occurrence", "first")
+        spec = _EditSpec(
+            index=index,
+            edit_type=edit_type,
+            edit=edit,
+            action="replace",
+            pattern=None,
+            new_text="",
+            track=track,
+            scope=scope,
+            regex=edit.get("regex", False),
+            occurrence=occurrence,
+        )
+
+        if edit_type.startswith("insert"):
+            text, after, before = edit.get("text"), edit.get("after"), edit.get("before")
+            if always_tracked:
+                before = None
+            if not text or not (after or before):
+                return spec
+            if after is not None and before is not None:
+                # Document.insert() rejects this before searching
+                return None
+            spec.action = "insert_after" if after else "insert_before"
+            spec.pattern = after or before
+            spec.new_text = text
+        elif edit_type.startswith("delete"):
+            if not edit.get("text"):
+                return spec
+            spec.action = "delete"
+            spec.pattern = edit["text"]
+        else:
+            find, replace = edit.get("find"), edit.get("replace")
+            if not find or replace is None:
+                return spec
+            spec.pattern = find
+            spec.new_text = replace
+
+        return spec
+
+    def _search(self, specs: list[_EditSpec], positions: Any) -> None:
+        """Find the matches of every spec with one search per scope and mode."""
+        text_search = self._document._text_search
+        groups: dict[tuple[Any, bool], list[_EditSpec]] = {}
+        scopes: dict[Any, Any] = {}
+        for spec in specs:
+            if spec.pattern is None:
+                continue
+            if spec.regex:
+                try:
+                    compile_regex(spec.pattern)
+                except re.error as e:
+                    spec.error = re.error(f"Invalid regex pattern '{spec.pattern}': {e}")
+                    continue
+            # Scopes given as dicts or callables are grouped by identity
+            scope_key = spec.scope if isinstance(spec.scope, (str, type(None))) else id(spec.scope)
+            scopes[scope_key] = spec.scope
+            groups.setdefault((scope_key, spec.regex), []).append(spec)
+
+        paragraphs_by_scope: dict[Any, list[Any]] = {}
+        for (scope_key, regex), group in groups.items():
+            if scope_key not in paragraphs_by_scope:
+                try:
+                    paragraphs_by_scope[scope_key] = ScopeEvaluator.filter_paragraphs(
+                        positions.paragraphs, scopes[scope_key], positions
+                    )
+                except Exception as e:
+                    for spec in group:
+                        spec.error = e
+                    continue
+            paragraphs = paragraphs_by_scope[scope_key]
+
+            patterns: dict[str, int] = {}
+            for spec in group:
+                spec.paragraphs = paragraphs
+                patterns.setdefault(spec.pattern, len(patterns))  # type: ignore[arg-type]
+
+            found = text_search.find_text_many(
+                list(patterns), paragraphs, regex=regex, normalize_special_chars=not regex
+            )
+            matches: list[list[TextSpan]] = [[] for _ in patterns]
+            for pattern_idx, span in found:
+                matches[pattern_idx].append(span)
+            for spec in group:
+                spec.matches = matches[patterns[spec.pattern]]  # type: ignore[index]
+
+    def _select(self, spec: _EditSpec) -> None:
+        """Pick the targets of a spec and record them as paragraph offsets.
+
+        Raises:
+            TextNotFoundError: If the edit's text was not found
+            AmbiguousTextError: If the occurrence cannot be resolved
+            ValueError: If the occurrence is out of range
+            re.error: If a regex replacement refers to a missing group
+        """
+        assert spec.pattern is not None
+        if not spec.matches:
+            raise TextNotFoundError(spec.pattern)
+
+        tracked_ops = self._document._tracked_ops
+        selected = tracked_ops._select_matches(spec.matches, spec.occurrence, spec.pattern)
+        for span in selected:
+            start, end = self._offsets(span)
+            new_text = spec.new_text
+            if spec.action == "replace":
+                new_text = tracked_ops._expand_replacement(span, new_text, spec.regex)
+            spec.targets.append((span.paragraph, start, end, span.match_obj, new_text))
+
+    def _offsets(self, span: TextSpan) -> tuple[int, int]:
+        """Get the start and end offsets of a span in its paragraph's text."""
+        text_map = self._document._text_index.get(span.paragraph)
+        start = text_map.offset(span.start_run_index, span.start_offset)
+        end = text_map.offset(span.end_run_index, span.end_offset - 1) + 1
+        return start, end
+
+    def _independent(self, spec: _EditSpec, drafts: dict[Any, _ParagraphDraft]) -> bool:
+        """Whether a spec's matches are untouched by the edits planned so far."""
+        for span in spec.matches:
+            draft = drafts.get(span.paragraph)
+            if draft is not None and draft.overlaps(*self._offsets(span)):
+                return False
+        return True
+
+    def _claim(self, spec: _EditSpec, drafts: dict[Any, _ParagraphDraft]) -> bool:
+        """Record a spec's targets in the paragraph drafts.
+
+        Returns:
+            False, leaving the drafts unchanged, if the targets cannot be
+            applied in any order: they overlap or touch each other, match
+            no text, lie in a paragraph nested in or containing another, or
+            share a paragraph with other tracked edits while one of them
+            may use word-level diffs
+        """
+        # Word-level diffs fall back to coarse ones in paragraphs that already
+        # have revisions, so their outcome would depend on the order applied
+        minimal = spec.track and spec.action == "replace" and self._minimal(spec)
+
+        claims = sorted(
+            (
+                (self._claimed_interval(spec, paragraph, start, end), paragraph, new_text)
+                for paragraph, start, end, _, new_text in spec.targets
+                if start < end
+            ),
+            key=lambda claim: (id(claim[1]), claim[0]),
+        )
+        if len(claims) < len(spec.targets):
+            return False
+        for i, ((start, end), paragraph, _) in enumerate(claims):
+            draft = drafts.get(paragraph)
+            if draft is not None and draft.overlaps(start, end):
+                return False
+            if draft is not None and spec.track and (draft.minimal or (minimal and draft.tracked)):
+                return False
+            if i and claims[i - 1][1] is paragraph and claims[i - 1][0][1] >= start:
+                return False
+            if paragraph.find(f".//{_P_TAG}") is not None:
+                return False
+            if next(paragraph.iterancestors(_P_TAG), None) is not None:
+                return False
+
+        for (start, end), paragraph, new_text in claims:
+            draft = drafts.get(paragraph)
+            if draft is None:
+                draft = _ParagraphDraft(self._document._text_index.get(paragraph).text)
+                drafts[paragraph] = draft
+            draft.add(start, end, self._visible_change(spec, draft.original[start:end], new_text))
+            draft.tracked = draft.tracked or spec.track
+            draft.minimal = draft.minimal or minimal
+        return True
+
+    def _claimed_interval(
+        self, spec: _EditSpec, paragraph: Any, start: int, end: int
+    ) -> tuple[int, int]:
+        """Get the original text an edit's outcome depends on.
+
+        Insertions are placed next to the whole run holding the anchor's
+        edge, so they also depend on the rest of that run.
+        """
+        if spec.action == "insert_after":
+            text_map = self._document._text_index.get(paragraph)
+            return start, text_map.run_bounds(end - 1)[1]
+        if spec.action == "insert_before":
+            text_map = self._document._text_index.get(paragraph)
+            return text_map.run_bounds(start)[0], end
+        return start, end
+
+    def _minimal(self, spec: _EditSpec) -> bool:
+        """Whether a replace edit uses word-level diffs when tracked."""
+        minimal = spec.edit.get("minimal")
+        return self._document._minimal_edits if minimal is None else bool(minimal)
+
+    def _visible_change(self, spec: _EditSpec, matched: str, new_text: str) -> str | None:
+        """Get the text a search will see in place of a target once edited.
+
+        Tracked deletions stay visible to searches, so they return None.
+        """
+        if spec.action == "insert_after":
+            return matched + new_text
+        if spec.action == "insert_before":
+            return new_text + matched
+        if spec.action == "delete":
+            return None if spec.track else ""
+        # Tracked replacements keep the old text, in a deletion
+        return matched + new_text if spec.track else new_text
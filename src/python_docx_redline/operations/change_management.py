@@ -10,6 +10,9 @@ import re
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
+from ..regex_cache import compile_regex
+from ..revision_index import RESOLVABLE_TAGS
+
 if TYPE_CHECKING:
     from ..document import Document
 
@@ -42,6 +45,28 @@ class ChangeManagement:
 
     # Helper methods
 
+    def _load_listed_changes(self) -> None:
+        """Read the text and date of listed changes before the tree changes.
+
+        TrackedChange objects from get_tracked_changes() read them from
+        their element on first access, and resolving a change empties or
+        detaches elements.
+        """
+        listed = self._document._listed_changes
+        while listed:
+            _, change = listed.popitem()
+            change._load()
+
+    def _invalidate(self, element: Any) -> None:
+        """Drop the cached text of the paragraph holding an element about to change.
+
+        Args:
+            element: The element to change, while still in the document
+        """
+        paragraph = next(element.iterancestors(f"{{{WORD_NAMESPACE}}}p"), None)
+        # Outside any paragraph, the change may span several
+        self._document._text_index.invalidate(paragraph)
+
     def _unwrap_element(self, element: Any) -> None:
         """Unwrap an element by moving its children to its parent.
 
@@ -51,6 +76,7 @@ class ChangeManagement:
         parent = element.getparent()
         if parent is None:
             return
+        self._invalidate(element)
 
         # Get the position of the element
         elem_index = list(parent).index(element)
@@ -73,6 +99,7 @@ class ChangeManagement:
         Args:
             del_elem: The <w:del> element to unwrap
         """
+        self._invalidate(del_elem)
         # First, convert all w:delText to w:t within this deletion
         for deltext in del_elem.iter(f"{{{WORD_NAMESPACE}}}delText"):
             deltext.tag = f"{{{WORD_NAMESPACE}}}t"
@@ -88,6 +115,7 @@ class ChangeManagement:
         """
         parent = element.getparent()
         if parent is not None:
+            self._invalidate(element)
             parent.remove(element)
 
     # Accept/Reject all changes
@@ -130,6 +158,7 @@ class ChangeManagement:
         Returns:
             Number of insertions accepted
         """
+        self._load_listed_changes()
         insertions = list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}ins"))
         for ins in insertions:
             self._unwrap_element(ins)
@@ -143,6 +172,7 @@ class ChangeManagement:
         Returns:
             Number of insertions rejected
         """
+        self._load_listed_changes()
         insertions = list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}ins"))
         for ins in insertions:
             self._remove_element(ins)
@@ -156,6 +186,7 @@ class ChangeManagement:
         Returns:
             Number of deletions accepted
         """
+        self._load_listed_changes()
         deletions = list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}del"))
         for del_elem in deletions:
             self._remove_element(del_elem)
@@ -170,6 +201,7 @@ class ChangeManagement:
         Returns:
             Number of deletions rejected
         """
+        self._load_listed_changes()
         deletions = list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}del"))
         for del_elem in deletions:
             self._unwrap_deletion(del_elem)
@@ -184,6 +216,7 @@ class ChangeManagement:
         Returns:
             Number of formatting changes accepted
         """
+        self._load_listed_changes()
         count = 0
 
         # Accept run property changes (character formatting)
@@ -211,6 +244,7 @@ class ChangeManagement:
         Returns:
             Number of formatting changes rejected
         """
+        self._load_listed_changes()
         count = 0
 
         # Reject run property changes - restore previous formatting
@@ -218,6 +252,7 @@ class ChangeManagement:
             parent_rpr = rpr_change.getparent()
             if parent_rpr is None:
                 continue
+            self._invalidate(parent_rpr)
 
             # Get the previous rPr from inside the change element
             previous_rpr = rpr_change.find(f"{{{WORD_NAMESPACE}}}rPr")
@@ -245,6 +280,7 @@ class ChangeManagement:
             parent_ppr = ppr_change.getparent()
             if parent_ppr is None:
                 continue
+            self._invalidate(parent_ppr)
 
             # Get the previous pPr from inside the change element
             previous_ppr = ppr_change.find(f"{{{WORD_NAMESPACE}}}pPr")
@@ -277,6 +313,108 @@ class ChangeManagement:
 
         return count
 
+    # Resolving single changes
+
+    def _accept_element(self, change: Any) -> None:
+        """Accept one tracked change element.
+
+        Args:
+            change: A <w:ins>, <w:del>, <w:rPrChange> or <w:pPrChange> element
+        """
+        self._load_listed_changes()
+        if change.tag == f"{{{WORD_NAMESPACE}}}ins":
+            self._unwrap_element(change)
+        else:
+            # Deleted content and format change records are discarded
+            self._remove_element(change)
+
+    def _reject_element(self, change: Any) -> None:
+        """Reject one tracked change element.
+
+        Args:
+            change: A <w:ins>, <w:del>, <w:rPrChange> or <w:pPrChange> element
+        """
+        self._load_listed_changes()
+        if change.tag == f"{{{WORD_NAMESPACE}}}ins":
+            self._remove_element(change)
+        elif change.tag == f"{{{WORD_NAMESPACE}}}del":
+            self._unwrap_deletion(change)
+        elif change.tag == f"{{{WORD_NAMESPACE}}}rPrChange":
+            parent_rpr = change.getparent()
+            if parent_rpr is not None:
+                self._invalidate(parent_rpr)
+                previous_rpr = change.find(f"{{{WORD_NAMESPACE}}}rPr")
+                # Remove current properties (except rPrChange)
+                for child in list(parent_rpr):
+                    if child.tag != f"{{{WORD_NAMESPACE}}}rPrChange":
+                        parent_rpr.remove(child)
+                parent_rpr.remove(change)
+                # Restore previous
+                if previous_rpr is not None:
+                    for child in previous_rpr:
+                        parent_rpr.append(deepcopy(child))
+        else:
+            parent_ppr = change.getparent()
+            if parent_ppr is not None:
+                self._invalidate(parent_ppr)
+                previous_ppr = change.find(f"{{{WORD_NAMESPACE}}}pPr")
+                # Remove current properties (except pPrChange and rPr)
+                for child in list(parent_ppr):
+                    if child.tag not in (
+                        f"{{{WORD_NAMESPACE}}}pPrChange",
+                        f"{{{WORD_NAMESPACE}}}rPr",
+                    ):
+                        parent_ppr.remove(child)
+                parent_ppr.remove(change)
+                # Restore previous
+                if previous_ppr is not None:
+                    insert_idx = 0
+                    for child in previous_ppr:
+                        parent_ppr.insert(insert_idx, deepcopy(child))
+                        insert_idx += 1
+
+    def _find_change(self, change_id: str | int) -> Any | None:
+        """Find the change element with an ID using the revision index.
+
+        Insertions are preferred over deletions, and deletions over format
+        changes, should several elements share the ID.
+
+        Args:
+            change_id: The change ID (w:id attribute value)
+
+        Returns:
+            The change element, or None if no change has the ID
+        """
+        changes = self._document._revisions.lookup("id", str(change_id))
+        if not changes:
+            return None
+        return min(changes, key=lambda change: RESOLVABLE_TAGS.index(change.tag))
+
+    def _resolve_all(self, changes: list[Any], accept: bool) -> int:
+        """Accept or reject changes, one kind of change at a time.
+
+        Changes are resolved in the same order as when accepting or
+        rejecting every change of a kind: insertions, deletions, then run and
+        paragraph format changes. Changes removed from the document while
+        resolving an earlier kind are skipped.
+
+        Args:
+            changes: Change elements, in document order
+            accept: True to accept the changes, False to reject them
+
+        Returns:
+            Number of changes resolved
+        """
+        resolve = self._accept_element if accept else self._reject_element
+        revisions = self._document._revisions
+        count = 0
+        for tag in RESOLVABLE_TAGS:
+            of_kind = [c for c in changes if c.tag == tag and revisions.attached(c)]
+            for change in of_kind:
+                resolve(change)
+            count += len(of_kind)
+        return count
+
     # Accept/Reject by change ID
 
     def accept_change(self, change_id: str | int) -> None:
@@ -291,37 +429,10 @@ class ChangeManagement:
         Example:
             >>> doc.accept_change("5")
         """
-        change_id_str = str(change_id)
-
-        # Search for insertion with this ID
-        for ins in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}ins"):
-            if ins.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                self._unwrap_element(ins)
-                return
-
-        # Search for deletion with this ID
-        for del_elem in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}del"):
-            if del_elem.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                self._remove_element(del_elem)
-                return
-
-        # Search for run property change with this ID
-        for rpr_change in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}rPrChange"):
-            if rpr_change.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                parent = rpr_change.getparent()
-                if parent is not None:
-                    parent.remove(rpr_change)
-                return
-
-        # Search for paragraph property change with this ID
-        for ppr_change in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}pPrChange"):
-            if ppr_change.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                parent = ppr_change.getparent()
-                if parent is not None:
-                    parent.remove(ppr_change)
-                return
-
-        raise ValueError(f"No tracked change found with ID: {change_id}")
+        change = self._find_change(change_id)
+        if change is None:
+            raise ValueError(f"No tracked change found with ID: {change_id}")
+        self._accept_element(change)
 
     def reject_change(self, change_id: str | int) -> None:
         """Reject a specific tracked change by its ID.
@@ -335,60 +446,52 @@ class ChangeManagement:
         Example:
             >>> doc.reject_change("5")
         """
-        change_id_str = str(change_id)
-
-        # Search for insertion with this ID
-        for ins in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}ins"):
-            if ins.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                self._remove_element(ins)
-                return
-
-        # Search for deletion with this ID
-        for del_elem in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}del"):
-            if del_elem.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                self._unwrap_deletion(del_elem)
-                return
-
-        # Search for run property change with this ID
-        for rpr_change in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}rPrChange"):
-            if rpr_change.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                parent_rpr = rpr_change.getparent()
-                if parent_rpr is not None:
-                    previous_rpr = rpr_change.find(f"{{{WORD_NAMESPACE}}}rPr")
-                    # Remove current properties (except rPrChange)
-                    for child in list(parent_rpr):
-                        if child.tag != f"{{{WORD_NAMESPACE}}}rPrChange":
-                            parent_rpr.remove(child)
-                    parent_rpr.remove(rpr_change)
-                    # Restore previous
-                    if previous_rpr is not None:
-                        for child in previous_rpr:
-                            parent_rpr.append(deepcopy(child))
-                return
-
-        # Search for paragraph property change with this ID
-        for ppr_change in self.xml_root.iter(f"{{{WORD_NAMESPACE}}}pPrChange"):
-            if ppr_change.get(f"{{{WORD_NAMESPACE}}}id") == change_id_str:
-                parent_ppr = ppr_change.getparent()
-                if parent_ppr is not None:
-                    previous_ppr = ppr_change.find(f"{{{WORD_NAMESPACE}}}pPr")
-                    # Remove current properties (except pPrChange and rPr)
-                    for child in list(parent_ppr):
-                        if child.tag not in (
-                            f"{{{WORD_NAMESPACE}}}pPrChange",
-                            f"{{{WORD_NAMESPACE}}}rPr",
-                        ):
-                            parent_ppr.remove(child)
-                    parent_ppr.remove(ppr_change)
-                    # Restore previous
-                    if previous_ppr is not None:
-                        insert_idx = 0
-                        for child in previous_ppr:
-                            parent_ppr.insert(insert_idx, deepcopy(child))
-                            insert_idx += 1
-                return
-
-        raise ValueError(f"No tracked change found with ID: {change_id}")
+        change = self._find_change(change_id)
+        if change is None:
+            raise ValueError(f"No tracked change found with ID: {change_id}")
+        self._reject_element(change)
+
+    def accept_ids(self, change_ids: list[str] | list[int]) -> int:
+        """Accept the tracked changes with the given IDs, last ID first.
+
+        IDs with no change in the document (for example, changes already
+        accepted as part of an enclosing change) are skipped.
+
+        Args:
+            change_ids: Change IDs (w:id attribute values)
+
+        Returns:
+            Number of changes accepted
+        """
+        count = 0
+        ids: list[str | int] = list(change_ids)
+        for change_id in reversed(ids):
+            change = self._find_change(change_id)
+            if change is not None:
+                self._accept_element(change)
+                count += 1
+        return count
+
+    def reject_ids(self, change_ids: list[str] | list[int]) -> int:
+        """Reject the tracked changes with the given IDs, last ID first.
+
+        IDs with no change in the document (for example, changes already
+        removed with an enclosing insertion) are skipped.
+
+        Args:
+            change_ids: Change IDs (w:id attribute values)
+
+        Returns:
+            Number of changes rejected
+        """
+        count = 0
+        ids: list[str | int] = list(change_ids)
+        for change_id in reversed(ids):
+            change = self._find_change(change_id)
+            if change is not None:
+                self._reject_element(change)
+                count += 1
+        return count
 
     # Accept/Reject by author
 
@@ -405,36 +508,7 @@ class ChangeManagement:
             >>> count = doc.accept_by_author("John Doe")
             >>> print(f"Accepted {count} changes from John Doe")
         """
-        count = 0
-
-        # Accept insertions by this author
-        for ins in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}ins")):
-            if ins.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                self._unwrap_element(ins)
-                count += 1
-
-        # Accept deletions by this author
-        for del_elem in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}del")):
-            if del_elem.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                self._remove_element(del_elem)
-                count += 1
-
-        # Accept format changes by this author (remove rPrChange/pPrChange)
-        for rpr_change in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}rPrChange")):
-            if rpr_change.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                parent = rpr_change.getparent()
-                if parent is not None:
-                    parent.remove(rpr_change)
-                count += 1
-
-        for ppr_change in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}pPrChange")):
-            if ppr_change.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                parent = ppr_change.getparent()
-                if parent is not None:
-                    parent.remove(ppr_change)
-                count += 1
-
-        return count
+        return self._resolve_all(self._document._revisions.lookup("author", author), True)
 
     def reject_by_author(self, author: str) -> int:
         """Reject all tracked changes by a specific author.
@@ -449,63 +523,7 @@ class ChangeManagement:
             >>> count = doc.reject_by_author("John Doe")
             >>> print(f"Rejected {count} changes from John Doe")
         """
-        count = 0
-
-        # Reject insertions by this author
-        for ins in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}ins")):
-            if ins.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                self._remove_element(ins)
-                count += 1
-
-        # Reject deletions by this author (convert delText back to t)
-        for del_elem in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}del")):
-            if del_elem.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                self._unwrap_deletion(del_elem)
-                count += 1
-
-        # Reject format changes by this author (restore previous formatting)
-        for rpr_change in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}rPrChange")):
-            if rpr_change.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                parent_rpr = rpr_change.getparent()
-                if parent_rpr is not None:
-                    # Get the previous rPr from inside the change element
-                    prev_rpr = rpr_change.find(f"{{{WORD_NAMESPACE}}}rPr")
-                    if prev_rpr is not None:
-                        # Replace current rPr content with previous
-                        # Clear all children except rPrChange
-                        for child in list(parent_rpr):
-                            if child.tag != f"{{{WORD_NAMESPACE}}}rPrChange":
-                                parent_rpr.remove(child)
-                        # Copy previous formatting back using deepcopy and append
-                        for child in list(prev_rpr):
-                            parent_rpr.append(deepcopy(child))
-                    # Remove the change tracking element
-                    parent_rpr.remove(rpr_change)
-                count += 1
-
-        for ppr_change in list(self.xml_root.iter(f"{{{WORD_NAMESPACE}}}pPrChange")):
-            if ppr_change.get(f"{{{WORD_NAMESPACE}}}author") == author:
-                parent_ppr = ppr_change.getparent()
-                if parent_ppr is not None:
-                    # Get the previous pPr from inside the change element
-                    prev_ppr = ppr_change.find(f"{{{WORD_NAMESPACE}}}pPr")
-                    if prev_ppr is not None:
-                        # Replace current pPr content with previous
-                        # Clear all children except pPrChange and rPr
-                        for child in list(parent_ppr):
-                            if child.tag not in (
-                                f"{{{WORD_NAMESPACE}}}pPrChange",
-                                f"{{{WORD_NAMESPACE}}}rPr",
-                            ):
-                                parent_ppr.remove(child)
-                        # Copy previous formatting back using deepcopy and append
-                        for child in list(prev_ppr):
-                            parent_ppr.append(deepcopy(child))
-                    # Remove the change tracking element
-                    parent_ppr.remove(ppr_change)
-                count += 1
-
-        return count
+        return self._resolve_all(self._document._revisions.lookup("author", author), False)
 
     # Bulk accept/reject with filters
 
@@ -545,25 +563,14 @@ class ChangeManagement:
             self.accept_all()
             return 0  # Can't determine count after the fact
 
-        count = 0
-
         # If only author filter, use existing method for efficiency
         if change_type is None and author is not None:
             return self.accept_by_author(author)
 
-        # Otherwise, get filtered changes and accept each
-        changes = self._document.get_tracked_changes(change_type=change_type, author=author)
-
-        # Accept changes in reverse order to handle nested elements properly
-        for change in reversed(changes):
-            try:
-                self.accept_change(change.id)
-                count += 1
-            except ValueError:
-                # Change may have already been accepted (e.g., nested structure)
-                pass
-
-        return count
+        # Otherwise, get filtered changes and accept each, last first to
+        # handle nested elements properly
+        changes = self._document.iter_tracked_changes(change_type=change_type, author=author)
+        return self.accept_ids([change.id for change in changes])
 
     def reject_changes(
         self,
@@ -601,25 +608,14 @@ class ChangeManagement:
             self.reject_all()
             return 0  # Can't determine count after the fact
 
-        count = 0
-
         # If only author filter, use existing method for efficiency
         if change_type is None and author is not None:
             return self.reject_by_author(author)
 
-        # Otherwise, get filtered changes and reject each
-        changes = self._document.get_tracked_changes(change_type=change_type, author=author)
-
-        # Reject changes in reverse order to handle nested elements properly
-        for change in reversed(changes):
-            try:
-                self.reject_change(change.id)
-                count += 1
-            except ValueError:
-                # Change may have already been rejected (e.g., nested structure)
-                pass
-
-        return count
+        # Otherwise, get filtered changes and reject each, last first to
+        # handle nested elements properly
+        changes = self._document.iter_tracked_changes(change_type=change_type, author=author)
+        return self.reject_ids([change.id for change in changes])
 
     # Accept/Reject by text content
 
@@ -668,7 +664,7 @@ class ChangeManagement:
         matching_changes = []
         if regex:
             flags = 0 if match_case else re.IGNORECASE
-            pattern = re.compile(text, flags)
+            pattern = compile_regex(text, flags)
             for change in changes:
                 if change.text and pattern.search(change.text):
                     matching_changes.append(change)
@@ -679,17 +675,8 @@ class ChangeManagement:
                 if search_text in change_text:
                     matching_changes.append(change)
 
-        # Reject matching changes in reverse order to handle nested elements properly
-        count = 0
-        for change in reversed(matching_changes):
-            try:
-                self.reject_change(change.id)
-                count += 1
-            except ValueError:
-                # Change may have already been rejected (e.g., nested structure)
-                pass
-
-        return count
+        # Reject matching changes last first to handle nested elements properly
+        return self.reject_ids([change.id for change in matching_changes])
 
     def accept_changes_containing(
         self,
@@ -736,7 +723,7 @@ class ChangeManagement:
         matching_changes = []
         if regex:
             flags = 0 if match_case else re.IGNORECASE
-            pattern = re.compile(text, flags)
+            pattern = compile_regex(text, flags)
             for change in changes:
                 if change.text and pattern.search(change.text):
                     matching_changes.append(change)
@@ -747,14 +734,5 @@ class ChangeManagement:
                 if search_text in change_text:
                     matching_changes.append(change)
 
-        # Accept matching changes in reverse order to handle nested elements properly
-        count = 0
-        for change in reversed(matching_changes):
-            try:
-                self.accept_change(change.id)
-                count += 1
-            except ValueError:
-                # Change may have already been accepted (e.g., nested structure)
-                pass
-
-        return count
+        # Accept matching changes last first to handle nested elements properly
+        return self.accept_ids([change.id for change in matching_changes])
@@ -16,6 +16,7 @@ from lxml import etree
 from ..constants import WORD_NAMESPACE
 from ..content_types import ContentTypeManager, ContentTypes
 from ..errors import AmbiguousTextError, TextNotFoundError
+from ..id_allocator import COMMENT
 from ..relationships import RelationshipManager, RelationshipTypes
 from ..scope import ScopeEvaluator
 from ..suggestions import SuggestionGenerator
@@ -280,7 +281,7 @@ class CommentOperations:
                 current_comment_id, text, author, initials, timestamp
             )
 
-            start_para = Paragraph(match.paragraph)
+            start_para = Paragraph(match.paragraph, on_change=self._document._text_index.invalidate)
             comment_range = CommentRange(
                 start_paragraph=start_para,
                 end_paragraph=start_para,
@@ -386,7 +387,7 @@ class CommentOperations:
     def _remove_comment_package_files(self) -> None:
         """Remove comment-related files from the ZIP package."""
         doc = self._document
-        if not (doc._is_zip and doc._temp_dir):
+        if doc._package is None:
             return
 
         comment_files = [
@@ -395,14 +396,11 @@ class CommentOperations:
             "word/commentsIds.xml",
             "word/commentsExtensible.xml",
         ]
-        for file_path in comment_files:
-            full_path = doc._temp_dir / file_path
-            if full_path.exists():
-                full_path.unlink()
+        for part_name in comment_files:
+            doc._package.delete_part(part_name)
 
-        if doc._package:
-            self._remove_comment_relationships()
-            self._remove_comment_content_types()
+        self._remove_comment_relationships()
+        self._remove_comment_content_types()
 
     def _remove_comment_relationships(self) -> None:
         """Remove comment relationships from document.xml.rels."""
@@ -463,15 +461,10 @@ class CommentOperations:
             Root element of comments.xml or None if not present
         """
         doc = self._document
-        if not doc._is_zip or not doc._temp_dir:
+        if doc._package is None:
             return None
 
-        comments_path = doc._temp_dir / "word" / "comments.xml"
-        if not comments_path.exists():
-            return None
-
-        tree = etree.parse(str(comments_path))
-        return tree.getroot()
+        return doc._package.get_part("word/comments.xml")
 
     def _build_comment_ranges(self) -> dict[str, Any]:
         """Build a mapping of comment ID to marked text range.
@@ -556,7 +549,7 @@ class CommentOperations:
             if parent is None:
                 break
             if parent.tag == f"{{{WORD_NAMESPACE}}}p":
-                return Paragraph(parent)
+                return Paragraph(parent, on_change=self._document._text_index.invalidate)
             current = parent
 
         return None
@@ -579,20 +572,8 @@ class CommentOperations:
         raise ValueError(f"Comment with ID '{ref_id}' not found")
 
     def _get_next_comment_id(self) -> int:
-        """Get the next available comment ID."""
-        comments_xml = self._load_comments_xml()
-        if comments_xml is None:
-            return 0
-
-        max_id = -1
-        for comment_elem in comments_xml.findall(f".//{{{WORD_NAMESPACE}}}comment"):
-            try:
-                comment_id = int(comment_elem.get(f"{{{WORD_NAMESPACE}}}id", "0"))
-                max_id = max(max_id, comment_id)
-            except ValueError:
-                pass
-
-        return max_id + 1
+        """Allocate the next available comment ID."""
+        return self._document._ids.allocate(COMMENT)
 
     def _insert_comment_markers(self, match: TextSpan, comment_id: int) -> None:
         """Insert comment range markers around matched text.
@@ -689,11 +670,10 @@ class CommentOperations:
         import random
 
         doc = self._document
-        if doc._temp_dir is None:
+        if doc._package is None:
             raise ValueError("Cannot add comments to non-ZIP documents")
 
-        comments_path = doc._temp_dir / "word" / "comments.xml"
-        root, tree = self._load_or_create_comments_xml(comments_path)
+        root = self._load_or_create_comments_xml()
 
         # OOXML spec requires paraId to be less than 0x80000000
         para_id = f"{random.randint(0, 0x7FFFFFFF):08X}"
@@ -701,23 +681,22 @@ class CommentOperations:
             root, comment_id, text, author, initials, timestamp, para_id
         )
 
-        tree.write(str(comments_path), encoding="utf-8", xml_declaration=True, pretty_print=True)
+        doc._package.set_part("word/comments.xml", root, pretty_print=True)
         return comment_elem
 
-    def _load_or_create_comments_xml(self, comments_path) -> tuple:
+    def _load_or_create_comments_xml(self) -> etree._Element:
         """Load existing comments.xml or create a new one."""
-        if comments_path.exists():
-            tree = etree.parse(str(comments_path))
-            return tree.getroot(), tree
+        root = self._load_comments_xml()
+        if root is not None:
+            return root
 
         root = etree.Element(
             f"{{{WORD_NAMESPACE}}}comments",
             nsmap={"w": WORD_NAMESPACE, "w14": W14_NAMESPACE},
         )
-        tree = etree.ElementTree(root)
         self._ensure_comments_relationship()
         self._ensure_comments_content_type()
-        return root, tree
+        return root
 
     def _create_comment_element(
         self,
@@ -749,19 +728,15 @@ class CommentOperations:
         """Create parent-child relationship in commentsExtended.xml."""
         doc = self._document
 
-        if doc._temp_dir is None:
+        if doc._package is None:
             raise ValueError("Cannot link comments in non-ZIP documents")
-        comments_ex_path = doc._temp_dir / "word" / "commentsExtended.xml"
 
-        if comments_ex_path.exists():
-            tree = etree.parse(str(comments_ex_path))
-            root = tree.getroot()
-        else:
+        root = doc._package.get_part("word/commentsExtended.xml")
+        if root is None:
             root = etree.Element(
                 f"{{{W15_NAMESPACE}}}commentsEx",
                 nsmap={"w15": W15_NAMESPACE},
             )
-            tree = etree.ElementTree(root)
 
             self._ensure_comments_extended_relationship()
             self._ensure_comments_extended_content_type()
@@ -772,12 +747,7 @@ class CommentOperations:
         comment_ex.set(f"{{{W15_NAMESPACE}}}paraIdParent", parent_para_id)
         comment_ex.set(f"{{{W15_NAMESPACE}}}done", "0")
 
-        tree.write(
-            str(comments_ex_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        doc._package.set_part("word/commentsExtended.xml", root, pretty_print=True)
 
     def _ensure_comments_relationship(self) -> None:
         """Ensure comments.xml relationship exists."""
@@ -822,16 +792,13 @@ class CommentOperations:
     def _get_comment_ex(self, para_id: str) -> etree._Element | None:
         """Get the commentEx element for a given paraId."""
         doc = self._document
-        if not doc._is_zip or not doc._temp_dir:
+        if doc._package is None:
             return None
 
-        comments_ex_path = doc._temp_dir / "word" / "commentsExtended.xml"
-        if not comments_ex_path.exists():
+        root = doc._package.get_part("word/commentsExtended.xml")
+        if root is None:
             return None
 
-        tree = etree.parse(str(comments_ex_path))
-        root = tree.getroot()
-
         for comment_ex in root.findall(f".//{{{W15_NAMESPACE}}}commentEx"):
             if comment_ex.get(f"{{{W15_NAMESPACE}}}paraId") == para_id:
                 return comment_ex
@@ -841,20 +808,15 @@ class CommentOperations:
     def _set_comment_resolved(self, para_id: str, resolved: bool) -> None:
         """Set the resolved status for a comment."""
         doc = self._document
-        if not doc._is_zip or not doc._temp_dir:
+        if doc._package is None:
             raise ValueError("Cannot set resolution on non-ZIP documents")
 
-        comments_ex_path = doc._temp_dir / "word" / "commentsExtended.xml"
-
-        if comments_ex_path.exists():
-            tree = etree.parse(str(comments_ex_path))
-            root = tree.getroot()
-        else:
+        root = doc._package.get_part("word/commentsExtended.xml")
+        if root is None:
             root = etree.Element(
                 f"{{{W15_NAMESPACE}}}commentsEx",
                 nsmap={"w15": W15_NAMESPACE},
             )
-            tree = etree.ElementTree(root)
 
             self._ensure_comments_extended_relationship()
             self._ensure_comments_extended_content_type()
@@ -872,12 +834,7 @@ class CommentOperations:
 
         comment_ex.set(f"{{{W15_NAMESPACE}}}done", "1" if resolved else "0")
 
-        tree.write(
-            str(comments_ex_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        doc._package.set_part("word/commentsExtended.xml", root, pretty_print=True)
 
     def _delete_comment(self, comment_id: str, para_id: str | None) -> None:
         """Delete a comment by ID."""
@@ -924,49 +881,33 @@ class CommentOperations:
     def _remove_from_comments_xml(self, comment_id: str) -> None:
         """Remove a comment from comments.xml."""
         doc = self._document
-        if not doc._is_zip or not doc._temp_dir:
+        if doc._package is None:
             return
 
-        comments_path = doc._temp_dir / "word" / "comments.xml"
-        if not comments_path.exists():
+        root = doc._package.get_part("word/comments.xml")
+        if root is None:
             return
 
-        tree = etree.parse(str(comments_path))
-        root = tree.getroot()
-
         for comment_elem in list(root.findall(f".//{{{WORD_NAMESPACE}}}comment")):
             if comment_elem.get(f"{{{WORD_NAMESPACE}}}id") == comment_id:
                 root.remove(comment_elem)
                 break
 
-        tree.write(
-            str(comments_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        doc._package.set_part("word/comments.xml", root, pretty_print=True)
 
     def _remove_from_comments_extended(self, para_id: str) -> None:
         """Remove a comment from commentsExtended.xml."""
         doc = self._document
-        if not doc._is_zip or not doc._temp_dir:
+        if doc._package is None:
             return
 
-        comments_ex_path = doc._temp_dir / "word" / "commentsExtended.xml"
-        if not comments_ex_path.exists():
+        root = doc._package.get_part("word/commentsExtended.xml")
+        if root is None:
             return
 
-        tree = etree.parse(str(comments_ex_path))
-        root = tree.getroot()
-
         for comment_ex in list(root.findall(f".//{{{W15_NAMESPACE}}}commentEx")):
             if comment_ex.get(f"{{{W15_NAMESPACE}}}paraId") == para_id:
                 root.remove(comment_ex)
                 break
 
-        tree.write(
-            str(comments_ex_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        doc._package.set_part("word/commentsExtended.xml", root, pretty_print=True)
@@ -314,25 +314,14 @@ class ComparisonOperations:
             if not run_text:
                 continue
 
-            # Create deletion XML (this creates w:del containing w:r with w:delText)
-            del_xml = self._document._xml_generator.create_deletion(run_text, author)
-
-            # Parse the deletion XML
-            del_elem = etree.fromstring(
-                f'<root xmlns:w="{WORD_NAMESPACE}" '
-                f'xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du" '
-                f'xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml">'
-                f"{del_xml}</root>"
-            )
-
-            # Get the w:del element
-            del_node = del_elem.find(f"{{{WORD_NAMESPACE}}}del")
-            if del_node is not None:
-                # Insert the w:del at the paragraph level, before the original run
-                run_idx = list(paragraph).index(run)
-                paragraph.insert(run_idx, del_node)
-                # Remove the original run
-                paragraph.remove(run)
+            # Create deletion (a w:del containing w:r with w:delText)
+            del_node = self._document._xml_generator.create_deletion_element(run_text, author)
+
+            # Insert the w:del at the paragraph level, before the original run
+            run_idx = list(paragraph).index(run)
+            paragraph.insert(run_idx, del_node)
+            # Remove the original run
+            paragraph.remove(run)
 
     def _insert_comparison_paragraph(
         self,
@@ -351,24 +340,9 @@ class ComparisonOperations:
             text: Text content of the new paragraph
             author: Author for the insertion
         """
-        # Create insertion XML
-        ins_xml = self._document._xml_generator.create_insertion(text, author)
-
         # Create a new paragraph with the insertion
         new_para = etree.Element(f"{{{WORD_NAMESPACE}}}p")
-
-        # Parse the insertion XML
-        ins_elem = etree.fromstring(
-            f'<root xmlns:w="{WORD_NAMESPACE}" '
-            f'xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du" '
-            f'xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml">'
-            f"{ins_xml}</root>"
-        )
-
-        # Get the w:ins element
-        ins_node = ins_elem.find(f"{{{WORD_NAMESPACE}}}ins")
-        if ins_node is not None:
-            new_para.append(ins_node)
+        new_para.append(self._document._xml_generator.create_insertion_element(text, author))
 
         # Insert the new paragraph at the appropriate position
         if after_index < 0:
@@ -30,6 +30,7 @@ from ..errors import (
     InvalidBookmarkNameError,
     TextNotFoundError,
 )
+from ..id_allocator import BOOKMARK
 from ..scope import ScopeEvaluator
 
 if TYPE_CHECKING:
@@ -477,24 +478,12 @@ class CrossReferenceOperations:
         return name
 
     def _get_next_bookmark_id(self) -> int:
-        """Get the next available bookmark ID.
-
-        Scans all bookmarkStart elements to find the maximum ID and returns
-        the next available one.
+        """Allocate the next available bookmark ID.
 
         Returns:
             The next available bookmark ID (integer)
         """
-        max_id = -1
-
-        for bookmark_start in self._document.xml_root.iter(f"{{{WORD_NAMESPACE}}}bookmarkStart"):
-            try:
-                bk_id = int(bookmark_start.get(w("id"), "0"))
-                max_id = max(max_id, bk_id)
-            except ValueError:
-                pass
-
-        return max_id + 1
+        return self._document._ids.allocate(BOOKMARK)
 
     def list_bookmarks(
         self,
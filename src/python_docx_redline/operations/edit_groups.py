@@ -242,16 +242,9 @@ class EditGroupMixin:
         """
         self._ensure_edit_groups()
         ids = self._edit_groups.get_group_ids(group_name)
-        count = 0
 
         # Reject in reverse order to handle nested elements properly
-        for change_id in reversed(ids):
-            try:
-                self._change_mgmt.reject_change(change_id)
-                count += 1
-            except ValueError:
-                # Change may have already been rejected or no longer exists
-                pass
+        count = self._change_mgmt.reject_ids(ids)
 
         self._edit_groups.mark_rejected(group_name)
         return count
@@ -281,15 +274,6 @@ class EditGroupMixin:
         """
         self._ensure_edit_groups()
         ids = self._edit_groups.get_group_ids(group_name)
-        count = 0
 
         # Accept in reverse order to handle nested elements properly
-        for change_id in reversed(ids):
-            try:
-                self._change_mgmt.accept_change(change_id)
-                count += 1
-            except ValueError:
-                # Change may have already been accepted or no longer exists
-                pass
-
-        return count
+        return self._change_mgmt.accept_ids(ids)
@@ -70,7 +70,7 @@ class HeaderFooterOperations:
         """
         from ..models.header_footer import Header, HeaderFooterType
 
-        if not self._document._temp_dir:
+        if self._document._package is None:
             return []
 
         # Load relationships to map rId -> filename
@@ -136,7 +136,7 @@ class HeaderFooterOperations:
         """
         from ..models.header_footer import Footer, HeaderFooterType
 
-        if not self._document._temp_dir:
+        if self._document._package is None:
             return []
 
         # Load relationships to map rId -> filename
@@ -191,16 +191,14 @@ class HeaderFooterOperations:
         Returns:
             Dictionary mapping relationship IDs to target filenames
         """
-        if not self._document._temp_dir:
+        if self._document._package is None:
             return {}
 
-        rels_path = self._document._temp_dir / "word" / "_rels" / "document.xml.rels"
-        if not rels_path.exists():
+        root = self._document._package.get_part("word/_rels/document.xml.rels")
+        if root is None:
             return {}
 
         rels_ns = "http://schemas.openxmlformats.org/package/2006/relationships"
-        tree = etree.parse(str(rels_path))
-        root = tree.getroot()
 
         rel_map: dict[str, str] = {}
         for rel in root.findall(f"{{{rels_ns}}}Relationship"):
@@ -220,20 +218,10 @@ class HeaderFooterOperations:
         Returns:
             The root element of the header/footer XML, or None if not found
         """
-        if not self._document._temp_dir:
+        if self._document._package is None:
             return None
 
-        # Handle relative paths - they're relative to word/
-        if not target.startswith("/"):
-            file_path = self._document._temp_dir / "word" / target
-        else:
-            file_path = self._document._temp_dir / target.lstrip("/")
-
-        if not file_path.exists():
-            return None
-
-        tree = etree.parse(str(file_path))
-        return tree.getroot()
+        return self._document._package.get_part(self._target_part_name(target))
 
     def _save_header_footer_xml(self, target: str, root: etree._Element) -> None:
         """Save a header or footer XML file.
@@ -242,22 +230,25 @@ class HeaderFooterOperations:
             target: The target path from relationships (e.g., "header1.xml")
             root: The root element to save
         """
-        if not self._document._temp_dir:
+        if self._document._package is None:
             return
 
-        # Handle relative paths
+        self._document._package.set_part(self._target_part_name(target), root, standalone=True)
+
+    @staticmethod
+    def _target_part_name(target: str) -> str:
+        """Resolve a relationship target to a package part name.
+
+        Args:
+            target: The target path from relationships (e.g., "header1.xml")
+
+        Returns:
+            The part name within the package (e.g., "word/header1.xml")
+        """
+        # Relative targets are relative to word/
         if not target.startswith("/"):
-            file_path = self._document._temp_dir / "word" / target
-        else:
-            file_path = self._document._temp_dir / target.lstrip("/")
-
-        tree = etree.ElementTree(root)
-        tree.write(
-            str(file_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            standalone=True,
-        )
+            return f"word/{target}"
+        return target.lstrip("/")
 
     def _get_header_by_type(self, header_type: str) -> Header | None:
         """Get a header by its type.
@@ -579,20 +570,10 @@ class HeaderFooterOperations:
                         reason,
                     )
 
-            # Coarse tracked replacement: deletion + insertion XML
-            deletion_xml = self._document._xml_generator.create_deletion(find, author)
-            insertion_xml = self._document._xml_generator.create_insertion(replace, author)
-
-            # Parse the XML elements
-            wrapped_deletion = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {deletion_xml}{insertion_xml}
-</root>"""
-            root = etree.fromstring(wrapped_deletion.encode("utf-8"))
-            deletion_element = root[0]
-            insertion_element = root[1]
+            # Coarse tracked replacement: deletion + insertion
+            generator = self._document._xml_generator
+            deletion_element = generator.create_deletion_element(find, author)
+            insertion_element = generator.create_insertion_element(replace, author)
 
             # Replace the match with deletion + insertion
             self._document._replace_match_with_elements(
@@ -664,18 +645,8 @@ class HeaderFooterOperations:
         match = matches[0]
 
         if track:
-            # Generate the tracked insertion XML
-            insertion_xml = self._document._xml_generator.create_insertion(text, author)
-
-            # Parse the insertion XML
-            wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {insertion_xml}
-</root>"""
-            root = etree.fromstring(wrapped_xml.encode("utf-8"))
-            insertion_element = root[0]
+            # Generate the tracked insertion
+            insertion_element = self._document._xml_generator.create_insertion_element(text, author)
         else:
             # Create a plain run for untracked insert
             source_run = match.runs[0] if match.runs else None
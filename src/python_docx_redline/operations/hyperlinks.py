@@ -159,7 +159,7 @@ class HyperlinkOperations:
             raise ValueError("Must specify either 'after' or 'before' parameter")
 
         # Ensure we have a valid package
-        if not self._document._is_zip or not self._document._temp_dir:
+        if not self._document._is_zip or not self._document._package:
             raise ValueError("Cannot add hyperlinks to non-ZIP documents")
 
         # Find location for hyperlink insertion
@@ -286,7 +286,7 @@ class HyperlinkOperations:
             )
 
         # Ensure we have a valid package
-        if not self._document._is_zip or not self._document._temp_dir:
+        if not self._document._is_zip or not self._document._package:
             raise ValueError("Cannot add hyperlinks to non-ZIP documents")
 
         # Get the header
@@ -421,7 +421,7 @@ class HyperlinkOperations:
             )
 
         # Ensure we have a valid package
-        if not self._document._is_zip or not self._document._temp_dir:
+        if not self._document._is_zip or not self._document._package:
             raise ValueError("Cannot add hyperlinks to non-ZIP documents")
 
         # Get the footer
@@ -714,7 +714,7 @@ class HyperlinkOperations:
             raise ValueError("new_url cannot be empty")
 
         # Ensure we have a valid package
-        if not self._document._is_zip or not self._document._temp_dir:
+        if not self._document._is_zip or not self._document._package:
             raise ValueError("Cannot edit hyperlinks in non-ZIP documents")
 
         package = self._document._package
@@ -788,12 +788,9 @@ class HyperlinkOperations:
         if track:
             # Create tracked deletion for old text and insertion for new text
             # Replace all runs with deletion + insertion
-            deletion_xml = self._document._xml_generator.create_deletion(old_text, author)
-            insertion_xml = self._document._xml_generator.create_insertion(new_text, author)
-
-            # Parse both elements
-            deletion_elements = self._parse_xml_elements(deletion_xml)
-            insertion_elements = self._parse_xml_elements(insertion_xml)
+            generator = self._document._xml_generator
+            deletion_element = generator.create_deletion_element(old_text, author)
+            insertion_element = generator.create_insertion_element(new_text, author)
 
             # Get first run position
             first_run_index = list(hyperlink_elem).index(runs[0])
@@ -803,13 +800,8 @@ class HyperlinkOperations:
                 hyperlink_elem.remove(run)
 
             # Insert deletion and insertion elements at the first run position
-            insert_pos = first_run_index
-            for elem in deletion_elements:
-                hyperlink_elem.insert(insert_pos, elem)
-                insert_pos += 1
-            for elem in insertion_elements:
-                hyperlink_elem.insert(insert_pos, elem)
-                insert_pos += 1
+            hyperlink_elem.insert(first_run_index, deletion_element)
+            hyperlink_elem.insert(first_run_index + 1, insertion_element)
         else:
             # Untracked edit: replace text content while preserving Hyperlink style
             # Strategy: preserve rStyle from first run, remove all runs, create new runs
@@ -1006,10 +998,9 @@ class HyperlinkOperations:
                 link_text = self._get_hyperlink_text(hyperlink_elem)
                 if link_text:
                     # Create tracked deletion element
-                    deletion_xml = self._document._xml_generator.create_deletion(link_text, author)
-                    # Parse the deletion XML
-                    elements = self._parse_xml_elements(deletion_xml)
-                    deletion_element = elements[0]
+                    deletion_element = self._document._xml_generator.create_deletion_element(
+                        link_text, author
+                    )
 
                     # Replace hyperlink with deletion element
                     parent.remove(hyperlink_elem)
@@ -1299,24 +1290,6 @@ class HyperlinkOperations:
                     if len(run_props) == 0:
                         run.remove(run_props)
 
-    def _parse_xml_elements(self, xml_content: str) -> list:
-        """Parse XML content into lxml elements with proper namespaces.
-
-        Args:
-            xml_content: The XML string(s) to parse (can be multiple fragments)
-
-        Returns:
-            List of parsed lxml Elements
-        """
-        wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {xml_content}
-</root>"""
-        root = etree.fromstring(wrapped_xml.encode("utf-8"))
-        return list(root)
-
     def _insert_hyperlink_in_note(
         self,
         note_type: str,
@@ -1366,33 +1339,28 @@ class HyperlinkOperations:
             raise ValueError("Must specify either 'after' or 'before' parameter")
 
         # Ensure we have a valid package
-        if not self._document._is_zip or not self._document._temp_dir:
+        if not self._document._is_zip or not self._document._package:
             raise ValueError("Cannot add hyperlinks to non-ZIP documents")
 
-        temp_dir = self._document._temp_dir
         package = self._document._package
         if not package:
             raise ValueError("Cannot add hyperlinks: package not available")
 
-        # Determine file paths based on note type
+        # Determine part names based on note type
         if note_type == "footnote":
-            xml_path = temp_dir / "word" / "footnotes.xml"
             rels_part = "word/footnotes.xml"
             tag_name = "footnote"
         else:
-            xml_path = temp_dir / "word" / "endnotes.xml"
             rels_part = "word/endnotes.xml"
             tag_name = "endnote"
 
         # Find the note element
         note_id_str = str(note_id)
 
-        if not xml_path.exists():
+        root = package.get_part(rels_part)
+        if root is None:
             raise NoteNotFoundError(note_type, note_id_str, [])
 
-        tree = etree.parse(str(xml_path))
-        root = tree.getroot()
-
         # Find the note element by ID
         note_elem = None
         available_ids: list[str] = []
@@ -1479,11 +1447,6 @@ class HyperlinkOperations:
             self._insert_before_match(match, hyperlink_elem)
 
         # Save the modified XML
-        tree.write(
-            str(xml_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package.set_part(rels_part, root, pretty_print=True)
 
         return r_id
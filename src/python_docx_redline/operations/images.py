@@ -7,11 +7,11 @@ including inserting images into documents with optional tracking.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import random
-import shutil
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Any
 
 from lxml import etree
@@ -45,6 +45,8 @@ EMU_PER_INCH = 914400
 EMU_PER_CM = 360000
 EMU_PER_PIXEL = 9525  # At 96 DPI
 
+MEDIA_PREFIX = "word/media/"
+
 
 def _get_image_dimensions(image_path: Path) -> tuple[int, int] | None:
     """Try to get image dimensions using PIL/Pillow.
@@ -66,6 +68,11 @@ def _get_image_dimensions(image_path: Path) -> tuple[int, int] | None:
         return None
 
 
+def _content_hash(data: bytes) -> str:
+    """Hash media contents for deduplication."""
+    return hashlib.sha256(data).hexdigest()
+
+
 def _generate_docpr_id() -> int:
     """Generate a random ID for docPr element."""
     return random.randint(1, 2147483647)
@@ -79,6 +86,9 @@ class ImageOperations:
     - Wrapping image insertions in tracked changes
     - Managing image relationships and content types
 
+    Media is stored by content: inserting the same image bytes again reuses
+    the existing media part and relationship instead of adding a copy.
+
     The class takes a Document reference and operates on its XML structure.
 
     Example:
@@ -95,6 +105,8 @@ class ImageOperations:
             document: The Document instance to operate on
         """
         self._document = document
+        # Content hash -> media part name, built on first insertion
+        self._media_by_hash: dict[str, str] | None = None
 
     def _find_unique_match(
         self,
@@ -137,9 +149,26 @@ class ImageOperations:
 
         return matches[0]
 
+    def _media_index(self) -> dict[str, str]:
+        """Get the content hash index of the media parts in the package."""
+        if self._media_by_hash is None:
+            package = self._document._package
+            assert package is not None
+
+            self._media_by_hash = {}
+            for part_name in package.part_names():
+                if part_name.startswith(MEDIA_PREFIX):
+                    data = package.get_part_bytes(part_name)
+                    if data is not None:
+                        self._media_by_hash.setdefault(_content_hash(data), part_name)
+        return self._media_by_hash
+
     def _add_image_to_package(self, image_path: Path) -> str:
         """Add an image file to the document package.
 
+        If the package already holds a media part with the same bytes, that
+        part is reused.
+
         Args:
             image_path: Path to the image file
 
@@ -149,30 +178,89 @@ class ImageOperations:
         if self._document._package is None:
             raise ValueError("Cannot add images to documents without a package")
 
-        # Create word/media directory if it doesn't exist
-        media_dir = self._document._package.temp_dir / "word" / "media"
-        media_dir.mkdir(parents=True, exist_ok=True)
+        package = self._document._package
+        data = image_path.read_bytes()
+        digest = _content_hash(data)
+
+        media_index = self._media_index()
+        existing = media_index.get(digest)
+        if existing is not None:
+            # The part may have been replaced or removed since it was indexed
+            if package.get_part_bytes(existing) == data:
+                return existing.removeprefix("word/")
+            del media_index[digest]
 
         # Find next available image number
-        existing_images = list(media_dir.glob("image*"))
         next_num = 1
-        for img in existing_images:
+        for part_name in package.part_names():
+            if not part_name.startswith("word/media/image"):
+                continue
             try:
                 # Extract number from "image1.png" etc.
-                num = int(img.stem.replace("image", ""))
+                num = int(PurePosixPath(part_name).stem.replace("image", ""))
                 if num >= next_num:
                     next_num = num + 1
             except ValueError:
                 pass
 
-        # Copy image to media folder with new name
+        # Copy image into the media folder with new name
         extension = image_path.suffix.lower()
         new_name = f"image{next_num}{extension}"
-        dest_path = media_dir / new_name
-        shutil.copy2(image_path, dest_path)
+        package.set_part_bytes(f"{MEDIA_PREFIX}{new_name}", data)
+        media_index[digest] = f"{MEDIA_PREFIX}{new_name}"
 
         return f"media/{new_name}"
 
+    def deduplicate_media(self) -> int:
+        """Collapse media parts with identical contents into a single part.
+
+        Relationships from every part (document, headers, footers, notes)
+        that target a duplicate are pointed at the part that is kept, and
+        the duplicates are removed from the package.
+
+        Returns:
+            Number of media parts removed
+        """
+        package = self._document._package
+        if package is None:
+            return 0
+
+        part_names = package.part_names()
+        kept: dict[str, str] = {}
+        replacements: dict[str, str] = {}
+        for part_name in part_names:
+            if not part_name.startswith(MEDIA_PREFIX):
+                continue
+            data = package.get_part_bytes(part_name)
+            if data is None:
+                continue
+            original = kept.setdefault(_content_hash(data), part_name)
+            if original != part_name:
+                replacements[part_name] = original
+
+        if not replacements:
+            return 0
+
+        for rels_part in part_names:
+            rels_path = PurePosixPath(rels_part)
+            if rels_path.suffix != ".rels" or rels_path.parent.name != "_rels":
+                continue
+            source_part = (rels_path.parent.parent / rels_path.stem).as_posix()
+            rel_manager = RelationshipManager(package, source_part)
+            if rel_manager.retarget_parts(replacements):
+                rel_manager.save()
+
+        for part_name in replacements:
+            package.delete_part(part_name)
+
+        ct_manager = ContentTypeManager(package)
+        if ct_manager.remove_overrides([f"/{name}" for name in replacements]):
+            ct_manager.save()
+
+        self._media_by_hash = {digest: name for digest, name in kept.items()}
+        logger.debug(f"Removed {len(replacements)} duplicate media parts")
+        return len(replacements)
+
     def _ensure_content_type(self, extension: str) -> None:
         """Ensure the content type for an image extension is registered.
 
@@ -192,7 +280,7 @@ class ImageOperations:
             ct_manager.save()
 
     def _add_image_relationship(self, image_target: str) -> str:
-        """Add a relationship for the image.
+        """Add a relationship for the image, reusing one that targets the same part.
 
         Args:
             image_target: Relative path to the image (e.g., "media/image1.png")
@@ -204,8 +292,10 @@ class ImageOperations:
             raise ValueError("Cannot add relationships to documents without a package")
 
         rel_manager = RelationshipManager(self._document._package, "word/document.xml")
-        rel_id = rel_manager.add_unique_relationship(RelationshipTypes.IMAGE, image_target)
-        rel_manager.save()
+        rel_id = rel_manager.find_relationship(RelationshipTypes.IMAGE, image_target)
+        if rel_id is None:
+            rel_id = rel_manager.add_unique_relationship(RelationshipTypes.IMAGE, image_target)
+            rel_manager.save()
 
         return rel_id
 
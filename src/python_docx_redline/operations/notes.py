@@ -11,7 +11,6 @@ Rich content support:
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from lxml import etree
@@ -19,6 +18,7 @@ from lxml import etree
 from ..constants import WORD_NAMESPACE
 from ..content_types import ContentTypeManager, ContentTypes
 from ..errors import AmbiguousTextError, NoteNotFoundError, TextNotFoundError
+from ..id_allocator import ENDNOTE, FOOTNOTE
 from ..markdown_parser import parse_markdown
 from ..relationships import RelationshipManager, RelationshipTypes
 from ..scope import ScopeEvaluator
@@ -69,17 +69,14 @@ class NoteOperations:
         """
         from ..models.footnote import Footnote
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             return []
 
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-        if not footnotes_path.exists():
+        root = package.get_part("word/footnotes.xml")
+        if root is None:
             return []
 
-        tree = etree.parse(str(footnotes_path))
-        root = tree.getroot()
-
         # Find all footnote elements
         footnote_elems = root.findall(f"{{{WORD_NAMESPACE}}}footnote")
 
@@ -100,17 +97,14 @@ class NoteOperations:
         """
         from ..models.footnote import Endnote
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             return []
 
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-        if not endnotes_path.exists():
+        root = package.get_part("word/endnotes.xml")
+        if root is None:
             return []
 
-        tree = etree.parse(str(endnotes_path))
-        root = tree.getroot()
-
         # Find all endnote elements
         endnote_elems = root.findall(f"{{{WORD_NAMESPACE}}}endnote")
 
@@ -142,17 +136,14 @@ class NoteOperations:
         """
         from ..models.footnote import OrphanedFootnote
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
-            return []
-
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-        if not footnotes_path.exists():
+        package = self._document._package
+        if package is None:
             return []
 
         # Get all footnote IDs from footnotes.xml (excluding system footnotes)
-        tree = etree.parse(str(footnotes_path))
-        root = tree.getroot()
+        root = package.get_part("word/footnotes.xml")
+        if root is None:
+            return []
 
         footnote_ids_in_xml: set[str] = set()
         footnote_texts: dict[str, str] = {}
@@ -221,17 +212,14 @@ class NoteOperations:
         """
         from ..models.footnote import OrphanedEndnote
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
-            return []
-
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-        if not endnotes_path.exists():
+        package = self._document._package
+        if package is None:
             return []
 
         # Get all endnote IDs from endnotes.xml (excluding system endnotes)
-        tree = etree.parse(str(endnotes_path))
-        root = tree.getroot()
+        root = package.get_part("word/endnotes.xml")
+        if root is None:
+            return []
 
         endnote_ids_in_xml: set[str] = set()
         endnote_texts: dict[str, str] = {}
@@ -353,29 +341,20 @@ class NoteOperations:
         # Verify footnote exists (will raise NoteNotFoundError if not found)
         self.get_footnote(note_id_str)
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             raise ValueError("Cannot delete footnotes from non-ZIP documents")
 
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-
         # Remove from footnotes.xml
-        if footnotes_path.exists():
-            tree = etree.parse(str(footnotes_path))
-            root = tree.getroot()
-
+        root = package.get_part("word/footnotes.xml")
+        if root is not None:
             # Find and remove the footnote element
             for fn_elem in root.findall(f"{{{WORD_NAMESPACE}}}footnote"):
                 if fn_elem.get(f"{{{WORD_NAMESPACE}}}id") == note_id_str:
                     root.remove(fn_elem)
                     break
 
-            tree.write(
-                str(footnotes_path),
-                encoding="utf-8",
-                xml_declaration=True,
-                pretty_print=True,
-            )
+            package.set_part("word/footnotes.xml", root, pretty_print=True)
 
         # Remove footnoteReference from document.xml
         self._remove_footnote_reference(note_id_str)
@@ -406,29 +385,20 @@ class NoteOperations:
         # Verify endnote exists (will raise NoteNotFoundError if not found)
         self.get_endnote(note_id_str)
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             raise ValueError("Cannot delete endnotes from non-ZIP documents")
 
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-
         # Remove from endnotes.xml
-        if endnotes_path.exists():
-            tree = etree.parse(str(endnotes_path))
-            root = tree.getroot()
-
+        root = package.get_part("word/endnotes.xml")
+        if root is not None:
             # Find and remove the endnote element
             for en_elem in root.findall(f"{{{WORD_NAMESPACE}}}endnote"):
                 if en_elem.get(f"{{{WORD_NAMESPACE}}}id") == note_id_str:
                     root.remove(en_elem)
                     break
 
-            tree.write(
-                str(endnotes_path),
-                encoding="utf-8",
-                xml_declaration=True,
-                pretty_print=True,
-            )
+            package.set_part("word/endnotes.xml", root, pretty_print=True)
 
         # Remove endnoteReference from document.xml
         self._remove_endnote_reference(note_id_str)
@@ -463,28 +433,19 @@ class NoteOperations:
         # Verify footnote exists (will raise NoteNotFoundError if not found)
         self.get_footnote(note_id_str)
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             raise ValueError("Cannot edit footnotes in non-ZIP documents")
 
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-
-        if footnotes_path.exists():
-            tree = etree.parse(str(footnotes_path))
-            root = tree.getroot()
-
+        root = package.get_part("word/footnotes.xml")
+        if root is not None:
             # Find the footnote element
             for fn_elem in root.findall(f"{{{WORD_NAMESPACE}}}footnote"):
                 if fn_elem.get(f"{{{WORD_NAMESPACE}}}id") == note_id_str:
                     self._replace_note_content(fn_elem, new_text, note_type="footnote")
                     break
 
-            tree.write(
-                str(footnotes_path),
-                encoding="utf-8",
-                xml_declaration=True,
-                pretty_print=True,
-            )
+            package.set_part("word/footnotes.xml", root, pretty_print=True)
 
     def edit_endnote(
         self,
@@ -512,28 +473,19 @@ class NoteOperations:
         # Verify endnote exists (will raise NoteNotFoundError if not found)
         self.get_endnote(note_id_str)
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             raise ValueError("Cannot edit endnotes in non-ZIP documents")
 
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-
-        if endnotes_path.exists():
-            tree = etree.parse(str(endnotes_path))
-            root = tree.getroot()
-
+        root = package.get_part("word/endnotes.xml")
+        if root is not None:
             # Find the endnote element
             for en_elem in root.findall(f"{{{WORD_NAMESPACE}}}endnote"):
                 if en_elem.get(f"{{{WORD_NAMESPACE}}}id") == note_id_str:
                     self._replace_note_content(en_elem, new_text, note_type="endnote")
                     break
 
-            tree.write(
-                str(endnotes_path),
-                encoding="utf-8",
-                xml_declaration=True,
-                pretty_print=True,
-            )
+            package.set_part("word/endnotes.xml", root, pretty_print=True)
 
     def _replace_note_content(
         self,
@@ -732,17 +684,14 @@ class NoteOperations:
         Note: IDs -1 and 0 are reserved for separator footnotes and
         are never modified.
         """
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             return
 
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-        if not footnotes_path.exists():
+        root = package.get_part("word/footnotes.xml")
+        if root is None:
             return
 
-        tree = etree.parse(str(footnotes_path))
-        root = tree.getroot()
-
         # Collect user footnotes (not separators)
         user_footnotes = []
         for fn_elem in root.findall(f"{{{WORD_NAMESPACE}}}footnote"):
@@ -761,12 +710,8 @@ class NoteOperations:
                 fn_elem.set(f"{{{WORD_NAMESPACE}}}id", str(new_id))
 
         # Save footnotes.xml
-        tree.write(
-            str(footnotes_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package.set_part("word/footnotes.xml", root, pretty_print=True)
+        self._document._ids.set_next(FOOTNOTE, len(user_footnotes) + 1)
 
         # Update references in document.xml
         if id_mapping:
@@ -784,17 +729,14 @@ class NoteOperations:
         Note: IDs -1 and 0 are reserved for separator endnotes and
         are never modified.
         """
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             return
 
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-        if not endnotes_path.exists():
+        root = package.get_part("word/endnotes.xml")
+        if root is None:
             return
 
-        tree = etree.parse(str(endnotes_path))
-        root = tree.getroot()
-
         # Collect user endnotes (not separators)
         user_endnotes = []
         for en_elem in root.findall(f"{{{WORD_NAMESPACE}}}endnote"):
@@ -813,12 +755,8 @@ class NoteOperations:
                 en_elem.set(f"{{{WORD_NAMESPACE}}}id", str(new_id))
 
         # Save endnotes.xml
-        tree.write(
-            str(endnotes_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package.set_part("word/endnotes.xml", root, pretty_print=True)
+        self._document._ids.set_next(ENDNOTE, len(user_endnotes) + 1)
 
         # Update references in document.xml
         if id_mapping:
@@ -861,7 +799,7 @@ class NoteOperations:
             ...     at="citation needed"
             ... )
         """
-        if not self._document._is_zip or not self._document._temp_dir:
+        if self._document._package is None:
             raise ValueError("Cannot add footnotes to non-ZIP documents")
 
         author_name = author if author is not None else self._document.author
@@ -926,7 +864,7 @@ class NoteOperations:
             ...     at="see notes"
             ... )
         """
-        if not self._document._is_zip or not self._document._temp_dir:
+        if self._document._package is None:
             raise ValueError("Cannot add endnotes to non-ZIP documents")
 
         author_name = author if author is not None else self._document.author
@@ -958,66 +896,20 @@ class NoteOperations:
         return endnote_id
 
     def _get_next_footnote_id(self) -> int:
-        """Get the next available footnote ID.
+        """Allocate the next available footnote ID.
 
         Returns:
             Integer ID for new footnote
         """
-        temp_dir = self._document._temp_dir
-        if temp_dir is None:
-            return 1
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-
-        if not footnotes_path.exists():
-            return 1
-
-        tree = etree.parse(str(footnotes_path))
-        root = tree.getroot()
-
-        # Find all footnote IDs
-        footnote_elems = root.findall(f"{{{WORD_NAMESPACE}}}footnote")
-        ids = []
-
-        for elem in footnote_elems:
-            id_str = elem.get(f"{{{WORD_NAMESPACE}}}id")
-            if id_str:
-                try:
-                    ids.append(int(id_str))
-                except ValueError:
-                    pass
-
-        return max(ids) + 1 if ids else 1
+        return self._document._ids.allocate(FOOTNOTE)
 
     def _get_next_endnote_id(self) -> int:
-        """Get the next available endnote ID.
+        """Allocate the next available endnote ID.
 
         Returns:
             Integer ID for new endnote
         """
-        temp_dir = self._document._temp_dir
-        if temp_dir is None:
-            return 1
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-
-        if not endnotes_path.exists():
-            return 1
-
-        tree = etree.parse(str(endnotes_path))
-        root = tree.getroot()
-
-        # Find all endnote IDs
-        endnote_elems = root.findall(f"{{{WORD_NAMESPACE}}}endnote")
-        ids = []
-
-        for elem in endnote_elems:
-            id_str = elem.get(f"{{{WORD_NAMESPACE}}}id")
-            if id_str:
-                try:
-                    ids.append(int(id_str))
-                except ValueError:
-                    pass
-
-        return max(ids) + 1 if ids else 1
+        return self._document._ids.allocate(ENDNOTE)
 
     def _add_footnote_to_xml(self, footnote_id: int, text: str | list[str], author: str) -> None:
         """Add a footnote to footnotes.xml, creating the file if needed.
@@ -1028,22 +920,18 @@ class NoteOperations:
                   Supports markdown formatting.
             author: Author name (for tracking if needed)
         """
-        temp_dir = self._document._temp_dir
-        if temp_dir is None:
+        package = self._document._package
+        if package is None:
             return
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
 
         # Load or create footnotes.xml
-        if footnotes_path.exists():
-            footnotes_tree = etree.parse(str(footnotes_path))
-            footnotes_root = footnotes_tree.getroot()
-        else:
+        footnotes_root = package.get_part("word/footnotes.xml")
+        if footnotes_root is None:
             # Create new footnotes.xml with separators
             footnotes_root = etree.Element(
                 f"{{{WORD_NAMESPACE}}}footnotes",
                 nsmap={"w": WORD_NAMESPACE},
             )
-            footnotes_tree = etree.ElementTree(footnotes_root)
 
             # Add standard footnote separators (required by Word)
             # Separator (ID -1)
@@ -1075,12 +963,7 @@ class NoteOperations:
         self._create_note_content(footnote_elem, text, note_type="footnote")
 
         # Write footnotes.xml
-        footnotes_tree.write(
-            str(footnotes_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package.set_part("word/footnotes.xml", footnotes_root, pretty_print=True)
 
     def _add_endnote_to_xml(self, endnote_id: int, text: str | list[str], author: str) -> None:
         """Add an endnote to endnotes.xml, creating the file if needed.
@@ -1091,22 +974,18 @@ class NoteOperations:
                   Supports markdown formatting.
             author: Author name (for tracking if needed)
         """
-        temp_dir = self._document._temp_dir
-        if temp_dir is None:
+        package = self._document._package
+        if package is None:
             return
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
 
         # Load or create endnotes.xml
-        if endnotes_path.exists():
-            endnotes_tree = etree.parse(str(endnotes_path))
-            endnotes_root = endnotes_tree.getroot()
-        else:
+        endnotes_root = package.get_part("word/endnotes.xml")
+        if endnotes_root is None:
             # Create new endnotes.xml with separators
             endnotes_root = etree.Element(
                 f"{{{WORD_NAMESPACE}}}endnotes",
                 nsmap={"w": WORD_NAMESPACE},
             )
-            endnotes_tree = etree.ElementTree(endnotes_root)
 
             # Add standard endnote separators
             sep = etree.SubElement(endnotes_root, f"{{{WORD_NAMESPACE}}}endnote")
@@ -1136,12 +1015,7 @@ class NoteOperations:
         self._create_note_content(endnote_elem, text, note_type="endnote")
 
         # Write endnotes.xml
-        endnotes_tree.write(
-            str(endnotes_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package.set_part("word/endnotes.xml", endnotes_root, pretty_print=True)
 
     def _create_note_content(
         self,
@@ -1482,7 +1356,7 @@ class NoteOperations:
         position = self._calculate_position_in_paragraph(para_elem, run_elem)
 
         return FootnoteReference(
-            paragraph=Paragraph(para_elem),
+            paragraph=Paragraph(para_elem, on_change=self._document._text_index.invalidate),
             run_element=run_elem,
             position_in_paragraph=position,
         )
@@ -1513,22 +1387,22 @@ class NoteOperations:
         position = self._calculate_position_in_paragraph(para_elem, run_elem)
 
         return FootnoteReference(
-            paragraph=Paragraph(para_elem),
+            paragraph=Paragraph(para_elem, on_change=self._document._text_index.invalidate),
             run_element=run_elem,
             position_in_paragraph=position,
         )
 
     # ==================== Tracked Changes in Footnotes/Endnotes ====================
 
-    def _get_note_element(self, note_type: str, note_id: str | int) -> tuple[etree._Element, Path]:
-        """Get the note element and its XML file path.
+    def _get_note_element(self, note_type: str, note_id: str | int) -> tuple[etree._Element, str]:
+        """Get the note element and the name of the package part holding it.
 
         Args:
             note_type: Either "footnote" or "endnote"
             note_id: The note ID
 
         Returns:
-            Tuple of (note_element, xml_file_path)
+            Tuple of (note_element, part_name)
 
         Raises:
             NoteNotFoundError: If note not found
@@ -1536,29 +1410,27 @@ class NoteOperations:
         """
 
         note_id_str = str(note_id)
-        temp_dir = self._document._temp_dir
+        package = self._document._package
 
-        if not temp_dir:
+        if package is None:
             raise ValueError(f"Cannot access {note_type}s in non-ZIP documents")
 
         if note_type == "footnote":
-            xml_path = temp_dir / "word" / "footnotes.xml"
+            part_name = "word/footnotes.xml"
             tag_name = "footnote"
         else:
-            xml_path = temp_dir / "word" / "endnotes.xml"
+            part_name = "word/endnotes.xml"
             tag_name = "endnote"
 
-        if not xml_path.exists():
+        root = package.get_part(part_name)
+        if root is None:
             available: list[str] = []
             raise NoteNotFoundError(note_type, note_id_str, available)
 
-        tree = etree.parse(str(xml_path))
-        root = tree.getroot()
-
         # Find the note element
         for note_elem in root.findall(f"{{{WORD_NAMESPACE}}}{tag_name}"):
             if note_elem.get(f"{{{WORD_NAMESPACE}}}id") == note_id_str:
-                return note_elem, xml_path
+                return note_elem, part_name
 
         # Note not found - get available IDs for error message
         available = []
@@ -1587,29 +1459,21 @@ class NoteOperations:
         return list(note_elem.findall(f"{{{WORD_NAMESPACE}}}p"))
 
     def _save_note_xml(self, note_type: str, note_id: str | int) -> None:
-        """Save the modified note XML back to the file.
+        """Save the modified note XML back to the package.
 
         Args:
             note_type: Either "footnote" or "endnote"
             note_id: The note ID
         """
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             return
 
-        if note_type == "footnote":
-            xml_path = temp_dir / "word" / "footnotes.xml"
-        else:
-            xml_path = temp_dir / "word" / "endnotes.xml"
-
-        if xml_path.exists():
-            tree = etree.parse(str(xml_path))
-            tree.write(
-                str(xml_path),
-                encoding="utf-8",
-                xml_declaration=True,
-                pretty_print=True,
-            )
+        part_name = "word/footnotes.xml" if note_type == "footnote" else "word/endnotes.xml"
+
+        root = package.get_part(part_name)
+        if root is not None:
+            package.set_part(part_name, root, pretty_print=True)
 
     def insert_tracked_in_footnote(
         self,
@@ -1693,7 +1557,7 @@ class NoteOperations:
         insert_after = after is not None
 
         # Get note paragraphs for text search
-        note_elem, xml_path = self._get_note_element(note_type, note_id)
+        note_elem, part_name = self._get_note_element(note_type, note_id)
         paragraphs = list(note_elem.findall(f"{{{WORD_NAMESPACE}}}p"))
 
         if not paragraphs:
@@ -1710,9 +1574,8 @@ class NoteOperations:
 
         match = matches[0]
 
-        # Create tracked insertion XML
-        insertion_xml = self._document._xml_generator.create_insertion(text, author)
-        insertion_element = self._parse_xml_element(insertion_xml)
+        # Create tracked insertion
+        insertion_element = self._document._xml_generator.create_insertion_element(text, author)
 
         # Insert at the match location
         if insert_after:
@@ -1721,13 +1584,9 @@ class NoteOperations:
             self._insert_before_match(match, insertion_element)
 
         # Save the modified XML
-        tree = etree.ElementTree(note_elem.getparent())
-        tree.write(
-            str(xml_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package = self._document._package
+        assert package is not None
+        package.set_part(part_name, note_elem.getparent(), pretty_print=True)
 
     def delete_tracked_in_footnote(
         self,
@@ -1790,7 +1649,7 @@ class NoteOperations:
     ) -> None:
         """Internal implementation for tracked deletion in notes."""
         # Get note paragraphs for text search
-        note_elem, xml_path = self._get_note_element(note_type, note_id)
+        note_elem, part_name = self._get_note_element(note_type, note_id)
         paragraphs = list(note_elem.findall(f"{{{WORD_NAMESPACE}}}p"))
 
         if not paragraphs:
@@ -1807,21 +1666,16 @@ class NoteOperations:
 
         match = matches[0]
 
-        # Create tracked deletion XML
-        deletion_xml = self._document._xml_generator.create_deletion(match.text, author)
-        deletion_element = self._parse_xml_element(deletion_xml)
+        # Create tracked deletion
+        deletion_element = self._document._xml_generator.create_deletion_element(match.text, author)
 
         # Replace the matched text with deletion
         self._replace_match_with_element(match, deletion_element)
 
         # Save the modified XML
-        tree = etree.ElementTree(note_elem.getparent())
-        tree.write(
-            str(xml_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package = self._document._package
+        assert package is not None
+        package.set_part(part_name, note_elem.getparent(), pretty_print=True)
 
     def replace_tracked_in_footnote(
         self,
@@ -1891,7 +1745,7 @@ class NoteOperations:
     ) -> None:
         """Internal implementation for tracked replacement in notes."""
         # Get note paragraphs for text search
-        note_elem, xml_path = self._get_note_element(note_type, note_id)
+        note_elem, part_name = self._get_note_element(note_type, note_id)
         paragraphs = list(note_elem.findall(f"{{{WORD_NAMESPACE}}}p"))
 
         if not paragraphs:
@@ -1908,63 +1762,23 @@ class NoteOperations:
 
         match = matches[0]
 
-        # Create tracked deletion + insertion XML
-        deletion_xml = self._document._xml_generator.create_deletion(match.text, author)
-        insertion_xml = self._document._xml_generator.create_insertion(replace, author)
-
-        # Parse both elements
-        elements = self._parse_xml_elements(f"{deletion_xml}\n{insertion_xml}")
+        # Create tracked deletion + insertion
+        generator = self._document._xml_generator
+        elements = [
+            generator.create_deletion_element(match.text, author),
+            generator.create_insertion_element(replace, author),
+        ]
 
         # Replace the matched text with deletion + insertion
         self._replace_match_with_elements(match, elements)
 
         # Save the modified XML
-        tree = etree.ElementTree(note_elem.getparent())
-        tree.write(
-            str(xml_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package = self._document._package
+        assert package is not None
+        package.set_part(part_name, note_elem.getparent(), pretty_print=True)
 
     # ==================== Helper Methods for XML Manipulation ====================
 
-    def _parse_xml_element(self, xml_content: str) -> Any:
-        """Parse XML content into a single lxml element.
-
-        Args:
-            xml_content: The XML string to parse
-
-        Returns:
-            Parsed lxml Element
-        """
-        wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {xml_content}
-</root>"""
-        root = etree.fromstring(wrapped_xml.encode("utf-8"))
-        return list(root)[0]
-
-    def _parse_xml_elements(self, xml_content: str) -> list[Any]:
-        """Parse XML content into multiple lxml elements.
-
-        Args:
-            xml_content: The XML string(s) to parse
-
-        Returns:
-            List of parsed lxml Elements
-        """
-        wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {xml_content}
-</root>"""
-        root = etree.fromstring(wrapped_xml.encode("utf-8"))
-        return list(root)
-
     def _insert_after_match(self, match: TextSpan, insertion_element: Any) -> None:
         """Insert XML element after a matched text span.
 
@@ -2400,7 +2214,7 @@ class NoteOperations:
             AmbiguousTextError: If find text found multiple times
         """
         # Get note paragraphs for text search
-        note_elem, xml_path = self._get_note_element(note_type, note_id)
+        note_elem, part_name = self._get_note_element(note_type, note_id)
         paragraphs = list(note_elem.findall(f"{{{WORD_NAMESPACE}}}p"))
 
         if not paragraphs:
@@ -2418,10 +2232,12 @@ class NoteOperations:
         match = matches[0]
 
         if track:
-            # Tracked replace: deletion + insertion XML
-            deletion_xml = self._document._xml_generator.create_deletion(match.text, author)
-            insertion_xml = self._document._xml_generator.create_insertion(replace, author)
-            elements = self._parse_xml_elements(f"{deletion_xml}\n{insertion_xml}")
+            # Tracked replace: deletion + insertion
+            generator = self._document._xml_generator
+            elements = [
+                generator.create_deletion_element(match.text, author),
+                generator.create_insertion_element(replace, author),
+            ]
             self._replace_match_with_elements(match, elements)
         else:
             # Untracked replace: just replace with plain runs
@@ -2435,13 +2251,9 @@ class NoteOperations:
                 self._replace_match_with_elements(match, new_runs)
 
         # Save the modified XML
-        tree = etree.ElementTree(note_elem.getparent())
-        tree.write(
-            str(xml_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package = self._document._package
+        assert package is not None
+        package.set_part(part_name, note_elem.getparent(), pretty_print=True)
 
     def insert_in_note(
         self,
@@ -2484,7 +2296,7 @@ class NoteOperations:
         insert_after = after is not None
 
         # Get note paragraphs for text search
-        note_elem, xml_path = self._get_note_element(note_type, note_id)
+        note_elem, part_name = self._get_note_element(note_type, note_id)
         paragraphs = list(note_elem.findall(f"{{{WORD_NAMESPACE}}}p"))
 
         if not paragraphs:
@@ -2503,8 +2315,7 @@ class NoteOperations:
 
         if track:
             # Tracked insertion: wrap in <w:ins>
-            insertion_xml = self._document._xml_generator.create_insertion(text, author)
-            insertion_element = self._parse_xml_element(insertion_xml)
+            insertion_element = self._document._xml_generator.create_insertion_element(text, author)
         else:
             # Untracked insertion: plain runs
             source_run = match.runs[0] if match.runs else None
@@ -2520,13 +2331,9 @@ class NoteOperations:
             self._insert_before_match_elements(match, insertion_element)
 
         # Save the modified XML
-        tree = etree.ElementTree(note_elem.getparent())
-        tree.write(
-            str(xml_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package = self._document._package
+        assert package is not None
+        package.set_part(part_name, note_elem.getparent(), pretty_print=True)
 
     def delete_in_note(
         self,
@@ -2555,7 +2362,7 @@ class NoteOperations:
             AmbiguousTextError: If text found multiple times
         """
         # Get note paragraphs for text search
-        note_elem, xml_path = self._get_note_element(note_type, note_id)
+        note_elem, part_name = self._get_note_element(note_type, note_id)
         paragraphs = list(note_elem.findall(f"{{{WORD_NAMESPACE}}}p"))
 
         if not paragraphs:
@@ -2574,21 +2381,18 @@ class NoteOperations:
 
         if track:
             # Tracked deletion: wrap in <w:del>
-            deletion_xml = self._document._xml_generator.create_deletion(match.text, author)
-            deletion_element = self._parse_xml_element(deletion_xml)
+            deletion_element = self._document._xml_generator.create_deletion_element(
+                match.text, author
+            )
             self._replace_match_with_element(match, deletion_element)
         else:
             # Untracked deletion: simply remove the matched runs
             self._remove_match(match)
 
         # Save the modified XML
-        tree = etree.ElementTree(note_elem.getparent())
-        tree.write(
-            str(xml_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package = self._document._package
+        assert package is not None
+        package.set_part(part_name, note_elem.getparent(), pretty_print=True)
 
     # ==================== Merge Footnotes/Endnotes ====================
 
@@ -2625,12 +2429,11 @@ class NoteOperations:
         if len(footnote_ids) < 2:
             raise ValueError("Must provide at least 2 footnote IDs to merge")
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             raise ValueError("Cannot merge footnotes in non-ZIP documents")
 
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-        if not footnotes_path.exists():
+        if not package.part_exists("word/footnotes.xml"):
             raise NoteNotFoundError("footnote", str(footnote_ids[0]), [])
 
         # Verify all footnotes exist and collect their content
@@ -2706,12 +2509,11 @@ class NoteOperations:
         if len(endnote_ids) < 2:
             raise ValueError("Must provide at least 2 endnote IDs to merge")
 
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             raise ValueError("Cannot merge endnotes in non-ZIP documents")
 
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-        if not endnotes_path.exists():
+        if not package.part_exists("word/endnotes.xml"):
             raise NoteNotFoundError("endnote", str(endnote_ids[0]), [])
 
         # Verify all endnotes exist and collect their content
@@ -2784,29 +2586,21 @@ class NoteOperations:
             note_id: The footnote ID to delete
         """
         note_id_str = str(note_id)
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             return
 
-        footnotes_path = temp_dir / "word" / "footnotes.xml"
-        if not footnotes_path.exists():
+        root = package.get_part("word/footnotes.xml")
+        if root is None:
             return
 
-        tree = etree.parse(str(footnotes_path))
-        root = tree.getroot()
-
         # Find and remove the footnote element
         for fn_elem in root.findall(f"{{{WORD_NAMESPACE}}}footnote"):
             if fn_elem.get(f"{{{WORD_NAMESPACE}}}id") == note_id_str:
                 root.remove(fn_elem)
                 break
 
-        tree.write(
-            str(footnotes_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package.set_part("word/footnotes.xml", root, pretty_print=True)
 
     def _delete_endnote_content_only(self, note_id: int | str) -> None:
         """Delete endnote content from endnotes.xml without removing reference or renumbering.
@@ -2817,26 +2611,18 @@ class NoteOperations:
             note_id: The endnote ID to delete
         """
         note_id_str = str(note_id)
-        temp_dir = self._document._temp_dir
-        if not temp_dir:
+        package = self._document._package
+        if package is None:
             return
 
-        endnotes_path = temp_dir / "word" / "endnotes.xml"
-        if not endnotes_path.exists():
+        root = package.get_part("word/endnotes.xml")
+        if root is None:
             return
 
-        tree = etree.parse(str(endnotes_path))
-        root = tree.getroot()
-
         # Find and remove the endnote element
         for en_elem in root.findall(f"{{{WORD_NAMESPACE}}}endnote"):
             if en_elem.get(f"{{{WORD_NAMESPACE}}}id") == note_id_str:
                 root.remove(en_elem)
                 break
 
-        tree.write(
-            str(endnotes_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        package.set_part("word/endnotes.xml", root, pretty_print=True)
@@ -11,8 +11,6 @@ import re
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from lxml import etree
-
 from ..constants import WORD_NAMESPACE
 from ..errors import AmbiguousTextError, TextNotFoundError
 from ..scope import ScopeEvaluator
@@ -275,23 +273,10 @@ class PatternOperations:
             if matched_text == replacement_text:
                 continue
 
-            # Generate tracked change XML
-            deletion_xml = self._document._xml_generator.create_deletion(matched_text, author_name)
-            insertion_xml = self._document._xml_generator.create_insertion(
-                replacement_text, author_name
-            )
-
-            # Parse XMLs with namespace context
-            wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {deletion_xml}
-    {insertion_xml}
-</root>"""
-            root = etree.fromstring(wrapped_xml.encode("utf-8"))
-            deletion_element = root[0]
-            insertion_element = root[1]
+            # Generate tracked change elements
+            generator = self._document._xml_generator
+            deletion_element = generator.create_deletion_element(matched_text, author_name)
+            insertion_element = generator.create_insertion_element(replacement_text, author_name)
 
             # Replace the matched text with deletion + insertion
             self._document._replace_match_with_elements(
@@ -377,26 +362,13 @@ class PatternOperations:
                 matched_text = match.text
                 replacement_text = f"{section_word} {new_number_text}"
 
-                # Generate tracked change XML
-                deletion_xml = self._document._xml_generator.create_deletion(
-                    matched_text, author_name
-                )
-                insertion_xml = self._document._xml_generator.create_insertion(
+                # Generate tracked change elements
+                generator = self._document._xml_generator
+                deletion_element = generator.create_deletion_element(matched_text, author_name)
+                insertion_element = generator.create_insertion_element(
                     replacement_text, author_name
                 )
 
-                # Parse XMLs with namespace context
-                wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {deletion_xml}
-    {insertion_xml}
-</root>"""
-                root = etree.fromstring(wrapped_xml.encode("utf-8"))
-                deletion_element = root[0]
-                insertion_element = root[1]
-
                 # Replace the matched text with deletion + insertion
                 self._document._replace_match_with_elements(
                     match, [deletion_element, insertion_element]
@@ -165,7 +165,7 @@ class SectionOperations:
 
         # Return Paragraph wrapper
         # new_p is always the actual paragraph element (whether tracked or not)
-        return Paragraph(new_p)
+        return Paragraph(new_p, on_change=self._document._text_index.invalidate)
 
     def insert_paragraphs(
         self,
@@ -62,7 +62,11 @@ class TableOperations:
         """
         from ..models.table import Table
 
-        return [Table(tbl) for tbl in self._document.xml_root.iter(f"{{{WORD_NAMESPACE}}}tbl")]
+        invalidate = self._document._text_index.invalidate
+        return [
+            Table(tbl, on_change=invalidate)
+            for tbl in self._document.xml_root.iter(f"{{{WORD_NAMESPACE}}}tbl")
+        ]
 
     def find(self, containing: str, case_sensitive: bool = True) -> Table | None:
         """Find the first table containing specific text.
@@ -196,20 +200,9 @@ class TableOperations:
                 )
 
         # Coarse tracked replacement
-        deletion_xml = self._document._xml_generator.create_deletion(match.text, author_str)
-        insertion_xml = self._document._xml_generator.create_insertion(new_text, author_str)
-
-        # Parse XMLs with namespace context
-        wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {deletion_xml}
-    {insertion_xml}
-</root>"""
-        root = etree.fromstring(wrapped_xml.encode("utf-8"))
-        deletion_element = root[0]
-        insertion_element = root[1]
+        generator = self._document._xml_generator
+        deletion_element = generator.create_deletion_element(match.text, author_str)
+        insertion_element = generator.create_insertion_element(new_text, author_str)
 
         self._document._replace_match_with_elements(match, [deletion_element, insertion_element])
 
@@ -287,7 +280,7 @@ class TableOperations:
         # Insert after the specified row
         self._insert_row_in_table(table, new_row, insert_after_index)
 
-        return TableRow(new_row, insert_after_index + 1)
+        return TableRow(new_row, insert_after_index + 1, self._document._text_index.invalidate)
 
     def _get_table(self, table_index: int) -> Table:
         """Get table by index with validation.
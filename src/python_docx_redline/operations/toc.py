@@ -461,19 +461,12 @@ class TOCOperations:
             logger.warning("Cannot update settings.xml: no package")
             return
 
-        temp_dir = package.temp_dir
-        settings_path = temp_dir / "word" / "settings.xml"
-
-        if settings_path.exists():
-            # Parse existing settings.xml
-            parser = etree.XMLParser(remove_blank_text=False)
-            tree = etree.parse(str(settings_path), parser)
-            root = tree.getroot()
-        else:
+        # Parse existing settings.xml
+        root = package.get_part("word/settings.xml")
+        if root is None:
             # Create minimal settings.xml
             nsmap = {"w": WORD_NAMESPACE}
             root = etree.Element(f"{{{WORD_NAMESPACE}}}settings", nsmap=nsmap)
-            tree = etree.ElementTree(root)
 
         # Check if updateFields already exists
         update_fields = root.find(w("updateFields"))
@@ -485,16 +478,8 @@ class TOCOperations:
             update_fields = etree.SubElement(root, w("updateFields"))
             update_fields.set(w("val"), "true")
 
-        # Ensure directory exists
-        settings_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Write settings.xml
-        tree.write(
-            str(settings_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            standalone=True,
-        )
+        package.set_part("word/settings.xml", root, standalone=True)
 
         # Ensure settings.xml is registered in relationships and content types
         self._ensure_settings_relationship()
@@ -532,13 +517,7 @@ class TOCOperations:
         if package is None:
             return
 
-        doc_path = package.temp_dir / "word" / "document.xml"
-        self._document.xml_tree.write(
-            str(doc_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            standalone=True,
-        )
+        package.set_part("word/document.xml", self._document.xml_root, standalone=True)
 
     def remove_toc(self) -> bool:
         """Remove the Table of Contents from the document.
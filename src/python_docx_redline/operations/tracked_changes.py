@@ -8,6 +8,7 @@ extracted from the main Document class to improve separation of concerns.
 from __future__ import annotations
 
 import logging
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from lxml import etree
@@ -108,6 +109,32 @@ class TrackedChangeOperations:
         else:
             return matches
 
+    def _find_matches(
+        self,
+        text: str,
+        paragraphs: list[Any],
+        occurrence: int | list[int] | str,
+        **search_options: Any,
+    ) -> list[TextSpan]:
+        """Find the matches needed to honour an occurrence parameter.
+
+        For occurrence="first" (or 1) the search stops at the first match
+        instead of scanning the rest of the document.
+
+        Args:
+            text: The text or regex pattern to find
+            paragraphs: Paragraph elements to search
+            occurrence: The occurrence parameter that will select targets
+            **search_options: Keyword arguments for TextSearch.iter_text()
+
+        Returns:
+            List of TextSpan matches, in document order
+        """
+        spans = self._document._text_search.iter_text(text, paragraphs, **search_options)
+        if occurrence == "first" or occurrence == 1:
+            return list(islice(spans, 1))
+        return list(spans)
+
     def _find_unique_match(
         self,
         text: str,
@@ -130,43 +157,29 @@ class TrackedChangeOperations:
             TextNotFoundError: If text is not found
             AmbiguousTextError: If multiple matches found
         """
-        all_paragraphs = list(self._document.xml_root.iter(f"{{{WORD_NAMESPACE}}}p"))
-        paragraphs = ScopeEvaluator.filter_paragraphs(all_paragraphs, scope)
+        self._document._text_index.resume()
+        positions = self._document._text_search.positions(self._document.xml_root)
+        paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
 
-        matches = self._document._text_search.find_text(
+        spans = self._document._text_search.iter_text(
             text,
             paragraphs,
             regex=regex,
             normalize_special_chars=normalize_special_chars and not regex,
         )
+        # A second match is enough to know the text is ambiguous
+        matches = list(islice(spans, 2))
 
         if not matches:
             suggestions = SuggestionGenerator.generate_suggestions(text, paragraphs)
             raise TextNotFoundError(text, suggestions=suggestions)
 
         if len(matches) > 1:
+            matches.extend(spans)  # Report every occurrence in the error
             raise AmbiguousTextError(text, matches)
 
         return matches[0]
 
-    def _parse_xml_elements(self, xml_content: str) -> list:
-        """Parse XML content into lxml elements with proper namespaces.
-
-        Args:
-            xml_content: The XML string(s) to parse (can be multiple fragments)
-
-        Returns:
-            List of parsed lxml Elements
-        """
-        wrapped_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<root xmlns:w="{WORD_NAMESPACE}"
-      xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml"
-      xmlns:w16du="http://schemas.microsoft.com/office/word/2023/wordml/word16du">
-    {xml_content}
-</root>"""
-        root = etree.fromstring(wrapped_xml.encode("utf-8"))
-        return list(root)
-
     def insert(
         self,
         text: str,
@@ -224,17 +237,19 @@ class TrackedChangeOperations:
         insert_after = after is not None
 
         # Find all matches
-        all_paragraphs = list(self._document.xml_root.iter(f"{{{WORD_NAMESPACE}}}p"))
-        paragraphs = ScopeEvaluator.filter_paragraphs(all_paragraphs, scope)
+        self._document._text_index.resume()
+        positions = self._document._text_search.positions(self._document.xml_root)
+        paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
 
         # Parse fuzzy configuration if provided
         from ..fuzzy import parse_fuzzy_config
 
         fuzzy_config = parse_fuzzy_config(fuzzy)
 
-        matches = self._document._text_search.find_text(
+        matches = self._find_matches(
             anchor,
             paragraphs,
+            occurrence,
             regex=regex,
             normalize_special_chars=normalize_special_chars and not regex and not fuzzy_config,
             fuzzy=fuzzy_config,
@@ -249,31 +264,48 @@ class TrackedChangeOperations:
 
         # Insert at each target match (process in reverse to preserve indices)
         for match in reversed(target_matches):
-            if track:
-                # Capture change ID before operation for edit group tracking
-                start_id = self._document._xml_generator.next_change_id
+            self._insert_at_match(match, text, author, track, insert_after)
 
-                # Tracked insertion: wrap in <w:ins>
-                insertion_xml = self._document._xml_generator.create_insertion(text, author)
-                elements = self._parse_xml_elements(insertion_xml)
-                insertion_element = elements[0]
+    def _insert_at_match(
+        self,
+        match: TextSpan,
+        text: str,
+        author: str | None,
+        track: bool,
+        insert_after: bool,
+    ) -> None:
+        """Insert text next to one matched anchor.
 
-                # Record change IDs with edit group registry
-                self._record_change_ids(start_id, self._document._xml_generator.next_change_id)
-            else:
-                # Untracked insertion: plain runs
-                # Get source run for formatting if available
-                source_run = match.runs[0] if match.runs else None
-                plain_runs = self._document._xml_generator.create_plain_runs(
-                    text, source_run=source_run
-                )
-                # Use list of runs (could be multiple for markdown formatting)
-                insertion_element = plain_runs
+        Args:
+            match: The anchor match
+            text: The text to insert (may contain markdown formatting)
+            author: Optional author override for tracked insertions
+            track: Whether to insert as a tracked change
+            insert_after: Insert after the anchor if True, before it if False
+        """
+        if track:
+            # Capture change ID before operation for edit group tracking
+            start_id = self._document._xml_generator.next_change_id
 
-            if insert_after:
-                self._insert_after_match(match, insertion_element)
-            else:
-                self._insert_before_match(match, insertion_element)
+            # Tracked insertion: wrap in <w:ins>
+            insertion_element = self._document._xml_generator.create_insertion_element(text, author)
+
+            # Record change IDs with edit group registry
+            self._record_change_ids(start_id, self._document._xml_generator.next_change_id)
+        else:
+            # Untracked insertion: plain runs
+            # Get source run for formatting if available
+            source_run = match.runs[0] if match.runs else None
+            plain_runs = self._document._xml_generator.create_plain_runs(
+                text, source_run=source_run
+            )
+            # Use list of runs (could be multiple for markdown formatting)
+            insertion_element = plain_runs
+
+        if insert_after:
+            self._insert_after_match(match, insertion_element)
+        else:
+            self._insert_before_match(match, insertion_element)
 
     def delete(
         self,
@@ -315,17 +347,19 @@ class TrackedChangeOperations:
             ImportError: If fuzzy matching requested but rapidfuzz not installed
         """
         # Find all matches
-        all_paragraphs = list(self._document.xml_root.iter(f"{{{WORD_NAMESPACE}}}p"))
-        paragraphs = ScopeEvaluator.filter_paragraphs(all_paragraphs, scope)
+        self._document._text_index.resume()
+        positions = self._document._text_search.positions(self._document.xml_root)
+        paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
 
         # Parse fuzzy configuration if provided
         from ..fuzzy import parse_fuzzy_config
 
         fuzzy_config = parse_fuzzy_config(fuzzy)
 
-        matches = self._document._text_search.find_text(
+        matches = self._find_matches(
             text,
             paragraphs,
+            occurrence,
             regex=regex,
             normalize_special_chars=normalize_special_chars and not regex and not fuzzy_config,
             fuzzy=fuzzy_config,
@@ -340,22 +374,32 @@ class TrackedChangeOperations:
 
         # Delete each target match (process in reverse to preserve indices)
         for match in reversed(target_matches):
-            if track:
-                # Capture change ID before operation for edit group tracking
-                start_id = self._document._xml_generator.next_change_id
-
-                # Tracked deletion: wrap in <w:del>
-                deletion_xml = self._document._xml_generator.create_deletion(match.text, author)
-                elements = self._parse_xml_elements(deletion_xml)
-                deletion_element = elements[0]
-                # Replace the matched text with deletion
-                self._replace_match_with_element(match, deletion_element)
-
-                # Record change IDs with edit group registry
-                self._record_change_ids(start_id, self._document._xml_generator.next_change_id)
-            else:
-                # Untracked deletion: simply remove the matched runs
-                self._remove_match(match)
+            self._delete_match(match, author, track)
+
+    def _delete_match(self, match: TextSpan, author: str | None, track: bool) -> None:
+        """Delete one matched span.
+
+        Args:
+            match: The match to delete
+            author: Optional author override for tracked deletions
+            track: Whether to delete as a tracked change
+        """
+        if track:
+            # Capture change ID before operation for edit group tracking
+            start_id = self._document._xml_generator.next_change_id
+
+            # Tracked deletion: wrap in <w:del>
+            deletion_element = self._document._xml_generator.create_deletion_element(
+                match.text, author
+            )
+            # Replace the matched text with deletion
+            self._replace_match_with_element(match, deletion_element)
+
+            # Record change IDs with edit group registry
+            self._record_change_ids(start_id, self._document._xml_generator.next_change_id)
+        else:
+            # Untracked deletion: simply remove the matched runs
+            self._remove_match(match)
 
     def replace(
         self,
@@ -421,17 +465,19 @@ class TrackedChangeOperations:
             ContinuityWarning: If check_continuity=True and potential sentence fragment detected
         """
         # Find all matches
-        all_paragraphs = list(self._document.xml_root.iter(f"{{{WORD_NAMESPACE}}}p"))
-        paragraphs = ScopeEvaluator.filter_paragraphs(all_paragraphs, scope)
+        self._document._text_index.resume()
+        positions = self._document._text_search.positions(self._document.xml_root)
+        paragraphs = ScopeEvaluator.filter_paragraphs(positions.paragraphs, scope, positions)
 
         # Parse fuzzy configuration if provided
         from ..fuzzy import parse_fuzzy_config
 
         fuzzy_config = parse_fuzzy_config(fuzzy)
 
-        matches = self._document._text_search.find_text(
+        matches = self._find_matches(
             find,
             paragraphs,
+            occurrence,
             regex=regex,
             normalize_special_chars=normalize_special_chars and not regex and not fuzzy_config,
             fuzzy=fuzzy_config,
@@ -446,8 +492,6 @@ class TrackedChangeOperations:
 
         # Replace each target match (process in reverse to preserve indices)
         for match in reversed(target_matches):
-            matched_text = match.text
-
             # Show context preview if requested
             if show_context:
                 self._log_context_preview(match, replace, context_chars)
@@ -459,60 +503,80 @@ class TrackedChangeOperations:
             if check_continuity:
                 self._check_and_warn_continuity(match, replacement_text, context_chars)
 
-            if track:
-                # Capture change ID before operation for edit group tracking
-                start_id = self._document._xml_generator.next_change_id
+            self._replace_match(match, replacement_text, author, track, minimal)
 
-                # Determine effective minimal setting
-                use_minimal = minimal if minimal is not None else self._document._minimal_edits
+    def _replace_match(
+        self,
+        match: TextSpan,
+        replacement_text: str,
+        author: str | None,
+        track: bool,
+        minimal: bool | None,
+    ) -> None:
+        """Replace one matched span.
 
-                if use_minimal:
-                    # Attempt word-level minimal edit
-                    from ..minimal_diff import apply_minimal_edits_to_textspan
+        Args:
+            match: The match to replace
+            replacement_text: The replacement, with any capture groups expanded
+            author: Optional author override for tracked changes
+            track: Whether to replace as a tracked change
+            minimal: Whether to use word-level diffing (None = document default)
+        """
+        matched_text = match.text
 
-                    success, reason = apply_minimal_edits_to_textspan(
-                        match,
-                        replacement_text,
-                        self._document._xml_generator,
-                        author,
-                    )
-                    if success:
-                        # Record change IDs with edit group registry
-                        self._record_change_ids(
-                            start_id, self._document._xml_generator.next_change_id
-                        )
-                        continue  # Minimal edit applied successfully
-                    else:
-                        # Log fallback at INFO level
-                        logger.info(
-                            "Falling back to coarse tracked change for '%s' -> '%s': %s",
-                            matched_text[:50],
-                            replacement_text[:50],
-                            reason,
-                        )
-
-                # Coarse tracked replace: deletion + insertion XML
-                deletion_xml = self._document._xml_generator.create_deletion(matched_text, author)
-                insertion_xml = self._document._xml_generator.create_insertion(
-                    replacement_text, author
-                )
-                elements = self._parse_xml_elements(f"{deletion_xml}\n    {insertion_xml}")
-                # Replace the matched text with deletion + insertion
-                self._replace_match_with_elements(match, elements)
+        if track:
+            # Capture change ID before operation for edit group tracking
+            start_id = self._document._xml_generator.next_change_id
 
-                # Record change IDs with edit group registry
-                self._record_change_ids(start_id, self._document._xml_generator.next_change_id)
-            else:
-                # Untracked replace: just replace with plain runs
-                # Get source run for formatting
-                source_run = match.runs[0] if match.runs else None
-                new_runs = self._document._xml_generator.create_plain_runs(
-                    replacement_text, source_run=source_run
+            # Determine effective minimal setting
+            use_minimal = minimal if minimal is not None else self._document._minimal_edits
+
+            if use_minimal:
+                # Attempt word-level minimal edit
+                from ..minimal_diff import apply_minimal_edits_to_textspan
+
+                self._document._text_index.invalidate(match.paragraph)
+                success, reason = apply_minimal_edits_to_textspan(
+                    match,
+                    replacement_text,
+                    self._document._xml_generator,
+                    author,
                 )
-                if len(new_runs) == 1:
-                    self._replace_match_with_element(match, new_runs[0])
+                if success:
+                    # Record change IDs with edit group registry
+                    self._record_change_ids(start_id, self._document._xml_generator.next_change_id)
+                    return  # Minimal edit applied successfully
                 else:
-                    self._replace_match_with_elements(match, new_runs)
+                    # Log fallback at INFO level
+                    logger.info(
+                        "Falling back to coarse tracked change for '%s' -> '%s': %s",
+                        matched_text[:50],
+                        replacement_text[:50],
+                        reason,
+                    )
+
+            # Coarse tracked replace: deletion + insertion
+            generator = self._document._xml_generator
+            elements = [
+                generator.create_deletion_element(matched_text, author),
+                generator.create_insertion_element(replacement_text, author),
+            ]
+            # Replace the matched text with deletion + insertion
+            self._replace_match_with_elements(match, elements)
+
+            # Record change IDs with edit group registry
+            self._record_change_ids(start_id, self._document._xml_generator.next_change_id)
+        else:
+            # Untracked replace: just replace with plain runs
+            # Get source run for formatting
+            source_run = match.runs[0] if match.runs else None
+            new_runs = self._document._xml_generator.create_plain_runs(
+                replacement_text, source_run=source_run
+            )
+            if len(new_runs) == 1:
+                self._replace_match_with_element(match, new_runs[0])
+            else:
+                self._replace_match_with_elements(match, new_runs)
 
     def _log_context_preview(self, match: TextSpan, replacement: str, context_chars: int) -> None:
         """Log context preview for debugging."""
@@ -772,16 +836,13 @@ class TrackedChangeOperations:
         Returns:
             Tuple of (move_to_elements, move_from_elements)
         """
-        move_from_xml, _, _ = self._document._xml_generator.create_move_from(
+        move_from_elements, _, _ = self._document._xml_generator.create_move_from_elements(
             source_text, move_name, author
         )
-        move_to_xml, _, _ = self._document._xml_generator.create_move_to(
+        move_to_elements, _, _ = self._document._xml_generator.create_move_to_elements(
             source_text, move_name, author
         )
 
-        move_to_elements = self._parse_xml_elements(move_to_xml)
-        move_from_elements = self._parse_xml_elements(move_from_xml)
-
         return move_to_elements, move_from_elements
 
     def _generate_move_name(self) -> str:
@@ -823,6 +884,7 @@ class TrackedChangeOperations:
         """
         # Get the paragraph containing the match
         paragraph = match.paragraph
+        self._document._text_index.invalidate(paragraph)
 
         # Find the run where the match ends
         end_run = match.runs[match.end_run_index]
@@ -848,6 +910,7 @@ class TrackedChangeOperations:
         """
         # Get the paragraph containing the match
         paragraph = match.paragraph
+        self._document._text_index.invalidate(paragraph)
 
         # Find the run where the match starts
         start_run = match.runs[match.start_run_index]
@@ -879,6 +942,7 @@ class TrackedChangeOperations:
             replacement_element: The lxml Element to insert in place of matched text
         """
         paragraph = match.paragraph
+        self._document._text_index.invalidate(paragraph)
 
         # If the match is within a single run
         if match.start_run_index == match.end_run_index:
@@ -1163,6 +1227,7 @@ class TrackedChangeOperations:
             replacement_elements: List of lxml Elements to insert in place of matched text
         """
         paragraph = match.paragraph
+        self._document._text_index.invalidate(paragraph)
 
         # Similar to _replace_match_with_element but inserts multiple elements
         if match.start_run_index == match.end_run_index:
@@ -2019,6 +2084,7 @@ class TrackedChangeOperations:
             match: TextSpan object representing the text to remove
         """
         paragraph = match.paragraph
+        self._document._text_index.invalidate(paragraph)
 
         # If the match is within a single run
         if match.start_run_index == match.end_run_index:
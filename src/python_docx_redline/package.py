@@ -3,20 +3,358 @@ OOXMLPackage class for managing Word document ZIP structure.
 
 This module provides a clean abstraction for the OOXML package format,
 separating ZIP handling from XML manipulation concerns.
+
+Two storage backends are available:
+- OOXMLPackage: extracts the archive to a temporary directory (default)
+- InMemoryPackage: keeps every ZIP member as bytes in memory and never
+  touches the filesystem
 """
 
+import copy
 import io
+import os
 import re
 import shutil
+import struct
 import tempfile
+import time
 import zipfile
-from pathlib import Path
-from typing import Any, BinaryIO
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, TypeVar
 
 from lxml import etree
 
 from .validation import ValidationError
 
+# Matches the encoding declaration in an XML prolog
+_ENCODING_DECLARATION = re.compile(r'(<\?xml[^>]*encoding=)["\']([^"\']*)["\']')
+
+# ZIP local file header layout (APPNOTE 4.3.7)
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_NAME_LENGTHS = struct.Struct("<HH")
+_DATA_DESCRIPTOR_FLAG = 0x08
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+T = TypeVar("T")
+
+# Media formats that are already compressed; deflating them again wastes CPU
+ALREADY_COMPRESSED_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".tif", ".tiff", ".wdp", ".emz", ".wmz", ".mp3", ".mp4"}
+)
+
+
+def _fix_encoding_declaration(data: bytes) -> bytes | None:
+    """Rewrite a non-UTF encoding declaration to UTF-8.
+
+    OOXML specification requires UTF-8 or UTF-16 encoding, but some tools
+    (including Microsoft Word in certain cases) generate files with
+    encoding="ASCII". This causes validation failures.
+
+    Args:
+        data: Raw bytes of an XML part
+
+    Returns:
+        The fixed bytes, or None if the part does not need fixing
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+
+    match = _ENCODING_DECLARATION.search(text[:200])
+    if not match:
+        return None
+
+    encoding = match.group(2).upper()
+    # Only fix if it's not already UTF-8 or UTF-16
+    if encoding in ["UTF-8", "UTF-16", "UTF-16LE", "UTF-16BE"]:
+        return None
+
+    return _ENCODING_DECLARATION.sub(r'\1"UTF-8"', text, count=1).encode("utf-8")
+
+
+def _iter_raw_member_data(source: zipfile.ZipFile, info: zipfile.ZipInfo) -> Iterator[bytes]:
+    """Stream a member's compressed bytes out of an archive.
+
+    Args:
+        source: Archive opened for reading that contains the member
+        info: The member's entry in the source archive
+
+    Yields:
+        Chunks of the compressed member data
+    """
+    assert source.fp is not None
+
+    # Skip the local header; its name and extra field lengths may differ
+    # from the central directory entry
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(_LOCAL_HEADER_SIZE)
+    name_length, extra_length = _LOCAL_HEADER_NAME_LENGTHS.unpack(header[26:30])
+    source.fp.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = source.fp.read(min(remaining, _COPY_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member in source archive: {info.filename}")
+        yield chunk
+        remaining -= len(chunk)
+
+
+def _append_member(target: zipfile.ZipFile, info: zipfile.ZipInfo, data: Iterable[bytes]) -> None:
+    """Append an already-compressed member to an archive opened for writing.
+
+    Args:
+        target: Archive opened for writing
+        info: Entry with compression type, CRC and sizes filled in
+        data: The compressed member data
+    """
+    assert target.fp is not None
+
+    # Sizes are known up front, so no data descriptor follows the data
+    info.flag_bits &= ~_DATA_DESCRIPTOR_FLAG
+    info.header_offset = target.fp.tell()
+    target.fp.write(info.FileHeader())
+    for chunk in data:
+        target.fp.write(chunk)
+
+    target.filelist.append(info)
+    target.NameToInfo[info.filename] = info
+    target.start_dir = target.fp.tell()
+
+
+def _compress_member(
+    part_name: str, data: bytes, compress_type: int, level: int | None, date_time: tuple
+) -> tuple[zipfile.ZipInfo, bytes]:
+    """Compress a part's contents into a ready-to-append ZIP member.
+
+    Args:
+        part_name: Name of the member
+        data: Uncompressed contents
+        compress_type: zipfile.ZIP_DEFLATED or zipfile.ZIP_STORED
+        level: Deflate level, or None for the zlib default
+        date_time: Modification time stamp for the entry
+
+    Returns:
+        Tuple of (entry, compressed data)
+    """
+    info = zipfile.ZipInfo(part_name, date_time=date_time)
+    info.compress_type = compress_type
+    info.external_attr = 0o600 << 16
+    info.file_size = len(data)
+    info.CRC = zlib.crc32(data)
+
+    if compress_type == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, -15
+        )
+        data = compressor.compress(data) + compressor.flush()
+
+    info.compress_size = len(data)
+    return info, data
+
+
+def _map_bounded(
+    executor: ThreadPoolExecutor,
+    window: int,
+    fn: Callable[..., T],
+    items: Iterable[Any],
+    *args: Any,
+) -> Iterator[T]:
+    """Map fn over items in a thread pool, keeping few results in memory.
+
+    Unlike executor.map, which submits every call at once, at most
+    `window` calls are pending or finished but not yet consumed.
+
+    Args:
+        executor: Thread pool running the calls
+        window: Maximum number of calls submitted ahead of the consumer
+        fn: Function called as fn(item, *args)
+        items: Items to map
+        *args: Extra arguments passed to every call
+
+    Yields:
+        Results in the order of items
+    """
+    pending: deque[Future[T]] = deque()
+    try:
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, item, *args))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Get a cheap change signature (size, mtime) for a file, or None if missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class _SourceArchive:
+    """The original .docx archive a package was opened from.
+
+    Unchanged members are copied from here verbatim when the package is
+    saved. A path source is only trusted while the file on disk is
+    unchanged since it was opened.
+    """
+
+    def __init__(self, source: Path | bytes) -> None:
+        """Read the central directory of the source archive.
+
+        Args:
+            source: Path to the .docx file, or its contents
+        """
+        self._source = source
+        self._signature = _file_signature(source) if isinstance(source, Path) else None
+        with self.open() as zip_ref:
+            self.members: dict[str, zipfile.ZipInfo] = {
+                info.filename: info for info in zip_ref.infolist() if not info.is_dir()
+            }
+
+    def open(self) -> zipfile.ZipFile:
+        """Open the source archive for reading."""
+        if isinstance(self._source, Path):
+            return zipfile.ZipFile(self._source, "r")
+        return zipfile.ZipFile(io.BytesIO(self._source), "r")
+
+    def read(self, part_name: str) -> bytes:
+        """Read and decompress a single member."""
+        with self.open() as zip_ref:
+            return zip_ref.read(part_name)
+
+    def is_current(self) -> bool:
+        """Check that the source can still be read as it was when opened."""
+        if not isinstance(self._source, Path):
+            return True
+        return _file_signature(self._source) == self._signature
+
+    def copy_to(self, target: str | Path | BinaryIO) -> None:
+        """Write the source archive, unchanged, to a file or stream."""
+        if isinstance(target, (str, Path)):
+            if isinstance(self._source, Path):
+                shutil.copyfile(self._source, target)
+                return
+            with open(target, "wb") as out:
+                self.copy_to(out)
+        elif isinstance(self._source, Path):
+            with open(self._source, "rb") as src:
+                shutil.copyfileobj(src, target, _COPY_CHUNK_SIZE)
+        else:
+            target.write(self._source)
+
+    def in_memory(self) -> "_SourceArchive":
+        """Get an equivalent archive whose contents are held in memory."""
+        if not isinstance(self._source, Path):
+            return self
+        return _SourceArchive(self._source.read_bytes())
+
+    def is_file(self, path: Path) -> bool:
+        """Check whether the source is the given file on disk."""
+        if not isinstance(self._source, Path):
+            return False
+        try:
+            return os.path.samefile(self._source, path)
+        except OSError:
+            return False
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """Per-member compression settings used when saving a package.
+
+    The default policy matches plain zipfile behaviour: every modified member
+    is deflated at the zlib default level, one at a time. Members that are
+    unchanged since the package was opened are copied verbatim unless
+    recompress_unchanged is set.
+
+    Attributes:
+        level: Deflate level (0-9) for members not covered by a more specific
+            setting, or None for the zlib default
+        xml_level: Deflate level for XML parts (.xml and .rels), or None to
+            use `level`
+        store_extensions: File extensions (e.g. ".png") written without
+            compression
+        workers: Number of threads compressing members in parallel
+        recompress_unchanged: Whether to apply the policy to unchanged
+            members too, instead of copying them from the source archive
+
+    Example:
+        >>> doc.save("out.docx", compression=CompressionPolicy.fast())
+        >>> doc.save("archive.docx", compression=CompressionPolicy.archival())
+    """
+
+    level: int | None = None
+    xml_level: int | None = None
+    store_extensions: frozenset[str] = field(default_factory=frozenset)
+    workers: int = 1
+    recompress_unchanged: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate compression settings."""
+        for name in ("level", "xml_level"):
+            value = getattr(self, name)
+            if value is not None and not 0 <= value <= 9:
+                raise ValueError(f"{name} must be between 0 and 9, got {value}")
+        if self.workers < 1:
+            raise ValueError(f"workers must be at least 1, got {self.workers}")
+        # Normalize extensions so lookups are case-insensitive
+        object.__setattr__(
+            self, "store_extensions", frozenset(ext.lower() for ext in self.store_extensions)
+        )
+
+    @classmethod
+    def fast(cls, workers: int | None = None) -> "CompressionPolicy":
+        """Favor save latency: store compressed media, fast XML deflate, all cores.
+
+        Args:
+            workers: Number of compression threads (default: CPU count)
+        """
+        return cls(
+            xml_level=1,
+            store_extensions=ALREADY_COMPRESSED_EXTENSIONS,
+            workers=workers or os.cpu_count() or 1,
+        )
+
+    @classmethod
+    def archival(cls, workers: int | None = None) -> "CompressionPolicy":
+        """Favor file size: maximum deflate level for every member.
+
+        Args:
+            workers: Number of compression threads (default: CPU count)
+        """
+        return cls(level=9, workers=workers or os.cpu_count() or 1, recompress_unchanged=True)
+
+    def compression_for(self, part_name: str) -> tuple[int, int | None]:
+        """Get the compression settings for a member.
+
+        Args:
+            part_name: Name of the member (e.g., "word/media/image1.png")
+
+        Returns:
+            Tuple of (zipfile compression type, deflate level or None)
+        """
+        suffix = PurePosixPath(part_name).suffix.lower()
+        if suffix in self.store_extensions:
+            return zipfile.ZIP_STORED, None
+        if suffix in (".xml", ".rels") and self.xml_level is not None:
+            return zipfile.ZIP_DEFLATED, self.xml_level
+        return zipfile.ZIP_DEFLATED, self.level
+
 
 class OOXMLPackage:
     """Manages the OOXML ZIP package structure.
@@ -27,6 +365,15 @@ class OOXMLPackage:
     - Repacking modified content back to ZIP format
     - Cleaning up temporary resources
 
+    All part access goes through the part-level API (get_part, set_part,
+    get_part_bytes, set_part_bytes, delete_part, part_exists, part_names),
+    so callers work the same way against any storage backend.
+
+    XML parts are parsed lazily, once, on first access to get_part(). Every
+    caller receives the same cached element, and set_part() only marks the
+    part as modified: the tree is serialized when the package is flushed,
+    which happens automatically on save.
+
     Example:
         >>> with OOXMLPackage.open("document.docx") as pkg:
         ...     doc_xml = pkg.get_part("word/document.xml")
@@ -48,19 +395,33 @@ class OOXMLPackage:
         self._temp_dir = temp_dir
         self._source_path = source_path
         self._closed = False
+        # Parsed XML parts, keyed by part name
+        self._part_cache: dict[str, etree._Element] = {}
+        # Modified parts awaiting serialization -> (pretty_print, standalone)
+        self._dirty_parts: dict[str, tuple[bool, bool | None]] = {}
+        # Original archive, for copying unchanged members on save
+        self._source_archive: _SourceArchive | None = None
+        # Parts written or removed since the source archive was attached
+        self._modified_parts: set[str] = set()
+        # Signatures of extracted files, to detect edits made directly on disk
+        self._extracted_signatures: dict[str, tuple[int, int] | None] = {}
+        # XML parts known to declare a UTF encoding
+        self._encoding_checked: set[str] = set()
+        # Incremented whenever a part is stored, replaced or removed
+        self._generation = 0
 
-    @classmethod
-    def open(cls, source: str | Path | BinaryIO) -> "OOXMLPackage":
-        """Open an OOXML package from a file path or file-like object.
+    @staticmethod
+    def _resolve_source(source: str | Path | BinaryIO) -> tuple[Path | BinaryIO, Path | None]:
+        """Normalize and verify a package source.
 
         Args:
             source: Path to .docx file or file-like object containing it
 
         Returns:
-            OOXMLPackage instance with extracted contents
+            Tuple of (zip source, source path or None for streams)
 
         Raises:
-            ValidationError: If the source is not a valid ZIP file
+            ValidationError: If the source does not exist or is not a ZIP file
         """
         source_path: Path | None = None
 
@@ -81,17 +442,54 @@ class OOXMLPackage:
         if hasattr(zip_source, "seek"):
             zip_source.seek(0)
 
+        return zip_source, source_path
+
+    @staticmethod
+    def _read_source_bytes(zip_source: Path | BinaryIO, source_path: Path | None) -> bytes:
+        """Read the complete source archive into memory."""
+        if source_path is not None:
+            return source_path.read_bytes()
+        assert not isinstance(zip_source, Path)
+        return zip_source.read()
+
+    @classmethod
+    def _read_source_archive(
+        cls, zip_source: Path | BinaryIO, source_path: Path | None
+    ) -> _SourceArchive:
+        """Open the source archive, keeping streams in memory for later raw copies."""
+        if source_path is not None:
+            return _SourceArchive(source_path)
+        return _SourceArchive(cls._read_source_bytes(zip_source, source_path))
+
+    @classmethod
+    def open(cls, source: str | Path | BinaryIO) -> "OOXMLPackage":
+        """Open an OOXML package from a file path or file-like object.
+
+        Args:
+            source: Path to .docx file or file-like object containing it
+
+        Returns:
+            OOXMLPackage instance with extracted contents
+
+        Raises:
+            ValidationError: If the source is not a valid ZIP file
+        """
+        zip_source, source_path = cls._resolve_source(source)
+
         # Extract to temp directory
         temp_dir = Path(tempfile.mkdtemp(prefix="python_docx_redline_"))
         try:
-            with zipfile.ZipFile(zip_source, "r") as zip_ref:
+            archive = cls._read_source_archive(zip_source, source_path)
+            with archive.open() as zip_ref:
                 zip_ref.extractall(temp_dir)
         except Exception as e:
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
             raise ValidationError(f"Failed to extract .docx file: {e}") from e
 
-        return cls(temp_dir, source_path)
+        package = cls(temp_dir, source_path)
+        package._attach_source(archive)
+        return package
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "OOXMLPackage":
@@ -107,7 +505,12 @@ class OOXMLPackage:
 
     @property
     def temp_dir(self) -> Path:
-        """Get the temporary directory containing extracted package contents."""
+        """Get the temporary directory containing extracted package contents.
+
+        Pending part modifications are flushed first, so the directory
+        always reflects the current state of the package.
+        """
+        self.flush()
         return self._temp_dir
 
     @property
@@ -118,149 +521,500 @@ class OOXMLPackage:
     def get_part_path(self, part_name: str) -> Path:
         """Get the filesystem path to a package part.
 
+        Pending modifications to the part are flushed first.
+
         Args:
             part_name: Relative path within the package (e.g., "word/document.xml")
 
         Returns:
             Path to the part in the temp directory
         """
+        self._flush_part(part_name)
         return self._temp_dir / part_name
 
+    # ------------------------------------------------------------------
+    # Storage backend
+    #
+    # Subclasses override these hooks to store raw part bytes elsewhere.
+    # They bypass the parsed-part cache.
+    # ------------------------------------------------------------------
+
+    def _read_part_bytes(self, part_name: str) -> bytes | None:
+        """Read a part from storage, or None if it isn't stored."""
+        part_path = self._temp_dir / part_name
+        if not part_path.is_file():
+            return None
+        return part_path.read_bytes()
+
+    def _write_part_bytes(self, part_name: str, data: bytes) -> None:
+        """Write a part to storage, creating it if needed."""
+        part_path = self._temp_dir / part_name
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path.write_bytes(data)
+
+    def _remove_part_bytes(self, part_name: str) -> bool:
+        """Remove a part from storage, returning True if it was stored."""
+        part_path = self._temp_dir / part_name
+        if not part_path.is_file():
+            return False
+        part_path.unlink()
+        return True
+
+    def _stored_part_names(self) -> list[str]:
+        """List the names of all stored parts, in source archive order."""
+        names = [
+            file.relative_to(self._temp_dir).as_posix()
+            for file in self._temp_dir.rglob("*")
+            if file.is_file()
+        ]
+        if self._source_archive is not None:
+            order = {name: index for index, name in enumerate(self._source_archive.members)}
+            names.sort(key=lambda name: order.get(name, len(order)))
+        return names
+
+    def _attach_source(self, archive: _SourceArchive) -> None:
+        """Use an archive holding the current contents as the source for raw copies."""
+        self._source_archive = archive
+        self._modified_parts.clear()
+        self._extracted_signatures = {
+            name: _file_signature(self._temp_dir / name) for name in archive.members
+        }
+
+    def _is_unchanged(self, part_name: str) -> bool:
+        """Check if a stored part still matches its source archive member."""
+        if part_name in self._modified_parts:
+            return False
+        # The temp directory is public, so also catch edits made directly on disk
+        signature = self._extracted_signatures.get(part_name)
+        return signature is not None and _file_signature(self._temp_dir / part_name) == signature
+
+    # ------------------------------------------------------------------
+    # Raw part access
+    # ------------------------------------------------------------------
+
+    def get_part_bytes(self, part_name: str) -> bytes | None:
+        """Get the raw bytes of a package part.
+
+        Args:
+            part_name: Relative path within the package (e.g., "word/media/image1.png")
+
+        Returns:
+            The part contents, or None if the part doesn't exist
+        """
+        self._flush_part(part_name)
+        return self._read_part_bytes(part_name)
+
+    def set_part_bytes(self, part_name: str, data: bytes) -> None:
+        """Write raw bytes to a package part, creating it if needed.
+
+        Any cached parse of the part is discarded.
+
+        Args:
+            part_name: Relative path within the package
+            data: The new part contents
+        """
+        self._part_cache.pop(part_name, None)
+        self._dirty_parts.pop(part_name, None)
+        self._encoding_checked.discard(part_name)
+        self._modified_parts.add(part_name)
+        self._generation += 1
+        self._write_part_bytes(part_name, data)
+
+    def delete_part(self, part_name: str) -> bool:
+        """Remove a part from the package.
+
+        Args:
+            part_name: Relative path within the package
+
+        Returns:
+            True if the part existed and was removed
+        """
+        self._part_cache.pop(part_name, None)
+        self._encoding_checked.discard(part_name)
+        self._modified_parts.add(part_name)
+        self._generation += 1
+        pending = self._dirty_parts.pop(part_name, None) is not None
+        return self._remove_part_bytes(part_name) or pending
+
+    def part_exists(self, part_name: str) -> bool:
+        """Check if a package part exists.
+
+        Args:
+            part_name: Relative path within the package
+
+        Returns:
+            True if the part exists
+        """
+        return part_name in self._dirty_parts or self._read_part_bytes(part_name) is not None
+
+    def part_names(self) -> list[str]:
+        """List every part in the package.
+
+        Returns:
+            Part names using forward slashes (e.g., "word/document.xml")
+        """
+        names = self._stored_part_names()
+        stored = set(names)
+        names.extend(name for name in self._dirty_parts if name not in stored)
+        return names
+
+    # ------------------------------------------------------------------
+    # XML parts
+    # ------------------------------------------------------------------
+
     def get_part(self, part_name: str) -> etree._Element | None:
         """Get a package part as a parsed XML element.
 
+        The part is parsed on first access and cached; later calls return
+        the same element, so modifications are shared between callers.
+
         Args:
             part_name: Relative path within the package (e.g., "word/document.xml")
 
         Returns:
             Parsed XML element tree, or None if part doesn't exist
         """
-        part_path = self.get_part_path(part_name)
-        if not part_path.exists():
+        cached = self._part_cache.get(part_name)
+        if cached is not None:
+            return cached
+
+        data = self._read_part_bytes(part_name)
+        if data is None:
             return None
 
         parser = etree.XMLParser(remove_blank_text=False)
-        tree = etree.parse(str(part_path), parser)
-        return tree.getroot()
+        root = etree.fromstring(data, parser)
+        self._part_cache[part_name] = root
+        return root
 
-    def set_part(self, part_name: str, element: etree._Element) -> None:
-        """Write an XML element to a package part.
+    def set_part(
+        self,
+        part_name: str,
+        element: etree._Element,
+        pretty_print: bool = False,
+        standalone: bool | None = None,
+    ) -> None:
+        """Store an XML element as a package part.
+
+        The element becomes the cached tree for the part and the part is
+        marked as modified. Serialization is deferred until flush().
 
         Args:
             part_name: Relative path within the package (e.g., "word/document.xml")
             element: XML element to write
+            pretty_print: Whether to indent the serialized XML
+            standalone: Value of the standalone flag in the XML declaration
+                (None omits the flag)
         """
-        part_path = self.get_part_path(part_name)
+        self._part_cache[part_name] = element.getroottree().getroot()
+        self._dirty_parts[part_name] = (pretty_print, standalone)
+        self._generation += 1
 
-        # Ensure parent directory exists
-        part_path.parent.mkdir(parents=True, exist_ok=True)
+    def _flush_part(self, part_name: str) -> None:
+        """Serialize a single modified part to storage, if it is pending."""
+        options = self._dirty_parts.pop(part_name, None)
+        if options is None:
+            return
 
-        # Get the tree from the element
-        tree = element.getroottree()
-        tree.write(
-            str(part_path),
+        pretty_print, standalone = options
+        data = etree.tostring(
+            self._part_cache[part_name].getroottree(),
             encoding="utf-8",
             xml_declaration=True,
-            pretty_print=False,
+            pretty_print=pretty_print,
+            standalone=standalone,
         )
+        self._modified_parts.add(part_name)
+        self._encoding_checked.add(part_name)
+        self._write_part_bytes(part_name, data)
 
-    def part_exists(self, part_name: str) -> bool:
-        """Check if a package part exists.
+    def flush(self) -> None:
+        """Serialize every modified XML part to storage.
 
-        Args:
-            part_name: Relative path within the package
+        Called automatically before saving or unpacking the package.
+        """
+        for part_name in list(self._dirty_parts):
+            self._flush_part(part_name)
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    @property
+    def generation(self) -> int:
+        """Modification counter of the package.
+
+        Incremented whenever a part is stored, replaced or removed through
+        the part-level API. Compare two readings to tell whether anything was written to the
+        package in between.
+        """
+        return self._generation
+
+    def is_modified(self) -> bool:
+        """Check whether the package differs from the archive it was opened from.
+
+        Parts are compared by their stored state, so modifications that have
+        not been passed back through set_part() are not seen. After saving
+        over the source file, the saved file becomes the reference.
 
         Returns:
-            True if the part exists
+            True if saving would produce anything other than the source archive
         """
-        return self.get_part_path(part_name).exists()
+        source = self._source_archive
+        if source is None or self._dirty_parts or self._modified_parts:
+            return True
+        if not source.is_current():
+            return True
+
+        # Saving normalizes encoding declarations, which counts as a change
+        self._fix_encoding_declarations()
+
+        part_names = self._stored_part_names()
+        if len(part_names) != len(source.members):
+            return True
+        return not all(name in source.members and self._is_unchanged(name) for name in part_names)
+
+    def _is_pristine(self, compression: CompressionPolicy | None) -> bool:
+        """Check whether a save can simply reproduce the source archive."""
+        if compression is not None and compression.recompress_unchanged:
+            return False
+        return not self.is_modified()
+
+    # ------------------------------------------------------------------
+    # Cloning
+    # ------------------------------------------------------------------
+
+    def clone(self) -> "InMemoryPackage":
+        """Create an independent in-memory copy of the package.
+
+        Parsed XML parts are deep-copied, so the copy starts with the same
+        trees and pending modifications without re-parsing anything. Members
+        that are unchanged since the package was opened are not read at all:
+        the copy decompresses them from the source archive on first access.
+
+        Returns:
+            InMemoryPackage with the same contents as this package
+        """
+        source = self._source_archive
+        if source is not None and not source.is_current():
+            source = None
+        elif source is not None:
+            source = source.in_memory()
+
+        parts: dict[str, bytes | None] = {}
+        modified: set[str] = set()
+        for part_name in self._stored_part_names():
+            if source is not None and part_name in source.members and self._is_unchanged(part_name):
+                parts[part_name] = None
+            else:
+                parts[part_name] = self._read_part_bytes(part_name)
+                modified.add(part_name)
+
+        package = InMemoryPackage(parts, self._source_path)
+        package._source_archive = source
+        package._modified_parts = modified | self._modified_parts
+        self._copy_parsed_parts(package)
+        return package
+
+    def _copy_parsed_parts(self, package: "OOXMLPackage") -> None:
+        """Deep-copy cached trees and pending modifications into another package."""
+        package._part_cache = {
+            name: copy.deepcopy(root.getroottree()).getroot()
+            for name, root in self._part_cache.items()
+        }
+        package._dirty_parts = dict(self._dirty_parts)
+        package._encoding_checked = set(self._encoding_checked)
+
+    # ------------------------------------------------------------------
+    # Saving
+    # ------------------------------------------------------------------
 
     def _fix_encoding_declarations(self) -> None:
         """Fix encoding declarations in all XML files to use UTF-8.
 
-        OOXML specification requires UTF-8 or UTF-16 encoding, but some tools
-        (including Microsoft Word in certain cases) generate files with
-        encoding="ASCII". This causes validation failures.
+        Each part is checked once; parts serialized by this package are
+        always UTF-8 and are skipped.
         """
-        # Find all XML and .rels files
-        xml_files = list(self._temp_dir.rglob("*.xml")) + list(self._temp_dir.rglob("*.rels"))
-
-        for xml_file in xml_files:
+        for part_name in self._stored_part_names():
+            if part_name in self._encoding_checked or not part_name.endswith((".xml", ".rels")):
+                continue
             try:
-                # Read the file
-                with open(xml_file, "rb") as f:
-                    data = f.read()
-
-                # Decode and check if it has an encoding declaration
-                try:
-                    text = data.decode("utf-8")
-                except UnicodeDecodeError:
-                    text = data.decode("latin-1")
-
-                # Look for encoding declaration
-                pattern = r'(<\?xml[^>]*encoding=)["\']([^"\']*)["\']'
-                match = re.search(pattern, text[:200])
-
-                if match:
-                    encoding = match.group(2).upper()
-                    # Only fix if it's not already UTF-8 or UTF-16
-                    if encoding not in ["UTF-8", "UTF-16", "UTF-16LE", "UTF-16BE"]:
-                        # Replace encoding declaration with UTF-8
-                        new_text = re.sub(
-                            pattern,
-                            r'\1"UTF-8"',
-                            text,
-                            count=1,
-                        )
-
-                        # Write back as UTF-8
-                        with open(xml_file, "wb") as f:
-                            f.write(new_text.encode("utf-8"))
-
+                data = self._read_part_bytes(part_name)
+                fixed = _fix_encoding_declaration(data) if data is not None else None
+                if fixed is not None:
+                    # Cached trees are unaffected by the declaration
+                    self._modified_parts.add(part_name)
+                    self._write_part_bytes(part_name, fixed)
+                self._encoding_checked.add(part_name)
             except Exception:
                 # Ignore errors on individual files
                 pass
 
-    def save(self, output_path: str | Path) -> None:
+    def _compress_part(
+        self, part_name: str, policy: CompressionPolicy, date_time: tuple
+    ) -> tuple[zipfile.ZipInfo, bytes]:
+        """Read and compress a stored part according to a policy."""
+        data = self._read_part_bytes(part_name)
+        assert data is not None
+        compress_type, level = policy.compression_for(part_name)
+        return _compress_member(part_name, data, compress_type, level, date_time)
+
+    def _write_zip(self, zip_ref: zipfile.ZipFile, policy: CompressionPolicy) -> None:
+        """Write every stored part into an open ZIP archive.
+
+        Parts that are unchanged since the package was opened are copied
+        verbatim from the source archive; only modified parts are compressed,
+        in parallel when the policy allows it. Members keep their order.
+
+        Args:
+            zip_ref: ZIP archive opened for writing
+            policy: Compression settings for the members being compressed
+        """
+        part_names = self._stored_part_names()
+
+        source = self._source_archive
+        raw_members: dict[str, zipfile.ZipInfo] = {}
+        if source is not None and source.is_current() and not policy.recompress_unchanged:
+            for part_name in part_names:
+                info = source.members.get(part_name)
+                if info is not None and self._is_unchanged(part_name):
+                    raw_members[part_name] = info
+
+        to_compress = [name for name in part_names if name not in raw_members]
+        date_time = time.localtime(time.time())[:6]
+
+        with ExitStack() as stack:
+            if policy.workers > 1 and len(to_compress) > 1:
+                workers = min(policy.workers, len(to_compress))
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+                # zlib releases the GIL, so members compress concurrently;
+                # only a few are held compressed while earlier ones are written
+                compressed = _map_bounded(
+                    executor, 2 * workers, self._compress_part, to_compress, policy, date_time
+                )
+            else:
+                compressed = map(
+                    self._compress_part, to_compress, repeat(policy), repeat(date_time)
+                )
+
+            source_zip = None
+            if raw_members:
+                if source is None:
+                    raise ValidationError("Cannot copy unchanged parts: no source archive")
+                source_zip = stack.enter_context(source.open())
+
+            for part_name in part_names:
+                raw_info = raw_members.get(part_name)
+                if raw_info is not None:
+                    assert source_zip is not None
+                    data = _iter_raw_member_data(source_zip, raw_info)
+                    _append_member(zip_ref, copy.copy(raw_info), data)
+                else:
+                    info, member_data = next(compressed)
+                    _append_member(zip_ref, info, (member_data,))
+
+    def _write_archive(
+        self, target: str | Path | BinaryIO, compression: CompressionPolicy | None
+    ) -> None:
+        """Flush pending changes and write the complete archive to a target.
+
+        If nothing changed since the package was opened, the source archive
+        is copied as-is instead of being rebuilt.
+        """
+        if self._is_pristine(compression):
+            assert self._source_archive is not None
+            self._source_archive.copy_to(target)
+            return
+
+        self.flush()
+
+        # Fix encoding declarations before packing
+        self._fix_encoding_declarations()
+
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+            self._write_zip(zip_ref, compression or CompressionPolicy())
+
+    def save(self, output_path: str | Path, compression: CompressionPolicy | None = None) -> None:
         """Save the package to a .docx file.
 
         Args:
             output_path: Path to save the .docx file
+            compression: Compression settings (default: deflate modified
+                members at the zlib default level)
         """
         output_path = Path(output_path)
 
-        # Fix encoding declarations before packing
-        self._fix_encoding_declarations()
+        source = self._source_archive
+        if source is None or not source.is_file(output_path):
+            self._write_archive(output_path, compression)
+            return
+        if self._is_pristine(compression):
+            # The file already holds exactly these contents
+            return
+
+        # Overwriting the source archive, which unchanged members are copied
+        # from: write next to it, then swap the finished file into place
+        fd, temp_name = tempfile.mkstemp(suffix=".docx", dir=output_path.parent)
+        os.close(fd)
+        try:
+            self._write_archive(temp_name, compression)
+            shutil.copymode(output_path, temp_name)
+            os.replace(temp_name, output_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+        # The saved file now holds the current contents
+        self._attach_source(_SourceArchive(output_path))
+
+    def save_to_stream(
+        self, stream: BinaryIO, compression: CompressionPolicy | None = None
+    ) -> None:
+        """Write the package into a writable binary stream.
 
-        # Create ZIP file
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
-            for file in self._temp_dir.rglob("*"):
-                if file.is_file():
-                    arcname = file.relative_to(self._temp_dir)
-                    zip_ref.write(file, arcname)
+        Members are written to the stream one at a time, so the archive is
+        never held in memory as a whole. The stream does not need to be
+        seekable (HTTP response bodies, pipes and sockets work) and is left
+        open.
 
-    def save_to_bytes(self) -> bytes:
+        Args:
+            stream: Writable binary file-like object
+            compression: Compression settings (default: deflate modified
+                members at the zlib default level)
+        """
+        self._write_archive(stream, compression)
+
+    def save_to_bytes(self, compression: CompressionPolicy | None = None) -> bytes:
         """Save the package to bytes.
 
+        Args:
+            compression: Compression settings (default: deflate modified
+                members at the zlib default level)
+
         Returns:
             The complete .docx file as bytes
         """
-        # Fix encoding declarations before packing
-        self._fix_encoding_declarations()
-
-        # Create ZIP in memory
         buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_ref:
-            for file in self._temp_dir.rglob("*"):
-                if file.is_file():
-                    arcname = file.relative_to(self._temp_dir)
-                    zip_ref.write(file, arcname)
+        self.save_to_stream(buffer, compression)
+        return buffer.getvalue()
+
+    @contextmanager
+    def unpacked(self) -> Iterator[Path]:
+        """Provide the package contents as a directory on disk.
 
-        buffer.seek(0)
-        return buffer.read()
+        Used by the schema validators, which operate on an unpacked tree.
+        For the extracted backend this is simply the temp directory.
+
+        Yields:
+            Directory containing every package part
+        """
+        self.flush()
+        yield self._temp_dir
 
     def close(self) -> None:
         """Clean up temporary directory."""
+        self._part_cache.clear()
+        self._dirty_parts.clear()
         if not self._closed and self._temp_dir and self._temp_dir.exists():
             try:
                 shutil.rmtree(self._temp_dir)
@@ -280,3 +1034,150 @@ class OOXMLPackage:
     def __del__(self) -> None:
         """Clean up temporary directory on garbage collection."""
         self.close()
+
+
+class InMemoryPackage(OOXMLPackage):
+    """OOXML package that keeps every ZIP member in memory.
+
+    Parts are held as bytes keyed by part name, in archive order. Members
+    are decompressed on first read, so untouched media is never inflated.
+    Opening, editing and saving never touch the filesystem, and there is no
+    temporary directory to leak if a worker dies before cleanup runs.
+
+    Only `unpacked()` writes to disk: the schema validators need a directory,
+    so a scratch copy is materialized for the duration of validation.
+
+    Example:
+        >>> pkg = InMemoryPackage.from_bytes(docx_bytes)
+        >>> root = pkg.get_part("word/document.xml")
+        >>> pkg.set_part("word/document.xml", root)
+        >>> new_bytes = pkg.save_to_bytes()
+    """
+
+    def __init__(self, parts: dict[str, bytes | None], source_path: Path | None = None) -> None:
+        """Initialize package from a mapping of part names to bytes.
+
+        Use the class methods `open()` or `from_bytes()` instead of
+        calling this constructor directly.
+
+        Args:
+            parts: Part contents keyed by part name, in archive order. None
+                marks a member not yet read from the source archive.
+            source_path: Original source file path (for validation reference)
+        """
+        super().__init__(None, source_path)  # type: ignore[arg-type]
+        self._parts = parts
+
+    @classmethod
+    def open(cls, source: str | Path | BinaryIO) -> "InMemoryPackage":
+        """Open an OOXML package from a file path or file-like object.
+
+        Args:
+            source: Path to .docx file or file-like object containing it
+
+        Returns:
+            InMemoryPackage instance holding every member as bytes
+
+        Raises:
+            ValidationError: If the source is not a valid ZIP file
+        """
+        zip_source, source_path = cls._resolve_source(source)
+
+        try:
+            archive = _SourceArchive(cls._read_source_bytes(zip_source, source_path))
+        except Exception as e:
+            raise ValidationError(f"Failed to read .docx file: {e}") from e
+
+        package = cls(dict.fromkeys(archive.members), source_path)
+        package._attach_source(archive)
+        return package
+
+    @property
+    def temp_dir(self) -> Path | None:  # type: ignore[override]
+        """In-memory packages have no temporary directory."""
+        return None
+
+    def get_part_path(self, part_name: str) -> Path:
+        """In-memory parts have no filesystem path.
+
+        Raises:
+            ValidationError: Always; use get_part_bytes() or unpacked() instead
+        """
+        raise ValidationError(f"Part '{part_name}' has no filesystem path in an in-memory package")
+
+    def _read_part_bytes(self, part_name: str) -> bytes | None:
+        """Read a part from memory, or None if it isn't stored."""
+        if part_name not in self._parts:
+            return None
+
+        data = self._parts[part_name]
+        if data is None:
+            # First access: decompress from the source archive
+            assert self._source_archive is not None
+            data = self._source_archive.read(part_name)
+            self._parts[part_name] = data
+        return data
+
+    def _write_part_bytes(self, part_name: str, data: bytes) -> None:
+        """Store a part in memory, creating it if needed."""
+        self._parts[part_name] = data
+
+    def _remove_part_bytes(self, part_name: str) -> bool:
+        """Remove a part from memory, returning True if it was stored."""
+        if part_name not in self._parts:
+            return False
+        del self._parts[part_name]
+        return True
+
+    def _stored_part_names(self) -> list[str]:
+        """List the names of all stored parts, in archive order."""
+        return list(self._parts)
+
+    def _attach_source(self, archive: _SourceArchive) -> None:
+        """Use an archive holding the current contents as the source for raw copies."""
+        self._source_archive = archive
+        self._modified_parts.clear()
+
+    def _is_unchanged(self, part_name: str) -> bool:
+        """Check if a stored part still matches its source archive member."""
+        return part_name not in self._modified_parts
+
+    def clone(self) -> "InMemoryPackage":
+        """Create an independent copy of the package.
+
+        Stored bytes are immutable and shared with the copy; a part is only
+        duplicated when one of the packages writes to it. Parsed XML parts
+        are deep-copied.
+
+        Returns:
+            InMemoryPackage with the same contents as this package
+        """
+        package = InMemoryPackage(dict(self._parts), self._source_path)
+        package._source_archive = self._source_archive
+        package._modified_parts = set(self._modified_parts)
+        self._copy_parsed_parts(package)
+        return package
+
+    @contextmanager
+    def unpacked(self) -> Iterator[Path]:
+        """Materialize the parts into a scratch directory for validation.
+
+        Yields:
+            Directory containing every package part; removed on exit
+        """
+        self.flush()
+        scratch = Path(tempfile.mkdtemp(prefix="python_docx_redline_"))
+        try:
+            for part_name in self._parts:
+                part_path = scratch / part_name
+                part_path.parent.mkdir(parents=True, exist_ok=True)
+                part_path.write_bytes(self._read_part_bytes(part_name) or b"")
+            yield scratch
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def close(self) -> None:
+        """Release the in-memory parts."""
+        self._part_cache.clear()
+        self._dirty_parts.clear()
+        self._closed = True
@@ -6,9 +6,55 @@ dashes) allowing users to search with standard keyboard characters while matchin
 the various Unicode variants common in Word documents.
 
 The approach is to normalize BOTH the search text and document text to standard
-ASCII equivalents for comparison.
+ASCII equivalents for comparison. Some folds change the length of the text
+(an ellipsis becomes three periods), so NormalizedText keeps an offset map
+from normalized positions back to the original text.
 """
 
+import re
+from array import array
+
+# One character to one character: applied with a single str.translate call
+_CHAR_FOLDS = {
+    # Quotes - convert smart quotes to straight quotes
+    "\u2018": "'",  # Left single quotation mark → '
+    "\u2019": "'",  # Right single quotation mark → '
+    "\u201c": '"',  # Left double quotation mark → "
+    "\u201d": '"',  # Right double quotation mark → "
+    # Bullets - normalize to standard bullet •
+    "\u00b7": "\u2022",  # Middle dot → bullet
+    "\u25e6": "\u2022",  # White bullet → bullet
+    "\u25aa": "\u2022",  # Black small square → bullet
+    "\u25ab": "\u2022",  # White small square → bullet
+    "\u2023": "\u2022",  # Triangular bullet → bullet
+    "\u2043": "\u2022",  # Hyphen bullet → bullet
+    "\u25cf": "\u2022",  # Black circle → bullet
+    "\u25cb": "\u2022",  # White circle → bullet
+    # Dashes - normalize to standard hyphen-minus
+    "\u2013": "-",  # En dash → hyphen
+    "\u2014": "-",  # Em dash → hyphen
+    "\u2010": "-",  # Hyphen → hyphen-minus
+    "\u2011": "-",  # Non-breaking hyphen → hyphen
+    "\u2212": "-",  # Minus sign → hyphen
+}
+
+# One character to several: the normalized text is longer than the original
+_EXPANSIONS = {
+    "\u2026": "...",  # Horizontal ellipsis → three periods
+    "\ufb00": "ff",  # Latin small ligature ff
+    "\ufb01": "fi",  # Latin small ligature fi
+    "\ufb02": "fl",  # Latin small ligature fl
+    "\ufb03": "ffi",  # Latin small ligature ffi
+    "\ufb04": "ffl",  # Latin small ligature ffl
+}
+
+# Runs of non-breaking spaces (no-break, figure, narrow) fold to one space
+_NBSP_CHARS = "\u00a0\u2007\u202f"
+
+_SPECIAL_CHARS_TABLE = str.maketrans({**_CHAR_FOLDS, **_EXPANSIONS})
+_NBSP_RUN_RE = re.compile(f"[{_NBSP_CHARS}]+")
+_RESIZING_RE = re.compile(f"[{''.join(_EXPANSIONS)}]|[{_NBSP_CHARS}]+")
+
 
 def normalize_special_chars(text: str) -> str:
     """Normalize special characters (quotes, bullets, dashes) for matching.
@@ -41,6 +87,13 @@ def normalize_special_chars(text: str) -> str:
         - ‑ (U+2011) → - - Non-breaking hyphen
         - − (U+2212) → - - Minus sign
 
+        Length-changing folds:
+        - … (U+2026) → ... - Horizontal ellipsis
+        - ﬀ ﬁ ﬂ ﬃ ﬄ (U+FB00-U+FB04) → ff fi fl ffi ffl - Ligatures
+        - Runs of non-breaking spaces (U+00A0, U+2007, U+202F) → one space
+
+    Use NormalizedText to map positions in the result back to the original.
+
     Args:
         text: Text containing special characters
 
@@ -57,30 +110,83 @@ def normalize_special_chars(text: str) -> str:
         >>> normalize_special_chars("2020–2024")
         "2020-2024"  # En dash becomes hyphen
     """
-    # Quotes - convert smart quotes to straight quotes
-    text = text.replace("\u2018", "'")  # Left single quotation mark → '
-    text = text.replace("\u2019", "'")  # Right single quotation mark → '
-    text = text.replace("\u201c", '"')  # Left double quotation mark → "
-    text = text.replace("\u201d", '"')  # Right double quotation mark → "
+    return _NBSP_RUN_RE.sub(" ", text.translate(_SPECIAL_CHARS_TABLE))
 
-    # Bullets - normalize to standard bullet •
-    text = text.replace("\u00b7", "\u2022")  # Middle dot → bullet
-    text = text.replace("\u25e6", "\u2022")  # White bullet → bullet
-    text = text.replace("\u25aa", "\u2022")  # Black small square → bullet
-    text = text.replace("\u25ab", "\u2022")  # White small square → bullet
-    text = text.replace("\u2023", "\u2022")  # Triangular bullet → bullet
-    text = text.replace("\u2043", "\u2022")  # Hyphen bullet → bullet
-    text = text.replace("\u25cf", "\u2022")  # Black circle → bullet
-    text = text.replace("\u25cb", "\u2022")  # White circle → bullet
 
-    # Dashes - normalize to standard hyphen-minus
-    text = text.replace("\u2013", "-")  # En dash → hyphen
-    text = text.replace("\u2014", "-")  # Em dash → hyphen
-    text = text.replace("\u2010", "-")  # Hyphen → hyphen-minus
-    text = text.replace("\u2011", "-")  # Non-breaking hyphen → hyphen
-    text = text.replace("\u2212", "-")  # Minus sign → hyphen
+class NormalizedText:
+    """Text normalized with normalize_special_chars(), mapped back to the original.
 
-    return text
+    When every fold in the text preserves length, positions are the same in
+    both texts and no map is stored. Otherwise the original span of each
+    normalized character is recorded, so a match in the normalized text can
+    be mapped to the characters it came from.
+
+    Attributes:
+        text: The normalized text
+
+    Example:
+        >>> normalized = NormalizedText("Wait\u2026 what")
+        >>> normalized.text
+        'Wait... what'
+        >>> normalized.original_span(4, 7)
+        (4, 5)
+    """
+
+    __slots__ = ("text", "_starts", "_ends")
+
+    def __init__(self, original: str) -> None:
+        """Normalize text and record where each normalized character came from.
+
+        Args:
+            original: The text to normalize
+        """
+        self._starts: array | None = None
+        self._ends: array | None = None
+        if _RESIZING_RE.search(original) is None:
+            self.text = original.translate(_SPECIAL_CHARS_TABLE)
+            return
+
+        pieces: list[str] = []
+        starts = array("I")
+        ends = array("I")
+        position = 0
+        for match in _RESIZING_RE.finditer(original):
+            # Unchanged stretch before the fold maps one to one
+            pieces.append(original[position : match.start()].translate(_SPECIAL_CHARS_TABLE))
+            starts.extend(range(position, match.start()))
+            ends.extend(range(position + 1, match.start() + 1))
+
+            # Every character of the fold maps to the whole folded stretch
+            folded = _EXPANSIONS.get(match.group(), " ")
+            pieces.append(folded)
+            starts.extend([match.start()] * len(folded))
+            ends.extend([match.end()] * len(folded))
+            position = match.end()
+
+        pieces.append(original[position:].translate(_SPECIAL_CHARS_TABLE))
+        starts.extend(range(position, len(original)))
+        ends.extend(range(position + 1, len(original) + 1))
+
+        self.text = "".join(pieces)
+        self._starts = starts
+        self._ends = ends
+
+    def original_span(self, start: int, end: int) -> tuple[int, int]:
+        """Map a span of the normalized text to the original text.
+
+        A span that starts or ends inside a fold is widened to cover the
+        whole original character or run.
+
+        Args:
+            start: Offset of the first normalized character
+            end: Offset just past the last normalized character (greater than start)
+
+        Returns:
+            Tuple of (start, end) offsets in the original text
+        """
+        if self._starts is None or self._ends is None:
+            return start, end
+        return self._starts[start], self._ends[end - 1]
 
 
 def normalize_quotes(text: str) -> str:
@@ -190,11 +296,7 @@ def has_special_chars(text: str) -> bool:
         text: Text to check
 
     Returns:
-        True if text contains smart quotes, special bullets, or special dashes
+        True if text contains smart quotes, special bullets, special dashes,
+        ellipses, ligatures or non-breaking spaces
     """
-    special_chars = (
-        "\u2018\u2019\u201c\u201d"  # Smart quotes
-        "\u00b7\u25e6\u25aa\u25ab\u2023\u2043\u25cf\u25cb"  # Bullets
-        "\u2013\u2014\u2010\u2011\u2212"  # Dashes
-    )
-    return any(c in text for c in special_chars)
+    return any(c in text for c in (*_CHAR_FOLDS, *_EXPANSIONS, *_NBSP_CHARS))
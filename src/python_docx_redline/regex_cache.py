@@ -0,0 +1,147 @@
+"""
+Process-wide cache of compiled regular expressions.
+
+Rule engines replay the same patterns against every document they process,
+and each regex search used to compile its pattern again. RegexCache keeps
+the most recently used compiled patterns, keyed by pattern and flags, and
+counts hits and misses so the cache can be monitored.
+
+Patterns the standard library cannot compile (such as possessive
+quantifiers or atomic groups before Python 3.11) are compiled with the
+third-party `regex` module when it is installed.
+
+Example:
+    >>> from python_docx_redline import get_regex_cache
+    >>> doc.find_all(r"Section \\d+", regex=True)
+    >>> cache = get_regex_cache()
+    >>> cache.hits, cache.misses
+    (0, 1)
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any
+
+try:
+    import regex as _regex_module
+except ImportError:  # pragma: no cover - depends on environment
+    _regex_module = None  # type: ignore[assignment]
+
+
+def _compile_extended(pattern: str, flags: int) -> Any:
+    """Compile a pattern with the `regex` module, if installed and able to."""
+    if _regex_module is None:
+        return None
+    try:
+        return _regex_module.compile(pattern, flags)
+    except _regex_module.error:
+        return None
+
+
+class RegexCache:
+    """Bounded least-recently-used cache of compiled patterns.
+
+    The cache is safe to share between threads.
+
+    Example:
+        >>> cache = RegexCache(max_size=128)
+        >>> pattern = cache.compile(r"\\d+ days", re.IGNORECASE)
+        >>> cache.compile(r"\\d+ days", re.IGNORECASE) is pattern
+        True
+        >>> cache.hits, cache.misses
+        (1, 1)
+    """
+
+    def __init__(self, max_size: int = 512) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of compiled patterns held (default: 512)
+
+        Raises:
+            ValueError: If max_size is less than 1
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._patterns: OrderedDict[tuple[str, int], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of patterns currently cached."""
+        return len(self._patterns)
+
+    def compile(self, pattern: str, flags: int = 0) -> re.Pattern[str]:
+        """Get the compiled form of a pattern, compiling it on first use.
+
+        Args:
+            pattern: The regular expression
+            flags: re flags such as re.IGNORECASE (default: 0)
+
+        Returns:
+            The compiled pattern. It comes from the `regex` module if only
+            that module could compile it.
+
+        Raises:
+            re.error: If the pattern is invalid
+        """
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return compiled
+
+        try:
+            compiled = re.compile(pattern, flags)
+        except re.error:
+            compiled = _compile_extended(pattern, flags)
+            if compiled is None:
+                raise
+
+        with self._lock:
+            self._patterns[key] = compiled
+            self.misses += 1
+            while len(self._patterns) > self.max_size:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop every cached pattern and reset the hit/miss counters."""
+        with self._lock:
+            self._patterns.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_default_cache = RegexCache()
+
+
+def get_regex_cache() -> RegexCache:
+    """Get the cache used by every regex search in the package.
+
+    Returns:
+        The shared RegexCache
+    """
+    return _default_cache
+
+
+def compile_regex(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a pattern through the shared cache.
+
+    Args:
+        pattern: The regular expression
+        flags: re flags such as re.IGNORECASE (default: 0)
+
+    Returns:
+        The compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return _default_cache.compile(pattern, flags)
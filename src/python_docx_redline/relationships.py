@@ -7,7 +7,8 @@ and comments.xml, footnotes.xml, etc.
 """
 
 import logging
-from pathlib import Path
+import posixpath
+from pathlib import Path, PurePosixPath
 
 from lxml import etree
 
@@ -55,39 +56,42 @@ class RelationshipManager:
         """
         self._package = package
         self._part_name = part_name
-        self._rels_path = self._compute_rels_path(part_name)
+        self._rels_part = self._compute_rels_part(part_name)
         self._root: etree._Element | None = None
         self._tree: etree._ElementTree | None = None
         self._modified = False
 
-    def _compute_rels_path(self, part_name: str) -> Path:
-        """Compute the .rels file path for a given part.
+    @staticmethod
+    def _compute_rels_part(part_name: str) -> str:
+        """Compute the .rels part name for a given part.
 
         For example:
         - "word/document.xml" -> "word/_rels/document.xml.rels"
         - "[Content_Types].xml" -> "_rels/[Content_Types].xml.rels"
 
         Args:
-            part_name: The part name to compute rels path for
+            part_name: The part name to compute rels part for
 
         Returns:
-            Path to the .rels file
+            Part name of the .rels file within the package
         """
-        part_path = Path(part_name)
-        parent = part_path.parent
-        filename = part_path.name
+        part_path = PurePosixPath(part_name)
+        return str(part_path.parent / "_rels" / f"{part_path.name}.rels")
 
-        return self._package.temp_dir / parent / "_rels" / f"{filename}.rels"
+    @property
+    def _rels_path(self) -> Path:
+        """Filesystem path to the .rels file (extracted packages only)."""
+        return self._package.get_part_path(self._rels_part)
 
     def _ensure_loaded(self) -> None:
         """Ensure the relationship XML is loaded into memory."""
         if self._root is not None:
             return
 
-        if self._rels_path.exists():
-            parser = etree.XMLParser(remove_blank_text=False)
-            self._tree = etree.parse(str(self._rels_path), parser)
-            self._root = self._tree.getroot()
+        root = self._package.get_part(self._rels_part)
+        if root is not None:
+            self._root = root
+            self._tree = root.getroottree()
         else:
             # Create new rels file structure
             self._root = etree.Element(
@@ -248,6 +252,67 @@ class RelationshipManager:
 
         return False
 
+    def _resolve_target(self, target: str) -> str:
+        """Resolve an internal relationship target to a package part name."""
+        if target.startswith("/"):
+            return target.lstrip("/")
+        base = posixpath.dirname(self._part_name)
+        return posixpath.normpath(posixpath.join(base, target))
+
+    def find_relationship(self, rel_type: str, target: str) -> str | None:
+        """Find an internal relationship of a given type pointing at a target.
+
+        Targets are compared after resolving them to part names, so
+        "media/image1.png" and "/word/media/image1.png" are the same target
+        for "word/document.xml".
+
+        Args:
+            rel_type: The relationship type URI to search for
+            target: The target path (relative to the part's directory)
+
+        Returns:
+            The relationship ID (e.g., "rId5") if found, None otherwise
+        """
+        self._ensure_loaded()
+        assert self._root is not None
+
+        part_name = self._resolve_target(target)
+        for rel in self._root:
+            if rel.get("Type") != rel_type or rel.get("TargetMode") == "External":
+                continue
+            if self._resolve_target(rel.get("Target", "")) == part_name:
+                return rel.get("Id")
+
+        return None
+
+    def retarget_parts(self, replacements: dict[str, str]) -> int:
+        """Point internal relationships at different parts.
+
+        Args:
+            replacements: Maps the part name currently targeted
+                (e.g., "word/media/image2.png") to the part name to target instead
+
+        Returns:
+            Number of relationships updated
+        """
+        self._ensure_loaded()
+        assert self._root is not None
+
+        base = posixpath.dirname(self._part_name) or "."
+        updated = 0
+        for rel in self._root:
+            if rel.get("TargetMode") == "External":
+                continue
+            new_part = replacements.get(self._resolve_target(rel.get("Target", "")))
+            if new_part is not None:
+                rel.set("Target", posixpath.relpath(new_part, base))
+                updated += 1
+
+        if updated > 0:
+            self._modified = True
+
+        return updated
+
     def get_relationship_by_id(self, rel_id: str) -> dict[str, str] | None:
         """Get a relationship by its ID.
 
@@ -350,25 +415,16 @@ class RelationshipManager:
     def save(self) -> None:
         """Persist changes to the .rels file.
 
-        Only writes if modifications were made. Creates the _rels
-        directory if it doesn't exist.
+        Only writes if modifications were made. Creates the .rels
+        part if it doesn't exist.
         """
         if not self._modified or self._tree is None:
             return
 
-        # Ensure parent directory exists
-        self._rels_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write the file
-        self._tree.write(
-            str(self._rels_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        self._package.set_part(self._rels_part, self._tree.getroot(), pretty_print=True)
 
         self._modified = False
-        logger.debug(f"Saved relationship file: {self._rels_path}")
+        logger.debug(f"Saved relationship file: {self._rels_part}")
 
     @property
     def is_modified(self) -> bool:
@@ -161,6 +161,32 @@ class FormatResult:
         return f"○ No change to '{self.text_matched}' (already formatted)"
 
 
+@dataclass
+class SaveResult:
+    """Result of saving a document.
+
+    Attributes:
+        unchanged: True if nothing had changed since the document was loaded,
+            so the original package was written back as-is, without
+            re-serializing or validating it
+        validated: Whether the DOCX schema validator ran
+
+    Example:
+        >>> result = doc.save("out.docx")
+        >>> if result.unchanged:
+        ...     print("No edits matched; copied the original")
+    """
+
+    unchanged: bool
+    validated: bool = False
+
+    def __str__(self) -> str:
+        """Get string representation of the result."""
+        if self.unchanged:
+            return "Saved unchanged document (original package copied)"
+        return "Saved document" + (" (validated)" if self.validated else "")
+
+
 @dataclass
 class BatchResult:
     """Result of applying multiple edits in batch mode.
@@ -172,6 +198,10 @@ class BatchResult:
         succeeded: List of EditResult objects for successful edits
         failed: List of EditResult objects for failed edits
         dry_run: Whether this was a dry run (no actual changes made)
+        timings: Seconds spent in each phase of the batch: "search" and
+            "plan" to resolve edit targets in one pass, "apply" to apply
+            them, and "sequential" for edits applied one at a time
+            (empty for dry runs)
 
     Example:
         >>> results = doc.apply_edits(edits, continue_on_error=True)
@@ -187,6 +217,7 @@ class BatchResult:
     succeeded: list[EditResult] = field(default_factory=list)
     failed: list[EditResult] = field(default_factory=list)
     dry_run: bool = False
+    timings: dict[str, float] = field(default_factory=dict)
 
     @property
     def total(self) -> int:
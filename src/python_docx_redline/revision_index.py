@@ -0,0 +1,152 @@
+"""
+Index of the tracked changes in a document by ID, author and date.
+
+Accepting or rejecting a change by ID used to scan the whole document for
+every change, so resolving many changes one at a time took quadratic time.
+RevisionIndex finds every insertion, deletion and formatting change in one
+traversal the first time it is needed, and TrackedXMLGenerator adds each
+change it creates, so lookups cost time proportional to the number of
+changes they return.
+
+Entries are checked when looked up: changes that were accepted, rejected or
+otherwise removed from the document are dropped then. The index is rebuilt
+when the document root is replaced, or when change IDs were allocated for
+changes the generator did not create.
+
+Example:
+    >>> index = RevisionIndex(doc)
+    >>> index.lookup("author", "Legal Team")
+    [<Element {...}ins>, <Element {...}del>]
+"""
+
+from typing import Any
+
+from .constants import w
+from .id_allocator import CHANGE
+
+# Changes that can be accepted or rejected individually, in the order
+# ChangeManagement looks for a change ID among them
+RESOLVABLE_TAGS = (w("ins"), w("del"), w("rPrChange"), w("pPrChange"))
+
+# Attribute indexed for each key
+_KEYS = {"id": w("id"), "author": w("author"), "date": w("date")}
+
+_ID = _KEYS["id"]
+
+
+class RevisionIndex:
+    """Maps change IDs, authors and dates to tracked change elements.
+
+    Only changes in the main document body are indexed, since those are the
+    ones ChangeManagement resolves.
+
+    Code that edits tracked changes in `xml_root` directly, without going
+    through the document's generator, should call `invalidate()` before
+    accepting or rejecting changes again.
+
+    Example:
+        >>> index = RevisionIndex(doc)
+        >>> [change] = index.lookup("id", "5")
+    """
+
+    def __init__(self, doc: Any) -> None:
+        """Initialize an empty index.
+
+        Args:
+            doc: Document whose tracked changes are indexed
+        """
+        self._doc = doc
+        self._root: Any = None
+        self._maps: dict[str, dict[str, list[Any]]] | None = None
+        # Next change ID when the index was last known to hold every change
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        """Number of indexed changes, including ones not yet checked."""
+        if self._maps is None:
+            return 0
+        return sum(len(changes) for changes in self._maps["id"].values())
+
+    def invalidate(self) -> None:
+        """Forget every entry so the next lookup scans the document again."""
+        self._maps = None
+
+    def add(self, change: Any) -> None:
+        """Index a tracked change created for the document.
+
+        Changes whose tag is not resolvable are not indexed, but their ID
+        still counts as accounted for.
+
+        Args:
+            change: A tracked change Element, before or after insertion
+        """
+        if self._maps is None:
+            return
+        try:
+            change_id = int(change.get(_ID, ""))
+        except ValueError:
+            return
+        self._next_id = max(self._next_id, change_id + 1)
+        if change.tag in RESOLVABLE_TAGS:
+            self._insert(change)
+
+    def lookup(self, key: str, value: str) -> list[Any]:
+        """Get the tracked changes in the document with an attribute value.
+
+        Args:
+            key: "id", "author" or "date"
+            value: Attribute value to match exactly
+
+        Returns:
+            Matching Elements still in the document, in the order they were
+            indexed (document order, then creation order)
+        """
+        by_value = self._ensure()[key]
+        changes = by_value.get(value)
+        if not changes:
+            return []
+
+        attr = _KEYS[key]
+        live = [change for change in changes if change.get(attr) == value and self.attached(change)]
+        if len(live) != len(changes):
+            if live:
+                by_value[value] = live
+            else:
+                del by_value[value]
+        return live
+
+    def _ensure(self) -> dict[str, dict[str, list[Any]]]:
+        """Get the maps, rebuilding them if they may be missing changes."""
+        root = self._doc.xml_root
+        next_id = self._doc._ids.peek(CHANGE)
+        if self._maps is None or self._root is not root or self._next_id != next_id:
+            self._maps = {key: {} for key in _KEYS}
+            self._root = root
+            self._next_id = next_id
+            for change in root.iter(*RESOLVABLE_TAGS):
+                self._insert(change)
+        return self._maps
+
+    def _insert(self, change: Any) -> None:
+        """Add a change to the map of each key it has a value for."""
+        assert self._maps is not None
+        for key, attr in _KEYS.items():
+            value = change.get(attr)
+            if value is not None:
+                self._maps[key].setdefault(value, []).append(change)
+
+    def attached(self, change: Any) -> bool:
+        """Whether an element is still inside the indexed document root.
+
+        Args:
+            change: An Element returned by lookup()
+
+        Returns:
+            True if the element has not been removed from the document
+        """
+        top = change
+        parent = top.getparent()
+        while parent is not None:
+            top = parent
+            parent = top.getparent()
+        return top is self._root
@@ -14,6 +14,7 @@ Supports footnote/endnote scopes:
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from .constants import WORD_NAMESPACE
@@ -90,214 +91,422 @@ def is_note_scope(scope_spec: str | dict | Callable | None) -> bool:
     return False
 
 
-class ScopeEvaluator:
-    """Evaluates scope specifications to filter paragraphs.
+_TABLE_CELL = f"{{{WORD_NAMESPACE}}}tc"
+_HEADER = f"{{{WORD_NAMESPACE}}}hdr"
+_FOOTER = f"{{{WORD_NAMESPACE}}}ftr"
+_CONTAINER_TAGS = frozenset({_TABLE_CELL, _HEADER, _FOOTER})
 
-    Supports multiple scope formats:
-    - None: Match all paragraphs
-    - String: "text" matches paragraphs containing text
-    - String with prefix: "section:Name" or "paragraph_containing:text"
-    - Dictionary: {"contains": "text", "section": "Name", ...}
-    - Callable: Custom filter function
+# Paragraph containers accepted by the "location" scope, as enclosing tags
+# that must be present (True) or absent (False)
+_LOCATIONS: dict[str, dict[str, bool]] = {
+    "tables": {_TABLE_CELL: True},
+    "body": {_TABLE_CELL: False, _HEADER: False, _FOOTER: False},
+    "headers": {_HEADER: True},
+    "footers": {_FOOTER: True},
+}
+
+
+class PositionIndex:
+    """Ordinal positions of paragraphs and tables, and their section headings.
+
+    Looking up a paragraph's position with list.index() or walking back to
+    its heading costs O(paragraphs) per lookup, which turns into O(n^2) when
+    done for every match or every filtered paragraph. The index answers both
+    in O(1) after a single pass, and is meant to be rebuilt whenever the
+    document changes.
+
+    Attributes:
+        root: The element whose paragraphs and tables are indexed, or None
+            when only section headings are needed
+        generation: Optional document generation the index was built for
+        paragraphs: Every w:p under root, in document order (read-only)
+
+    Example:
+        >>> positions = PositionIndex(doc.xml_root)
+        >>> positions.paragraph_index(paragraph)
+        12
+        >>> heading = positions.preceding_heading(paragraph)
     """
 
-    @staticmethod
-    def parse(scope_spec: str | dict | Callable | None) -> Callable[[Any], bool]:
-        """Convert scope specification to evaluation function.
+    def __init__(self, root: Any = None, generation: int | None = None) -> None:
+        """Build the index.
 
         Args:
-            scope_spec: The scope specification:
-                - None: Match all paragraphs
-                - str: Paragraph containing text (or special formats)
-                - dict: Dictionary with filter criteria
-                - callable: Custom filter function
+            root: Element to index, typically the document root (default: None)
+            generation: Document generation the index reflects (default: None)
+        """
+        self.root = root
+        self.generation = generation
+        self.paragraphs: list[Any] = (
+            list(root.iter(f"{{{WORD_NAMESPACE}}}p")) if root is not None else []
+        )
+        self._paragraph_ordinals: dict[Any, int] | None = None
+        self._table_ordinals: dict[Any, int] | None = None
+        # Nearest preceding heading of each paragraph, per container element
+        self._headings: dict[Any, dict[Any, Any]] = {}
+        self._heading_texts: dict[Any, str] = {}
+        self._is_heading: dict[Any, bool] = {}
+        # Table cell / header / footer tags enclosing each element seen so far
+        self._enclosing: dict[Any, frozenset[str]] = {}
+
+    def forget_layout(self) -> None:
+        """Drop what was derived from headings, tables and nesting.
+
+        Only the paragraph order is kept, for reuse by callers that have
+        checked the paragraphs under root are unchanged but not whether any
+        was restyled, retitled or moved into a table.
+        """
+        self._table_ordinals = None
+        self._headings = {}
+        self._heading_texts = {}
+        self._is_heading = {}
+        self._enclosing = {}
 
-        Returns:
-            A callable that takes a paragraph Element and returns bool
+    def paragraph_index(self, para: Any) -> int:
+        """Get the position of a paragraph among all paragraphs under root.
 
         Raises:
-            ValueError: If scope specification is invalid
+            ValueError: If the paragraph is not under root
         """
-        if scope_spec is None:
-            return lambda p: True
-
-        if isinstance(scope_spec, str):
-            return ScopeEvaluator._parse_string(scope_spec)
+        if self._paragraph_ordinals is None:
+            self._paragraph_ordinals = {p: i for i, p in enumerate(self.paragraphs)}
+        try:
+            return self._paragraph_ordinals[para]
+        except KeyError:
+            raise ValueError("paragraph is not in the indexed document") from None
 
-        if isinstance(scope_spec, dict):
-            return ScopeEvaluator._parse_dict(scope_spec)
+    def table_index(self, table: Any) -> int:
+        """Get the position of a table among all tables under root.
 
-        if callable(scope_spec):
-            return scope_spec
+        Raises:
+            ValueError: If the table is not under root
+        """
+        if self._table_ordinals is None:
+            tables = self.root.iter(f"{{{WORD_NAMESPACE}}}tbl") if self.root is not None else []
+            self._table_ordinals = {t: i for i, t in enumerate(tables)}
+        try:
+            return self._table_ordinals[table]
+        except KeyError:
+            raise ValueError("table is not in the indexed document") from None
 
-        raise ValueError(f"Invalid scope specification: {scope_spec}")
+    def preceding_heading(self, para: Any) -> Any | None:
+        """Get the nearest heading before a paragraph within its parent element.
 
-    @staticmethod
-    def _parse_string(s: str) -> Callable[[Any], bool]:
-        """Parse string scope shortcuts.
+        Args:
+            para: The paragraph Element
 
-        Supported formats:
-        - "section:Name": Match paragraphs in section with heading "Name"
-        - "paragraph_containing:text": Explicit paragraph containing text
-        - "tables": Match paragraphs inside tables only
-        - "body": Match paragraphs outside tables only
-        - "text": Default - paragraph containing text
+        Returns:
+            The heading paragraph Element, or None if there is none
+        """
+        container = para.getparent()
+        if container is None:
+            return None
+
+        headings = self._headings.get(container)
+        if headings is None:
+            headings = {}
+            last_heading = None
+            for candidate in container.iter(f"{{{WORD_NAMESPACE}}}p"):
+                headings[candidate] = last_heading
+                if self.is_heading(candidate):
+                    last_heading = candidate
+            self._headings[container] = headings
+        return headings.get(para)
+
+    def heading_text(self, heading: Any) -> str:
+        """Get the text of a heading paragraph."""
+        text = self._heading_texts.get(heading)
+        if text is None:
+            text = self._heading_texts[heading] = "".join(heading.itertext())
+        return text
+
+    def is_heading(self, para: Any) -> bool:
+        """Check if a paragraph is a heading (see ScopeEvaluator._is_heading)."""
+        heading = self._is_heading.get(para)
+        if heading is None:
+            heading = self._is_heading[para] = ScopeEvaluator._is_heading(para)
+        return heading
+
+    def enclosing(self, para: Any) -> frozenset[str]:
+        """Get the table cell, header and footer tags enclosing a paragraph.
+
+        Ancestors are walked only up to the first element already seen, so
+        classifying every paragraph of a document is linear overall.
 
         Args:
-            s: The string scope specification
+            para: The paragraph Element
 
         Returns:
-            A callable that filters paragraphs
+            Set of qualified tags among w:tc, w:hdr and w:ftr
         """
-        if s.startswith("section:"):
-            section_name = s[8:]
-            return ScopeEvaluator._create_section_filter(section_name)
+        enclosing = self._enclosing
+        chain = []
+        node = para.getparent()
+        while node is not None and node not in enclosing:
+            chain.append(node)
+            node = node.getparent()
 
-        if s.startswith("paragraph_containing:"):
-            text = s[21:]
-            return ScopeEvaluator._create_text_filter(text)
+        tags = enclosing[node] if node is not None else frozenset()
+        for element in reversed(chain):
+            if element.tag in _CONTAINER_TAGS:
+                tags = tags | {element.tag}
+            enclosing[element] = tags
+        return tags
 
-        # Location shortcuts
-        if s == "tables":
-            return ScopeEvaluator._create_location_filter("tables")
 
-        if s == "body":
-            return ScopeEvaluator._create_location_filter("body")
+class ScopePlan:
+    """A scope specification compiled into a sequence of checks.
 
-        # Default: paragraph containing the specified text
-        return ScopeEvaluator._create_text_filter(s)
+    Plans are built by ScopeEvaluator.compile(), which caches them by
+    specification, so the same scope used across a batch of edits is parsed
+    once. A plan holds no document state: heading, table and header/footer
+    lookups go through the PositionIndex passed to filter() or matches().
 
-    @staticmethod
-    def _parse_dict(d: dict) -> Callable[[Any], bool]:
-        """Parse dictionary scope specification.
+    Attributes:
+        steps: Checks applied in order; a paragraph is in scope if it passes
+            all of them. Each is a tuple whose first item names the check:
+            ("contains", text), ("not_contains", text),
+            ("section", name, exclude_headings), ("location", name) or
+            ("callable", func).
+
+    Example:
+        >>> plan = ScopeEvaluator.compile("section:Payment Terms")
+        >>> paragraphs = plan.filter(all_paragraphs, positions)
+    """
 
-        Supported keys:
-        - contains: Text that must be in the paragraph
-        - section: Section heading name
-        - not_contains: Text that must NOT be in the paragraph
-        - location: Filter by location ("tables", "body", "headers", "footers")
+    __slots__ = ("steps",)
+
+    def __init__(self, steps: tuple[tuple[Any, ...], ...] = ()) -> None:
+        """Initialize the plan.
 
         Args:
-            d: Dictionary with filter criteria
+            steps: The checks to apply (default: none, every paragraph matches)
+        """
+        self.steps = steps
+
+    def __repr__(self) -> str:
+        """Return a string representation listing the checks."""
+        return f"ScopePlan({self.steps!r})"
+
+    def matches(self, para: Any, positions: PositionIndex) -> bool:
+        """Check whether a paragraph is in scope.
+
+        Args:
+            para: The paragraph Element
+            positions: Index of the document containing the paragraph
 
         Returns:
-            A callable that filters paragraphs
+            True if the paragraph passes every check
         """
+        para_text = None
+        for step in self.steps:
+            kind = step[0]
+            if kind == "contains" or kind == "not_contains":
+                if para_text is None:
+                    para_text = "".join(para.itertext())
+                if (step[1] in para_text) != (kind == "contains"):
+                    return False
+            elif kind == "section":
+                _, section_name, exclude_headings = step
+                # Don't include headings themselves
+                if exclude_headings and positions.is_heading(para):
+                    return False
+                heading = positions.preceding_heading(para)
+                if heading is None or section_name not in positions.heading_text(heading):
+                    return False
+            elif kind == "location":
+                enclosing = positions.enclosing(para)
+                for tag, required in _LOCATIONS[step[1]].items():
+                    if (tag in enclosing) != required:
+                        return False
+            elif not step[1](para):
+                return False
+        return True
 
-        def evaluator(para: Any) -> bool:
-            # Extract paragraph text
-            para_text = "".join(para.itertext())
+    def filter(self, paragraphs: list[Any], positions: PositionIndex | None = None) -> list[Any]:
+        """Select the paragraphs in scope, in one pass.
 
-            # Check 'contains' filter
-            if "contains" in d:
-                if d["contains"] not in para_text:
-                    return False
+        Args:
+            paragraphs: List of paragraph Elements to filter
+            positions: Index of the current document to reuse (default: None,
+                a temporary one is built for this call)
 
-            # Check 'not_contains' filter
-            if "not_contains" in d:
-                if d["not_contains"] in para_text:
-                    return False
+        Returns:
+            Filtered list of paragraph Elements
+        """
+        if not self.steps:
+            return paragraphs
+        if positions is None:
+            positions = PositionIndex()
+        return [p for p in paragraphs if self.matches(p, positions)]
 
-            # Check 'section' filter
-            if "section" in d:
-                # For section filtering, we need to check if this paragraph
-                # comes after a heading with the specified text
-                # This is a simplified implementation
-                section_name = d["section"]
-                if not ScopeEvaluator._is_in_section(para, section_name):
-                    return False
 
-            # Check 'location' filter
-            if "location" in d:
-                location = d["location"]
-                location_filter = ScopeEvaluator._create_location_filter(location)
-                if not location_filter(para):
-                    return False
+@lru_cache(maxsize=256)
+def _compile_cached(key: str | tuple[tuple[str, Any], ...]) -> ScopePlan:
+    """Compile a string or frozen dict scope specification.
+
+    Args:
+        key: A string scope, or the sorted items of a dict scope
+
+    Returns:
+        The compiled ScopePlan
+
+    Raises:
+        ValueError: If a location filter is invalid
+    """
+    if isinstance(key, str):
+        return ScopePlan(ScopeEvaluator._string_steps(key))
+    return ScopePlan(ScopeEvaluator._dict_steps(dict(key)))
 
-            return True
 
-        return evaluator
+class ScopeEvaluator:
+    """Evaluates scope specifications to filter paragraphs.
+
+    Supports multiple scope formats:
+    - None: Match all paragraphs
+    - String: "text" matches paragraphs containing text
+    - String with prefix: "section:Name" or "paragraph_containing:text"
+    - Dictionary: {"contains": "text", "section": "Name", ...}
+    - Callable: Custom filter function
+
+    Specifications are compiled into ScopePlan objects, cached by
+    specification, and evaluated against a PositionIndex of the document.
+    """
 
     @staticmethod
-    def _create_text_filter(text: str) -> Callable[[Any], bool]:
-        """Create a filter that checks if paragraph contains text.
+    def compile(scope_spec: str | dict | Callable | None) -> ScopePlan:
+        """Compile a scope specification into a reusable plan.
+
+        String and dict specifications are cached, so compiling the same
+        scope again returns the same plan.
 
         Args:
-            text: The text to search for
+            scope_spec: The scope specification (see parse() for formats)
 
         Returns:
-            A callable that checks if the paragraph contains the text
+            The compiled ScopePlan
+
+        Raises:
+            ValueError: If scope specification is invalid
         """
+        if scope_spec is None:
+            return _compile_cached(())
 
-        def filter_func(para: Any) -> bool:
-            para_text = "".join(para.itertext())
-            return text in para_text
+        if isinstance(scope_spec, str):
+            return _compile_cached(scope_spec)
 
-        return filter_func
+        if isinstance(scope_spec, dict):
+            key = tuple(sorted(scope_spec.items()))
+            try:
+                return _compile_cached(key)
+            except TypeError:
+                # Unhashable values cannot be cached
+                return ScopePlan(ScopeEvaluator._dict_steps(scope_spec))
 
-    @staticmethod
-    def _create_section_filter(section_name: str) -> Callable[[Any], bool]:
-        """Create a filter for paragraphs in a specific section.
+        if callable(scope_spec):
+            return ScopePlan((("callable", scope_spec),))
+
+        raise ValueError(f"Invalid scope specification: {scope_spec}")
 
-        A section is defined by a heading paragraph. This filter matches
-        paragraphs that come after a heading containing the section name,
-        but excludes the heading itself.
+    @staticmethod
+    def parse(
+        scope_spec: str | dict | Callable | None, positions: PositionIndex | None = None
+    ) -> Callable[[Any], bool]:
+        """Convert scope specification to evaluation function.
 
         Args:
-            section_name: The section heading text to match
+            scope_spec: The scope specification:
+                - None: Match all paragraphs
+                - str: Paragraph containing text (or special formats)
+                - dict: Dictionary with filter criteria
+                - callable: Custom filter function
+            positions: Index used to find section headings. Must reflect the
+                current document; if None, headings are searched on each call.
 
         Returns:
-            A callable that checks if the paragraph is in the section
+            A callable that takes a paragraph Element and returns bool
+
+        Raises:
+            ValueError: If scope specification is invalid
         """
+        if scope_spec is None:
+            return lambda p: True
 
-        def filter_func(para: Any) -> bool:
-            # Don't include headings themselves
-            if ScopeEvaluator._is_heading(para):
-                return False
-            return ScopeEvaluator._is_in_section(para, section_name)
+        if not isinstance(scope_spec, str | dict) and callable(scope_spec):
+            return scope_spec
 
-        return filter_func
+        plan = ScopeEvaluator.compile(scope_spec)
+        return lambda p: plan.matches(p, positions or PositionIndex())
 
     @staticmethod
-    def _is_in_section(para: Any, section_name: str) -> bool:
-        """Check if a paragraph is within a named section.
+    def _string_steps(s: str) -> tuple[tuple[Any, ...], ...]:
+        """Compile string scope shortcuts.
+
+        Supported formats:
+        - "section:Name": Match paragraphs in section with heading "Name"
+        - "paragraph_containing:text": Explicit paragraph containing text
+        - "tables": Match paragraphs inside tables only
+        - "body": Match paragraphs outside tables only
+        - "text": Default - paragraph containing text
 
-        Walks backwards from the paragraph to find the most recent heading,
-        then checks if that heading contains the section name.
+        A section is defined by a heading paragraph: "section:Name" matches
+        paragraphs that come after a heading containing the name, but
+        excludes the heading itself.
 
         Args:
-            para: The paragraph Element
-            section_name: The section heading text to match
+            s: The string scope specification
 
         Returns:
-            True if the paragraph is in the specified section
+            The plan steps
         """
-        # Get the parent body element
-        body = para.getparent()
-        if body is None:
-            return False
+        if s.startswith("section:"):
+            return (("section", s[8:], True),)
 
-        # Get all paragraphs in the document
-        all_paragraphs = list(body.iter(f"{{{WORD_NAMESPACE}}}p"))
+        if s.startswith("paragraph_containing:"):
+            return (("contains", s[21:]),)
 
-        # Find the index of our paragraph
-        try:
-            para_index = all_paragraphs.index(para)
-        except ValueError:
-            return False
+        # Location shortcuts
+        if s == "tables" or s == "body":
+            return (("location", s),)
+
+        # Default: paragraph containing the specified text
+        return (("contains", s),)
 
-        # Walk backwards to find the most recent heading
-        for i in range(para_index - 1, -1, -1):
-            prev_para = all_paragraphs[i]
+    @staticmethod
+    def _dict_steps(d: dict) -> tuple[tuple[Any, ...], ...]:
+        """Compile a dictionary scope specification.
 
-            # Check if this paragraph is a heading
-            if ScopeEvaluator._is_heading(prev_para):
-                heading_text = "".join(prev_para.itertext())
-                # Check if heading contains the section name
-                return section_name in heading_text
+        Supported keys:
+        - contains: Text that must be in the paragraph
+        - section: Section heading name (headings themselves are included)
+        - not_contains: Text that must NOT be in the paragraph
+        - location: Filter by location ("tables", "body", "headers", "footers")
+
+        Args:
+            d: Dictionary with filter criteria
+
+        Returns:
+            The plan steps
 
-        # No heading found - not in any section
-        return False
+        Raises:
+            ValueError: If the location is not a valid option
+        """
+        steps: list[tuple[Any, ...]] = []
+        if "contains" in d:
+            steps.append(("contains", d["contains"]))
+        if "not_contains" in d:
+            steps.append(("not_contains", d["not_contains"]))
+        if "section" in d:
+            steps.append(("section", d["section"], False))
+        if "location" in d:
+            location = d["location"]
+            if location not in _LOCATIONS:
+                raise ValueError(
+                    f"Invalid location filter: {location!r}. "
+                    f"Valid options: 'tables', 'body', 'headers', 'footers'"
+                )
+            steps.append(("location", location))
+        return tuple(steps)
 
     @staticmethod
     def _is_heading(para: Any) -> bool:
@@ -343,126 +552,23 @@ class ScopeEvaluator:
             or style_lower.startswith("toc")
         )
 
-    @staticmethod
-    def _is_in_table(para: Any) -> bool:
-        """Check if a paragraph is inside a table cell.
-
-        Args:
-            para: The paragraph Element
-
-        Returns:
-            True if the paragraph is inside a table cell (w:tc)
-        """
-        parent = para.getparent()
-        while parent is not None:
-            if parent.tag == f"{{{WORD_NAMESPACE}}}tc":
-                return True
-            parent = parent.getparent()
-        return False
-
-    @staticmethod
-    def _is_in_header(para: Any) -> bool:
-        """Check if a paragraph is inside a header.
-
-        Args:
-            para: The paragraph Element
-
-        Returns:
-            True if the paragraph is inside a header (w:hdr)
-        """
-        parent = para.getparent()
-        while parent is not None:
-            if parent.tag == f"{{{WORD_NAMESPACE}}}hdr":
-                return True
-            parent = parent.getparent()
-        return False
-
-    @staticmethod
-    def _is_in_footer(para: Any) -> bool:
-        """Check if a paragraph is inside a footer.
-
-        Args:
-            para: The paragraph Element
-
-        Returns:
-            True if the paragraph is inside a footer (w:ftr)
-        """
-        parent = para.getparent()
-        while parent is not None:
-            if parent.tag == f"{{{WORD_NAMESPACE}}}ftr":
-                return True
-            parent = parent.getparent()
-        return False
-
-    @staticmethod
-    def _create_location_filter(location: str) -> Callable[[Any], bool]:
-        """Create a filter based on paragraph location.
-
-        Supported locations:
-        - "tables": Match paragraphs inside table cells
-        - "body": Match paragraphs outside tables (main body text)
-        - "headers": Match paragraphs inside headers
-        - "footers": Match paragraphs inside footers
-
-        Args:
-            location: The location filter ("tables", "body", "headers", "footers")
-
-        Returns:
-            A callable that filters paragraphs by location
-
-        Raises:
-            ValueError: If location is not a valid option
-        """
-        if location == "tables":
-
-            def tables_filter(para: Any) -> bool:
-                return ScopeEvaluator._is_in_table(para)
-
-            return tables_filter
-
-        elif location == "body":
-
-            def body_filter(para: Any) -> bool:
-                # Body means not in table, not in header, not in footer
-                return (
-                    not ScopeEvaluator._is_in_table(para)
-                    and not ScopeEvaluator._is_in_header(para)
-                    and not ScopeEvaluator._is_in_footer(para)
-                )
-
-            return body_filter
-
-        elif location == "headers":
-
-            def headers_filter(para: Any) -> bool:
-                return ScopeEvaluator._is_in_header(para)
-
-            return headers_filter
-
-        elif location == "footers":
-
-            def footers_filter(para: Any) -> bool:
-                return ScopeEvaluator._is_in_footer(para)
-
-            return footers_filter
-
-        else:
-            raise ValueError(
-                f"Invalid location filter: {location!r}. "
-                f"Valid options: 'tables', 'body', 'headers', 'footers'"
-            )
-
     @staticmethod
     def filter_paragraphs(
-        paragraphs: list[Any], scope_spec: str | dict | Callable | None
+        paragraphs: list[Any],
+        scope_spec: str | dict | Callable | None,
+        positions: PositionIndex | None = None,
     ) -> list[Any]:
         """Filter a list of paragraphs using a scope specification.
 
-        This is a convenience method that combines parse() and filtering.
+        This is a convenience method that combines compile() and filtering.
+        Section headings and containers are found in one pass, so filtering
+        is linear in the number of paragraphs.
 
         Args:
             paragraphs: List of paragraph Elements to filter
             scope_spec: The scope specification (see parse() for formats)
+            positions: Index of the current document to reuse (default: None,
+                a temporary one is built for this call)
 
         Returns:
             Filtered list of paragraph Elements
@@ -477,8 +583,7 @@ class ScopeEvaluator:
         if scope_spec is None:
             return paragraphs
 
-        evaluator = ScopeEvaluator.parse(scope_spec)
-        return [p for p in paragraphs if evaluator(p)]
+        return ScopeEvaluator.compile(scope_spec).filter(paragraphs, positions)
 
     @staticmethod
     def debug_scope(
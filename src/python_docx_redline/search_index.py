@@ -0,0 +1,194 @@
+"""
+Trigram inverted index for repeated searches over an unchanged document.
+
+Every search scans the text of every paragraph in scope. When the same
+document is queried many times, most of those paragraphs cannot contain the
+query at all. The index built here maps each three-character sequence of
+paragraph text to the paragraphs containing it, so a search only scans
+paragraphs that contain every trigram of the query (or, for a regex, of a
+literal the regex requires).
+
+Keys are case-folded and special-character normalized, so one index serves
+case-sensitive, case-insensitive and normalized searches alike. Narrowing
+never drops a paragraph that could match; the exact search still decides.
+
+Example:
+    >>> from python_docx_redline import Document
+    >>> doc = Document("contract.docx")
+    >>> doc.build_search_index()
+    >>> doc.find_all("indemnification")  # Only scans candidate paragraphs
+"""
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from .quote_normalization import normalize_special_chars
+
+if TYPE_CHECKING:
+    from .text_search import ParagraphTextIndex
+
+try:  # Python 3.11+
+    from re import _parser as _regex_parser  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _regex_parser  # type: ignore[no-redef]
+
+_GRAM_SIZE = 3
+
+
+def _fold(text: str) -> str:
+    """Fold text to the form used for index keys."""
+    return normalize_special_chars(text).casefold()
+
+
+def _trigrams(text: str) -> set[str]:
+    """Get the set of trigrams of already folded text."""
+    return {text[i : i + _GRAM_SIZE] for i in range(len(text) - _GRAM_SIZE + 1)}
+
+
+def required_literal(pattern: re.Pattern[str]) -> str:
+    """Find a literal substring that every match of a regex contains.
+
+    Only literals at the top level of the pattern are considered, so
+    alternations and groups contribute nothing; the longest run of
+    consecutive literal characters is returned.
+
+    Args:
+        pattern: A compiled regex
+
+    Returns:
+        The longest required literal, or "" if none could be found
+    """
+    try:
+        parsed = _regex_parser.parse(pattern.pattern, pattern.flags)
+    except Exception:  # Internal parser; never let it break a search
+        return ""
+
+    literal = _regex_parser.LITERAL
+    best = ""
+    run: list[str] = []
+    for opcode, argument in (*parsed, (None, None)):
+        if opcode is literal:
+            run.append(chr(argument))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    return best
+
+
+class SearchIndex:
+    """Inverted index from text trigrams to the paragraphs containing them.
+
+    Paragraph text comes from a ParagraphTextIndex, which owns the index and
+    keeps it current: paragraphs it invalidates are dropped here, and any
+    paragraph a search sees that is not indexed yet, or that changed since
+    it was indexed, is indexed on the spot.
+    While the text index is suspended, searches are not narrowed.
+
+    Both the text with and without tracked deletions is indexed, so the
+    index serves either kind of search.
+
+    Example:
+        >>> index = SearchIndex(text_index)
+        >>> index.update(paragraphs)
+        >>> candidates = index.narrow(paragraphs, "indemnification")
+    """
+
+    def __init__(self, text_index: "ParagraphTextIndex") -> None:
+        """Initialize an empty index.
+
+        Args:
+            text_index: Source of paragraph text
+        """
+        self._text_index = text_index
+        self._postings: dict[str, set[Any]] = {}
+        self._grams: dict[Any, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed paragraphs."""
+        return len(self._grams)
+
+    def __contains__(self, paragraph: Any) -> bool:
+        """Whether a paragraph is currently indexed."""
+        return paragraph in self._grams
+
+    def add(self, paragraph: Any) -> None:
+        """Index a paragraph, replacing any previous entry for it.
+
+        Args:
+            paragraph: A w:p Element
+        """
+        self.discard(paragraph)
+        grams = _trigrams(_fold(self._text_index.get(paragraph, True).text))
+        grams |= _trigrams(_fold(self._text_index.get(paragraph, False).text))
+        self._grams[paragraph] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(paragraph)
+
+    def update(self, paragraphs: list[Any]) -> None:
+        """Index the paragraphs that are not indexed yet, or changed since.
+
+        Args:
+            paragraphs: w:p Elements
+        """
+        discard_stale = self._text_index.discard_stale
+        for paragraph in paragraphs:
+            # Stale paragraphs are invalidated, which drops them from here
+            discard_stale(paragraph)
+            if paragraph not in self._grams:
+                self.add(paragraph)
+
+    def discard(self, paragraph: Any) -> None:
+        """Remove a paragraph from the index, if present.
+
+        Args:
+            paragraph: A w:p Element
+        """
+        grams = self._grams.pop(paragraph, None)
+        if grams is None:
+            return
+        for gram in grams:
+            posting = self._postings[gram]
+            posting.discard(paragraph)
+            if not posting:
+                del self._postings[gram]
+
+    def clear(self) -> None:
+        """Remove every paragraph from the index."""
+        self._postings.clear()
+        self._grams.clear()
+
+    def narrow(self, paragraphs: list[Any], query: str | re.Pattern[str]) -> list[Any]:
+        """Keep only the paragraphs that can contain a query.
+
+        Args:
+            paragraphs: w:p Elements to search, in document order
+            query: Literal search text, or a compiled regex
+
+        Returns:
+            The paragraphs containing every trigram of the query (or of the
+            literal a regex requires), in their original order. All
+            paragraphs are returned when the query is too short to narrow
+            or the text index is suspended.
+        """
+        if not self._text_index.active:
+            return paragraphs
+
+        needle = query if isinstance(query, str) else required_literal(query)
+        grams = _trigrams(_fold(needle))
+        if not grams:
+            return paragraphs
+
+        self.update(paragraphs)
+
+        candidates: set[Any] | None = None
+        for gram in sorted(grams, key=lambda g: len(self._postings.get(g, ()))):
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return []
+
+        assert candidates is not None  # grams is non-empty
+        return [paragraph for paragraph in paragraphs if paragraph in candidates]
@@ -57,7 +57,6 @@ class StyleManager:
             package: The OOXMLPackage containing the word/styles.xml file
         """
         self._package = package
-        self._styles_path = package.temp_dir / STYLES_PATH
         self._root: etree._Element | None = None
         self._tree: etree._ElementTree | None = None
         self._styles: dict[str, Style] = {}
@@ -72,11 +71,11 @@ class StyleManager:
         Reads word/styles.xml from the package and parses it. If the file
         doesn't exist, creates a minimal default styles structure.
         """
-        if self._styles_path.exists():
-            parser = etree.XMLParser(remove_blank_text=False)
-            self._tree = etree.parse(str(self._styles_path), parser)
-            self._root = self._tree.getroot()
-            logger.debug(f"Loaded styles from {self._styles_path}")
+        root = self._package.get_part(STYLES_PATH)
+        if root is not None:
+            self._root = root
+            self._tree = root.getroottree()
+            logger.debug(f"Loaded styles from {STYLES_PATH}")
         else:
             # Create minimal styles structure
             self._root = self._create_minimal_styles()
@@ -1092,22 +1091,13 @@ class StyleManager:
     def save(self) -> None:
         """Persist changes to the word/styles.xml file.
 
-        Only writes if modifications were made. Creates the word/
-        directory if it doesn't exist.
+        Only writes if modifications were made. Creates the part if it
+        doesn't exist.
         """
         if not self._modified or self._tree is None:
             return
 
-        # Ensure parent directory exists
-        self._styles_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write the file
-        self._tree.write(
-            str(self._styles_path),
-            encoding="utf-8",
-            xml_declaration=True,
-            pretty_print=True,
-        )
+        self._package.set_part(STYLES_PATH, self._tree.getroot(), pretty_print=True)
 
         self._modified = False
-        logger.debug(f"Saved styles file: {self._styles_path}")
+        logger.debug(f"Saved styles file: {STYLES_PATH}")
@@ -0,0 +1,137 @@
+"""
+Cache of parsed template documents.
+
+Generating many documents from the same template normally means loading,
+unzipping and parsing the template again for every output. TemplateCache
+keeps one parsed copy of each template in memory, keyed by a hash of its
+contents, and hands out cheap clones of it instead.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO
+
+from .author import AuthorIdentity
+from .document import Document
+from .validation import ValidationError
+
+
+class TemplateCache:
+    """Keeps parsed templates in memory and returns independent clones.
+
+    Templates are keyed by the SHA-256 hash of their .docx bytes, so the
+    same template reached through different paths or streams is parsed
+    once, and a template file that changes on disk is picked up as a new
+    entry. The least recently used templates are evicted once more than
+    `max_size` are held.
+
+    The cache is safe to share between threads.
+
+    Example:
+        >>> cache = TemplateCache()
+        >>> for client in clients:
+        ...     doc = cache.get("engagement_letter.docx", author="Legal Ops")
+        ...     doc.replace("{{CLIENT}}", client.name)
+        ...     doc.save(f"letters/{client.id}.docx")
+        >>> cache.hits, cache.misses
+        (99, 1)
+    """
+
+    def __init__(self, max_size: int = 16) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of templates held at once (default: 16)
+
+        Raises:
+            ValueError: If max_size is less than 1
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[str, Document] = OrderedDict()
+        # Content hashes of template files, keyed by path -> (size, mtime_ns, hash)
+        self._file_hashes: dict[Path, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of templates currently cached."""
+        return len(self._templates)
+
+    def _read_source(self, source: str | Path | bytes | BinaryIO) -> tuple[str, bytes | None]:
+        """Hash a template source.
+
+        Returns:
+            Tuple of (content hash, template bytes). The bytes are None when
+            the hash of an unchanged file was already known.
+        """
+        if isinstance(source, bytes):
+            return hashlib.sha256(source).hexdigest(), source
+        if hasattr(source, "read"):
+            data = source.read()  # type: ignore[union-attr]
+            return hashlib.sha256(data).hexdigest(), data
+
+        path = Path(source)  # type: ignore[arg-type]
+        stat = path.stat()
+        known = self._file_hashes.get(path)
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2], None
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        self._file_hashes[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest, data
+
+    def get(
+        self,
+        source: str | Path | bytes | BinaryIO,
+        author: str | AuthorIdentity = "Claude",
+    ) -> Document:
+        """Get an editable copy of a template.
+
+        The template is loaded and parsed on first use; later calls with the
+        same contents clone the cached copy.
+
+        Args:
+            source: Path to the template .docx, its bytes, or a binary stream
+            author: Author for tracked changes made in the returned document
+
+        Returns:
+            A new in-memory Document that can be edited and saved freely
+
+        Raises:
+            ValidationError: If the template cannot be loaded
+        """
+        with self._lock:
+            key, data = self._read_source(source)
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+            else:
+                if data is None:
+                    # Known file whose template was evicted: hash it again
+                    self._file_hashes.pop(Path(source), None)  # type: ignore[arg-type]
+                    key, data = self._read_source(source)
+                    if data is None:
+                        raise ValidationError("Failed to read the template file")
+                template = Document(data, in_memory=True)
+                self._templates[key] = template
+                self.misses += 1
+                while len(self._templates) > self.max_size:
+                    self._templates.popitem(last=False)
+
+            return template.clone(author=author)
+
+    def clear(self) -> None:
+        """Drop every cached template and reset the hit/miss counters."""
+        with self._lock:
+            self._templates.clear()
+            self._file_hashes.clear()
+            self.hits = 0
+            self.misses = 0
@@ -6,16 +6,32 @@ across multiple <w:r> (run) elements in the OOXML structure.
 
 Algorithm Note:
     This implementation uses a character map approach for efficient read-only
-    text searching. For an alternative approach using single-character run
-    normalization (better for complex replacements), see Eric White's algorithm
-    documented in docs/ERIC_WHITE_ALGORITHM.md.
+    text searching. The map stores one start offset per run rather than one
+    entry per character; positions are resolved to runs with a binary search.
+    For an alternative approach using single-character run normalization
+    (better for complex replacements), see Eric White's algorithm documented
+    in docs/ERIC_WHITE_ALGORITHM.md.
 """
 
 import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .constants import WORD_NAMESPACE
+from .quote_normalization import NormalizedText
+from .quote_normalization import normalize_special_chars as normalize_func
+from .regex_cache import compile_regex
+from .scope import PositionIndex
+
+if TYPE_CHECKING:
+    from .search_index import SearchIndex
+
+# Pattern syntax that refers to a group by number, which an enclosing
+# alternation would renumber
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?\(")
 
 
 def _parse_tag(tag: str) -> str:
@@ -83,6 +99,330 @@ def _is_run_in_deletion(run: Any) -> bool:
     return False
 
 
+class ParagraphTextMap:
+    """The searchable text of a paragraph and the runs it came from.
+
+    Holds the concatenated run text plus the start offset of every run that
+    contributes text, so memory grows with the number of runs rather than
+    the number of characters.
+
+    Attributes:
+        paragraph: The w:p element
+        runs: Every w:r element in the paragraph, in document order
+        text: Concatenated text of the runs included in the map
+    """
+
+    __slots__ = ("paragraph", "runs", "text", "_starts", "_run_indices", "_normalized")
+
+    def __init__(self, paragraph: Any, include_deleted: bool = True) -> None:
+        """Build the map for a paragraph.
+
+        Args:
+            paragraph: A w:p Element
+            include_deleted: Whether to include runs inside tracked deletions
+                and w:delText content
+        """
+        self.paragraph = paragraph
+        self.runs = list(paragraph.iter(_parse_tag("w:r")))
+        # Start offset of each non-empty run in text, and its index in runs
+        self._starts = array("I")
+        self._run_indices = array("I")
+
+        run_texts = []
+        offset = 0
+        for run_idx, run in enumerate(self.runs):
+            # Skip runs inside deletion wrappers if include_deleted is False
+            if not include_deleted and _is_run_in_deletion(run):
+                continue
+
+            run_text = _get_run_text(run, include_deleted=include_deleted)
+            if run_text:
+                self._starts.append(offset)
+                self._run_indices.append(run_idx)
+                run_texts.append(run_text)
+                offset += len(run_text)
+
+        self.text = "".join(run_texts)
+        self._normalized: NormalizedText | None = None
+
+    @property
+    def normalized(self) -> NormalizedText:
+        """The text with special characters normalized, computed once per map."""
+        if self._normalized is None:
+            self._normalized = NormalizedText(self.text)
+        return self._normalized
+
+    def locate(self, offset: int) -> tuple[int, int]:
+        """Resolve a character offset in text to its run.
+
+        Negative offsets count from the end, as with sequence indexing.
+
+        Args:
+            offset: Character offset into text
+
+        Returns:
+            Tuple of (run index, offset within that run)
+
+        Raises:
+            IndexError: If the offset is outside the text
+        """
+        if offset < 0:
+            offset += len(self.text)
+        if not 0 <= offset < len(self.text):
+            raise IndexError("character offset out of range")
+
+        position = bisect_right(self._starts, offset) - 1
+        return self._run_indices[position], offset - self._starts[position]
+
+    def run_bounds(self, offset: int) -> tuple[int, int]:
+        """Get the offsets in text where the run holding a character starts and ends.
+
+        Args:
+            offset: Character offset into text
+
+        Returns:
+            Tuple of (start, end) offsets of that run's text, end exclusive
+
+        Raises:
+            IndexError: If the offset is outside the text
+        """
+        _, run_offset = self.locate(offset)
+        position = bisect_right(self._starts, offset)
+        start = offset - run_offset
+        end = self._starts[position] if position < len(self._starts) else len(self.text)
+        return start, end
+
+    def offset(self, run_index: int, run_offset: int) -> int:
+        """Resolve a position within a run to a character offset in text.
+
+        This is the inverse of locate().
+
+        Args:
+            run_index: Index of the run in runs
+            run_offset: Character offset within that run
+
+        Returns:
+            Character offset into text
+
+        Raises:
+            IndexError: If the run contributes no text to the map
+        """
+        position = bisect_left(self._run_indices, run_index)
+        if position == len(self._run_indices) or self._run_indices[position] != run_index:
+            raise IndexError("run contributes no text")
+        return self._starts[position] + run_offset
+
+    def span(self, start: int, end: int, match_obj: Any = None) -> "TextSpan":
+        """Create a TextSpan for the text between two offsets.
+
+        Args:
+            start: Offset of the first matched character
+            end: Offset just past the last matched character
+            match_obj: Optional regex Match object
+
+        Returns:
+            TextSpan covering the matched characters
+        """
+        start_run_idx, start_offset = self.locate(start)
+        end_run_idx, end_offset = self.locate(end - 1)
+        return TextSpan(
+            runs=self.runs,
+            start_run_index=start_run_idx,
+            end_run_index=end_run_idx,
+            start_offset=start_offset,
+            end_offset=end_offset + 1,  # Make end_offset exclusive
+            paragraph=self.paragraph,
+            match_obj=match_obj,
+        )
+
+
+# Elements whose identity, order, tag and text determine a paragraph's map
+_SIGNATURE_TAGS = tuple(
+    _parse_tag(tag) for tag in ("w:r", "w:t", "w:delText", "w:del", "w:moveFrom")
+)
+
+
+def _text_signature(paragraph: Any) -> list[Any]:
+    """Get what a paragraph's text map was built from, to tell if it changed.
+
+    Lists each run, text element and deletion wrapper in the paragraph with
+    its tag and text. This is several times cheaper than building the map,
+    and differs whenever a rebuilt map could: when runs or text elements are
+    added, removed, moved or retagged, or their text is edited.
+
+    Args:
+        paragraph: A w:p Element
+
+    Returns:
+        Flat list of (element, tag, text) triples
+    """
+    signature: list[Any] = []
+    for element in paragraph.iter(*_SIGNATURE_TAGS):
+        signature += (element, element.tag, element.text)
+    return signature
+
+
+class ParagraphTextIndex:
+    """Cache of ParagraphTextMap objects, keyed by paragraph element.
+
+    Rebuilding a paragraph's text means walking every run and text element
+    in it, which dominates the cost of repeated searches over an unchanged
+    document. The index keeps the map of each paragraph until that paragraph
+    changes, so only edited paragraphs are rebuilt.
+
+    Code that edits a paragraph invalidates it. Edits made any other way,
+    such as directly through xml_root, are caught when the paragraph is next
+    looked up: each cached map is checked against a signature of the runs
+    and text elements it was built from, which costs a fraction of a
+    rebuild. suspend() stops caching altogether; resume() drops everything
+    and starts caching again. Every invalidation bumps `generation`, so
+    caches derived from paragraph text can tell whether the document may
+    have changed.
+
+    An optional SearchIndex over the cached text is kept in step with it:
+    invalidated paragraphs are dropped from it as well.
+
+    Attributes:
+        generation: Counter incremented whenever cached text may be stale
+        search_index: Optional trigram index used to narrow searches
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that built a new map
+
+    Example:
+        >>> index = ParagraphTextIndex()
+        >>> text_map = index.get(paragraph)
+        >>> index.invalidate(paragraph)  # After editing the paragraph
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, active index."""
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._maps: dict[tuple[Any, bool], ParagraphTextMap] = {}
+        # Signature of each paragraph with cached maps, taken when cached
+        self._signatures: dict[Any, list[Any]] = {}
+        self._positions: PositionIndex | None = None
+        self._suspended = False
+        self.search_index: SearchIndex | None = None
+
+    def __len__(self) -> int:
+        """Number of cached paragraph maps."""
+        return len(self._maps)
+
+    @property
+    def active(self) -> bool:
+        """Whether maps are currently being cached."""
+        return not self._suspended
+
+    def get(self, paragraph: Any, include_deleted: bool = True) -> ParagraphTextMap:
+        """Get the text map of a paragraph, building it if needed.
+
+        Args:
+            paragraph: A w:p Element
+            include_deleted: Whether to include runs inside tracked deletions
+                and w:delText content
+
+        Returns:
+            The cached or newly built ParagraphTextMap
+        """
+        key = (paragraph, include_deleted)
+        self.discard_stale(paragraph)
+        text_map = self._maps.get(key)
+        if text_map is not None:
+            self.hits += 1
+            return text_map
+
+        self.misses += 1
+        text_map = ParagraphTextMap(paragraph, include_deleted=include_deleted)
+        if not self._suspended:
+            self._maps[key] = text_map
+            if paragraph not in self._signatures:
+                self._signatures[paragraph] = _text_signature(paragraph)
+        return text_map
+
+    def discard_stale(self, paragraph: Any) -> bool:
+        """Invalidate a paragraph if it changed since its maps were cached.
+
+        Args:
+            paragraph: A w:p Element
+
+        Returns:
+            True if the paragraph's cached maps were out of date
+        """
+        signature = self._signatures.get(paragraph)
+        if signature is None or signature == _text_signature(paragraph):
+            return False
+        self.invalidate(paragraph)
+        return True
+
+    def positions(self, root: Any) -> PositionIndex:
+        """Get the positional index of a document for the current generation.
+
+        The index is reused within a generation as long as root holds the
+        same paragraphs, with what it derived from headings and tables
+        dropped, since those may have been edited without invalidating
+        anything. While suspended, a fresh index is built on every call.
+
+        Args:
+            root: The document root element
+
+        Returns:
+            PositionIndex over root
+        """
+        positions = self._positions
+        if (
+            positions is not None
+            and positions.root is root
+            and positions.generation == self.generation
+            and not self._suspended
+            and positions.paragraphs == list(root.iter(_parse_tag("w:p")))
+        ):
+            positions.forget_layout()
+            return positions
+
+        positions = PositionIndex(root, generation=self.generation)
+        self._positions = None if self._suspended else positions
+        return positions
+
+    def invalidate(self, paragraph: Any = None) -> None:
+        """Drop cached maps after the document changed.
+
+        Paragraphs nested in the given one (text boxes) and paragraphs
+        containing it are dropped as well, since their text overlaps.
+
+        Args:
+            paragraph: The w:p Element that changed, or None to drop every map
+        """
+        self.generation += 1
+        if paragraph is None:
+            self._maps.clear()
+            self._signatures.clear()
+            if self.search_index is not None:
+                self.search_index.clear()
+            return
+
+        p_tag = _parse_tag("w:p")
+        for para in (*paragraph.iter(p_tag), *paragraph.iterancestors(p_tag)):
+            self._maps.pop((para, True), None)
+            self._maps.pop((para, False), None)
+            self._signatures.pop(para, None)
+            if self.search_index is not None:
+                self.search_index.discard(para)
+
+    def suspend(self) -> None:
+        """Stop caching until resume() is called."""
+        if not self._suspended:
+            self._suspended = True
+            self.invalidate()
+
+    def resume(self) -> None:
+        """Start caching again, discarding anything edited while suspended."""
+        if self._suspended:
+            self._suspended = False
+            self.invalidate()
+
+
 @dataclass
 class TextSpan:
     """Represents found text across potentially multiple runs.
@@ -165,14 +505,68 @@ class TextSpan:
         return context
 
 
+@dataclass
+class MultiParagraphSpan:
+    """Text found across one or more consecutive paragraphs.
+
+    Returned by TextSearch.find_text_spanning(). Each paragraph the match
+    covers contributes one TextSpan, mapped to that paragraph's runs.
+
+    Attributes:
+        spans: TextSpans of the matched text, one per paragraph, in order
+        separator: The paragraph separator used by the search
+        match_obj: Optional regex Match object (offsets are into the joined text)
+    """
+
+    spans: list[TextSpan]
+    separator: str = "\n"
+    match_obj: Any = None
+
+    @property
+    def text(self) -> str:
+        """Get the matched text, with paragraphs joined by the separator."""
+        return self.separator.join(span.text for span in self.spans)
+
+    @property
+    def paragraphs(self) -> list[Any]:
+        """Get the paragraph Elements the match covers."""
+        return [span.paragraph for span in self.spans]
+
+
 class TextSearch:
     """Handles searching for text in Word documents with fragmentation support.
 
     The core challenge is that text in Word documents can be split across
     multiple <w:r> (run) elements, making simple text search unreliable.
     This class builds a character map to handle fragmentation correctly.
+
+    When given a ParagraphTextIndex, character maps are taken from the index
+    instead of being rebuilt on every search, and paragraphs are narrowed
+    through its SearchIndex if one has been built.
     """
 
+    def __init__(self, index: ParagraphTextIndex | None = None) -> None:
+        """Initialize the searcher.
+
+        Args:
+            index: Optional cache of paragraph text maps (default: None,
+                maps are built for each search)
+        """
+        self.index = index
+
+    def positions(self, root: Any) -> PositionIndex:
+        """Get the positional index of a document, cached by the text index if any.
+
+        Args:
+            root: The document root element
+
+        Returns:
+            PositionIndex over root
+        """
+        if self.index is not None:
+            return self.index.positions(root)
+        return PositionIndex(root)
+
     def find_text(
         self,
         text: str,
@@ -186,7 +580,7 @@ class TextSearch:
         """Find all occurrences of text in the given paragraphs.
 
         This is the core algorithm that handles text fragmentation:
-        1. Build a character map that tracks which run each character belongs to
+        1. Build a character map that tracks where each run's text starts
         2. Concatenate all text from all runs
         3. Search in the concatenated text (literal, regex, or fuzzy)
         4. Map the results back to the original runs
@@ -202,6 +596,7 @@ class TextSearch:
                 - threshold: Similarity threshold (0.0 to 1.0)
                 - algorithm: Matching algorithm (ratio, partial_ratio, etc.)
                 - normalize_whitespace: Whether to normalize whitespace
+                - workers: Optional number of threads used to score paragraphs
                 (default: None for exact matching)
             include_deleted: Whether to include text inside tracked deletions
                 (w:del, w:delText) in the search. When False, deleted text is
@@ -214,26 +609,74 @@ class TextSearch:
             re.error: If regex=True and the pattern is invalid
             ImportError: If fuzzy matching requested but rapidfuzz not installed
         """
-        from .quote_normalization import normalize_special_chars as normalize_func
+        return list(
+            self.iter_text(
+                text,
+                paragraphs,
+                case_sensitive=case_sensitive,
+                regex=regex,
+                normalize_special_chars=normalize_special_chars,
+                fuzzy=fuzzy,
+                include_deleted=include_deleted,
+            )
+        )
+
+    def iter_text(
+        self,
+        text: str,
+        paragraphs: list[Any],
+        case_sensitive: bool = True,
+        regex: bool = False,
+        normalize_special_chars: bool = False,
+        fuzzy: dict[str, Any] | None = None,
+        include_deleted: bool = True,
+    ) -> Iterator[TextSpan]:
+        """Yield occurrences of text in the given paragraphs as they are found.
+
+        Paragraphs are searched only as far as the caller consumes the
+        iterator, so stopping early skips the rest of the document.
+
+        This is the core algorithm behind find_text(): each paragraph's runs
+        are concatenated, searched, and the matches mapped back to runs.
+
+        Args:
+            text: The text or regex pattern to search for
+            paragraphs: List of paragraph Elements to search in
+            case_sensitive: Whether to perform case-sensitive search (default: True)
+            regex: Whether to treat text as a regex pattern (default: False)
+            normalize_special_chars: Normalize special characters (quotes, bullets,
+                dashes) for flexible matching (default: False)
+            fuzzy: Fuzzy matching configuration dict with keys:
+                - threshold: Similarity threshold (0.0 to 1.0)
+                - algorithm: Matching algorithm (ratio, partial_ratio, etc.)
+                - normalize_whitespace: Whether to normalize whitespace
+                - workers: Optional number of threads used to score paragraphs
+                (default: None for exact matching)
+            include_deleted: Whether to include text inside tracked deletions
+                (w:del, w:delText) in the search. When False, deleted text is
+                skipped. (default: True for backwards compatibility)
 
-        results = []
+        Yields:
+            TextSpan objects representing each match, in document order
 
+        Raises:
+            re.error: If regex=True and the pattern is invalid
+            ImportError: If fuzzy matching requested but rapidfuzz not installed
+        """
         # Fuzzy and regex are mutually exclusive
         if fuzzy and regex:
             raise ValueError("Cannot use both fuzzy matching and regex")
 
-        # Prepare search pattern
         if fuzzy:
-            # Fuzzy matching mode - import fuzzy functions
-            from .fuzzy import fuzzy_find_all
+            yield from self._iter_fuzzy(text, paragraphs, fuzzy, include_deleted)
+            return
 
-            search_text = text  # Keep original for fuzzy matching
-            pattern = None
-        elif regex:
+        # Prepare search pattern
+        if regex:
             # Compile regex pattern with case sensitivity flag
             flags = 0 if case_sensitive else re.IGNORECASE
             try:
-                pattern = re.compile(text, flags)
+                pattern = compile_regex(text, flags)
             except re.error as e:
                 raise re.error(f"Invalid regex pattern '{text}': {e}") from e
             search_text = None  # Not used for regex
@@ -245,87 +688,38 @@ class TextSearch:
                 search_text = normalize_func(search_text)
             pattern = None  # Not used for literal search
 
+        # Skip paragraphs that cannot contain the text, if they are indexed
+        if self.index is not None and self.index.search_index is not None:
+            paragraphs = self.index.search_index.narrow(paragraphs, pattern or text)
+
         for para in paragraphs:
-            # Get all runs in this paragraph
-            runs = list(para.iter(_parse_tag("w:r")))
+            # Map characters back to runs: one start offset per run
+            if self.index is not None:
+                text_map = self.index.get(para, include_deleted)
+            else:
+                text_map = ParagraphTextMap(para, include_deleted=include_deleted)
 
-            if not runs:
+            if not text_map.runs:
                 continue
 
-            # Build character map: char_index -> (run_index, offset_in_run)
-            char_map = []
-            full_text_chars = []
-
-            for run_idx, run in enumerate(runs):
-                # Skip runs inside deletion wrappers if include_deleted is False
-                if not include_deleted and _is_run_in_deletion(run):
-                    continue
-
-                # Extract text, optionally excluding delText elements
-                run_text = _get_run_text(run, include_deleted=include_deleted)
-                for char_idx, char in enumerate(run_text):
-                    char_map.append((run_idx, char_idx))
-                    full_text_chars.append(char)
-
-            # Join into full paragraph text
-            full_text = "".join(full_text_chars)
+            full_text = text_map.text
 
             # Normalize document text for matching if requested
             search_full_text = full_text
-            if normalize_special_chars and not regex and not fuzzy:
-                search_full_text = normalize_func(search_full_text)
-            if not case_sensitive and not regex and not fuzzy:
+            normalized = None
+            if normalize_special_chars and not regex:
+                normalized = text_map.normalized
+                search_full_text = normalized.text
+            if not case_sensitive and not regex:
                 search_full_text = search_full_text.lower()
 
             # Find all occurrences
-            if fuzzy:
-                # Use fuzzy search
-                assert search_text is not None  # Type guard: search_text is set when fuzzy=True
-                fuzzy_matches = fuzzy_find_all(
-                    full_text,
-                    search_text,
-                    threshold=fuzzy["threshold"],
-                    algorithm=fuzzy["algorithm"],
-                    normalize_ws=fuzzy["normalize_whitespace"],
-                )
-
-                for start_pos, end_pos, similarity in fuzzy_matches:
-                    # Map the found position back to runs
-                    start_run_idx, start_offset = char_map[start_pos]
-                    end_run_idx, end_offset = char_map[end_pos - 1]
-
-                    # Create TextSpan for this match
-                    span = TextSpan(
-                        runs=runs,
-                        start_run_index=start_run_idx,
-                        end_run_index=end_run_idx,
-                        start_offset=start_offset,
-                        end_offset=end_offset + 1,  # Make end_offset exclusive
-                        paragraph=para,
-                    )
-                    results.append(span)
-            elif regex:
+            if regex:
                 # Use regex search
                 assert pattern is not None  # Type guard: pattern is set when regex=True
                 for match in pattern.finditer(full_text):
-                    pos = match.start()
-                    match_len = match.end() - match.start()
-
-                    # Map the found position back to runs
-                    start_run_idx, start_offset = char_map[pos]
-                    end_run_idx, end_offset = char_map[pos + match_len - 1]
-
-                    # Create TextSpan for this match with regex Match object
-                    span = TextSpan(
-                        runs=runs,
-                        start_run_index=start_run_idx,
-                        end_run_index=end_run_idx,
-                        start_offset=start_offset,
-                        end_offset=end_offset + 1,  # Make end_offset exclusive
-                        paragraph=para,
-                        match_obj=match,  # Store match for capture group support
-                    )
-                    results.append(span)
+                    # Store match for capture group support
+                    yield text_map.span(match.start(), match.end(), match_obj=match)
             else:
                 # Use literal search
                 assert search_text is not None  # Type guard: search_text is set when regex=False
@@ -338,22 +732,305 @@ class TextSearch:
                     if pos == -1:
                         break
 
-                    # Map the found position back to runs
-                    start_run_idx, start_offset = char_map[pos]
-                    end_run_idx, end_offset = char_map[pos + len(search_text) - 1]
-
-                    # Create TextSpan for this match
-                    span = TextSpan(
-                        runs=runs,
-                        start_run_index=start_run_idx,
-                        end_run_index=end_run_idx,
-                        start_offset=start_offset,
-                        end_offset=end_offset + 1,  # Make end_offset exclusive
-                        paragraph=para,
-                    )
-                    results.append(span)
+                    end = pos + len(search_text)
+                    if normalized is not None:
+                        yield text_map.span(*normalized.original_span(pos, end))
+                    else:
+                        yield text_map.span(pos, end)
 
                     # Move past this match for the next search
                     start = pos + 1
 
+    def _iter_fuzzy(
+        self,
+        text: str,
+        paragraphs: list[Any],
+        fuzzy: dict[str, Any],
+        include_deleted: bool,
+    ) -> Iterator[TextSpan]:
+        """Yield fuzzy matches of text, scoring all paragraphs as one batch.
+
+        Args:
+            text: The text to search for
+            paragraphs: List of paragraph Elements to search in
+            fuzzy: Fuzzy matching configuration, as for iter_text()
+            include_deleted: Whether to include text inside tracked deletions
+
+        Yields:
+            TextSpan objects representing each match, in document order
+        """
+        from .fuzzy import fuzzy_find_all_batch
+
+        text_maps = []
+        for para in paragraphs:
+            if self.index is not None:
+                text_map = self.index.get(para, include_deleted)
+            else:
+                text_map = ParagraphTextMap(para, include_deleted=include_deleted)
+            if text_map.runs:
+                text_maps.append(text_map)
+
+        found = fuzzy_find_all_batch(
+            [text_map.text for text_map in text_maps],
+            text,
+            threshold=fuzzy["threshold"],
+            algorithm=fuzzy["algorithm"],
+            normalize_ws=fuzzy["normalize_whitespace"],
+            workers=fuzzy.get("workers", 1),
+        )
+        for map_idx, fuzzy_matches in found:
+            for start_pos, end_pos, _similarity in fuzzy_matches:
+                yield text_maps[map_idx].span(start_pos, end_pos)
+
+    def find_text_many(
+        self,
+        patterns: list[str],
+        paragraphs: list[Any],
+        case_sensitive: bool = True,
+        regex: bool = False,
+        normalize_special_chars: bool = False,
+        include_deleted: bool = True,
+    ) -> list[tuple[int, TextSpan]]:
+        """Find all occurrences of several patterns in one pass over the paragraphs.
+
+        Literal patterns are matched with an Aho-Corasick automaton, so each
+        paragraph's text is scanned once however many patterns there are.
+        Regex patterns are combined into one alternation of named groups, and
+        each paragraph is scanned once with it. A pattern can only match
+        where the alternation matched, so each pattern is then only tried at
+        the positions the alternation's matches cover; overlapping matches of
+        different patterns are all reported, exactly as find_text() would.
+        Patterns with inline flags or numbered group references, which an
+        alternation would change, are scanned on their own.
+
+        Args:
+            patterns: The texts or regex patterns to search for
+            paragraphs: List of paragraph Elements to search in
+            case_sensitive: Whether to perform case-sensitive search (default: True)
+            regex: Whether to treat patterns as regexes (default: False)
+            normalize_special_chars: Normalize special characters (quotes, bullets,
+                dashes) for flexible literal matching (default: False)
+            include_deleted: Whether to include text inside tracked deletions
+                (default: True, as in find_text())
+
+        Returns:
+            List of (pattern index, TextSpan) tuples, ordered by paragraph,
+            then by start position, then by pattern index
+
+        Raises:
+            re.error: If regex=True and a pattern is invalid
+            ValueError: If a literal pattern is empty
+        """
+        from .multi_search import AhoCorasick
+
+        automaton = None
+        compiled: list[re.Pattern[str]] = []
+        combined = None
+        # Indexes of regex patterns in the alternation, and of the others
+        joined: list[int] = []
+        separate: list[int] = []
+        if regex:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            for text in patterns:
+                try:
+                    compiled.append(compile_regex(text, flags))
+                except re.error as e:
+                    raise re.error(f"Invalid regex pattern '{text}': {e}") from e
+
+            # Inline flags would be misplaced and group references renumbered
+            # inside an alternation, so such patterns are scanned separately
+            base_flags = re.compile("", flags).flags
+            for pattern_idx, pattern in enumerate(compiled):
+                if pattern.flags == base_flags and not _GROUP_REFERENCE.search(pattern.pattern):
+                    joined.append(pattern_idx)
+                else:
+                    separate.append(pattern_idx)
+            if joined:
+                alternation = "|".join(f"(?P<_{i}>{compiled[i].pattern})" for i in joined)
+                try:
+                    combined = compile_regex(alternation, flags)
+                except re.error:
+                    # Group names repeated across patterns
+                    joined, separate = [], list(range(len(compiled)))
+        else:
+            keys = []
+            for text in patterns:
+                key = text if case_sensitive else text.lower()
+                if normalize_special_chars:
+                    key = normalize_func(key)
+                keys.append(key)
+            automaton = AhoCorasick(keys)
+
+        results: list[tuple[int, TextSpan]] = []
+        for para in paragraphs:
+            if self.index is not None:
+                text_map = self.index.get(para, include_deleted)
+            else:
+                text_map = ParagraphTextMap(para, include_deleted=include_deleted)
+
+            if not text_map.runs:
+                continue
+
+            full_text = text_map.text
+            found: list[tuple[int, int, int, Any]] = []
+
+            if automaton is not None:
+                search_in = full_text
+                normalized = None
+                if normalize_special_chars:
+                    normalized = text_map.normalized
+                    search_in = normalized.text
+                if not case_sensitive:
+                    search_in = search_in.lower()
+                for start, end, pattern_idx in automaton.iter_matches(search_in):
+                    if normalized is not None:
+                        start, end = normalized.original_span(start, end)
+                    found.append((start, pattern_idx, end, None))
+            else:
+                if combined is not None:
+                    spans = [match.span() for match in combined.finditer(full_text)]
+                    for pattern_idx in joined:
+                        matches = self._matches_in_spans(compiled[pattern_idx], full_text, spans)
+                        for match in matches:
+                            found.append((match.start(), pattern_idx, match.end(), match))
+                for pattern_idx in separate:
+                    for match in compiled[pattern_idx].finditer(full_text):
+                        found.append((match.start(), pattern_idx, match.end(), match))
+
+            found.sort(key=lambda item: (item[0], item[1]))
+            for start, pattern_idx, end, match_obj in found:
+                results.append((pattern_idx, text_map.span(start, end, match_obj=match_obj)))
+
+        return results
+
+    def _matches_in_spans(
+        self, pattern: re.Pattern[str], text: str, spans: list[tuple[int, int]]
+    ) -> list[re.Match[str]]:
+        """Get pattern.finditer(text), given the spans of an alternation including it.
+
+        Every match of the pattern starts inside a span of the alternation's
+        matches, since wherever the pattern matches outside them the
+        alternation would have matched too. Empty matches, which finditer
+        treats specially, make the text be scanned in full.
+
+        Args:
+            pattern: A pattern in the alternation
+            text: The text the alternation was matched against
+            spans: (start, end) of the alternation's matches, in order
+
+        Returns:
+            The pattern's matches, as finditer would report them
+        """
+        matches = []
+        position = 0
+        for start, end in spans:
+            if start == end:
+                return list(pattern.finditer(text))
+            start = max(start, position)
+            while start < end:
+                match = pattern.match(text, start)
+                if match is None:
+                    start += 1
+                    continue
+                if match.end() == start:
+                    return list(pattern.finditer(text))
+                matches.append(match)
+                start = position = match.end()
+        return matches
+
+    def find_text_spanning(
+        self,
+        text: str,
+        paragraphs: list[Any],
+        separator: str = "\n",
+        case_sensitive: bool = True,
+        regex: bool = False,
+        normalize_special_chars: bool = False,
+        include_deleted: bool = True,
+    ) -> list[MultiParagraphSpan]:
+        """Find text that may continue from one paragraph into the next.
+
+        The paragraphs are searched as one text, joined by the separator, so
+        a clause that wraps across paragraph breaks or list items is found.
+        Each match is mapped back to the runs of every paragraph it covers.
+        Paragraph texts come from the ParagraphTextIndex when there is one.
+
+        Args:
+            text: The text or regex pattern to search for. Use the separator
+                (or, for a regex, a pattern such as \\s+) where the text
+                crosses a paragraph break.
+            paragraphs: Consecutive paragraph Elements, in document order
+            separator: Text placed between paragraphs (default: "\\n")
+            case_sensitive: Whether to perform case-sensitive search (default: True)
+            regex: Whether to treat text as a regex pattern (default: False)
+            normalize_special_chars: Normalize special characters (quotes, bullets,
+                dashes) for flexible literal matching (default: False)
+            include_deleted: Whether to include text inside tracked deletions
+                (default: True, as in find_text())
+
+        Returns:
+            List of MultiParagraphSpan objects, in document order. Matches
+            consisting only of separators are skipped.
+
+        Raises:
+            re.error: If regex=True and the pattern is invalid
+        """
+        text_maps = [
+            self.index.get(para, include_deleted)
+            if self.index is not None
+            else ParagraphTextMap(para, include_deleted=include_deleted)
+            for para in paragraphs
+        ]
+        normalized = None
+        if normalize_special_chars and not regex:
+            normalized = [text_map.normalized for text_map in text_maps]
+            texts = [item.text for item in normalized]
+        else:
+            texts = [text_map.text for text_map in text_maps]
+
+        # Offset of each paragraph's text in the joined text
+        starts = array("I")
+        offset = 0
+        for para_text in texts:
+            starts.append(offset)
+            offset += len(para_text) + len(separator)
+        joined = separator.join(texts)
+
+        found: list[tuple[int, int, Any]] = []
+        if regex:
+            flags = 0 if case_sensitive else re.IGNORECASE
+            try:
+                pattern = compile_regex(text, flags)
+            except re.error as e:
+                raise re.error(f"Invalid regex pattern '{text}': {e}") from e
+            found = [(match.start(), match.end(), match) for match in pattern.finditer(joined)]
+        elif text:
+            search_text = text if case_sensitive else text.lower()
+            if normalize_special_chars:
+                search_text = normalize_func(search_text)
+            search_in = joined if case_sensitive else joined.lower()
+            pos = search_in.find(search_text)
+            while pos != -1:
+                found.append((pos, pos + len(search_text), None))
+                pos = search_in.find(search_text, pos + 1)
+
+        results: list[MultiParagraphSpan] = []
+        for start, end, match_obj in found:
+            spans = []
+            for idx in range(bisect_right(starts, start) - 1, len(texts)):
+                para_start = starts[idx]
+                if para_start >= end:
+                    break
+                local_start = max(start - para_start, 0)
+                local_end = min(end - para_start, len(texts[idx]))
+                if local_start >= local_end:
+                    continue
+                if normalized is not None:
+                    local_start, local_end = normalized[idx].original_span(local_start, local_end)
+                spans.append(text_maps[idx].span(local_start, local_end))
+            if spans:
+                results.append(
+                    MultiParagraphSpan(spans=spans, separator=separator, match_obj=match_obj)
+                )
+
         return results
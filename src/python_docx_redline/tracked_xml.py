@@ -3,6 +3,8 @@ XML generation for tracked changes in Word documents.
 
 This module provides the TrackedXMLGenerator class which automatically generates
 proper OOXML for tracked insertions and deletions with all required attributes.
+The *_element(s) methods build lxml elements directly, ready to insert into the
+document; the string methods serialize those elements.
 
 Supports markdown formatting in inserted text:
 - **bold** -> <w:b/>
@@ -12,19 +14,74 @@ Supports markdown formatting in inserted text:
 """
 
 import random
+import re
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 from lxml import etree
 
+from .constants import W15_NAMESPACE, WORD_NAMESPACE, XML_NAMESPACE
 from .constants import w as _w
 from .constants import w15 as _w15
+from .id_allocator import CHANGE, IdAllocator, highest_ids
+from .revision_index import RevisionIndex
 
 if TYPE_CHECKING:
     from python_docx_redline.author import AuthorIdentity
     from python_docx_redline.markdown_parser import TextSegment
 
+# Qualified names, built once rather than per element
+_INS = _w("ins")
+_DEL = _w("del")
+_R = _w("r")
+_T = _w("t")
+_DEL_TEXT = _w("delText")
+_MOVE_FROM = _w("moveFrom")
+_MOVE_FROM_RANGE_START = _w("moveFromRangeStart")
+_MOVE_FROM_RANGE_END = _w("moveFromRangeEnd")
+_MOVE_TO = _w("moveTo")
+_MOVE_TO_RANGE_START = _w("moveToRangeStart")
+_MOVE_TO_RANGE_END = _w("moveToRangeEnd")
+_ID = _w("id")
+_NAME = _w("name")
+_AUTHOR = _w("author")
+_DATE = _w("date")
+_RSID_R = _w("rsidR")
+_RSID_DEL = _w("rsidDel")
+_USER_ID = _w15("userId")
+_PROVIDER_ID = _w15("providerId")
+_W16DU_NAMESPACE = "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+_DATE_UTC = f"{{{_W16DU_NAMESPACE}}}dateUtc"
+_XML_SPACE = f"{{{XML_NAMESPACE}}}space"
+
+# Prefixes used when tracked change elements are serialized
+_NSMAP = {"w": WORD_NAMESPACE}
+_NSMAP_DATE_UTC = {**_NSMAP, "w16du": _W16DU_NAMESPACE}
+
+# Namespace declaration lxml adds to the root of a serialized element
+_NAMESPACE_DECLARATION = re.compile(r' xmlns:\w+="[^"]*"')
+
+
+def _timestamp() -> str:
+    """Get the current UTC time as an ISO 8601 timestamp."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _serialize(elements: list[etree._Element]) -> str:
+    """Serialize tracked change elements as newline-separated XML fragments.
+
+    Fragments are inserted into XML that already declares the w, w15 and
+    w16du prefixes, so the declarations lxml puts on each fragment's root
+    are left out, as in fragments written by hand.
+    """
+    fragments = []
+    for elem in elements:
+        xml = etree.tostring(elem, encoding="unicode")
+        end = xml.index(">")
+        fragments.append(_NAMESPACE_DECLARATION.sub("", xml[:end]) + xml[end:])
+    return "\n".join(fragments)
+
 
 class TrackedXMLGenerator:
     """Generates OOXML for tracked changes with auto-managed attributes.
@@ -60,11 +117,22 @@ class TrackedXMLGenerator:
         if doc is not None:
             self._author_identity = getattr(doc, "_author_identity", None)
 
-        # Start change IDs from max existing + 1, or 1 if no doc provided
-        if doc is not None:
-            self.next_change_id = self._get_max_change_id(doc) + 1
-        else:
-            self.next_change_id = 1
+        # Share the document's ID allocator so every part draws from one
+        # sequence; change IDs start above the highest existing ID
+        ids = getattr(doc, "_ids", None)
+        self.ids: IdAllocator = ids if ids is not None else IdAllocator(doc)
+
+        # Changes created here are added to the document's revision index
+        self.revisions: RevisionIndex | None = getattr(doc, "_revisions", None)
+
+    @property
+    def next_change_id(self) -> int:
+        """The ID the next tracked change will get."""
+        return self.ids.peek(CHANGE)
+
+    @next_change_id.setter
+    def next_change_id(self, value: int) -> None:
+        self.ids.set_next(CHANGE, value)
 
     def create_insertion(self, text: str, author: str | None = None) -> str:
         """Generate <w:ins> XML for a tracked insertion.
@@ -82,178 +150,114 @@ class TrackedXMLGenerator:
         Returns:
             Complete OOXML string for the insertion with MS365 identity if available
         """
-        from python_docx_redline.markdown_parser import parse_markdown
+        return _serialize([self.create_insertion_element(text, author)])
 
-        author = author if author is not None else self.author
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        change_id = self.next_change_id
-        self.next_change_id += 1
-
-        # Build MS365 identity attributes if available
-        identity_attrs = ""
-        if self._author_identity:
-            if self._author_identity.guid:
-                identity_attrs += f' w15:userId="{self._author_identity.guid}"'
-            identity_attrs += f' w15:providerId="{self._author_identity.provider_id}"'
-
-        # Parse markdown to get formatted segments
-        segments = parse_markdown(text)
+    def create_insertion_element(self, text: str, author: str | None = None) -> etree._Element:
+        """Build a <w:ins> element for a tracked insertion.
 
-        # Generate runs for each segment
-        runs_xml = self._generate_runs(segments)
-
-        # Generate the OOXML
-        xml = (
-            f'<w:ins w:id="{change_id}" w:author="{author}" '
-            f'w:date="{timestamp}" w16du:dateUtc="{timestamp}"{identity_attrs}>\n'
-            f"{runs_xml}"
-            f"</w:ins>"
-        )
-
-        return xml
-
-    def _generate_runs(self, segments: list["TextSegment"]) -> str:
-        """Generate <w:r> elements for a list of text segments.
+        Same as create_insertion(), but returns the element ready to be
+        inserted into the document instead of XML to be parsed.
 
         Args:
-            segments: List of TextSegment objects with formatting info
+            text: The text to insert (supports markdown formatting)
+            author: Override author (uses default if None)
 
         Returns:
-            XML string containing all runs
+            lxml Element for the insertion (<w:ins>)
         """
-        runs = []
-        for segment in segments:
-            run_xml = self._generate_run(segment)
-            runs.append(run_xml)
-        return "".join(runs)
+        from python_docx_redline.markdown_parser import parse_markdown
 
-    def _generate_run(self, segment: "TextSegment") -> str:
-        """Generate a single <w:r> element for a text segment.
+        ins = self._create_change(_INS, author, _timestamp())
+        for segment in parse_markdown(text):
+            ins.append(self._create_plain_run_from_segment(segment))
+        return ins
+
+    def create_deletion(self, text: str, author: str | None = None) -> str:
+        """Generate <w:del> XML for a tracked deletion.
 
         Args:
-            segment: TextSegment with text and formatting
+            text: The text being deleted
+            author: Override author (uses default if None)
 
         Returns:
-            XML string for the run
+            Complete OOXML string for the deletion with MS365 identity if available
         """
-        # Handle linebreak segments - emit <w:br/> instead of <w:t>
-        if segment.is_linebreak:
-            return f'  <w:r w:rsidR="{self.rsid}">\n    <w:br/>\n  </w:r>\n'
-
-        text = segment.text
-
-        # Handle xml:space for leading/trailing whitespace
-        xml_space = (
-            ' xml:space="preserve"' if (text and (text[0].isspace() or text[-1].isspace())) else ""
-        )
-
-        # Escape XML special characters
-        escaped_text = self._escape_xml(text)
+        return _serialize([self.create_deletion_element(text, author)])
 
-        # Generate run properties if any formatting is applied
-        rpr_xml = self._generate_run_properties(segment)
-
-        # Build the run
-        if rpr_xml:
-            return (
-                f'  <w:r w:rsidR="{self.rsid}">\n'
-                f"{rpr_xml}"
-                f"    <w:t{xml_space}>{escaped_text}</w:t>\n"
-                f"  </w:r>\n"
-            )
-        else:
-            return (
-                f'  <w:r w:rsidR="{self.rsid}">\n'
-                f"    <w:t{xml_space}>{escaped_text}</w:t>\n"
-                f"  </w:r>\n"
-            )
+    def create_deletion_element(self, text: str, author: str | None = None) -> etree._Element:
+        """Build a <w:del> element for a tracked deletion.
 
-    def _generate_run_properties(self, segment: "TextSegment") -> str:
-        """Generate <w:rPr> element for formatting.
+        Same as create_deletion(), but returns the element ready to be
+        inserted into the document instead of XML to be parsed.
 
         Args:
-            segment: TextSegment with formatting flags
+            text: The text being deleted
+            author: Override author (uses default if None)
 
         Returns:
-            XML string for run properties, or empty string if no formatting
+            lxml Element for the deletion (<w:del>)
         """
-        if not segment.has_formatting():
-            return ""
-
-        props = []
-        if segment.bold:
-            props.append("      <w:b/>\n")
-        if segment.italic:
-            props.append("      <w:i/>\n")
-        if segment.underline:
-            props.append('      <w:u w:val="single"/>\n')
-        if segment.strikethrough:
-            props.append("      <w:strike/>\n")
-
-        if props:
-            return "    <w:rPr>\n" + "".join(props) + "    </w:rPr>\n"
-        return ""
+        deletion = self._create_change(_DEL, author, _timestamp())
+        # Note: deletions use <w:delText> instead of <w:t>
+        deletion.append(self._create_text_run(_RSID_DEL, _DEL_TEXT, text))
+        return deletion
 
-    def create_deletion(self, text: str, author: str | None = None) -> str:
-        """Generate <w:del> XML for a tracked deletion.
+    def _create_change(
+        self, tag: str, author: str | None, timestamp: str, date_utc: bool = True
+    ) -> etree._Element:
+        """Create a tracked change container with the next change ID.
 
         Args:
-            text: The text being deleted
+            tag: Qualified tag name of the container (e.g. w:ins)
             author: Override author (uses default if None)
+            timestamp: ISO 8601 timestamp for w:date
+            date_utc: Whether to add w16du:dateUtc
 
         Returns:
-            Complete OOXML string for the deletion with MS365 identity if available
+            lxml Element with ID, author, date and MS365 identity attributes
         """
-        author = author if author is not None else self.author
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        change_id = self.next_change_id
-        self.next_change_id += 1
-
-        # Handle xml:space for leading/trailing whitespace
-        xml_space = (
-            ' xml:space="preserve"' if (text and (text[0].isspace() or text[-1].isspace())) else ""
-        )
-
-        # Escape XML special characters
-        escaped_text = self._escape_xml(text)
+        nsmap = _NSMAP_DATE_UTC if date_utc else _NSMAP
+        if self._author_identity:
+            nsmap = {**nsmap, "w15": W15_NAMESPACE}
+        change = etree.Element(tag, nsmap=nsmap)
+        change.set(_ID, str(self.ids.allocate(CHANGE)))
+        change.set(_AUTHOR, author if author is not None else self.author)
+        change.set(_DATE, timestamp)
+        if date_utc:
+            change.set(_DATE_UTC, timestamp)
 
-        # Build MS365 identity attributes if available
-        identity_attrs = ""
+        # Add MS365 identity attributes if available
         if self._author_identity:
             if self._author_identity.guid:
-                identity_attrs += f' w15:userId="{self._author_identity.guid}"'
-            identity_attrs += f' w15:providerId="{self._author_identity.provider_id}"'
+                change.set(_USER_ID, self._author_identity.guid)
+            change.set(_PROVIDER_ID, self._author_identity.provider_id)
+        self._register(change)
+        return change
 
-        # Generate the OOXML
-        # Note: deletions use <w:delText> instead of <w:t>
-        xml = (
-            f'<w:del w:id="{change_id}" w:author="{author}" '
-            f'w:date="{timestamp}" w16du:dateUtc="{timestamp}"{identity_attrs}>\n'
-            f'  <w:r w:rsidDel="{self.rsid}">\n'
-            f"    <w:delText{xml_space}>{escaped_text}</w:delText>\n"
-            f"  </w:r>\n"
-            f"</w:del>"
-        )
+    def _register(self, change: etree._Element) -> None:
+        """Add a new tracked change to the document's revision index, if any."""
+        if self.revisions is not None:
+            self.revisions.add(change)
 
-        return xml
-
-    @staticmethod
-    def _escape_xml(text: str) -> str:
-        """Escape XML special characters.
+    def _create_text_run(self, rsid_attr: str, text_tag: str, text: str) -> etree._Element:
+        """Create a run holding one text element.
 
         Args:
-            text: Raw text to escape
+            rsid_attr: Qualified name of the run's RSID attribute
+            text_tag: Qualified tag of the text element (w:t or w:delText)
+            text: The run's text
 
         Returns:
-            XML-safe text
+            lxml Element for the run (<w:r>)
         """
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&apos;")
-        )
+        run = etree.Element(_R)
+        run.set(rsid_attr, self.rsid)
+        text_elem = etree.SubElement(run, text_tag)
+        # Handle xml:space for leading/trailing whitespace
+        if text and (text[0].isspace() or text[-1].isspace()):
+            text_elem.set(_XML_SPACE, "preserve")
+        text_elem.text = text
+        return run
 
     @staticmethod
     def _generate_rsid() -> str:
@@ -285,45 +289,37 @@ class TrackedXMLGenerator:
         Returns:
             Tuple of (XML string, range_id, move_id)
         """
-        author = author if author is not None else self.author
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        elements, range_id, move_id = self.create_move_from_elements(text, move_name, author)
+        return _serialize(elements), range_id, move_id
 
-        # Generate unique IDs for range markers and move element
-        range_id = self.next_change_id
-        self.next_change_id += 1
-        move_id = self.next_change_id
-        self.next_change_id += 1
+    def create_move_from_elements(
+        self,
+        text: str,
+        move_name: str,
+        author: str | None = None,
+    ) -> tuple[list[etree._Element], int, int]:
+        """Build the elements for the source location of a move.
 
-        # Handle xml:space for leading/trailing whitespace
-        xml_space = (
-            ' xml:space="preserve"' if (text and (text[0].isspace() or text[-1].isspace())) else ""
-        )
+        Same as create_move_from(), but returns the moveFromRangeStart,
+        moveFrom and moveFromRangeEnd elements instead of XML to be parsed.
 
-        # Escape XML special characters
-        escaped_text = self._escape_xml(text)
+        Args:
+            text: The text being moved
+            move_name: Name linking source to destination (e.g., "move1")
+            author: Override author (uses default if None)
 
-        # Build MS365 identity attributes if available
-        identity_attrs = ""
-        if self._author_identity:
-            if self._author_identity.guid:
-                identity_attrs += f' w15:userId="{self._author_identity.guid}"'
-            identity_attrs += f' w15:providerId="{self._author_identity.provider_id}"'
-
-        # Generate the OOXML for moveFrom container
-        xml = (
-            f'<w:moveFromRangeStart w:id="{range_id}" w:name="{move_name}" '
-            f'w:author="{author}" w:date="{timestamp}"/>\n'
-            f'<w:moveFrom w:id="{move_id}" w:author="{author}" '
-            f'w:date="{timestamp}"{identity_attrs}>\n'
-            f'  <w:r w:rsidDel="{self.rsid}">\n'
-            f"    <w:delText{xml_space}>{escaped_text}</w:delText>\n"
-            f"  </w:r>\n"
-            f"</w:moveFrom>\n"
-            f'<w:moveFromRangeEnd w:id="{range_id}"/>'
+        Returns:
+            Tuple of (elements, range_id, move_id)
+        """
+        return self._create_move(
+            _MOVE_FROM_RANGE_START,
+            _MOVE_FROM,
+            _MOVE_FROM_RANGE_END,
+            self._create_text_run(_RSID_DEL, _DEL_TEXT, text),
+            move_name,
+            author,
         )
 
-        return xml, range_id, move_id
-
     def create_move_to(
         self,
         text: str,
@@ -345,44 +341,77 @@ class TrackedXMLGenerator:
         Returns:
             Tuple of (XML string, range_id, move_id)
         """
-        author = author if author is not None else self.author
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        elements, range_id, move_id = self.create_move_to_elements(text, move_name, author)
+        return _serialize(elements), range_id, move_id
 
-        # Generate unique IDs for range markers and move element
-        range_id = self.next_change_id
-        self.next_change_id += 1
-        move_id = self.next_change_id
-        self.next_change_id += 1
+    def create_move_to_elements(
+        self,
+        text: str,
+        move_name: str,
+        author: str | None = None,
+    ) -> tuple[list[etree._Element], int, int]:
+        """Build the elements for the destination location of a move.
 
-        # Handle xml:space for leading/trailing whitespace
-        xml_space = (
-            ' xml:space="preserve"' if (text and (text[0].isspace() or text[-1].isspace())) else ""
-        )
+        Same as create_move_to(), but returns the moveToRangeStart, moveTo
+        and moveToRangeEnd elements instead of XML to be parsed.
 
-        # Escape XML special characters
-        escaped_text = self._escape_xml(text)
+        Args:
+            text: The text being moved
+            move_name: Name linking source to destination (must match moveFrom)
+            author: Override author (uses default if None)
 
-        # Build MS365 identity attributes if available
-        identity_attrs = ""
-        if self._author_identity:
-            if self._author_identity.guid:
-                identity_attrs += f' w15:userId="{self._author_identity.guid}"'
-            identity_attrs += f' w15:providerId="{self._author_identity.provider_id}"'
-
-        # Generate the OOXML for moveTo container
-        xml = (
-            f'<w:moveToRangeStart w:id="{range_id}" w:name="{move_name}" '
-            f'w:author="{author}" w:date="{timestamp}"/>\n'
-            f'<w:moveTo w:id="{move_id}" w:author="{author}" '
-            f'w:date="{timestamp}"{identity_attrs}>\n'
-            f'  <w:r w:rsidR="{self.rsid}">\n'
-            f"    <w:t{xml_space}>{escaped_text}</w:t>\n"
-            f"  </w:r>\n"
-            f"</w:moveTo>\n"
-            f'<w:moveToRangeEnd w:id="{range_id}"/>'
+        Returns:
+            Tuple of (elements, range_id, move_id)
+        """
+        return self._create_move(
+            _MOVE_TO_RANGE_START,
+            _MOVE_TO,
+            _MOVE_TO_RANGE_END,
+            self._create_text_run(_RSID_R, _T, text),
+            move_name,
+            author,
         )
 
-        return xml, range_id, move_id
+    def _create_move(
+        self,
+        start_tag: str,
+        move_tag: str,
+        end_tag: str,
+        run: etree._Element,
+        move_name: str,
+        author: str | None,
+    ) -> tuple[list[etree._Element], int, int]:
+        """Build a move container with its range markers.
+
+        Args:
+            start_tag: Qualified tag of the range start marker
+            move_tag: Qualified tag of the move container
+            end_tag: Qualified tag of the range end marker
+            run: The run holding the moved text
+            move_name: Name linking source to destination
+            author: Override author (uses default if None)
+
+        Returns:
+            Tuple of (elements, range_id, move_id)
+        """
+        timestamp = _timestamp()
+
+        # Generate unique IDs for range markers and move element
+        range_id = self.ids.allocate(CHANGE)
+        range_start = etree.Element(start_tag, nsmap=_NSMAP)
+        range_start.set(_ID, str(range_id))
+        range_start.set(_NAME, move_name)
+        range_start.set(_AUTHOR, author if author is not None else self.author)
+        range_start.set(_DATE, timestamp)
+
+        move = self._create_change(move_tag, author, timestamp, date_utc=False)
+        move.append(run)
+        move_id = int(move.get(_ID))
+
+        range_end = etree.Element(end_tag, nsmap=_NSMAP)
+        range_end.set(_ID, str(range_id))
+
+        return [range_start, move, range_end], range_id, move_id
 
     def create_run_property_change(
         self,
@@ -407,21 +436,20 @@ class TrackedXMLGenerator:
             >>> current_rpr.append(change)
         """
         author = author if author is not None else self.author
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        change_id = self.next_change_id
-        self.next_change_id += 1
+        timestamp = _timestamp()
+        change_id = self.ids.allocate(CHANGE)
 
         # Create the rPrChange element
         rpr_change = etree.Element(_w("rPrChange"))
-        rpr_change.set(_w("id"), str(change_id))
-        rpr_change.set(_w("author"), author)
-        rpr_change.set(_w("date"), timestamp)
+        rpr_change.set(_ID, str(change_id))
+        rpr_change.set(_AUTHOR, author)
+        rpr_change.set(_DATE, timestamp)
 
         # Add MS365 identity attributes if available
         if self._author_identity:
             if self._author_identity.guid:
-                rpr_change.set(_w15("userId"), self._author_identity.guid)
-            rpr_change.set(_w15("providerId"), self._author_identity.provider_id)
+                rpr_change.set(_USER_ID, self._author_identity.guid)
+            rpr_change.set(_PROVIDER_ID, self._author_identity.provider_id)
 
         # Add the previous rPr state as a child
         if previous_rpr is not None:
@@ -435,6 +463,7 @@ class TrackedXMLGenerator:
             # Empty previous state
             rpr_change.append(etree.Element(_w("rPr")))
 
+        self._register(rpr_change)
         return rpr_change, change_id
 
     def create_paragraph_property_change(
@@ -460,21 +489,20 @@ class TrackedXMLGenerator:
             >>> current_ppr.append(change)
         """
         author = author if author is not None else self.author
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        change_id = self.next_change_id
-        self.next_change_id += 1
+        timestamp = _timestamp()
+        change_id = self.ids.allocate(CHANGE)
 
         # Create the pPrChange element
         ppr_change = etree.Element(_w("pPrChange"))
-        ppr_change.set(_w("id"), str(change_id))
-        ppr_change.set(_w("author"), author)
-        ppr_change.set(_w("date"), timestamp)
+        ppr_change.set(_ID, str(change_id))
+        ppr_change.set(_AUTHOR, author)
+        ppr_change.set(_DATE, timestamp)
 
         # Add MS365 identity attributes if available
         if self._author_identity:
             if self._author_identity.guid:
-                ppr_change.set(_w15("userId"), self._author_identity.guid)
-            ppr_change.set(_w15("providerId"), self._author_identity.provider_id)
+                ppr_change.set(_USER_ID, self._author_identity.guid)
+            ppr_change.set(_PROVIDER_ID, self._author_identity.provider_id)
 
         # Add the previous pPr state as a child
         if previous_ppr is not None:
@@ -491,6 +519,7 @@ class TrackedXMLGenerator:
             # Empty previous state
             ppr_change.append(etree.Element(_w("pPr")))
 
+        self._register(ppr_change)
         return ppr_change, change_id
 
     def create_plain_run(
@@ -515,8 +544,8 @@ class TrackedXMLGenerator:
         """
 
         # Create the run element
-        run = etree.Element(_w("r"))
-        run.set(_w("rsidR"), self.rsid)
+        run = etree.Element(_R)
+        run.set(_RSID_R, self.rsid)
 
         # Copy run properties from source run if provided
         if source_run is not None:
@@ -525,11 +554,11 @@ class TrackedXMLGenerator:
                 run.append(deepcopy(source_rpr))
 
         # Create the text element
-        text_elem = etree.SubElement(run, _w("t"))
+        text_elem = etree.SubElement(run, _T)
 
         # Handle xml:space for leading/trailing whitespace
         if text and (text[0].isspace() or text[-1].isspace()):
-            text_elem.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+            text_elem.set(_XML_SPACE, "preserve")
 
         text_elem.text = text
 
@@ -590,16 +619,16 @@ class TrackedXMLGenerator:
         """
         # Handle linebreak segments - emit <w:br/> instead of <w:t>
         if segment.is_linebreak:
-            run = etree.Element(_w("r"))
-            run.set(_w("rsidR"), self.rsid)
+            run = etree.Element(_R)
+            run.set(_RSID_R, self.rsid)
             etree.SubElement(run, _w("br"))
             return run
 
         text = segment.text
 
         # Create the run element
-        run = etree.Element(_w("r"))
-        run.set(_w("rsidR"), self.rsid)
+        run = etree.Element(_R)
+        run.set(_RSID_R, self.rsid)
 
         # Build run properties
         rpr = None
@@ -632,11 +661,11 @@ class TrackedXMLGenerator:
                     etree.SubElement(rpr, _w("strike"))
 
         # Create the text element
-        text_elem = etree.SubElement(run, _w("t"))
+        text_elem = etree.SubElement(run, _T)
 
         # Handle xml:space for leading/trailing whitespace
         if text and (text[0].isspace() or text[-1].isspace()):
-            text_elem.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+            text_elem.set(_XML_SPACE, "preserve")
 
         text_elem.text = text
 
@@ -646,8 +675,8 @@ class TrackedXMLGenerator:
     def _get_max_change_id(doc: Any) -> int:
         """Find the maximum change ID in the document.
 
-        Scans document.xml for all w:id attributes on w:ins, w:del, w:moveFrom,
-        w:moveTo, and w:pPrChange elements to find the maximum existing ID.
+        Scans document.xml once for the w:id attributes of w:ins, w:del,
+        w:moveFrom, w:moveTo, property change and custom XML range elements.
 
         Args:
             doc: Document object with parsed XML (must have xml_root attribute)
@@ -655,42 +684,7 @@ class TrackedXMLGenerator:
         Returns:
             Maximum change ID found, or 0 if none exist
         """
-        max_id = 0
-
-        # Get the XML root from the document
         xml_root = getattr(doc, "xml_root", None)
         if xml_root is None:
             return 0
-
-        # Elements that use w:id for tracked changes
-        change_tags = [
-            _w("ins"),
-            _w("del"),
-            _w("moveFrom"),
-            _w("moveTo"),
-            _w("pPrChange"),
-            _w("rPrChange"),
-            _w("sectPrChange"),
-            _w("tblPrChange"),
-            _w("trPrChange"),
-            _w("tcPrChange"),
-            _w("customXmlInsRangeStart"),
-            _w("customXmlDelRangeStart"),
-            _w("customXmlMoveFromRangeStart"),
-            _w("customXmlMoveToRangeStart"),
-        ]
-
-        # Find all elements with w:id attribute
-        for tag in change_tags:
-            for elem in xml_root.iter(tag):
-                id_attr = elem.get(_w("id"))
-                if id_attr is not None:
-                    try:
-                        id_val = int(id_attr)
-                        if id_val > max_id:
-                            max_id = id_val
-                    except ValueError:
-                        # Non-integer ID, skip
-                        pass
-
-        return max_id
+        return max(highest_ids([xml_root]).get(CHANGE, 0), 0)
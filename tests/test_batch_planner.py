@@ -0,0 +1,247 @@
+"""Tests for single-pass planning of batch edits (apply_edits_batch).
+
+These tests verify that:
+- Independent edits are applied together and match applying them in turn
+- Edits that depend on earlier ones fall back to one-at-a-time application
+- Errors, continue_on_error and dry runs behave as before
+- Per-phase timings are reported
+"""
+
+import random
+import re
+import tempfile
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from python_docx_redline import Document
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def create_document(body: str) -> Path:
+    """Create a test document with the given body XML."""
+    doc_path = Path(tempfile.mktemp(suffix=".docx"))
+    doc_path.write_text(
+        f"""<?xml version="1.0" encoding="UTF-8"?>
+<w:document xmlns:w="{WORD_NS}">
+<w:body>
+{body}
+</w:body>
+</w:document>""",
+        encoding="utf-8",
+    )
+    return doc_path
+
+
+def canonical(doc: Document) -> str:
+    """Serialize a document without revision dates, IDs and rsids."""
+    xml = etree.tostring(doc.xml_root, encoding="unicode")
+    xml = re.sub(r' (w:date|w:id|w:rsid\w*|\w+:dateUtc)="[^"]*"', "", xml)
+    return re.sub(r">\s*\n\s*<", "><", xml)
+
+
+def apply_both(body: str, edits: list, **kwargs) -> tuple:
+    """Apply edits with apply_edits_batch and one at a time with apply_edits."""
+    doc_path = create_document(body)
+    try:
+        batch_doc = Document(doc_path)
+        sequential_doc = Document(doc_path)
+        batch = batch_doc.apply_edits_batch(edits, **kwargs)
+        dict_edits = [
+            {"type": "replace", "find": e[0], "replace": e[1]} if isinstance(e, tuple) else e
+            for e in edits
+        ]
+        sequential = sequential_doc.apply_edits(
+            dict_edits,
+            stop_on_error=not kwargs.get("continue_on_error", True),
+            default_track=kwargs.get("default_track", True),
+        )
+        return batch_doc, batch, sequential_doc, sequential
+    finally:
+        doc_path.unlink()
+
+
+BODY = """
+<w:p><w:r><w:t>The Seller shall deliver the goods within 30 days.</w:t></w:r></w:p>
+<w:p><w:r><w:t xml:space="preserve">The Buyer </w:t></w:r><w:r><w:t>shall pay within 30 days.</w:t></w:r></w:p>
+<w:p><w:r><w:t>Notices go to the Seller and the Buyer.</w:t></w:r></w:p>
+"""
+
+
+def test_independent_edits_are_planned_together() -> None:
+    """Edits in one run are all applied and match applying them in turn."""
+    edits = [
+        ("Seller", "Vendor"),
+        {"type": "insert", "text": " calendar", "after": "30", "occurrence": "all"},
+        {"type": "delete", "text": "the goods ", "track": False},
+        {"type": "replace_tracked", "find": "Notices", "replace": "All notices"},
+    ]
+    batch_doc, batch, sequential_doc, sequential = apply_both(BODY, edits)
+
+    assert batch.all_succeeded
+    assert canonical(batch_doc) == canonical(sequential_doc)
+    assert [r.message for r in batch.all_results] == [r.message for r in sequential]
+
+
+def test_occurrence_all_within_one_run() -> None:
+    """Several matches in the same run are replaced together."""
+    doc_path = create_document("<w:p><w:r><w:t>a-b a-b a-b</w:t></w:r></w:p>")
+    try:
+        doc = Document(doc_path)
+        result = doc.apply_edits_batch(
+            [
+                {
+                    "type": "replace",
+                    "find": "a-b",
+                    "replace": "c",
+                    "occurrence": "all",
+                    "track": False,
+                }
+            ]
+        )
+
+        assert result.all_succeeded
+        assert doc.get_text().strip() == "c c c"
+    finally:
+        doc_path.unlink()
+
+
+def test_chained_edits_match_sequential() -> None:
+    """An edit that matches text an earlier edit inserts sees that text."""
+    edits = [("Seller", "Vendor"), ("Vendor shall", "Vendor must")]
+    batch_doc, batch, sequential_doc, sequential = apply_both(BODY, edits)
+
+    assert batch.all_succeeded
+    assert "Vendor must" in batch_doc.get_text()
+    assert canonical(batch_doc) == canonical(sequential_doc)
+
+
+def test_overlapping_edits_match_sequential() -> None:
+    """Edits whose targets overlap are applied one at a time."""
+    edits = [
+        {"type": "replace", "find": "within 30 days", "replace": "promptly", "track": False},
+        {"type": "delete", "text": "30 days", "track": False},
+    ]
+    batch_doc, batch, sequential_doc, sequential = apply_both(BODY, edits)
+
+    assert [r.success for r in batch.all_results] == [r.success for r in sequential]
+    assert canonical(batch_doc) == canonical(sequential_doc)
+
+
+def test_not_found_keeps_suggestions() -> None:
+    """A missing edit fails with the same message as applying it alone."""
+    edits = [("seller", "vendor"), ("Buyer", "Purchaser")]
+    batch_doc, batch, sequential_doc, sequential = apply_both(BODY, edits)
+
+    assert [r.success for r in batch.all_results] == [False, True]
+    assert batch.failed[0].message == sequential[0].message
+    assert "case-insensitive" in batch.failed[0].message
+
+
+def test_stops_on_first_error() -> None:
+    """With continue_on_error=False, edits after a failure are not applied."""
+    edits = [("Seller", "Vendor"), ("missing", "x"), ("Buyer", "Purchaser")]
+    batch_doc, batch, sequential_doc, sequential = apply_both(BODY, edits, continue_on_error=False)
+
+    assert len(batch.all_results) == 2
+    assert "Purchaser" not in batch_doc.get_text()
+    assert canonical(batch_doc) == canonical(sequential_doc)
+
+
+def test_stops_on_error_while_applying(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An edit failing once planned stops later edits and reports them skipped."""
+    doc_path = create_document(BODY)
+    try:
+        doc = Document(doc_path)
+        replace_match = doc._tracked_ops._replace_match
+
+        def fail_on_letters(match, new_text, *args):
+            if new_text == "Letters":
+                raise RuntimeError("cannot edit")
+            return replace_match(match, new_text, *args)
+
+        monkeypatch.setattr(doc._tracked_ops, "_replace_match", fail_on_letters)
+        edits = [("Seller", "Vendor"), ("Notices", "Letters"), ("Buyer", "Purchaser")]
+        result = doc.apply_edits_batch(edits, continue_on_error=False)
+
+        assert [r.success for r in result.all_results] == [True, False, False]
+        assert result.failed[1].message == "Skipped after edit 1 failed"
+        assert "Vendor" in doc.get_text()
+        assert "Purchaser" not in doc.get_text()
+    finally:
+        doc_path.unlink()
+
+
+def test_dry_run_has_no_timings() -> None:
+    """Dry runs do not edit the document or report timings."""
+    doc_path = create_document(BODY)
+    try:
+        doc = Document(doc_path)
+        before = canonical(doc)
+        result = doc.apply_edits_batch([("Seller", "Vendor")], dry_run=True)
+
+        assert result.timings == {}
+        assert canonical(doc) == before
+    finally:
+        doc_path.unlink()
+
+
+def test_timings_cover_each_phase() -> None:
+    """Applied batches report the time spent in each phase."""
+    doc_path = create_document(BODY)
+    try:
+        doc = Document(doc_path)
+        result = doc.apply_edits_batch([("Seller", "Vendor")])
+
+        assert set(result.timings) == {"search", "plan", "apply", "sequential"}
+        assert all(seconds >= 0 for seconds in result.timings.values())
+    finally:
+        doc_path.unlink()
+
+
+WORDS = ["alpha", "beta", "the Party", "30 days", "ab", "ba", "“quoted”"]
+
+
+def random_edit(rng: random.Random) -> dict:
+    """Build a random insert, delete or replace edit."""
+    edit_type = rng.choice(["insert", "delete", "replace", "insert_tracked", "replace_tracked"])
+    edit: dict = {"type": edit_type}
+    if not edit_type.endswith("_tracked"):
+        edit["track"] = rng.random() < 0.5
+        edit["occurrence"] = rng.choice(["first", "last", "all", 2])
+    if edit_type.startswith("insert"):
+        edit["text"] = rng.choice(WORDS)
+        edit[rng.choice(["after", "before"])] = rng.choice(WORDS)
+    elif edit_type == "delete":
+        edit["text"] = rng.choice(WORDS)
+    else:
+        edit["find"] = rng.choice(WORDS)
+        edit["replace"] = rng.choice(WORDS)
+    return edit
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_batches_match_sequential(seed: int) -> None:
+    """Random batches give the same document and results as one at a time."""
+    rng = random.Random(seed)
+    for _ in range(20):
+        body = "".join(
+            "<w:p>"
+            + "".join(
+                f'<w:r><w:t xml:space="preserve">{" ".join(rng.choices(WORDS, k=3))} </w:t></w:r>'
+                for _ in range(rng.randint(1, 3))
+            )
+            + "</w:p>"
+            for _ in range(rng.randint(1, 4))
+        )
+        edits = [random_edit(rng) for _ in range(rng.randint(1, 6))]
+        batch_doc, batch, sequential_doc, sequential = apply_both(body, edits)
+        if any("is not in list" in r.message for r in sequential):
+            # Applied one at a time, several matches in one run can fail;
+            # only the planned path is expected to handle them
+            continue
+
+        assert canonical(batch_doc) == canonical(sequential_doc), edits
+        assert [r.success for r in batch.all_results] == [r.success for r in sequential], edits
@@ -5,10 +5,11 @@ These tests verify that Document can be loaded from:
 - BytesIO objects
 - Open file objects
 
-And that save_to_bytes() correctly produces valid .docx files.
+And that save_to_bytes() and save_to_stream() correctly produce valid .docx files.
 """
 
 import io
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -159,6 +160,87 @@ class TestSaveToBytes:
         assert len(result) > 0
 
 
+class NonSeekableSink:
+    """Write-only sink, like an HTTP response body or a pipe."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+class TestSaveToStream:
+    """Test saving documents into writable streams."""
+
+    def test_save_to_stream_bytesio(self) -> None:
+        """save_to_stream() writes a valid .docx into a BytesIO."""
+        doc = Document(SIMPLE_DOC)
+        doc.insert_tracked(" [STREAMED]", after="lazy dog.")
+        buffer = io.BytesIO()
+
+        doc.save_to_stream(buffer)
+
+        assert not buffer.closed
+        reloaded = Document(buffer.getvalue())
+        assert "[STREAMED]" in reloaded.get_text()
+
+    def test_save_to_non_seekable_stream(self) -> None:
+        """Streams without seek()/tell() receive the archive member by member."""
+        doc = Document(SIMPLE_DOC)
+        doc.insert_tracked(" [STREAMED]", after="lazy dog.")
+        sink = NonSeekableSink()
+
+        doc.save_to_stream(sink)  # type: ignore[arg-type]
+
+        assert len(sink.chunks) > 1
+        with zipfile.ZipFile(io.BytesIO(sink.getvalue())) as zf:
+            assert zf.testzip() is None
+        assert Document(sink.getvalue()).get_text() == doc.get_text()
+
+    def test_save_to_stream_matches_save_to_bytes(self) -> None:
+        """Streaming and byte output contain the same parts."""
+        doc = Document(SIMPLE_DOC)
+        buffer = io.BytesIO()
+
+        doc.save_to_stream(buffer, validate=False)
+        doc_bytes = doc.save_to_bytes(validate=False)
+
+        with zipfile.ZipFile(buffer) as streamed, zipfile.ZipFile(io.BytesIO(doc_bytes)) as whole:
+            assert streamed.namelist() == whole.namelist()
+            for name in whole.namelist():
+                assert streamed.read(name) == whole.read(name)
+
+    def test_save_accepts_file_object(self, tmp_path: Path) -> None:
+        """Document.save() accepts an open binary file."""
+        doc = Document(SIMPLE_DOC)
+        doc.replace_tracked("lazy dog", "sleepy cat")
+        output_path = tmp_path / "streamed.docx"
+
+        with open(output_path, "wb") as f:
+            doc.save(f)
+            assert not f.closed
+
+        assert "sleepy cat" in Document(output_path).get_text()
+
+    def test_save_to_stream_from_bytes(self) -> None:
+        """Documents loaded from bytes can be streamed without validation."""
+        doc = Document(SIMPLE_DOC.read_bytes())
+        sink = NonSeekableSink()
+
+        doc.save_to_stream(sink, validate=False)  # type: ignore[arg-type]
+
+        assert Document(sink.getvalue()).get_text() == doc.get_text()
+
+
 class TestRoundTrip:
     """Test round-trip workflows (bytes -> Document -> bytes -> Document)."""
 
@@ -0,0 +1,241 @@
+"""Tests for Document.clone() and TemplateCache.
+
+These tests verify that:
+- Clones are independent of the original document and of each other
+- Unchanged media bytes are shared instead of copied
+- Unsaved edits are carried over into the clone
+- TemplateCache parses each template once, keyed by its contents
+"""
+
+import io
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from python_docx_redline import (
+    AuthorIdentity,
+    Document,
+    InMemoryPackage,
+    OOXMLPackage,
+    TemplateCache,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SIMPLE_DOC = FIXTURES_DIR / "simple_document.docx"
+
+MEDIA_PART = "word/media/image1.bin"
+MEDIA_DATA = os.urandom(32 * 1024)
+
+
+@pytest.fixture
+def template_bytes() -> bytes:
+    """The sample document with an extra media member."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(SIMPLE_DOC) as src, zipfile.ZipFile(buffer, "w") as dst:
+        for info in src.infolist():
+            dst.writestr(info, src.read(info), zipfile.ZIP_DEFLATED)
+        dst.writestr(MEDIA_PART, MEDIA_DATA, zipfile.ZIP_STORED)
+    return buffer.getvalue()
+
+
+class TestPackageClone:
+    """Test OOXMLPackage.clone()."""
+
+    @pytest.mark.parametrize("package_cls", [OOXMLPackage, InMemoryPackage])
+    def test_clone_is_in_memory_copy(
+        self, template_bytes: bytes, package_cls: type[OOXMLPackage]
+    ) -> None:
+        """Clones of either backend are in-memory packages with the same parts."""
+        with package_cls.from_bytes(template_bytes) as package:
+            clone = package.clone()
+
+            assert isinstance(clone, InMemoryPackage)
+            assert clone.part_names() == package.part_names()
+            assert clone.get_part_bytes(MEDIA_PART) == MEDIA_DATA
+
+    def test_media_is_shared(self, template_bytes: bytes) -> None:
+        """Stored bytes are shared with the clone rather than copied."""
+        package = InMemoryPackage.from_bytes(template_bytes)
+        original = package.get_part_bytes(MEDIA_PART)
+
+        clone = package.clone()
+
+        assert clone.get_part_bytes(MEDIA_PART) is original
+
+    def test_parsed_parts_are_copied(self, template_bytes: bytes) -> None:
+        """Cached trees are deep-copied, so edits stay in one package."""
+        package = InMemoryPackage.from_bytes(template_bytes)
+        root = package.get_part("word/settings.xml")
+
+        clone = package.clone()
+        cloned_root = clone.get_part("word/settings.xml")
+        cloned_root.set("marker", "1")
+        clone.set_part("word/settings.xml", cloned_root)
+
+        assert cloned_root is not root
+        assert root.get("marker") is None
+        assert b'marker="1"' not in package.get_part_bytes("word/settings.xml")
+
+    def test_clone_copies_unchanged_members_raw(self, template_bytes: bytes) -> None:
+        """A clone saves unchanged members verbatim from the shared source."""
+        with OOXMLPackage.from_bytes(template_bytes) as package:
+            data = package.clone().save_to_bytes()
+
+        with zipfile.ZipFile(io.BytesIO(data)) as saved:
+            with zipfile.ZipFile(io.BytesIO(template_bytes)) as src:
+                assert saved.getinfo(MEDIA_PART).compress_type == zipfile.ZIP_STORED
+                assert saved.read(MEDIA_PART) == src.read(MEDIA_PART)
+
+
+class TestDocumentClone:
+    """Test Document.clone()."""
+
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_edits_do_not_leak(self, template_bytes: bytes, in_memory: bool) -> None:
+        """Edits to a clone leave the original and other clones untouched."""
+        template = Document(template_bytes, in_memory=in_memory)
+        first = template.clone()
+        second = template.clone()
+
+        first.replace_tracked("lazy dog", "sleepy cat")
+
+        assert "sleepy cat" in Document(first.save_to_bytes(validate=False)).get_text()
+        assert "sleepy cat" not in Document(second.save_to_bytes(validate=False)).get_text()
+        assert "sleepy cat" not in Document(template.save_to_bytes(validate=False)).get_text()
+
+    def test_unsaved_edits_are_carried_over(self, template_bytes: bytes) -> None:
+        """The clone starts from the current, unsaved state."""
+        template = Document(template_bytes, in_memory=True)
+        template.insert_footnote("Template note", at="quick brown fox")
+
+        clone = template.clone()
+
+        assert [n.text for n in clone.footnotes] == ["Template note"]
+        reloaded = Document(clone.save_to_bytes(validate=False))
+        assert [n.text for n in reloaded.footnotes] == ["Template note"]
+
+    def test_change_ids_continue(self, template_bytes: bytes) -> None:
+        """Tracked changes in the clone don't reuse IDs from the original."""
+        template = Document(template_bytes, in_memory=True)
+        template.insert_tracked(" (template)", after="lazy dog.")
+
+        clone = template.clone()
+        clone.insert_tracked(" (clone)", after="Test Document")
+
+        ids = [change.id for change in clone.get_tracked_changes()]
+        assert len(ids) == len(set(ids)) == 2
+
+    def test_clone_has_no_path(self, template_bytes: bytes, tmp_path: Path) -> None:
+        """Clones can't overwrite the original file by accident."""
+        docx_path = tmp_path / "template.docx"
+        docx_path.write_bytes(template_bytes)
+
+        clone = Document(docx_path).clone()
+
+        assert clone.path is None
+        assert isinstance(clone._package, InMemoryPackage)
+
+    def test_clone_with_author(self, template_bytes: bytes) -> None:
+        """Clones can record changes under a different author."""
+        identity = AuthorIdentity(author="Reviewer", email="reviewer@example.com", guid="g-1")
+        template = Document(template_bytes, in_memory=True, author="Template")
+
+        clone = template.clone(author=identity)
+        clone.insert_tracked(" (reviewed)", after="lazy dog.")
+
+        assert template.author == "Template"
+        assert [c.author for c in clone.get_tracked_changes()] == ["Reviewer"]
+        assert "w16du" in clone.xml_root.nsmap
+
+    def test_clone_has_every_attribute(self, template_bytes: bytes) -> None:
+        """Clones set up the same attributes as a freshly loaded document."""
+        loaded = Document(template_bytes, in_memory=True)
+        clone = Document(template_bytes, in_memory=True).clone()
+
+        assert set(vars(clone)) == set(vars(loaded))
+        assert clone._xml_generator.doc is clone
+        assert clone._revisions._doc is clone
+
+    def test_pending_style_changes(self, template_bytes: bytes) -> None:
+        """Style changes not yet saved are included in the clone."""
+        from python_docx_redline import ensure_standard_styles
+
+        template = Document(template_bytes, in_memory=True)
+        ensure_standard_styles(template.styles, "FootnoteReference")
+
+        clone = template.clone()
+
+        assert clone.styles.get("FootnoteReference") is not None
+        assert b"FootnoteReference" in clone._package.get_part_bytes("word/styles.xml")
+
+
+class TestTemplateCache:
+    """Test TemplateCache."""
+
+    def test_parses_template_once(self, template_bytes: bytes, tmp_path: Path) -> None:
+        """Repeated requests for the same template are cache hits."""
+        docx_path = tmp_path / "template.docx"
+        docx_path.write_bytes(template_bytes)
+        cache = TemplateCache()
+
+        docs = [cache.get(docx_path) for _ in range(3)]
+
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert len({id(doc.xml_root) for doc in docs}) == 3
+
+    def test_keyed_by_content(self, template_bytes: bytes, tmp_path: Path) -> None:
+        """Identical contents share an entry regardless of how they are supplied."""
+        docx_path = tmp_path / "template.docx"
+        docx_path.write_bytes(template_bytes)
+        cache = TemplateCache()
+
+        cache.get(docx_path)
+        cache.get(template_bytes)
+        cache.get(io.BytesIO(template_bytes))
+
+        assert len(cache) == 1
+        assert cache.hits == 2
+
+    def test_changed_file_is_reloaded(self, template_bytes: bytes, tmp_path: Path) -> None:
+        """Rewriting the template file produces a new entry."""
+        docx_path = tmp_path / "template.docx"
+        docx_path.write_bytes(template_bytes)
+        cache = TemplateCache()
+        cache.get(docx_path)
+
+        edited = Document(template_bytes)
+        edited.replace_tracked("lazy dog", "sleepy cat")
+        edited.save(docx_path, validate=False)
+
+        assert "sleepy cat" in cache.get(docx_path).get_text()
+        assert cache.misses == 2
+
+    def test_clones_are_independent(self, template_bytes: bytes) -> None:
+        """Editing a returned document does not affect the cached template."""
+        cache = TemplateCache()
+
+        first = cache.get(template_bytes, author="First")
+        first.replace_tracked("lazy dog", "sleepy cat")
+        second = cache.get(template_bytes)
+
+        assert "sleepy cat" not in second.get_text()
+        assert first.author == "First"
+
+    def test_lru_eviction(self, template_bytes: bytes) -> None:
+        """The least recently used template is evicted first."""
+        cache = TemplateCache(max_size=1)
+        other = SIMPLE_DOC.read_bytes()
+
+        cache.get(template_bytes)
+        cache.get(other)
+        cache.get(template_bytes)
+
+        assert len(cache) == 1
+        assert cache.misses == 3
+
+    def test_invalid_max_size(self) -> None:
+        """The cache must be able to hold at least one template."""
+        with pytest.raises(ValueError, match="max_size"):
+            TemplateCache(max_size=0)
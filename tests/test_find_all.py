@@ -13,6 +13,7 @@ from pathlib import Path
 import pytest
 
 from python_docx_redline import Document
+from python_docx_redline.errors import AmbiguousTextError
 from python_docx_redline.match import Match
 
 
@@ -678,3 +679,88 @@ def test_find_all_scope_location_no_matches() -> None:
         assert len(matches) == 0
     finally:
         doc_path.unlink()
+
+
+def test_iter_matches_same_as_find_all() -> None:
+    """Test iter_matches() yields the same matches as find_all()."""
+    doc_path = create_multi_paragraph_document()
+    try:
+        doc = Document(doc_path)
+
+        lazy = list(doc.iter_matches("production products", case_sensitive=False))
+        eager = doc.find_all("production products", case_sensitive=False)
+
+        assert len(lazy) == 4
+        assert all(isinstance(m, Match) for m in lazy)
+        for lazy_match, eager_match in zip(lazy, eager, strict=True):
+            assert repr(lazy_match) == repr(eager_match)
+            assert lazy_match.context == eager_match.context
+            assert lazy_match.paragraph_text == eager_match.paragraph_text
+    finally:
+        doc_path.unlink()
+
+
+def test_iter_matches_defers_metadata() -> None:
+    """Test iter_matches() computes context and location only when read."""
+    doc_path = create_multi_paragraph_document()
+    try:
+        doc = Document(doc_path)
+
+        match = next(doc.iter_matches("production products"))
+        assert "context" not in vars(match)
+        assert "location" not in vars(match)
+
+        assert match.location == "body"
+        assert match.paragraph_index == 0
+        assert "location" in vars(match)
+        assert "context" not in vars(match)
+    finally:
+        doc_path.unlink()
+
+
+def test_iter_matches_stops_early() -> None:
+    """Test iter_matches() searches only as far as it is consumed."""
+    doc_path = create_multi_paragraph_document()
+    try:
+        doc = Document(doc_path)
+
+        next(doc.iter_matches("production products"))
+        assert doc.text_index.misses == 1
+    finally:
+        doc_path.unlink()
+
+
+def test_replace_first_occurrence_stops_early() -> None:
+    """Test occurrence='first' edits stop searching after the first match."""
+    doc_path = create_multi_paragraph_document()
+    try:
+        doc = Document(doc_path)
+
+        doc.replace_tracked("production products", "goods", occurrence="first")
+        assert doc.text_index.misses == 1
+
+        # Uniqueness checks still report every occurrence when ambiguous
+        with pytest.raises(AmbiguousTextError) as exc_info:
+            doc.move_tracked("production products", after="paragraph 1.")
+        assert len(exc_info.value.matches) == 3
+    finally:
+        doc_path.unlink()
+
+
+def test_find_all_reuses_positions_until_edit() -> None:
+    """Test paragraph positions are computed once per document generation."""
+    doc_path = create_multi_paragraph_document()
+    try:
+        doc = Document(doc_path)
+
+        doc.find_all("production products")
+        positions = doc._positions()
+        matches = doc.find_all("paragraph", scope="production")
+        assert doc._positions() is positions
+        assert [m.paragraph_index for m in matches] == [0, 1]
+
+        doc.replace_tracked("paragraph 1", "the first paragraph")
+        assert doc._positions() is not positions
+        assert [m.paragraph_index for m in doc.find_all("Completely")] == [4]
+    finally:
+        doc_path.unlink()
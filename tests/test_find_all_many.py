@@ -0,0 +1,151 @@
+"""Tests for Document.find_all_many() and the Aho-Corasick automaton.
+
+These tests verify that:
+- The automaton reports every occurrence, including overlapping ones
+- find_all_many() returns the same matches as one find_all() per pattern
+- Matches are tagged with the pattern that produced them
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from python_docx_redline import Document
+from python_docx_redline.multi_search import AhoCorasick
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SIMPLE_DOC = FIXTURES_DIR / "simple_document.docx"
+
+
+def _brute_force(patterns: list[str], text: str) -> list[tuple[int, int, int]]:
+    """Find every occurrence of every pattern with str.find."""
+    found = []
+    for pattern_idx, pattern in enumerate(patterns):
+        pos = text.find(pattern)
+        while pos != -1:
+            found.append((pos, pos + len(pattern), pattern_idx))
+            pos = text.find(pattern, pos + 1)
+    return sorted(found)
+
+
+def _keys(matches: list) -> list[tuple[int, int, int, int, int]]:
+    """Reduce matches to (paragraph, start run, end run, start offset, end offset)."""
+    return [
+        (
+            m.paragraph_index,
+            m.span.start_run_index,
+            m.span.end_run_index,
+            m.span.start_offset,
+            m.span.end_offset,
+        )
+        for m in matches
+    ]
+
+
+class TestAhoCorasick:
+    """Test the multi-pattern automaton."""
+
+    def test_overlapping_patterns(self) -> None:
+        """Patterns that are suffixes or prefixes of each other are all reported."""
+        patterns = ["he", "she", "his", "hers"]
+        automaton = AhoCorasick(patterns)
+
+        assert sorted(automaton.iter_matches("ushers")) == _brute_force(patterns, "ushers")
+
+    def test_repeated_characters(self) -> None:
+        """Self-overlapping occurrences are reported at every position."""
+        patterns = ["aa", "aaa", "ab"]
+        text = "aaaab aab"
+        automaton = AhoCorasick(patterns)
+
+        assert sorted(automaton.iter_matches(text)) == _brute_force(patterns, text)
+
+    def test_empty_pattern_rejected(self) -> None:
+        """An empty pattern would match everywhere and is rejected."""
+        with pytest.raises(ValueError):
+            AhoCorasick(["ok", ""])
+
+
+class TestFindAllMany:
+    """Test Document.find_all_many()."""
+
+    PATTERNS = ["fox", "the", "quick brown", "o", "document", "nowhere"]
+
+    def test_same_matches_as_find_all(self) -> None:
+        """Each pattern's matches equal those of find_all() for that pattern."""
+        doc = Document(SIMPLE_DOC)
+        matches = doc.find_all_many(self.PATTERNS)
+
+        for pattern in self.PATTERNS:
+            tagged = [m for m in matches if m.pattern == pattern]
+            assert _keys(tagged) == _keys(doc.find_all(pattern))
+            assert all(m.text == pattern for m in tagged)
+
+    def test_document_order(self) -> None:
+        """Matches are ordered by position and indexed consecutively."""
+        doc = Document(SIMPLE_DOC)
+        matches = doc.find_all_many(self.PATTERNS)
+
+        assert [m.index for m in matches] == list(range(len(matches)))
+        positions = [
+            (m.paragraph_index, m.span.start_run_index, m.span.start_offset) for m in matches
+        ]
+        assert positions == sorted(positions)
+
+    def test_case_insensitive(self) -> None:
+        """Case-insensitive matching folds both patterns and text."""
+        doc = Document(SIMPLE_DOC)
+        matches = doc.find_all_many(["THE QUICK", "Lazy Dog"], case_sensitive=False)
+
+        assert [m.text for m in matches] == ["The quick", "lazy dog"]
+        assert [m.pattern for m in matches] == ["THE QUICK", "Lazy Dog"]
+
+    def test_regex_patterns(self) -> None:
+        """Regex patterns keep their capture groups and find_all() semantics."""
+        doc = Document(SIMPLE_DOC)
+        patterns = [r"(\w+) fox", r"\bl\w+", r"o\w"]
+        matches = doc.find_all_many(patterns, regex=True)
+
+        for pattern in patterns:
+            tagged = [m for m in matches if m.pattern == pattern]
+            assert _keys(tagged) == _keys(doc.find_all(pattern, regex=True))
+        fox = next(m for m in matches if m.pattern == r"(\w+) fox")
+        assert fox.span.match_obj.group(1) == "brown"
+
+        # Any subset of the patterns gives the same matches for each
+        ungrouped = doc.find_all_many(patterns[1:], regex=True)
+        assert _keys(ungrouped) == _keys([m for m in matches if m.pattern != patterns[0]])
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            [r"\w+", r"o\w", r"(?<=o)\w+", r"\bq\w*"],
+            [r"(\w)\1", r"(?P<word>\w+) (?P=word)", r"(?i)THE", r"e"],
+            [r"x?o", r"fox", r"(?P<a>o)(?P<b>x)?"],
+            [r"(?P<_1>o)", r"(?P<_1>x)"],
+        ],
+    )
+    def test_overlapping_regex_patterns(self, patterns: list[str]) -> None:
+        """Regexes that overlap, nest, look around or refer to groups are all found."""
+        doc = Document(SIMPLE_DOC)
+        matches = doc.find_all_many(patterns, regex=True)
+
+        for pattern in patterns:
+            tagged = [m for m in matches if m.pattern == pattern]
+            assert _keys(tagged) == _keys(doc.find_all(pattern, regex=True))
+
+    def test_invalid_regex(self) -> None:
+        """An invalid regex raises re.error naming the pattern."""
+        doc = Document(SIMPLE_DOC)
+
+        with pytest.raises(re.error, match="fox\\("):
+            doc.find_all_many(["ok", "fox("], regex=True)
+
+    def test_scope_and_duplicates(self) -> None:
+        """Scope filters paragraphs and duplicate patterns are searched once."""
+        doc = Document(SIMPLE_DOC)
+        matches = doc.find_all_many(["fox", "fox", "test"], scope="lazy dog")
+
+        assert [m.pattern for m in matches] == ["fox"]
+        assert matches[0].location == "body"
@@ -0,0 +1,123 @@
+"""Tests for Document.find_all_spanning().
+
+These tests verify that:
+- Matches may cross paragraph breaks and keep one span per paragraph
+- Each per-paragraph span points at that paragraph's runs
+- Regex, case and special-character options behave as in find_all()
+"""
+
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from python_docx_redline import Document, MultiParagraphSpan
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def create_document(body: str) -> Path:
+    """Create a test document with the given body XML."""
+    doc_path = Path(tempfile.mktemp(suffix=".docx"))
+
+    document_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<w:document xmlns:w="{WORD_NS}">
+<w:body>
+{body}
+</w:body>
+</w:document>"""
+
+    with zipfile.ZipFile(doc_path, "w") as docx:
+        docx.writestr("word/document.xml", document_xml)
+        docx.writestr("[Content_Types].xml", '<?xml version="1.0"?><Types/>')
+        docx.writestr("_rels/.rels", '<?xml version="1.0"?><Relationships/>')
+
+    return doc_path
+
+
+CLAUSE_BODY = """
+<w:p><w:r><w:t>1. Definitions.</w:t></w:r></w:p>
+<w:p><w:r><w:t xml:space="preserve">The Supplier </w:t></w:r><w:r><w:t>shall</w:t></w:r></w:p>
+<w:p><w:r><w:t>indemnify the Customer against all losses.</w:t></w:r></w:p>
+<w:p><w:r><w:t>2. Term.</w:t></w:r></w:p>
+"""
+
+
+@pytest.fixture
+def clause_doc():
+    doc_path = create_document(CLAUSE_BODY)
+    try:
+        yield Document(doc_path)
+    finally:
+        doc_path.unlink()
+
+
+def test_literal_match_across_paragraphs(clause_doc) -> None:
+    """A literal with the separator at the break spans both paragraphs."""
+    spans = clause_doc.find_all_spanning("Supplier shall\nindemnify the Customer")
+
+    assert len(spans) == 1
+    span = spans[0]
+    assert isinstance(span, MultiParagraphSpan)
+    assert span.text == "Supplier shall\nindemnify the Customer"
+    assert [s.text for s in span.spans] == ["Supplier shall", "indemnify the Customer"]
+
+    body_paragraphs = list(clause_doc.xml_root.iter(f"{{{WORD_NS}}}p"))
+    assert span.paragraphs == body_paragraphs[1:3]
+
+
+def test_spans_map_to_each_paragraphs_runs(clause_doc) -> None:
+    """Each per-paragraph span indexes runs of its own paragraph."""
+    (span,) = clause_doc.find_all_spanning("Supplier shall\nindemnify")
+    first, second = span.spans
+
+    assert (first.start_run_index, first.start_offset) == (0, 4)
+    assert (first.end_run_index, first.end_offset) == (1, 5)
+    assert all(run.getparent() is first.paragraph for run in first.runs)
+    assert (second.start_run_index, second.end_run_index) == (0, 0)
+    assert (second.start_offset, second.end_offset) == (0, len("indemnify"))
+
+
+def test_regex_with_whitespace_across_break(clause_doc) -> None:
+    """A regex can match the paragraph break with \\s+."""
+    spans = clause_doc.find_all_spanning(r"shall\s+indemnify", regex=True)
+
+    assert [span.text for span in spans] == ["shall\nindemnify"]
+    assert spans[0].match_obj.group(0) == "shall\nindemnify"
+
+
+def test_matches_within_one_paragraph(clause_doc) -> None:
+    """Matches that do not cross a break have a single span."""
+    spans = clause_doc.find_all_spanning("Term")
+
+    assert len(spans) == 1
+    assert len(spans[0].spans) == 1
+    assert spans[0].text == "Term"
+
+
+def test_custom_separator_and_case(clause_doc) -> None:
+    """The separator and case sensitivity options are honoured."""
+    assert clause_doc.find_all_spanning("SHALL indemnify", separator=" ") == []
+    spans = clause_doc.find_all_spanning("SHALL indemnify", separator=" ", case_sensitive=False)
+    assert [span.text for span in spans] == ["shall indemnify"]
+
+
+def test_scope_limits_paragraphs(clause_doc) -> None:
+    """Paragraphs outside the scope are not joined."""
+    assert clause_doc.find_all_spanning("shall\nindemnify", scope="Supplier") == []
+
+
+def test_normalize_special_chars_maps_back_to_original() -> None:
+    """Normalized matches report spans over the original characters."""
+    doc_path = create_document(
+        "<w:p><w:r><w:t>the “Agreement”</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>means this contract</w:t></w:r></w:p>"
+    )
+    try:
+        doc = Document(doc_path)
+        spans = doc.find_all_spanning('"Agreement"\nmeans', normalize_special_chars=True)
+
+        assert [span.text for span in spans] == ["“Agreement”\nmeans"]
+    finally:
+        doc_path.unlink()
@@ -5,10 +5,13 @@ This module tests the fuzzy matching feature which allows finding text
 with OCR artifacts, typos, or minor variations using similarity thresholds.
 """
 
+import random
+
 import pytest
 
 from python_docx_redline.fuzzy import (
     fuzzy_find_all,
+    fuzzy_find_all_batch,
     fuzzy_match,
     normalize_whitespace,
     parse_fuzzy_config,
@@ -143,6 +146,150 @@ class TestFuzzyFindAll:
         # Should find at least one match
         assert len(matches) >= 1
 
+    def test_boundaries_refined_for_insertions(self):
+        """Test that a match longer than the pattern is found in full."""
+        text = "The Sect ion 2.1 applies and Section 2.2 does not"
+        matches = fuzzy_find_all(text, "Section 2.1", threshold=0.85)
+        assert [text[start:end] for start, end, _ in matches] == ["Sect ion 2.1", "Section 2."]
+
+    def test_long_pattern_in_long_text(self):
+        """Test locating a long clause with typos in a long paragraph."""
+        clause = (
+            "The Receiving Party shall hold the Confidential Information in strict "
+            "confidence and shall not disclose it to any third party without the prior "
+            "written consent of the Disclosing Party. "
+        ) * 3
+        filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 200
+        noisy = clause.replace("Party", "Partv", 4)
+        text = filler + noisy + filler
+
+        matches = fuzzy_find_all(text, clause, threshold=0.95)
+        assert len(matches) == 1
+        start, end, score = matches[0]
+        assert (start, end) == (len(filler), len(filler) + len(noisy))
+        assert score >= 0.95
+
+
+def reference_find_all(text, pattern, threshold, algorithm):
+    """Score every window, as fuzzy_find_all did before windows were skipped."""
+    fuzz = pytest.importorskip("rapidfuzz").fuzz
+    scorer = fuzz.partial_ratio if algorithm == "partial_ratio" else fuzz.ratio
+    matches = []
+    pattern_len = len(pattern)
+    for window_len in range(max(1, int(pattern_len * 0.7)), int(pattern_len * 1.3) + 1):
+        for start in range(len(text) - window_len + 1):
+            end = start + window_len
+            similarity = scorer(text[start:end], pattern) / 100.0
+            if similarity < threshold:
+                continue
+            overlaps = [
+                (i, m_score)
+                for i, (m_start, m_end, m_score) in enumerate(matches)
+                if not (end <= m_start or start >= m_end)
+            ]
+            if not overlaps:
+                matches.append((start, end, similarity))
+            elif similarity > max(score for _, score in overlaps):
+                for i, _ in reversed(overlaps):
+                    del matches[i]
+                matches.append((start, end, similarity))
+    return sorted(matches, key=lambda x: x[0])
+
+
+class TestFuzzyFindAllReference:
+    """Test that skipping windows never changes the matches."""
+
+    def test_matches_away_from_best_alignment(self):
+        """Test that windows shorter than the pattern are all found."""
+        text = "The rate pay noof rate pay is fixed"
+        matches = fuzzy_find_all(text, "of pay", threshold=0.8)
+        assert matches == [(8, 12, 0.8), (22, 26, 0.8)]
+        assert matches == reference_find_all(text, "of pay", 0.8, "ratio")
+
+    def test_partial_ratio_matches_reference(self):
+        """Test that partial_ratio matches are not grown to the longest window."""
+        text = "Late f pa notice, noof rate"
+        expected = reference_find_all(text, "of pay", 0.8, "partial_ratio")
+        assert fuzzy_find_all(text, "of pay", 0.8, "partial_ratio") == expected
+
+    @pytest.mark.parametrize("algorithm", ["ratio", "partial_ratio"])
+    @pytest.mark.parametrize("threshold", [0.6, 0.8, 0.9])
+    def test_random_texts(self, algorithm, threshold):
+        """Test random texts built from a small alphabet against the reference."""
+        rng = random.Random(f"{algorithm}-{threshold}")
+        for _ in range(40):
+            pattern = "".join(rng.choice("abc d") for _ in range(rng.randint(1, 12)))
+            text = "".join(rng.choice("abc de") for _ in range(rng.randint(0, 60)))
+            if rng.random() < 0.5:
+                pos = rng.randint(0, len(text))
+                text = text[:pos] + pattern + text[pos:]
+            expected = reference_find_all(text, pattern, threshold, algorithm)
+            assert fuzzy_find_all(text, pattern, threshold, algorithm) == expected
+
+    @pytest.mark.parametrize("algorithm", ["ratio", "partial_ratio"])
+    def test_long_pattern_with_typos(self, algorithm):
+        """Test a long pattern with typos in text of similar words."""
+        rng = random.Random(algorithm)
+        words = ["party", "shall", "notice", "the", "days", "pay", "of"]
+        pattern = " ".join(rng.choices(words, k=14))
+        noisy = "".join(c if rng.random() > 0.05 else rng.choice("aeiou") for c in pattern)
+        text = " ".join(rng.choices(words, k=30)) + noisy + " ".join(rng.choices(words, k=30))
+
+        expected = reference_find_all(text, pattern, 0.8, algorithm)
+        assert expected
+        assert fuzzy_find_all(text, pattern, 0.8, algorithm) == expected
+
+
+class TestFuzzyFindAllBatch:
+    """Test batched fuzzy matching over many texts."""
+
+    TEXTS = [
+        "The producti0n pr0ducts are ready",
+        "Nothing relevant in this paragraph at all",
+        "",
+        "prod",
+        "Production of products: production products shipped",
+        "Secti0n 1 and Secti0n 2",
+    ]
+
+    @pytest.mark.parametrize("algorithm", ["ratio", "levenshtein", "token_sort_ratio"])
+    @pytest.mark.parametrize("threshold", [0.7, 0.85, 0.95])
+    def test_same_results_as_per_text(self, algorithm, threshold):
+        """Test that prefiltering never changes the matches."""
+        for pattern in ["production products", "Section", "pr0ducts are"]:
+            expected = [
+                (i, matches)
+                for i, text in enumerate(self.TEXTS)
+                if (matches := fuzzy_find_all(text, pattern, threshold, algorithm))
+            ]
+            found = fuzzy_find_all_batch(self.TEXTS, pattern, threshold, algorithm)
+            assert list(found) == expected
+
+    def test_windows_scored_in_chunks(self, monkeypatch):
+        """Test that splitting the scored windows across calls keeps the matches."""
+        monkeypatch.setattr("python_docx_redline.fuzzy._CDIST_CHUNK", 5)
+        rng = random.Random(0)
+        texts = ["".join(rng.choices("abc d", k=rng.randint(0, 40))) for _ in range(30)]
+        expected = [
+            (i, matches)
+            for i, text in enumerate(texts)
+            if (matches := fuzzy_find_all(text, "abc da", 0.8))
+        ]
+        assert list(fuzzy_find_all_batch(texts, "abc da", 0.8)) == expected
+
+    def test_prefilter_skips_unrelated_texts(self):
+        """Test that texts without the pattern's q-grams are never searched."""
+        texts = ["lorem ipsum dolor sit amet " * 40] * 50 + ["The producti0n pr0ducts"]
+        found = list(fuzzy_find_all_batch(texts, "production products", threshold=0.85))
+        assert [i for i, _ in found] == [50]
+
+    def test_workers_config(self):
+        """Test that workers is validated and kept when given."""
+        assert parse_fuzzy_config({"workers": -1})["workers"] == -1
+        assert "workers" not in parse_fuzzy_config(0.9)
+        with pytest.raises(ValueError, match="workers"):
+            parse_fuzzy_config({"workers": 0})
+
 
 class TestParseFuzzyConfig:
     """Test fuzzy configuration parser."""
@@ -0,0 +1,117 @@
+"""Tests for the per-document w:id allocator.
+
+These tests verify that:
+- Counters are seeded from every annotated part of a loaded document
+- Tracked change IDs never reuse bookmark or comment IDs
+- Generators and operations share the document's allocator
+"""
+
+import tempfile
+import zipfile
+from pathlib import Path
+
+from lxml import etree
+
+from python_docx_redline import Document
+from python_docx_redline.id_allocator import (
+    BOOKMARK,
+    CHANGE,
+    COMMENT,
+    ENDNOTE,
+    FOOTNOTE,
+    IdAllocator,
+    highest_ids,
+)
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{WORD_NS}">
+  <w:body>
+    <w:p>
+      <w:bookmarkStart w:id="7" w:name="Intro"/>
+      <w:ins w:id="3" w:author="A"><w:r><w:t>Inserted</w:t></w:r></w:ins>
+      <w:bookmarkEnd w:id="7"/>
+      <w:r><w:t xml:space="preserve"> plain text here.</w:t></w:r>
+      <w:r><w:footnoteReference w:id="2"/></w:r>
+    </w:p>
+  </w:body>
+</w:document>"""
+
+FOOTNOTES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:footnotes xmlns:w="{WORD_NS}">
+  <w:footnote w:type="separator" w:id="-1"><w:p/></w:footnote>
+  <w:footnote w:type="continuationSeparator" w:id="0"><w:p/></w:footnote>
+  <w:footnote w:id="2">
+    <w:p><w:del w:id="11" w:author="A"><w:r><w:delText>Old</w:delText></w:r></w:del></w:p>
+  </w:footnote>
+</w:footnotes>"""
+
+
+def create_docx(footnotes: bool = True) -> Path:
+    """Create a .docx with a bookmark, tracked changes and optional footnotes."""
+    docx_path = Path(tempfile.mkdtemp()) / "test.docx"
+    with zipfile.ZipFile(docx_path, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", '<?xml version="1.0"?><Types/>')
+        docx.writestr("_rels/.rels", '<?xml version="1.0"?><Relationships/>')
+        docx.writestr("word/document.xml", DOCUMENT_XML)
+        if footnotes:
+            docx.writestr("word/footnotes.xml", FOOTNOTES_XML)
+    return docx_path
+
+
+def test_highest_ids_by_kind() -> None:
+    """highest_ids() groups IDs by annotation kind in one scan."""
+    roots = [etree.fromstring(DOCUMENT_XML.encode()), etree.fromstring(FOOTNOTES_XML.encode())]
+
+    assert highest_ids(roots) == {CHANGE: 11, BOOKMARK: 7, FOOTNOTE: 2}
+
+
+def test_seeded_from_every_part() -> None:
+    """Change IDs continue above changes in footnotes and the bookmark ID."""
+    doc = Document(create_docx())
+
+    assert doc._ids.peek(CHANGE) == 12
+    assert doc._ids.peek(FOOTNOTE) == 3
+    assert doc._ids.peek(ENDNOTE) == 1
+    assert doc._ids.peek(COMMENT) == 0
+
+
+def test_change_ids_start_above_bookmarks() -> None:
+    """Without higher change IDs, new changes start above bookmark IDs."""
+    doc = Document(create_docx(footnotes=False))
+
+    doc.insert_tracked(" more", after="plain text")
+
+    ins_ids = [int(e.get(f"{{{WORD_NS}}}id")) for e in doc.xml_root.iter(f"{{{WORD_NS}}}ins")]
+    assert sorted(ins_ids) == [3, 8]
+    assert doc._xml_generator.next_change_id == 9
+
+
+def test_kinds_do_not_collide() -> None:
+    """Change, bookmark and comment IDs handed out are all distinct."""
+    ids = IdAllocator()
+    handed_out = [ids.allocate(kind) for kind in [CHANGE, BOOKMARK, COMMENT] * 3]
+
+    assert len(set(handed_out)) == len(handed_out)
+    assert ids.allocate(FOOTNOTE) == 1
+
+
+def test_generator_shares_document_allocator() -> None:
+    """The XML generator draws from the document's allocator."""
+    doc = Document(create_docx())
+    generator = doc._xml_generator
+
+    assert generator.ids is doc._ids
+    generator.next_change_id = 40
+    assert doc._ids.allocate(CHANGE) == 40
+    assert generator.next_change_id == 41
+
+
+def test_reset_rescans() -> None:
+    """reset() makes the next allocation scan the document again."""
+    doc = Document(create_docx())
+    doc._ids.allocate(CHANGE)
+    doc._ids.reset()
+
+    assert doc._ids.peek(CHANGE) == 12
@@ -418,10 +418,10 @@ class TestInsertImage:
             drawings = list(doc.xml_root.iter(f"{{{WORD_NS}}}drawing"))
             assert len(drawings) == 2
 
-            # Verify two media files
+            # Identical image bytes share a single media file
             with zipfile.ZipFile(output_path, "r") as docx:
                 media_files = [n for n in docx.namelist() if n.startswith("word/media/")]
-                assert len(media_files) == 2
+                assert len(media_files) == 1
 
         finally:
             doc_path.unlink()
@@ -687,3 +687,122 @@ class TestImagePackageIntegrity:
             image_path.unlink()
             if output_path.exists():
                 output_path.unlink()
+
+
+def _image_rels(docx: zipfile.ZipFile, rels_part: str) -> dict[str, str]:
+    """Map image relationship IDs to their targets."""
+    root = etree.fromstring(docx.read(rels_part))
+    return {rel.get("Id"): rel.get("Target") for rel in root if rel.get("Type").endswith("/image")}
+
+
+class TestMediaDeduplication:
+    """Tests for content-addressed media storage."""
+
+    def test_identical_images_share_part_and_relationship(self, tmp_path: Path) -> None:
+        """Repeated insertions of the same bytes reuse one part and one rId."""
+        doc_path = create_test_document()
+        image_path = create_test_image()
+        output_path = tmp_path / "signed.docx"
+
+        try:
+            doc = Document(doc_path)
+            for _ in range(5):
+                doc.insert_image(image_path, after="Company Name:")
+            doc.insert_image_tracked(image_path, after="Authorized By:")
+            doc.save(output_path)
+
+            embeds = {
+                blip.get(f"{{{RELS_NS}}}embed") for blip in doc.xml_root.iter(f"{{{A_NS}}}blip")
+            }
+            assert len(embeds) == 1
+            with zipfile.ZipFile(output_path) as docx:
+                media_files = [n for n in docx.namelist() if n.startswith("word/media/")]
+                assert media_files == ["word/media/image1.png"]
+                rels = _image_rels(docx, "word/_rels/document.xml.rels")
+                assert rels == {embeds.pop(): "media/image1.png"}
+        finally:
+            doc_path.unlink()
+            image_path.unlink()
+
+    def test_different_images_get_separate_parts(self, tmp_path: Path) -> None:
+        """Images with different bytes are stored separately."""
+        doc_path = create_test_document()
+        image_path = create_test_image()
+        other_path = tmp_path / "other.png"
+        other_path.write_bytes(image_path.read_bytes() + b"\0")
+
+        try:
+            doc = Document(doc_path)
+            doc.insert_image(image_path, after="Company Name:")
+            doc.insert_image(other_path, after="Figure 1:")
+
+            assert doc._package.part_exists("word/media/image1.png")
+            assert doc._package.get_part_bytes("word/media/image2.png") == other_path.read_bytes()
+        finally:
+            doc_path.unlink()
+            image_path.unlink()
+
+    def test_replaced_media_part_is_not_reused(self) -> None:
+        """A media part whose bytes changed after indexing is not matched."""
+        doc_path = create_test_document()
+        image_path = create_test_image()
+
+        try:
+            doc = Document(doc_path)
+            doc.insert_image(image_path, after="Company Name:")
+            doc._package.set_part_bytes("word/media/image1.png", b"replaced")
+            doc.insert_image(image_path, after="Figure 1:")
+
+            assert doc._package.get_part_bytes("word/media/image2.png") == image_path.read_bytes()
+        finally:
+            doc_path.unlink()
+            image_path.unlink()
+
+    def test_deduplicate_existing_media_on_save(self, tmp_path: Path) -> None:
+        """Duplicates already in the package are collapsed when saving."""
+        doc_path = create_test_document()
+        image_path = create_test_image()
+        image_data = image_path.read_bytes()
+        image_path.unlink()
+        source = tmp_path / "duplicates.docx"
+        with zipfile.ZipFile(doc_path) as src, zipfile.ZipFile(source, "w") as dst:
+            for info in src.infolist():
+                data = src.read(info)
+                if info.filename == "word/_rels/document.xml.rels":
+                    data = data.replace(
+                        b"</Relationships>",
+                        f'<Relationship Id="rId5" Type="{RELS_NS}/image" '
+                        f'Target="media/image1.png"/>'
+                        f'<Relationship Id="rId6" Type="{RELS_NS}/image" '
+                        f'Target="/word/media/image2.png"/></Relationships>'.encode(),
+                    )
+                elif info.filename == "[Content_Types].xml":
+                    data = data.replace(
+                        b"</Types>",
+                        b'<Override PartName="/word/media/image2.png" '
+                        b'ContentType="image/png"/></Types>',
+                    )
+                dst.writestr(info, data)
+            dst.writestr("word/media/image1.png", image_data)
+            dst.writestr("word/media/image2.png", image_data)
+            dst.writestr(
+                "word/_rels/header1.xml.rels",
+                f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+                f'relationships"><Relationship Id="rId1" Type="{RELS_NS}/image" '
+                f'Target="media/image2.png"/></Relationships>',
+            )
+        doc_path.unlink()
+        output_path = tmp_path / "deduplicated.docx"
+
+        doc = Document(source)
+        doc.save(output_path, validate=False, deduplicate_media=True)
+
+        with zipfile.ZipFile(output_path) as docx:
+            assert "word/media/image2.png" not in docx.namelist()
+            assert _image_rels(docx, "word/_rels/document.xml.rels") == {
+                "rId5": "media/image1.png",
+                "rId6": "media/image1.png",
+            }
+            assert _image_rels(docx, "word/_rels/header1.xml.rels") == {"rId1": "media/image1.png"}
+            assert b"image2.png" not in docx.read("[Content_Types].xml")
+        assert doc.deduplicate_media() == 0
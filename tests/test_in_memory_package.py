@@ -0,0 +1,223 @@
+"""Tests for the InMemoryPackage storage backend.
+
+These tests verify that:
+- InMemoryPackage reads, writes and repacks parts without a temp directory
+- Document(in_memory=True) supports the same editing operations
+- Validation still works by materializing a scratch copy
+"""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from python_docx_redline import Document, InMemoryPackage, ensure_standard_styles
+from python_docx_redline.validation import ValidationError
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SIMPLE_DOC = FIXTURES_DIR / "simple_document.docx"
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# Minimal 1x1 pixel PNG
+PNG_DATA = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010802000000907753de"
+    "0000000c4944415408d763f8cfc000000301010018dd8db00000000049454e44ae426082"
+)
+
+
+@pytest.fixture
+def no_temp_dirs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail the test if the package layer creates a temporary directory."""
+
+    def fail(*args: object, **kwargs: object) -> str:
+        raise AssertionError("in-memory package must not create a temp directory")
+
+    monkeypatch.setattr("python_docx_redline.package.tempfile.mkdtemp", fail)
+
+
+def _read_part(docx_bytes: bytes, part_name: str) -> bytes:
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as zf:
+        return zf.read(part_name)
+
+
+class TestInMemoryPackage:
+    """Test the part-level API of InMemoryPackage."""
+
+    def test_open_from_path(self, no_temp_dirs: None) -> None:
+        """Opening from a path keeps all members in memory."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+
+        assert pkg.temp_dir is None
+        assert pkg.source_path == SIMPLE_DOC
+        assert "word/document.xml" in pkg.part_names()
+        assert pkg.part_exists("[Content_Types].xml")
+
+    def test_part_names_preserve_archive_order(self) -> None:
+        """Parts are listed in the order of the source archive."""
+        with zipfile.ZipFile(SIMPLE_DOC) as zf:
+            expected = [info.filename for info in zf.infolist() if not info.is_dir()]
+
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+
+        assert pkg.part_names() == expected
+
+    def test_get_and_set_part(self, no_temp_dirs: None) -> None:
+        """XML parts can be parsed, modified and stored."""
+        pkg = InMemoryPackage.from_bytes(SIMPLE_DOC.read_bytes())
+
+        root = pkg.get_part("word/document.xml")
+        assert root is not None
+        root.find(f".//{{{WORD_NS}}}t").text = "Changed Title"
+        pkg.set_part("word/document.xml", root)
+
+        assert b"Changed Title" in pkg.get_part_bytes("word/document.xml")
+
+    def test_missing_part(self) -> None:
+        """Missing parts return None and cannot be deleted."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+
+        assert pkg.get_part("word/footnotes.xml") is None
+        assert pkg.get_part_bytes("word/footnotes.xml") is None
+        assert pkg.delete_part("word/footnotes.xml") is False
+
+    def test_set_and_delete_part_bytes(self) -> None:
+        """Binary parts can be added and removed."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+
+        pkg.set_part_bytes("word/media/image1.png", PNG_DATA)
+        assert pkg.get_part_bytes("word/media/image1.png") == PNG_DATA
+
+        assert pkg.delete_part("word/media/image1.png") is True
+        assert not pkg.part_exists("word/media/image1.png")
+
+    def test_get_part_path_raises(self) -> None:
+        """In-memory parts have no filesystem path."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+
+        with pytest.raises(ValidationError, match="no filesystem path"):
+            pkg.get_part_path("word/document.xml")
+
+    def test_save_to_bytes_round_trip(self, no_temp_dirs: None) -> None:
+        """Saving repacks every part, including modifications."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+        pkg.set_part_bytes("customXml/extra.xml", b"<extra/>")
+
+        data = pkg.save_to_bytes()
+
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            names = zf.namelist()
+        assert names == pkg.part_names()
+        assert _read_part(data, "customXml/extra.xml") == b"<extra/>"
+
+    def test_save_to_path(self, tmp_path: Path) -> None:
+        """Saving to a path writes a valid ZIP file."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+        output = tmp_path / "out.docx"
+
+        pkg.save(output)
+
+        assert zipfile.is_zipfile(output)
+
+    def test_fixes_encoding_declaration_on_save(self) -> None:
+        """Non-UTF-8 encoding declarations are rewritten on save."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+        pkg.set_part_bytes("customXml/ascii.xml", b'<?xml version="1.0" encoding="ASCII"?><root/>')
+
+        data = pkg.save_to_bytes()
+
+        assert b'encoding="UTF-8"' in _read_part(data, "customXml/ascii.xml")
+
+    def test_unpacked_materializes_scratch_directory(self) -> None:
+        """unpacked() writes every part to disk and removes it afterwards."""
+        pkg = InMemoryPackage.open(SIMPLE_DOC)
+
+        with pkg.unpacked() as unpacked_dir:
+            assert (unpacked_dir / "word" / "document.xml").is_file()
+            scratch = unpacked_dir
+
+        assert not scratch.exists()
+
+    def test_invalid_source(self) -> None:
+        """Non-ZIP sources are rejected."""
+        with pytest.raises(ValidationError):
+            InMemoryPackage.from_bytes(b"not a zip file")
+
+
+class TestInMemoryDocument:
+    """Test Document editing on top of the in-memory backend."""
+
+    def test_document_uses_in_memory_package(self, no_temp_dirs: None) -> None:
+        """Document(in_memory=True) never creates a temp directory."""
+        doc = Document(SIMPLE_DOC, in_memory=True)
+
+        assert isinstance(doc._package, InMemoryPackage)
+        assert doc._temp_dir is None
+        assert "quick brown fox" in doc.get_text()
+
+    def test_tracked_edit_and_save(self, no_temp_dirs: None) -> None:
+        """Tracked edits are serialized into the saved package."""
+        doc = Document(SIMPLE_DOC.read_bytes(), in_memory=True)
+        doc.replace_tracked("lazy dog", "sleepy cat")
+
+        data = doc.save_to_bytes(validate=False)
+
+        reloaded = Document(data, in_memory=True)
+        assert "sleepy cat" in reloaded.get_text()
+        assert b"<w:del " in _read_part(data, "word/document.xml")
+
+    def test_footnotes(self, no_temp_dirs: None) -> None:
+        """Footnotes are created as in-memory parts."""
+        doc = Document(SIMPLE_DOC, in_memory=True)
+        doc.insert_footnote("A footnote", at="quick brown fox")
+
+        data = doc.save_to_bytes(validate=False)
+
+        assert b"A footnote" in _read_part(data, "word/footnotes.xml")
+        assert len(Document(data, in_memory=True).footnotes) == 1
+
+    def test_comments(self, no_temp_dirs: None) -> None:
+        """Comments are created and removed as in-memory parts."""
+        doc = Document(SIMPLE_DOC, in_memory=True)
+        doc.add_comment("Check this", on="quick brown fox")
+
+        assert [c.text for c in doc.comments] == ["Check this"]
+
+        doc.delete_all_comments()
+        assert not doc._package.part_exists("word/comments.xml")
+
+    def test_images(self, tmp_path: Path, no_temp_dirs: None) -> None:
+        """Images are stored in the media folder of the package."""
+        image_path = tmp_path / "pixel.png"
+        image_path.write_bytes(PNG_DATA)
+
+        other_path = tmp_path / "other.png"
+        other_path.write_bytes(PNG_DATA + b"\0")
+
+        doc = Document(SIMPLE_DOC, in_memory=True)
+        doc.insert_image(image_path, after="lazy dog.")
+        doc.insert_image(other_path, after="Test Document")
+
+        assert doc._package.get_part_bytes("word/media/image1.png") == PNG_DATA
+        assert doc._package.part_exists("word/media/image2.png")
+
+    def test_styles(self, no_temp_dirs: None) -> None:
+        """Style changes are written back to styles.xml."""
+        doc = Document(SIMPLE_DOC, in_memory=True)
+        ensure_standard_styles(doc.styles, "FootnoteReference")
+        doc.styles.save()
+
+        styles = etree.fromstring(doc._package.get_part_bytes("word/styles.xml"))
+        style_ids = {s.get(f"{{{WORD_NS}}}styleId") for s in styles}
+        assert "FootnoteReference" in style_ids
+
+    def test_validation(self) -> None:
+        """Validation runs against a scratch copy of the package."""
+        doc = Document(SIMPLE_DOC, in_memory=True)
+        doc.insert_tracked(" (edited)", after="lazy dog.")
+
+        data = doc.save_to_bytes(validate=True)
+
+        assert zipfile.is_zipfile(io.BytesIO(data))
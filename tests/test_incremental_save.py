@@ -0,0 +1,419 @@
+"""Tests for incremental saving of OOXML packages.
+
+These tests verify that:
+- Unchanged members are copied verbatim from the source archive
+- Modified parts are re-serialized and compressed
+- Edits made directly in the temp directory are still picked up
+- Saving over the source file is safe
+- Compression policies control how modified members are compressed
+- Saving an unchanged document reproduces the source without rebuilding it
+"""
+
+import io
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from python_docx_redline import (
+    CompressionPolicy,
+    Document,
+    InMemoryPackage,
+    OOXMLPackage,
+    TextNotFoundError,
+)
+from python_docx_redline.package import _map_bounded
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SIMPLE_DOC = FIXTURES_DIR / "simple_document.docx"
+
+MEDIA_PART = "word/media/image1.bin"
+MEDIA_DATA = os.urandom(64 * 1024)
+
+
+@pytest.fixture
+def source_docx(tmp_path: Path) -> Path:
+    """Copy the fixture, adding members with non-default compression settings.
+
+    Re-deflating these members would change their compressed size, so the
+    raw bytes reveal whether a member was copied or recompressed.
+    """
+    docx_path = tmp_path / "source.docx"
+    with zipfile.ZipFile(SIMPLE_DOC) as src, zipfile.ZipFile(docx_path, "w") as dst:
+        for info in src.infolist():
+            dst.writestr(info, src.read(info), zipfile.ZIP_DEFLATED, compresslevel=1)
+        dst.writestr(MEDIA_PART, MEDIA_DATA, zipfile.ZIP_STORED)
+    return docx_path
+
+
+def _raw_members(docx: Path | bytes) -> dict[str, tuple[int, int, int]]:
+    """Map member names to (compress_type, compress_size, CRC)."""
+    source = io.BytesIO(docx) if isinstance(docx, bytes) else docx
+    with zipfile.ZipFile(source) as zf:
+        return {
+            info.filename: (info.compress_type, info.compress_size, info.CRC)
+            for info in zf.infolist()
+        }
+
+
+def _read(docx: Path | bytes, part_name: str) -> bytes:
+    source = io.BytesIO(docx) if isinstance(docx, bytes) else docx
+    with zipfile.ZipFile(source) as zf:
+        return zf.read(part_name)
+
+
+@pytest.fixture(params=[OOXMLPackage, InMemoryPackage], ids=["extracted", "in_memory"])
+def package_cls(request: pytest.FixtureRequest) -> type[OOXMLPackage]:
+    return request.param
+
+
+class TestRawCopy:
+    """Test that unchanged members are not recompressed."""
+
+    def test_unchanged_package_copies_every_member(
+        self, source_docx: Path, package_cls: type[OOXMLPackage]
+    ) -> None:
+        """Saving an untouched package reproduces every member verbatim."""
+        with package_cls.open(source_docx) as package:
+            data = package.save_to_bytes()
+
+        assert _raw_members(data) == _raw_members(source_docx)
+        assert list(_raw_members(data)) == list(_raw_members(source_docx))
+        assert zipfile.ZipFile(io.BytesIO(data)).testzip() is None
+
+    def test_modified_part_is_recompressed(
+        self, source_docx: Path, package_cls: type[OOXMLPackage]
+    ) -> None:
+        """Only modified parts are re-serialized."""
+        with package_cls.open(source_docx) as package:
+            root = package.get_part("word/settings.xml")
+            root.set("marker", "1")
+            package.set_part("word/settings.xml", root)
+            data = package.save_to_bytes()
+
+        before = _raw_members(source_docx)
+        after = _raw_members(data)
+        assert after[MEDIA_PART] == before[MEDIA_PART]
+        assert after["word/styles.xml"] == before["word/styles.xml"]
+        assert after["word/settings.xml"] != before["word/settings.xml"]
+        assert b'marker="1"' in _read(data, "word/settings.xml")
+
+    def test_stream_source(self, source_docx: Path, package_cls: type[OOXMLPackage]) -> None:
+        """Packages opened from bytes also copy members verbatim."""
+        with package_cls.from_bytes(source_docx.read_bytes()) as package:
+            data = package.save_to_bytes()
+
+        assert _raw_members(data) == _raw_members(source_docx)
+
+    def test_new_and_deleted_parts(
+        self, source_docx: Path, package_cls: type[OOXMLPackage]
+    ) -> None:
+        """Added parts are written and deleted parts are dropped."""
+        with package_cls.open(source_docx) as package:
+            package.set_part_bytes("word/media/image2.bin", b"new image")
+            package.delete_part(MEDIA_PART)
+            data = package.save_to_bytes()
+
+        names = _raw_members(data)
+        assert MEDIA_PART not in names
+        assert _read(data, "word/media/image2.bin") == b"new image"
+
+    def test_in_memory_media_is_not_decompressed(self, source_docx: Path) -> None:
+        """In-memory packages only inflate members that are read."""
+        package = InMemoryPackage.open(source_docx)
+        package.save_to_bytes()
+
+        assert package._parts[MEDIA_PART] is None
+        assert package.get_part_bytes(MEDIA_PART) == MEDIA_DATA
+
+
+class TestChangeDetection:
+    """Test fallbacks that keep incremental saves correct."""
+
+    def test_direct_temp_dir_edit_is_saved(self, source_docx: Path) -> None:
+        """Files edited directly in the temp directory are recompressed."""
+        with OOXMLPackage.open(source_docx) as package:
+            (package.temp_dir / MEDIA_PART).write_bytes(b"edited on disk")
+            data = package.save_to_bytes()
+
+        assert _read(data, MEDIA_PART) == b"edited on disk"
+
+    def test_changed_source_file_falls_back(self, source_docx: Path) -> None:
+        """If the source file changes after opening, all parts are recompressed."""
+        with OOXMLPackage.open(source_docx) as package:
+            source_docx.write_bytes(SIMPLE_DOC.read_bytes())
+            data = package.save_to_bytes()
+
+        assert _read(data, MEDIA_PART) == MEDIA_DATA
+
+    def test_encoding_declaration_fix_is_saved(self, tmp_path: Path) -> None:
+        """Parts rewritten by the encoding fix are not copied raw."""
+        docx_path = tmp_path / "ascii.docx"
+        with zipfile.ZipFile(SIMPLE_DOC) as src, zipfile.ZipFile(docx_path, "w") as dst:
+            for info in src.infolist():
+                dst.writestr(info, src.read(info))
+            dst.writestr("customXml/ascii.xml", b'<?xml version="1.0" encoding="ASCII"?><a/>')
+
+        with OOXMLPackage.open(docx_path) as package:
+            data = package.save_to_bytes()
+
+        assert b'encoding="UTF-8"' in _read(data, "customXml/ascii.xml")
+
+
+class TestSaveOverSource:
+    """Test saving back to the file the package was opened from."""
+
+    def test_save_over_source(self, source_docx: Path) -> None:
+        """The source file can be overwritten while members are copied from it."""
+        doc = Document(source_docx)
+        doc.replace_tracked("lazy dog", "sleepy cat")
+        doc.save(validate=False)
+
+        assert "sleepy cat" in Document(source_docx).get_text()
+        assert _read(source_docx, MEDIA_PART) == MEDIA_DATA
+
+    def test_repeated_saves_over_source(self, source_docx: Path) -> None:
+        """Later saves keep copying unchanged members from the saved file."""
+        doc = Document(source_docx)
+        media_before = _raw_members(source_docx)[MEDIA_PART]
+
+        doc.replace_tracked("lazy dog", "sleepy cat")
+        doc.save(validate=False)
+        doc.insert_tracked(" Again.", after="quick brown fox")
+        doc.save(validate=False)
+
+        assert _raw_members(source_docx)[MEDIA_PART] == media_before
+        text = Document(source_docx).get_text()
+        assert "sleepy cat" in text
+        assert "Again." in text
+
+
+class TestCompressionPolicy:
+    """Test configurable per-member compression."""
+
+    def test_default_policy(self) -> None:
+        """The default policy deflates everything at the zlib default level."""
+        policy = CompressionPolicy()
+
+        assert policy.compression_for("word/document.xml") == (zipfile.ZIP_DEFLATED, None)
+        assert policy.compression_for("word/media/image1.png") == (zipfile.ZIP_DEFLATED, None)
+
+    def test_fast_policy(self) -> None:
+        """The fast preset stores compressed media and deflates XML at level 1."""
+        policy = CompressionPolicy.fast(workers=4)
+
+        assert policy.workers == 4
+        assert policy.compression_for("word/media/image1.PNG") == (zipfile.ZIP_STORED, None)
+        assert policy.compression_for("word/_rels/document.xml.rels") == (
+            zipfile.ZIP_DEFLATED,
+            1,
+        )
+        assert policy.compression_for("word/media/image1.emf") == (zipfile.ZIP_DEFLATED, None)
+
+    def test_invalid_settings(self) -> None:
+        """Out-of-range levels and worker counts are rejected."""
+        with pytest.raises(ValueError, match="level"):
+            CompressionPolicy(level=10)
+        with pytest.raises(ValueError, match="xml_level"):
+            CompressionPolicy(xml_level=-1)
+        with pytest.raises(ValueError, match="workers"):
+            CompressionPolicy(workers=0)
+
+    def test_policy_applies_to_modified_members(
+        self, source_docx: Path, package_cls: type[OOXMLPackage]
+    ) -> None:
+        """Modified members follow the policy; unchanged ones are copied."""
+        policy = CompressionPolicy(store_extensions=frozenset({".bin", ".xml"}))
+        with package_cls.open(source_docx) as package:
+            package.set_part_bytes("word/media/image2.bin", b"new image" * 100)
+            root = package.get_part("word/settings.xml")
+            package.set_part("word/settings.xml", root)
+            data = package.save_to_bytes(compression=policy)
+
+        before = _raw_members(source_docx)
+        after = _raw_members(data)
+        assert after["word/media/image2.bin"][0] == zipfile.ZIP_STORED
+        assert after["word/settings.xml"][0] == zipfile.ZIP_STORED
+        assert after["word/styles.xml"] == before["word/styles.xml"]
+
+    def test_recompress_unchanged(self, source_docx: Path, package_cls: type[OOXMLPackage]) -> None:
+        """Archival saves recompress every member at the maximum level."""
+        with package_cls.open(source_docx) as package:
+            data = package.save_to_bytes(compression=CompressionPolicy.archival(workers=2))
+
+        before = _raw_members(source_docx)
+        after = _raw_members(data)
+        assert after[MEDIA_PART][0] == zipfile.ZIP_DEFLATED
+        assert after["word/styles.xml"][1] < before["word/styles.xml"][1]
+        assert list(after) == list(before)
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_parallel_compression_round_trip(
+        self, source_docx: Path, package_cls: type[OOXMLPackage], workers: int
+    ) -> None:
+        """Parallel compression produces the same contents, in archive order."""
+        policy = CompressionPolicy(workers=workers, recompress_unchanged=True)
+        with package_cls.open(source_docx) as package:
+            data = package.save_to_bytes(compression=policy)
+
+        with zipfile.ZipFile(io.BytesIO(data)) as saved, zipfile.ZipFile(source_docx) as src:
+            assert saved.testzip() is None
+            assert saved.namelist() == src.namelist()
+            for name in src.namelist():
+                assert saved.read(name) == src.read(name)
+
+    def test_parallel_compression_is_bounded(self) -> None:
+        """Only a few members are compressed ahead of the one being written."""
+        started = 0
+        lock = threading.Lock()
+
+        def compress(item: int) -> int:
+            nonlocal started
+            with lock:
+                started += 1
+            return item
+
+        ahead = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = []
+            for result in _map_bounded(executor, 4, compress, range(100)):
+                ahead.append(started - len(results))
+                results.append(result)
+
+        assert results == list(range(100))
+        assert max(ahead) <= 4
+
+    def test_document_save_with_policy(self, source_docx: Path, tmp_path: Path) -> None:
+        """Document.save() passes the policy through to the package."""
+        doc = Document(source_docx)
+        doc.replace_tracked("lazy dog", "sleepy cat")
+        output = tmp_path / "fast.docx"
+
+        doc.save(output, validate=False, compression=CompressionPolicy.fast(workers=2))
+
+        assert _raw_members(output)["word/document.xml"][0] == zipfile.ZIP_DEFLATED
+        assert "sleepy cat" in Document(output).get_text()
+
+
+class TestNoOpSave:
+    """Test that saving unchanged content short-circuits."""
+
+    def test_generation_counts_writes(self, package_cls: type[OOXMLPackage]) -> None:
+        """The generation only advances when parts are written or removed."""
+        with package_cls.open(SIMPLE_DOC) as package:
+            start = package.generation
+            root = package.get_part("word/settings.xml")
+            assert package.generation == start
+
+            package.set_part("word/settings.xml", root)
+            package.set_part_bytes("customXml/item1.xml", b"<a/>")
+            package.delete_part("customXml/item1.xml")
+
+            assert package.generation == start + 3
+
+    def test_package_is_modified(self, source_docx: Path, package_cls: type[OOXMLPackage]) -> None:
+        """Packages compare their parts against the source archive."""
+        with package_cls.open(source_docx) as package:
+            assert not package.is_modified()
+
+            package.set_part_bytes("word/media/image2.bin", b"new image")
+            assert package.is_modified()
+
+    def test_unchanged_package_returns_source_bytes(
+        self, source_docx: Path, package_cls: type[OOXMLPackage]
+    ) -> None:
+        """An untouched package saves as an exact copy of its source."""
+        with package_cls.from_bytes(source_docx.read_bytes()) as package:
+            assert package.save_to_bytes() == source_docx.read_bytes()
+
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_unchanged_document_is_copied(
+        self,
+        source_docx: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        in_memory: bool,
+    ) -> None:
+        """Edits that match nothing leave the original to be copied, unvalidated."""
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("validator must not run for an unchanged document")
+
+        monkeypatch.setattr("python_docx_redline.validation_docx.DOCXSchemaValidator", fail)
+        doc = Document(source_docx, in_memory=in_memory)
+        with pytest.raises(TextNotFoundError):
+            doc.replace_tracked("no such phrase", "anything")
+        output = tmp_path / "copy.docx"
+
+        result = doc.save(output)
+
+        assert not doc.is_modified
+        assert result.unchanged
+        assert not result.validated
+        assert output.read_bytes() == source_docx.read_bytes()
+        assert doc.save_to_bytes() == source_docx.read_bytes()
+
+    def test_save_over_unchanged_source_is_skipped(self, source_docx: Path) -> None:
+        """Saving an unchanged document over its source leaves the file alone."""
+        before = source_docx.stat().st_mtime_ns
+        doc = Document(source_docx)
+
+        assert doc.save().unchanged
+        assert source_docx.stat().st_mtime_ns == before
+
+    def test_edited_document_is_saved(self, tmp_path: Path) -> None:
+        """Real edits are serialized and validated as usual."""
+        docx_path = tmp_path / "simple.docx"
+        docx_path.write_bytes(SIMPLE_DOC.read_bytes())
+        doc = Document(docx_path)
+        doc.replace_tracked("lazy dog", "sleepy cat")
+
+        assert doc.is_modified
+        result = doc.save()
+
+        assert not result.unchanged
+        assert result.validated
+        assert "sleepy cat" in Document(docx_path).get_text()
+        assert not doc.is_modified
+
+    def test_is_modified_does_not_serialize(
+        self, source_docx: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """is_modified follows generations instead of comparing the tree."""
+
+        def fail(self: Document) -> bool:
+            raise AssertionError("is_modified must not serialize the tree")
+
+        monkeypatch.setattr(Document, "_tree_differs_from_package", fail)
+        doc = Document(source_docx)
+        assert not doc.is_modified
+        with pytest.raises(TextNotFoundError):
+            doc.replace_tracked("no such phrase", "anything")
+        assert not doc.is_modified
+
+        doc.add_comment("Check this", on="lazy dog")
+        assert doc.is_modified
+        assert doc.clone().is_modified
+
+    def test_direct_tree_edit_is_saved(self, source_docx: Path) -> None:
+        """In-place changes to xml_root are written even though no generation counts them."""
+        doc = Document(source_docx)
+        text = doc.xml_root.find(".//{*}t")
+        text.text = text.text + " (edited)"
+
+        buffer = io.BytesIO()
+        assert not doc.save_to_stream(buffer, validate=False).unchanged
+        assert "(edited)" in Document(buffer.getvalue()).get_text()
+
+    def test_style_change_is_detected(self, source_docx: Path) -> None:
+        """Pending style changes count as modifications."""
+        from python_docx_redline import ensure_standard_styles
+
+        doc = Document(source_docx)
+        ensure_standard_styles(doc.styles, "FootnoteReference")
+
+        assert doc.is_modified
+        assert not doc.save(source_docx, validate=False).unchanged
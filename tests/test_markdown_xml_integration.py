@@ -298,6 +298,66 @@ class TestXMLValidity:
         assert "<" in full_text
 
 
+class TestElementBuilders:
+    """Test the element-returning variants of the XML generators."""
+
+    def test_insertion_element_matches_string(self):
+        """Test that create_insertion() serializes create_insertion_element()."""
+        gen = TrackedXMLGenerator(author="TestAuthor", rsid="12345678")
+        ins = gen.create_insertion_element("**bold** text")
+
+        assert ins.tag == f"{{{WORD_NS}}}ins"
+        assert ins.get(f"{{{WORD_NS}}}id") == "1"
+        assert [r.get(f"{{{WORD_NS}}}rsidR") for r in ins] == ["12345678", "12345678"]
+        assert ins[0].find("w:rPr/w:b", namespaces=NSMAP) is not None
+
+        parsed = parse_insertion_xml(gen.create_insertion("**bold** text"))
+        assert parsed.get(f"{{{WORD_NS}}}id") == "2"
+        assert [t.text for t in parsed.iter(f"{{{WORD_NS}}}t")] == ["bold", " text"]
+        assert [t.text for t in ins.iter(f"{{{WORD_NS}}}t")] == ["bold", " text"]
+
+    def test_deletion_element(self):
+        """Test that deletions hold a delText run with unescaped text."""
+        gen = TrackedXMLGenerator(author="A & B")
+        deletion = gen.create_deletion_element(" a < b ")
+
+        assert deletion.tag == f"{{{WORD_NS}}}del"
+        assert deletion.get(f"{{{WORD_NS}}}author") == "A & B"
+        del_text = deletion.find("w:r/w:delText", namespaces=NSMAP)
+        assert del_text.text == " a < b "
+        assert del_text.get("{http://www.w3.org/XML/1998/namespace}space") == "preserve"
+
+    def test_move_elements(self):
+        """Test that move builders return range markers around the move."""
+        gen = TrackedXMLGenerator(author="TestAuthor")
+        elements, range_id, move_id = gen.create_move_to_elements("moved", "move1")
+
+        assert [etree.QName(e).localname for e in elements] == [
+            "moveToRangeStart",
+            "moveTo",
+            "moveToRangeEnd",
+        ]
+        assert elements[0].get(f"{{{WORD_NS}}}name") == "move1"
+        assert elements[0].get(f"{{{WORD_NS}}}id") == str(range_id)
+        assert elements[1].get(f"{{{WORD_NS}}}id") == str(move_id)
+        assert elements[2].get(f"{{{WORD_NS}}}id") == str(range_id)
+        assert elements[1].findtext("w:r/w:t", namespaces=NSMAP) == "moved"
+
+    def test_strings_omit_namespace_declarations(self):
+        """Test that string fragments rely on the surrounding XML for prefixes."""
+        gen = TrackedXMLGenerator(author="TestAuthor")
+        fragments = [
+            gen.create_insertion("new"),
+            gen.create_deletion("old"),
+            gen.create_move_from("moved", "move1")[0],
+            gen.create_move_to("moved", "move1")[0],
+        ]
+
+        assert fragments[0].startswith('<w:ins w:id="1" w:author="TestAuthor" w:date=')
+        assert fragments[1].startswith('<w:del w:id="2" ')
+        assert all("xmlns" not in fragment for fragment in fragments)
+
+
 class TestRegressionFixesXML:
     """Regression tests for PR review fixes - XML generation."""
 
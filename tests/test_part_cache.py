@@ -0,0 +1,168 @@
+"""Tests for the shared parsed-part cache in OOXMLPackage.
+
+These tests verify that:
+- Each XML part is parsed at most once and shared between callers
+- set_part() defers serialization until the package is flushed or saved
+- Raw byte access stays consistent with pending modifications
+"""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from python_docx_redline import Document, InMemoryPackage, OOXMLPackage
+from python_docx_redline.relationships import RelationshipManager, RelationshipTypes
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SIMPLE_DOC = FIXTURES_DIR / "simple_document.docx"
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+@pytest.fixture(params=[OOXMLPackage, InMemoryPackage], ids=["extracted", "in_memory"])
+def package(request: pytest.FixtureRequest):
+    """Open the sample document with each storage backend."""
+    pkg = request.param.open(SIMPLE_DOC)
+    yield pkg
+    pkg.close()
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch, package_cls: type) -> list[str]:
+    """Record every part read from storage."""
+    reads: list[str] = []
+    original = package_cls._read_part_bytes
+
+    def spy(self, part_name):
+        reads.append(part_name)
+        return original(self, part_name)
+
+    monkeypatch.setattr(package_cls, "_read_part_bytes", spy)
+    return reads
+
+
+class TestPartCache:
+    """Test parse-once behaviour of get_part()."""
+
+    def test_get_part_returns_shared_element(self, package: OOXMLPackage) -> None:
+        """Repeated get_part() calls return the same element."""
+        first = package.get_part("word/settings.xml")
+        second = package.get_part("word/settings.xml")
+
+        assert first is not None
+        assert first is second
+
+    def test_get_part_parses_once(
+        self, package: OOXMLPackage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A part is read from storage only on first access."""
+        reads = _count_reads(monkeypatch, type(package))
+
+        for _ in range(5):
+            package.get_part("word/settings.xml")
+
+        assert reads.count("word/settings.xml") == 1
+
+    def test_managers_share_tree(self, package: OOXMLPackage) -> None:
+        """Independent managers see each other's unsaved changes."""
+        first = RelationshipManager(package, "word/document.xml")
+        first.add_relationship(RelationshipTypes.FOOTNOTES, "footnotes.xml")
+        first.save()
+
+        second = RelationshipManager(package, "word/document.xml")
+        assert second.get_relationship_target(RelationshipTypes.FOOTNOTES) == "footnotes.xml"
+
+
+class TestDeferredSerialization:
+    """Test that set_part() only serializes on flush."""
+
+    def test_set_part_defers_write(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """set_part() does not touch storage until flush()."""
+        with OOXMLPackage.open(SIMPLE_DOC) as package:
+            settings_path = package.get_part_path("word/settings.xml")
+            original = settings_path.read_bytes()
+
+            root = package.get_part("word/settings.xml")
+            etree.SubElement(root, f"{{{WORD_NS}}}updateFields")
+            package.set_part("word/settings.xml", root)
+
+            assert settings_path.read_bytes() == original
+
+            package.flush()
+            assert b"updateFields" in settings_path.read_bytes()
+
+    def test_get_part_bytes_sees_pending_changes(self, package: OOXMLPackage) -> None:
+        """Raw reads flush the pending part first."""
+        root = package.get_part("word/settings.xml")
+        etree.SubElement(root, f"{{{WORD_NS}}}updateFields")
+        package.set_part("word/settings.xml", root)
+
+        assert b"updateFields" in package.get_part_bytes("word/settings.xml")
+
+    def test_new_part_is_listed_before_flush(self, package: OOXMLPackage) -> None:
+        """A part created with set_part() exists before it is serialized."""
+        root = etree.Element(f"{{{WORD_NS}}}footnotes", nsmap={"w": WORD_NS})
+        package.set_part("word/footnotes.xml", root)
+
+        assert package.part_exists("word/footnotes.xml")
+        assert "word/footnotes.xml" in package.part_names()
+        assert package.get_part("word/footnotes.xml") is root
+
+    def test_delete_pending_part(self, package: OOXMLPackage) -> None:
+        """Deleting an unserialized part discards it."""
+        root = etree.Element(f"{{{WORD_NS}}}footnotes", nsmap={"w": WORD_NS})
+        package.set_part("word/footnotes.xml", root)
+
+        assert package.delete_part("word/footnotes.xml") is True
+        assert not package.part_exists("word/footnotes.xml")
+        assert package.get_part("word/footnotes.xml") is None
+
+    def test_set_part_bytes_invalidates_cache(self, package: OOXMLPackage) -> None:
+        """Writing raw bytes replaces the cached tree."""
+        cached = package.get_part("word/settings.xml")
+        package.set_part_bytes("word/settings.xml", f'<w:settings xmlns:w="{WORD_NS}"/>'.encode())
+
+        reparsed = package.get_part("word/settings.xml")
+        assert reparsed is not cached
+        assert len(reparsed) == 0
+
+    def test_save_serializes_pending_parts(self, package: OOXMLPackage) -> None:
+        """save_to_bytes() includes pending modifications."""
+        root = package.get_part("word/settings.xml")
+        etree.SubElement(root, f"{{{WORD_NS}}}updateFields")
+        package.set_part("word/settings.xml", root, standalone=True)
+
+        data = package.save_to_bytes()
+
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            settings = zf.read("word/settings.xml")
+        assert b"updateFields" in settings
+        assert b"standalone='yes'" in settings
+
+
+class TestDocumentPartCache:
+    """Test that document operations reuse cached parts."""
+
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_footnotes_parsed_once(self, monkeypatch: pytest.MonkeyPatch, in_memory: bool) -> None:
+        """Inserting more footnotes never re-reads footnotes.xml."""
+        doc = Document(SIMPLE_DOC, in_memory=in_memory)
+        doc.insert_footnote("Note on quick", at="quick")
+        reads = _count_reads(monkeypatch, type(doc._package))
+
+        for word in ["brown", "fox", "jumps", "lazy"]:
+            doc.insert_footnote(f"Note on {word}", at=word)
+
+        assert "word/footnotes.xml" not in reads
+        assert len(doc.footnotes) == 5
+
+        reloaded = Document(doc.save_to_bytes(validate=False))
+        assert [n.text for n in reloaded.footnotes] == [
+            "Note on quick",
+            "Note on brown",
+            "Note on fox",
+            "Note on jumps",
+            "Note on lazy",
+        ]
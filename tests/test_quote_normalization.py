@@ -14,10 +14,12 @@ import pytest
 from python_docx_redline import Document
 from python_docx_redline.errors import TextNotFoundError
 from python_docx_redline.quote_normalization import (
+    NormalizedText,
     denormalize_quotes,
     has_smart_quotes,
     has_straight_quotes,
     normalize_quotes,
+    normalize_special_chars,
 )
 
 
@@ -108,6 +110,44 @@ def test_has_straight_quotes_detection() -> None:
     assert not has_straight_quotes("no quotes here")
 
 
+def test_normalized_text_without_resizing_folds() -> None:
+    """Length-preserving folds keep offsets unchanged."""
+    normalized = NormalizedText("The \u201cterm\u201d \u2013 defined")
+
+    assert normalized.text == 'The "term" - defined'
+    assert normalized.original_span(4, 10) == (4, 10)
+
+
+def test_normalized_text_maps_resizing_folds() -> None:
+    """Ellipses, ligatures and non-breaking space runs map back to their source."""
+    original = "Wait\u2026 the \ufb01nal\u00a0\u00a0\u00a0offer"
+    normalized = NormalizedText(original)
+
+    assert normalized.text == "Wait... the final offer"
+    assert normalized.text == normalize_special_chars(original)
+    start, end = normalized.original_span(4, 7)
+    assert original[start:end] == "\u2026"
+    start, end = normalized.original_span(12, 23)
+    assert original[start:end] == "\ufb01nal\u00a0\u00a0\u00a0offer"
+    # A span ending inside a ligature covers the whole ligature
+    start, end = normalized.original_span(12, 13)
+    assert original[start:end] == "\ufb01"
+
+
+def test_search_matches_resizing_folds() -> None:
+    """Normalized search finds text across ellipses and ligatures."""
+    doc_path = create_test_document("Net thirty days\u2026 \ufb01nal offer.")
+    try:
+        doc = Document(doc_path)
+        spans = doc._text_search.find_text(
+            "days... final", doc._positions().paragraphs, normalize_special_chars=True
+        )
+
+        assert [span.text for span in spans] == ["days\u2026 \ufb01nal"]
+    finally:
+        doc_path.unlink()
+
+
 def test_normalize_denormalize_roundtrip() -> None:
     """Normalize and denormalize both convert to straight quotes (idempotent)."""
     # Both normalize and denormalize convert to straight quotes, so this test
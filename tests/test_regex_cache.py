@@ -0,0 +1,75 @@
+"""Tests for the process-wide compiled regex cache.
+
+These tests verify that:
+- Patterns are compiled once per (pattern, flags) and evicted least recently used
+- Hit and miss counters track lookups
+- Regex searches go through the shared cache
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from python_docx_redline import Document, RegexCache, get_regex_cache
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SIMPLE_DOC = FIXTURES_DIR / "simple_document.docx"
+
+
+class TestRegexCache:
+    """Test RegexCache on its own."""
+
+    def test_keyed_by_pattern_and_flags(self) -> None:
+        """The same pattern with different flags is compiled separately."""
+        cache = RegexCache()
+        pattern = cache.compile(r"\d+ days")
+
+        assert cache.compile(r"\d+ days") is pattern
+        assert cache.compile(r"\d+ days", re.IGNORECASE) is not pattern
+        assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Once full, the pattern unused for longest is dropped."""
+        cache = RegexCache(max_size=2)
+        first = cache.compile("a")
+        cache.compile("b")
+        cache.compile("a")  # "b" is now least recently used
+        cache.compile("c")
+
+        assert len(cache) == 2
+        assert cache.compile("a") is first
+        cache.compile("b")
+        assert cache.misses == 4
+
+    def test_invalid_pattern(self) -> None:
+        """Invalid patterns raise re.error and are not cached."""
+        cache = RegexCache()
+
+        with pytest.raises(re.error):
+            cache.compile("fox(")
+        assert (len(cache), cache.misses) == (0, 0)
+
+    def test_clear_and_max_size(self) -> None:
+        """clear() resets the counters; max_size must be positive."""
+        cache = RegexCache()
+        cache.compile("a")
+        cache.clear()
+
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+        with pytest.raises(ValueError):
+            RegexCache(max_size=0)
+
+
+def test_searches_share_cache() -> None:
+    """Repeated regex searches compile the pattern once."""
+    cache = get_regex_cache()
+    doc = Document(SIMPLE_DOC)
+    pattern = r"(\w+) fox shared-cache-test|\bl\w+"
+
+    doc.find_all(pattern, regex=True)
+    hits, misses = cache.hits, cache.misses
+    doc.find_all(pattern, regex=True)
+
+    assert cache.misses == misses
+    assert cache.hits == hits + 1
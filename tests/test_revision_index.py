@@ -0,0 +1,145 @@
+"""Tests for the index of tracked changes by ID, author and date.
+
+These tests verify that:
+- Changes in a loaded document are found by ID, author and date
+- Changes the generator creates are indexed without rescanning
+- Changes added another way, and resolved changes, are handled
+- Accepting and rejecting by ID, author and edit group use the index
+"""
+
+import tempfile
+from pathlib import Path
+
+from python_docx_redline import Document
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{WORD_NS}">
+  <w:body>
+    <w:p>
+      <w:r><w:t xml:space="preserve">Payment is due </w:t></w:r>
+      <w:ins w:id="1" w:author="Alice" w:date="2024-01-01T00:00:00Z">
+        <w:r><w:t xml:space="preserve">within </w:t></w:r>
+        <w:del w:id="2" w:author="Alice" w:date="2024-01-02T00:00:00Z">
+          <w:r><w:delText xml:space="preserve">sixty </w:delText></w:r>
+        </w:del>
+      </w:ins>
+      <w:del w:id="3" w:author="Bob" w:date="2024-01-01T00:00:00Z">
+        <w:r><w:delText xml:space="preserve">ninety </w:delText></w:r>
+      </w:del>
+      <w:r><w:t>thirty days of invoice.</w:t></w:r>
+    </w:p>
+  </w:body>
+</w:document>"""
+
+
+def create_document() -> Path:
+    """Create a test document with tracked changes by two authors."""
+    doc_path = Path(tempfile.mktemp(suffix=".docx"))
+    doc_path.write_text(DOCUMENT_XML, encoding="utf-8")
+    return doc_path
+
+
+def ids(changes: list) -> list[str]:
+    """Get the w:id of each change element."""
+    return [change.get(f"{{{WORD_NS}}}id") for change in changes]
+
+
+def test_lookup_by_id_author_and_date() -> None:
+    """Loaded changes are found by each indexed attribute."""
+    doc_path = create_document()
+    try:
+        index = Document(doc_path)._revisions
+
+        assert ids(index.lookup("id", "2")) == ["2"]
+        assert ids(index.lookup("author", "Alice")) == ["1", "2"]
+        assert ids(index.lookup("date", "2024-01-01T00:00:00Z")) == ["1", "3"]
+        assert index.lookup("author", "Carol") == []
+    finally:
+        doc_path.unlink()
+
+
+def test_created_changes_are_indexed_incrementally() -> None:
+    """Changes made through the generator are added without a rescan."""
+    doc_path = create_document()
+    try:
+        doc = Document(doc_path, author="Carol")
+        index = doc._revisions
+        index.lookup("id", "1")
+        maps = index._maps
+
+        doc.replace_tracked("invoice", "receipt")
+
+        assert ids(index.lookup("author", "Carol")) == ["4", "5"]
+        assert index._maps is maps
+    finally:
+        doc_path.unlink()
+
+
+def test_changes_added_directly_trigger_rescan() -> None:
+    """Change IDs allocated outside the generator make the index rebuild."""
+    doc_path = create_document()
+    try:
+        doc = Document(doc_path)
+        assert doc._revisions.lookup("author", "Dave") == []
+
+        change_id = doc._xml_generator.next_change_id
+        doc._xml_generator.next_change_id = change_id + 1
+        ins = doc._xml_generator.create_insertion_element("more ", author="Dave")
+        ins.set(f"{{{WORD_NS}}}id", str(change_id))
+        doc.xml_root.find(f".//{{{WORD_NS}}}p").append(ins)
+
+        assert ids(doc._revisions.lookup("author", "Dave")) == [str(change_id)]
+    finally:
+        doc_path.unlink()
+
+
+def test_resolved_changes_are_dropped() -> None:
+    """Accepted changes and changes removed with them are not returned."""
+    doc_path = create_document()
+    try:
+        doc = Document(doc_path)
+        doc.reject_change(1)
+
+        assert doc._revisions.lookup("id", "1") == []
+        assert doc._revisions.lookup("id", "2") == []
+        assert ids(doc._revisions.lookup("author", "Bob")) == ["3"]
+    finally:
+        doc_path.unlink()
+
+
+def test_reject_by_author_skips_nested_changes() -> None:
+    """A deletion inside a rejected insertion is removed, not counted."""
+    doc_path = create_document()
+    try:
+        doc = Document(doc_path)
+
+        assert doc.reject_by_author("Alice") == 1
+        assert "within" not in doc.get_text()
+        assert doc.accept_by_author("Bob") == 1
+    finally:
+        doc_path.unlink()
+
+
+def test_edit_group_of_many_changes() -> None:
+    """Every change in a large edit group is resolved once."""
+    doc_path = Path(tempfile.mktemp(suffix=".docx"))
+    paragraphs = "".join(
+        f"<w:p><w:r><w:t>Clause {i} applies.</w:t></w:r></w:p>" for i in range(300)
+    )
+    doc_path.write_text(
+        f'<w:document xmlns:w="{WORD_NS}"><w:body>{paragraphs}</w:body></w:document>',
+        encoding="utf-8",
+    )
+    try:
+        doc = Document(doc_path)
+        with doc.edit_group("round1"):
+            for i in range(300):
+                doc.replace_tracked(f"Clause {i} applies", f"Clause {i} governs")
+
+        assert doc.reject_edit_group("round1") == 600
+        assert "governs" not in doc.get_text()
+        assert doc.get_tracked_changes() == []
+    finally:
+        doc_path.unlink()
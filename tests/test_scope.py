@@ -5,9 +5,11 @@ These tests verify that scope specifications correctly filter paragraphs
 in Word documents.
 """
 
+import pytest
 from lxml import etree
 
 from python_docx_redline import ScopeEvaluator
+from python_docx_redline.scope import PositionIndex
 
 WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
@@ -237,4 +239,105 @@ def test_section_filter_multiple_sections():
     assert "B1" in "".join(filtered[0].itertext())
 
 
+def test_position_index_ordinals():
+    """Test PositionIndex gives paragraph and table positions."""
+    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<w:document xmlns:w="{WORD_NAMESPACE}">
+  <w:body>
+    <w:p><w:r><w:t>Before</w:t></w:r></w:p>
+    <w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+    <w:tbl><w:tr><w:tc><w:p/></w:tc></w:tr></w:tbl>
+    <w:p><w:r><w:t>After</w:t></w:r></w:p>
+  </w:body>
+</w:document>"""
+    root = etree.fromstring(xml.encode("utf-8"))
+    positions = PositionIndex(root)
+    paragraphs = list(root.iter(f"{{{WORD_NAMESPACE}}}p"))
+    tables = list(root.iter(f"{{{WORD_NAMESPACE}}}tbl"))
+
+    assert positions.paragraphs == paragraphs
+    assert [positions.paragraph_index(p) for p in paragraphs] == [0, 1, 2, 3]
+    assert [positions.table_index(t) for t in tables] == [0, 1]
+
+    with pytest.raises(ValueError):
+        positions.paragraph_index(create_test_paragraph("Elsewhere"))
+
+
+def test_position_index_preceding_heading():
+    """Test PositionIndex finds the nearest earlier heading."""
+    paragraphs = create_test_document(
+        [
+            ("Preamble", None),
+            ("Section A", "Heading1"),
+            ("Content A", None),
+            ("Section B", "Heading2"),
+            ("Content B", None),
+        ]
+    )
+    positions = PositionIndex()
+
+    headings = [positions.preceding_heading(p) for p in paragraphs]
+    assert headings == [None, None, paragraphs[1], paragraphs[1], paragraphs[3]]
+    assert positions.heading_text(paragraphs[3]).strip() == "Section B"
+
+
+def test_section_filter_shared_positions():
+    """Test section filters give the same result with a shared PositionIndex."""
+    paragraphs = create_test_document(
+        [(f"Section {i}", "Heading1") if i % 10 == 0 else (f"Text {i}", None) for i in range(200)]
+    )
+    positions = PositionIndex(paragraphs[0].getroottree().getroot())
+
+    for scope in ["section:Section 50", {"section": "Section 120", "contains": "Text 12"}]:
+        shared = ScopeEvaluator.filter_paragraphs(paragraphs, scope, positions)
+        assert shared == ScopeEvaluator.filter_paragraphs(paragraphs, scope)
+        assert shared == [p for p in paragraphs if ScopeEvaluator.parse(scope)(p)]
+
+    texts = [
+        "".join(p.itertext()).strip()
+        for p in ScopeEvaluator.filter_paragraphs(paragraphs, "section:Section 50", positions)
+    ]
+    assert texts == [f"Text {i}" for i in range(51, 60)]
+
+
+def test_compile_caches_plans():
+    """Test compiled scope plans are cached by specification."""
+    assert ScopeEvaluator.compile("section:Terms") is ScopeEvaluator.compile("section:Terms")
+    assert ScopeEvaluator.compile({"contains": "a", "location": "body"}) is (
+        ScopeEvaluator.compile({"location": "body", "contains": "a"})
+    )
+    assert ScopeEvaluator.compile("section:Terms").steps == (("section", "Terms", True),)
+
+
+def test_compile_rejects_invalid_location():
+    """Test invalid locations are rejected when the scope is compiled."""
+    with pytest.raises(ValueError, match="Invalid location filter"):
+        ScopeEvaluator.compile({"location": "margins"})
+
+
+def test_location_plans():
+    """Test location scopes classify table, header and footer paragraphs."""
+    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<w:root xmlns:w="{WORD_NAMESPACE}">
+  <w:body>
+    <w:p><w:r><w:t>Body</w:t></w:r></w:p>
+    <w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+  </w:body>
+  <w:hdr><w:p><w:r><w:t>Header</w:t></w:r></w:p></w:hdr>
+  <w:ftr><w:p><w:r><w:t>Footer</w:t></w:r></w:p></w:ftr>
+</w:root>"""
+    root = etree.fromstring(xml.encode("utf-8"))
+    paragraphs = list(root.iter(f"{{{WORD_NAMESPACE}}}p"))
+    positions = PositionIndex(root)
+
+    def texts(scope):
+        filtered = ScopeEvaluator.filter_paragraphs(paragraphs, scope, positions)
+        return ["".join(p.itertext()) for p in filtered]
+
+    assert texts("tables") == ["Cell"]
+    assert texts("body") == ["Body"]
+    assert texts({"location": "headers"}) == ["Header"]
+    assert texts({"location": "footers"}) == ["Footer"]
+
+
 # Run tests with: pytest tests/test_scope.py -v
@@ -0,0 +1,123 @@
+"""Tests for the trigram search index built by Document.build_search_index().
+
+These tests verify that:
+- Narrowing never changes search results, only which paragraphs are scanned
+- Regex searches narrow on a literal the regex requires
+- Notes are indexed and edits keep the index current
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from python_docx_redline import Document
+from python_docx_redline.constants import WORD_NAMESPACE
+from python_docx_redline.search_index import required_literal
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SIMPLE_DOC = FIXTURES_DIR / "simple_document.docx"
+
+
+def _keys(matches: list) -> list[tuple[int, int, int, int]]:
+    """Reduce matches to (paragraph, start run, start offset, end offset)."""
+    return [
+        (m.paragraph_index, m.span.start_run_index, m.span.start_offset, m.span.end_offset)
+        for m in matches
+    ]
+
+
+class TestRequiredLiteral:
+    """Test extraction of required literals from regexes."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            (r"net \d+ days", " days"),
+            (r"(\w+) fox jumps", " fox jumps"),
+            (r"(?x) quick \s brown", "quick"),
+            (r"fox|dog", ""),
+            (r"a+b", "b"),
+        ],
+    )
+    def test_longest_top_level_literal(self, pattern: str, expected: str) -> None:
+        """The longest run of top-level literal characters is returned."""
+        assert required_literal(re.compile(pattern)) == expected
+
+
+class TestSearchIndex:
+    """Test searching a document with a search index."""
+
+    QUERIES = ["quick brown", "document", "test", "nowhere to be found", "ox"]
+
+    def test_same_results_as_unindexed(self) -> None:
+        """Literal, case-insensitive and regex searches return the same matches."""
+        plain = Document(SIMPLE_DOC)
+        indexed = Document(SIMPLE_DOC)
+        indexed.build_search_index()
+
+        for query in self.QUERIES:
+            for case_sensitive in (True, False):
+                assert _keys(indexed.find_all(query, case_sensitive=case_sensitive)) == _keys(
+                    plain.find_all(query, case_sensitive=case_sensitive)
+                )
+        for pattern in [r"(\w+) fox", r"DOC\w+", r"\bl\w+"]:
+            assert _keys(indexed.find_all(pattern, regex=True, case_sensitive=False)) == _keys(
+                plain.find_all(pattern, regex=True, case_sensitive=False)
+            )
+
+    def test_narrows_candidates(self) -> None:
+        """Only paragraphs containing every trigram of the query are kept."""
+        doc = Document(SIMPLE_DOC)
+        search_index = doc.build_search_index()
+        paragraphs = doc._positions().paragraphs
+
+        candidates = search_index.narrow(paragraphs, "Quick Brown")
+        assert 0 < len(candidates) < len(paragraphs)
+        assert all("quick brown" in "".join(p.itertext()).lower() for p in candidates)
+        assert search_index.narrow(paragraphs, "nowhere to be found") == []
+
+        # Too short to narrow, or nothing literal to narrow on
+        assert search_index.narrow(paragraphs, "ox") == paragraphs
+        assert search_index.narrow(paragraphs, re.compile("fox|dog")) == paragraphs
+
+    def test_indexes_notes(self) -> None:
+        """Footnote paragraphs are indexed and searched through the index."""
+        doc = Document(SIMPLE_DOC)
+        doc.insert_footnote("Citation to the record", at="test document")
+        search_index = doc.build_search_index()
+
+        footnote = doc._read_notes()[0][0]
+        note_paragraph = footnote.element.find(f"{{{WORD_NAMESPACE}}}p")
+        assert note_paragraph in search_index
+
+        matches = doc.find_all("the record", scope="footnotes")
+        assert [m.location for m in matches] == [f"footnote:{footnote.id}"]
+        assert note_paragraph in search_index
+
+    def test_edits_update_index(self) -> None:
+        """Edited paragraphs are re-indexed and suspension clears the index."""
+        doc = Document(SIMPLE_DOC)
+        search_index = doc.build_search_index()
+        indexed = len(search_index)
+
+        doc.replace_tracked("quick brown", "slow grey")
+        assert len(search_index) < indexed
+        assert len(doc.find_all("grey")) == 1
+        assert len(search_index) == indexed
+
+        doc.text_index.suspend()
+        assert len(search_index) == 0
+        assert len(doc.find_all("grey")) == 1
+        assert len(search_index) == indexed
+
+    def test_direct_edits_update_index(self) -> None:
+        """Paragraphs edited directly through xml_root are re-indexed."""
+        doc = Document(SIMPLE_DOC)
+        doc.build_search_index()
+        text = next(t for t in doc.xml_root.iter(f"{{{WORD_NAMESPACE}}}t") if "fox" in t.text)
+
+        text.text = text.text.replace("fox", "hare")
+
+        assert doc.find_all("fox") == []
+        assert len(doc.find_all("hare")) == 1
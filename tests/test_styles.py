@@ -289,7 +289,9 @@ class TestStyleManagerSave:
             # Should no longer be modified
             assert style_mgr.is_modified is False
 
-            # File should exist
+            # Part should exist, and be written out once the package is flushed
+            assert package.part_exists(STYLES_PATH)
+            package.flush()
             assert styles_path.exists()
 
     def test_save_preserves_existing_unchanged(self):
@@ -0,0 +1,287 @@
+"""Tests for the run-offset character map used by TextSearch.
+
+These tests verify that:
+- ParagraphTextMap resolves character offsets to the right run
+- Empty runs and excluded deleted runs take no space in the map
+- find_text() returns the same spans as a per-character map
+- ParagraphTextIndex reuses maps until the paragraph is invalidated
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from python_docx_redline import Document
+from python_docx_redline.text_search import (
+    ParagraphTextIndex,
+    ParagraphTextMap,
+    TextSearch,
+    _get_run_text,
+)
+
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+SIMPLE_DOC = Path(__file__).parent / "fixtures" / "simple_document.docx"
+
+
+def _paragraph(*runs: str, deleted: tuple[int, ...] = ()) -> etree._Element:
+    """Build a w:p with one run per string; runs listed in `deleted` are tracked deletions."""
+    para = etree.Element(f"{{{WORD_NS}}}p", nsmap={"w": WORD_NS})
+    for index, text in enumerate(runs):
+        parent = para
+        tag = "t"
+        if index in deleted:
+            parent = etree.SubElement(para, f"{{{WORD_NS}}}del")
+            tag = "delText"
+        run = etree.SubElement(parent, f"{{{WORD_NS}}}r")
+        if text:
+            etree.SubElement(run, f"{{{WORD_NS}}}{tag}").text = text
+    return para
+
+
+def _reference_spans(text: str, para: etree._Element) -> list[tuple[int, int, int, int]]:
+    """Find literal matches using a per-character map, as a reference."""
+    runs = list(para.iter(f"{{{WORD_NS}}}r"))
+    char_map = [
+        (run_idx, char_idx)
+        for run_idx, run in enumerate(runs)
+        for char_idx in range(len(_get_run_text(run)))
+    ]
+    full_text = "".join(_get_run_text(run) for run in runs)
+
+    spans = []
+    pos = full_text.find(text)
+    while pos != -1:
+        start_run, start_offset = char_map[pos]
+        end_run, end_offset = char_map[pos + len(text) - 1]
+        spans.append((start_run, end_run, start_offset, end_offset + 1))
+        pos = full_text.find(text, pos + 1)
+    return spans
+
+
+class TestParagraphTextMap:
+    """Test offset resolution in ParagraphTextMap."""
+
+    def test_locate_across_runs(self) -> None:
+        """Offsets resolve to the run containing them, skipping empty runs."""
+        text_map = ParagraphTextMap(_paragraph("Hello ", "", "wor", "ld"))
+
+        assert text_map.text == "Hello world"
+        assert text_map.locate(0) == (0, 0)
+        assert text_map.locate(5) == (0, 5)
+        assert text_map.locate(6) == (2, 0)
+        assert text_map.locate(9) == (3, 0)
+        assert text_map.locate(-1) == (3, 1)
+
+    def test_locate_out_of_range(self) -> None:
+        """Offsets past the text raise IndexError, like a list would."""
+        text_map = ParagraphTextMap(_paragraph("abc"))
+
+        with pytest.raises(IndexError):
+            text_map.locate(3)
+
+    def test_deleted_runs_excluded(self) -> None:
+        """Runs inside w:del take no space when deleted text is excluded."""
+        para = _paragraph("keep ", "gone ", "this", deleted=(1,))
+
+        assert ParagraphTextMap(para).text == "keep gone this"
+        text_map = ParagraphTextMap(para, include_deleted=False)
+        assert text_map.text == "keep this"
+        assert text_map.locate(5) == (2, 0)
+
+
+class TestFindTextEquivalence:
+    """Test that find_text() matches a per-character map exactly."""
+
+    def test_random_fragmentation(self) -> None:
+        """Spans are identical for text split at arbitrary run boundaries."""
+        rng = random.Random(42)
+        search = TextSearch()
+        words = ["the ", "quick ", "brown ", "fox ", "jumps ", ""]
+
+        for _ in range(50):
+            text = "".join(rng.choice(words) for _ in range(30))
+            cuts = sorted(rng.sample(range(len(text) + 1), min(8, len(text) + 1)))
+            pieces = [text[a:b] for a, b in zip([0, *cuts], [*cuts, len(text)], strict=True)]
+            para = _paragraph(*pieces)
+
+            for needle in ["quick brown", "fox", "the the", "n f"]:
+                spans = search.find_text(needle, [para])
+                assert [
+                    (s.start_run_index, s.end_run_index, s.start_offset, s.end_offset)
+                    for s in spans
+                ] == _reference_spans(needle, para)
+                assert all(s.text == needle for s in spans)
+
+
+class TestParagraphTextIndex:
+    """Test caching and invalidation in ParagraphTextIndex."""
+
+    def test_maps_are_reused(self) -> None:
+        """A second lookup of the same paragraph is served from the cache."""
+        index = ParagraphTextIndex()
+        para = _paragraph("Hello ", "world")
+
+        first = index.get(para)
+        assert index.get(para) is first
+        assert (index.hits, index.misses) == (1, 1)
+
+        # Maps with and without deleted text are cached separately
+        assert index.get(para, include_deleted=False) is not first
+        assert len(index) == 2
+
+    def test_invalidate_paragraph(self) -> None:
+        """Invalidating one paragraph keeps the others and bumps the generation."""
+        index = ParagraphTextIndex()
+        edited, untouched = _paragraph("old"), _paragraph("same")
+        index.get(edited)
+        kept = index.get(untouched)
+
+        edited[0][0].text = "new"
+        index.invalidate(edited)
+
+        assert index.generation == 1
+        assert index.get(edited).text == "new"
+        assert index.get(untouched) is kept
+
+    def test_direct_edits_are_detected(self) -> None:
+        """Maps of paragraphs edited without invalidating them are rebuilt."""
+        index = ParagraphTextIndex()
+        para = _paragraph("old ", "text")
+        index.get(para)
+
+        para[0][0].text = "new "
+        assert index.get(para).text == "new text"
+
+        para.remove(para[1])
+        assert index.get(para).text == "new "
+        assert (index.hits, index.misses, index.generation) == (0, 3, 2)
+
+    def test_invalidate_nested_paragraphs(self) -> None:
+        """Paragraphs containing or contained in the edited one are dropped too."""
+        index = ParagraphTextIndex()
+        outer = _paragraph("outer")
+        inner = etree.SubElement(outer[0], f"{{{WORD_NS}}}p")
+        index.get(outer)
+        index.get(inner)
+
+        index.invalidate(inner)
+        assert len(index) == 0
+
+    def test_suspend_and_resume(self) -> None:
+        """Nothing is cached while suspended, and resuming starts from scratch."""
+        index = ParagraphTextIndex()
+        para = _paragraph("text")
+        index.get(para)
+
+        index.suspend()
+        assert not index.active
+        assert len(index) == 0
+        index.get(para)
+        assert len(index) == 0
+
+        index.resume()
+        assert index.active
+        index.get(para)
+        assert len(index) == 1
+
+
+class TestDocumentTextIndex:
+    """Test that Document edits keep the text index consistent."""
+
+    def test_repeated_search_uses_cache(self) -> None:
+        """Searching an unchanged document again rebuilds no paragraph text."""
+        doc = Document(SIMPLE_DOC)
+        doc.find_all("fox")
+        misses = doc.text_index.misses
+
+        doc.find_all("dog")
+        assert doc.text_index.misses == misses
+
+    def test_edits_invalidate_only_edited_paragraph(self) -> None:
+        """Each tracked edit rebuilds only the paragraph it changed."""
+        doc = Document(SIMPLE_DOC)
+        doc.replace_tracked("quick brown fox", "slow red fox")
+        misses = doc.text_index.misses
+
+        doc.insert_tracked(" Really.", after="lazy dog.")
+        doc.delete_tracked("simple ")
+        assert doc.text_index.misses - misses <= 2
+
+        assert doc.find_all("slow red fox")
+        assert doc.find_all("Really.")
+        assert not doc.find_all("simple test")
+
+    def test_direct_edits_suspend_cache(self) -> None:
+        """Editing through paragraph wrappers is seen by the next search."""
+        doc = Document(SIMPLE_DOC)
+        doc.find_all("fox")
+
+        paragraph = next(p for p in doc.paragraphs if "fox" in p.text)
+        paragraph.text = "No animals here."
+
+        assert doc.find_all("fox") == []
+        assert doc.find_all("No animals")
+
+    def test_direct_xml_edits_after_search(self) -> None:
+        """Text edited through xml_root or a paragraph's runs is searched as edited."""
+        doc = Document(SIMPLE_DOC)
+        doc.find_all("fox")
+
+        text = next(t for t in doc.xml_root.iter(f"{{{WORD_NS}}}t") if "fox" in t.text)
+        text.text = text.text.replace("fox", "hare")
+        assert doc.find_all("fox") == []
+        assert len(doc.find_all("hare")) == 1
+
+        paragraph = next(p for p in doc.paragraphs if "hare" in p.text)
+        run_text = next(
+            t for run in paragraph.runs for t in run.iter(f"{{{WORD_NS}}}t") if "hare" in t.text
+        )
+        run_text.text = run_text.text.replace("hare", "owl")
+        assert doc.find_all("hare") == []
+        assert len(doc.find_all("owl")) == 1
+
+    def test_other_operations_keep_cache(self) -> None:
+        """Operations other than tracked edits no longer drop the cache."""
+        doc = Document(SIMPLE_DOC)
+        doc.find_all("fox")
+        misses = doc.text_index.misses
+
+        doc.tables
+        doc.comments
+        doc.get_tracked_changes()
+        doc.find_all("dog")
+        assert doc.text_index.active
+        assert doc.text_index.misses == misses
+
+    def test_wrapper_edits_after_later_search(self) -> None:
+        """Wrappers held across a search still invalidate what they edit."""
+        doc = Document(SIMPLE_DOC)
+        paras = doc.paragraphs
+        doc.find_all("fox")
+
+        paras[0].text = "totally new text"
+
+        assert doc.find_all("totally new")
+        assert doc.text_index.active
+
+    def test_table_cell_edits_after_later_search(self) -> None:
+        """Setting a table cell's text invalidates its old paragraphs."""
+        doc = Document(SIMPLE_DOC)
+        doc.insert_paragraph("Anchor", after="lazy dog.", track=False)
+        doc.find_all("Anchor")
+        doc.xml_root.find(f".//{{{WORD_NS}}}body").append(
+            etree.fromstring(
+                f'<w:tbl xmlns:w="{WORD_NS}"><w:tr><w:tc><w:p><w:r><w:t>Cell text</w:t>'
+                "</w:r></w:p></w:tc></w:tr></w:tbl>"
+            )
+        )
+        doc.text_index.invalidate()
+        cell = doc.tables[0].get_cell(0, 0)
+        assert doc.find_all("Cell text")
+
+        cell.text = "Replaced cell"
+
+        assert doc.find_all("Cell text") == []
+        assert doc.find_all("Replaced cell")
@@ -4,12 +4,15 @@ Tests for the tracked changes listing functionality (Phase 9).
 These tests verify:
 - TrackedChange model class
 - get_tracked_changes() method with filters
+- iter_tracked_changes() and lazily extracted change text
 - accept_changes() and reject_changes() bulk operations
 - has_tracked_changes and tracked_changes properties
 """
 
 import tempfile
 import zipfile
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 
 import pytest
@@ -383,6 +386,119 @@ class TestGetTrackedChanges:
             docx_path.unlink()
 
 
+class TestIterTrackedChanges:
+    """Tests for iter_tracked_changes() and the date and paragraph filters."""
+
+    def test_changes_in_document_order(self):
+        """Changes of every type are listed in the order they appear."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+
+            assert [c.id for c in doc.iter_tracked_changes()] == ["1", "2", "3", "4", "5"]
+
+        finally:
+            docx_path.unlink()
+
+    def test_text_extracted_on_access(self):
+        """Change text and date are read from the element when first accessed."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+            change = next(doc.iter_tracked_changes(change_type="deletion"))
+
+            assert "text" not in vars(change)
+            assert change.text == "removed text"
+            assert change.date == datetime(2024, 1, 16, 14, 0, tzinfo=timezone.utc)
+            assert vars(change)["text"] == "removed text"
+
+        finally:
+            docx_path.unlink()
+
+    def test_text_kept_after_resolving(self):
+        """Listed changes keep their text after they are accepted or rejected."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+            first, second, *rest = doc.get_tracked_changes()
+
+            first.accept()
+            second.reject()
+            doc.accept_all_changes()
+
+            assert first.text == " Added by Alice."
+            assert second.text == "removed text"
+            assert second.date == datetime(2024, 1, 16, 14, 0, tzinfo=timezone.utc)
+            assert rest[0].text == "more insertions"
+
+        finally:
+            docx_path.unlink()
+
+    def test_filter_by_date_range(self):
+        """since and until are inclusive; naive datetimes are taken as UTC."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+            changes = doc.get_tracked_changes(
+                since=datetime(2024, 1, 16, 14, 0), until=datetime(2024, 1, 18, 11, 0)
+            )
+
+            assert [c.id for c in changes] == ["2", "3", "4"]
+
+        finally:
+            docx_path.unlink()
+
+    def test_filter_by_paragraph_range(self):
+        """Only changes inside the given paragraphs are listed."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+
+            assert [c.id for c in doc.get_tracked_changes(paragraph_range=(1, 3))] == ["2", "3"]
+            assert [c.id for c in doc.get_tracked_changes(paragraph_range=(3, 9))] == ["4", "5"]
+
+        finally:
+            docx_path.unlink()
+
+    def test_filters_combine(self):
+        """Type, author and paragraph filters all apply."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+            changes = doc.get_tracked_changes(
+                change_type="insertion", author="Alice", paragraph_range=(1, 4)
+            )
+
+            assert [c.id for c in changes] == ["3"]
+
+        finally:
+            docx_path.unlink()
+
+    def test_paginate(self):
+        """The iterator can be sliced to read one page of changes."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+            page = list(islice(doc.iter_tracked_changes(), 2, 4))
+
+            assert [c.id for c in page] == ["3", "4"]
+
+        finally:
+            docx_path.unlink()
+
+    def test_invalid_type_raises_immediately(self):
+        """An invalid change_type raises before the iterator is consumed."""
+        docx_path = create_test_docx(DOCUMENT_WITH_TRACKED_CHANGES)
+        try:
+            doc = Document(docx_path)
+
+            with pytest.raises(ValueError, match="Invalid change_type"):
+                doc.iter_tracked_changes(change_type="invalid")
+
+        finally:
+            docx_path.unlink()
+
+
 class TestTrackedChangesProperty:
     """Tests for the tracked_changes property."""
 